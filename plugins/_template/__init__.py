@@ -58,7 +58,7 @@ class MyPlugin(PluginBase):
         try:
             # TODO: Implement your data fetching logic here
             # Example:
-            # response = requests.get("https://api.example.com/data", headers={"Authorization": api_key})
+            # response = self.http.get("https://api.example.com/data", headers={"Authorization": api_key})
             # data = response.json()
             
             # For this template, return example data
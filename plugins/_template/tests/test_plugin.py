@@ -70,7 +70,7 @@ class TestTemplatePlugin:
         2. Plugin returns available=False with error message
         """
         # Example with mocking:
-        # with patch('requests.get') as mock_get:
+        # with patch('src.plugins.http.HttpSession.get') as mock_get:
         #     mock_get.side_effect = Exception("Network error")
         #     
         #     plugin = MyPlugin()
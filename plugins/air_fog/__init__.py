@@ -6,7 +6,6 @@ Displays air quality (AQI) and fog/visibility conditions.
 from typing import Any, Dict, List, Optional
 import logging
 import math
-import requests
 
 from src.plugins.base import PluginBase, PluginResult
 
@@ -132,7 +131,7 @@ class AirFogPlugin(PluginBase):
                 }
             
             headers = {"X-API-Key": api_key}
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = self.http.get(url, params=params, headers=headers, timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -177,7 +176,7 @@ class AirFogPlugin(PluginBase):
                 "units": "imperial"
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.http.get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -5,7 +5,6 @@ Displays bike share availability from Bay Wheels GBFS feed.
 
 from typing import Any, Dict, List, Optional
 import logging
-import requests
 import time
 import math
 
@@ -29,6 +28,9 @@ class BayWheelsPlugin(PluginBase):
     Fetches bike availability from Bay Wheels GBFS feed.
     """
     
+    # Live bike counts: never serve them past refresh_seconds
+    SERVE_STALE = False
+    
     def __init__(self, manifest: Dict[str, Any]):
         """Initialize the bay wheels plugin."""
         super().__init__(manifest)
@@ -58,7 +60,7 @@ class BayWheelsPlugin(PluginBase):
             return _station_info_cache
         
         try:
-            response = requests.get(STATION_INFORMATION_URL, timeout=10)
+            response = self.http.get(STATION_INFORMATION_URL, timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -101,7 +103,7 @@ class BayWheelsPlugin(PluginBase):
             )
         
         try:
-            response = requests.get(STATION_STATUS_URL, timeout=10)
+            response = self.http.get(STATION_STATUS_URL, timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -46,7 +46,7 @@ class TestBayWheelsSource:
             }
         }
         
-        with patch('requests.get') as mock_get, \
+        with patch('src.plugins.http.HttpSession.get') as mock_get, \
              patch.object(BayWheelsSource, '_get_station_information', return_value={
                  "station-123": {"name": "Test Station", "lat": 37.7749, "lon": -122.4194}
              }):
@@ -90,7 +90,7 @@ class TestBayWheelsSource:
             }
         }
         
-        with patch('requests.get') as mock_get:
+        with patch('src.plugins.http.HttpSession.get') as mock_get:
             mock_response = Mock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status.return_value = None
@@ -124,7 +124,7 @@ class TestBayWheelsSource:
             }
         }
         
-        with patch('requests.get') as mock_get:
+        with patch('src.plugins.http.HttpSession.get') as mock_get:
             mock_response = Mock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status.return_value = None
@@ -157,7 +157,7 @@ class TestBayWheelsSource:
             }
         }
         
-        with patch('requests.get') as mock_get:
+        with patch('src.plugins.http.HttpSession.get') as mock_get:
             mock_response = Mock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status.return_value = None
@@ -190,7 +190,7 @@ class TestBayWheelsSource:
             }
         }
         
-        with patch('requests.get') as mock_get:
+        with patch('src.plugins.http.HttpSession.get') as mock_get:
             mock_response = Mock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status.return_value = None
@@ -223,7 +223,7 @@ class TestBayWheelsSource:
             }
         }
         
-        with patch('requests.get') as mock_get:
+        with patch('src.plugins.http.HttpSession.get') as mock_get:
             mock_response = Mock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status.return_value = None
@@ -256,7 +256,7 @@ class TestBayWheelsSource:
             }
         }
         
-        with patch('requests.get') as mock_get:
+        with patch('src.plugins.http.HttpSession.get') as mock_get:
             mock_response = Mock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status.return_value = None
@@ -285,7 +285,7 @@ class TestBayWheelsSource:
             }
         }
         
-        with patch('requests.get') as mock_get:
+        with patch('src.plugins.http.HttpSession.get') as mock_get:
             mock_response = Mock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status.return_value = None
@@ -321,7 +321,7 @@ class TestBayWheelsSource:
             }
         }
         
-        with patch('requests.get') as mock_get:
+        with patch('src.plugins.http.HttpSession.get') as mock_get:
             mock_response = Mock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status.return_value = None
@@ -355,7 +355,7 @@ class TestBayWheelsSource:
             }
         }
         
-        with patch('requests.get') as mock_get:
+        with patch('src.plugins.http.HttpSession.get') as mock_get:
             mock_response = Mock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status.return_value = None
@@ -386,7 +386,7 @@ class TestBayWheelsSource:
             }
         }
         
-        with patch('requests.get') as mock_get, \
+        with patch('src.plugins.http.HttpSession.get') as mock_get, \
              patch.object(BayWheelsSource, '_get_station_information', return_value={
                  "station-new-format": {"name": "New Format Station", "lat": 37.7749, "lon": -122.4194}
              }):
@@ -421,7 +421,7 @@ class TestBayWheelsSource:
             }
         }
         
-        with patch('requests.get') as mock_get:
+        with patch('src.plugins.http.HttpSession.get') as mock_get:
             mock_response = Mock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status.return_value = None
@@ -435,7 +435,7 @@ class TestBayWheelsSource:
         """Test error handling for network failures."""
         source = BayWheelsSource(station_ids=["station-123"])
         
-        with patch('requests.get') as mock_get:
+        with patch('src.plugins.http.HttpSession.get') as mock_get:
             mock_get.side_effect = Exception("Network error")
             
             result = source.fetch_station_status()
@@ -446,7 +446,7 @@ class TestBayWheelsSource:
         """Test error handling for malformed JSON response."""
         source = BayWheelsSource(station_ids=["station-123"])
         
-        with patch('requests.get') as mock_get:
+        with patch('src.plugins.http.HttpSession.get') as mock_get:
             mock_response = Mock()
             mock_response.json.side_effect = ValueError("Invalid JSON")
             mock_response.raise_for_status.return_value = None
@@ -464,7 +464,7 @@ class TestBayWheelsSource:
             "stations": []  # Missing 'data' wrapper
         }
         
-        with patch('requests.get') as mock_get:
+        with patch('src.plugins.http.HttpSession.get') as mock_get:
             mock_response = Mock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status.return_value = None
@@ -525,7 +525,7 @@ class TestBayWheelsSource:
             }
         }
         
-        with patch('requests.get') as mock_get, \
+        with patch('src.plugins.http.HttpSession.get') as mock_get, \
              patch.object(BayWheelsSource, '_get_station_information', return_value={
                  "station-1": {"name": "Station 1", "lat": 37.7749, "lon": -122.4194},
                  "station-2": {"name": "Station 2", "lat": 37.7849, "lon": -122.4094},
@@ -574,7 +574,7 @@ class TestBayWheelsSource:
             }
         }
         
-        with patch('requests.get') as mock_get, \
+        with patch('src.plugins.http.HttpSession.get') as mock_get, \
              patch.object(BayWheelsSource, '_get_station_information', return_value={
                  "station-1": {"name": "Station 1", "lat": 37.7749, "lon": -122.4194},
                  "station-2": {"name": "Station 2", "lat": 37.7849, "lon": -122.4094},
@@ -633,7 +633,7 @@ class TestBayWheelsSource:
             }
         }
         
-        with patch('requests.get') as mock_get, \
+        with patch('src.plugins.http.HttpSession.get') as mock_get, \
              patch.object(BayWheelsSource, '_get_station_information', return_value={
                  "station-1": {"name": "Station 1", "lat": 37.7749, "lon": -122.4194},
                  "station-2": {"name": "Station 2", "lat": 37.7849, "lon": -122.4094},
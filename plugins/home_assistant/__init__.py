@@ -5,7 +5,6 @@ Displays entity states from Home Assistant with dynamic entity access.
 
 from typing import Any, Dict, List, Optional
 import logging
-import requests
 
 from src.plugins.base import PluginBase, PluginResult
 
@@ -59,7 +58,7 @@ class HomeAssistantPlugin(PluginBase):
         """Test connection to Home Assistant."""
         try:
             timeout = self.config.get("timeout", 5)
-            response = requests.get(
+            response = self.http.get(
                 f"{self._get_api_url()}/",
                 headers=self._get_headers(),
                 timeout=timeout
@@ -74,7 +73,7 @@ class HomeAssistantPlugin(PluginBase):
         """Get state of a single entity."""
         try:
             timeout = self.config.get("timeout", 5)
-            response = requests.get(
+            response = self.http.get(
                 f"{self._get_api_url()}/states/{entity_id}",
                 headers=self._get_headers(),
                 timeout=timeout
@@ -89,7 +88,7 @@ class HomeAssistantPlugin(PluginBase):
         """Fetch all entity states for template context."""
         try:
             timeout = self.config.get("timeout", 5)
-            response = requests.get(
+            response = self.http.get(
                 f"{self._get_api_url()}/states",
                 headers=self._get_headers(),
                 timeout=timeout
@@ -7,7 +7,7 @@ from unittest.mock import patch, Mock, MagicMock
 class TestHomeAssistantPlugin:
     """Tests for Home Assistant plugin functionality."""
     
-    @patch('requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_entity_state(self, mock_get):
         """Test fetching entity state from Home Assistant."""
         mock_response = Mock()
@@ -28,7 +28,7 @@ class TestHomeAssistantPlugin:
         assert "state" in data
         assert data["state"] == "72"
     
-    @patch('requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_multiple_entities(self, mock_get):
         """Test fetching multiple entity states."""
         mock_response = Mock()
@@ -48,7 +48,7 @@ class TestHomeAssistantPlugin:
         assert states["light.living_room"] == "on"
         assert states["lock.front_door"] == "locked"
     
-    @patch('requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_api_authentication(self, mock_get):
         """Test that API calls include authentication."""
         mock_response = Mock()
@@ -87,7 +87,7 @@ class TestHomeAssistantPlugin:
                 is_numeric = False
             assert is_numeric
     
-    @patch('requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_connection_error_handling(self, mock_get):
         """Test handling of connection errors."""
         mock_get.side_effect = Exception("Connection refused")
@@ -97,7 +97,7 @@ class TestHomeAssistantPlugin:
         except Exception as e:
             assert "Connection" in str(e)
     
-    @patch('requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_unauthorized_error_handling(self, mock_get):
         """Test handling of 401 unauthorized errors."""
         mock_response = Mock()
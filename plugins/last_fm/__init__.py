@@ -110,7 +110,7 @@ class LastFmPlugin(PluginBase):
                 "limit": 1,
             }
             
-            response = requests.get(LASTFM_API_URL, params=params, timeout=10)
+            response = self.http.get(LASTFM_API_URL, params=params, timeout=10)
             
             if response.status_code == 403:
                 return PluginResult(
@@ -56,7 +56,7 @@ class TestLastFmPlugin:
         errors = plugin.validate_config(config)
         assert errors == []
     
-    @patch('plugins.last_fm.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_nowplaying(self, mock_get, sample_manifest, sample_config, nowplaying_response):
         """Test fetch_data with currently playing track."""
         mock_response = Mock()
@@ -78,7 +78,7 @@ class TestLastFmPlugin:
         assert "extralarge" in result.data["artwork_url"]
         assert "Test Song by Test Artist" in result.data["formatted"]
     
-    @patch('plugins.last_fm.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_recent_track(self, mock_get, sample_manifest, sample_config, recent_track_response):
         """Test fetch_data with recently played track (not currently playing)."""
         mock_response = Mock()
@@ -97,7 +97,7 @@ class TestLastFmPlugin:
         assert result.data["is_playing"] is False
         assert result.data["status"] == "LAST PLAYED"
     
-    @patch('plugins.last_fm.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_no_tracks(self, mock_get, sample_manifest, sample_config, empty_tracks_response):
         """Test fetch_data with no recent tracks."""
         mock_response = Mock()
@@ -115,7 +115,7 @@ class TestLastFmPlugin:
         assert result.data["is_playing"] is False
         assert "No recent tracks" in result.data["status"]
     
-    @patch('plugins.last_fm.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_api_error(self, mock_get, sample_manifest, sample_config, error_response):
         """Test fetch_data handles API error response."""
         mock_response = Mock()
@@ -131,7 +131,7 @@ class TestLastFmPlugin:
         assert result.available is False
         assert "User not found" in result.error
     
-    @patch('plugins.last_fm.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_invalid_api_key(self, mock_get, sample_manifest, sample_config):
         """Test fetch_data handles 403 invalid API key."""
         mock_response = Mock()
@@ -146,7 +146,7 @@ class TestLastFmPlugin:
         assert result.available is False
         assert "Invalid API key" in result.error
     
-    @patch('plugins.last_fm.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_user_not_found(self, mock_get, sample_manifest, sample_config):
         """Test fetch_data handles 404 user not found."""
         mock_response = Mock()
@@ -161,7 +161,7 @@ class TestLastFmPlugin:
         assert result.available is False
         assert "not found" in result.error.lower()
     
-    @patch('plugins.last_fm.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_network_error(self, mock_get, sample_manifest, sample_config):
         """Test fetch_data handles network errors."""
         import requests
@@ -175,7 +175,7 @@ class TestLastFmPlugin:
         assert result.available is False
         assert "Network error" in result.error
     
-    @patch('plugins.last_fm.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_timeout(self, mock_get, sample_manifest, sample_config):
         """Test fetch_data handles timeout."""
         import requests
@@ -189,7 +189,7 @@ class TestLastFmPlugin:
         assert result.available is False
         assert "timed out" in result.error.lower()
     
-    @patch('plugins.last_fm.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_uses_cache(self, mock_get, sample_manifest, sample_config, nowplaying_response):
         """Test fetch_data uses cache within refresh interval."""
         mock_response = Mock()
@@ -211,7 +211,7 @@ class TestLastFmPlugin:
         assert mock_get.call_count == 1  # No additional API call
         assert result2.data["title"] == result1.data["title"]
     
-    @patch('plugins.last_fm.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_cache_expires(self, mock_get, sample_manifest, sample_config, nowplaying_response):
         """Test fetch_data refreshes cache after interval."""
         mock_response = Mock()
@@ -233,7 +233,7 @@ class TestLastFmPlugin:
         plugin.fetch_data()
         assert mock_get.call_count == 2
     
-    @patch('plugins.last_fm.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_fallback_to_cache_on_error(self, mock_get, sample_manifest, sample_config, nowplaying_response):
         """Test fetch_data falls back to cache on network error."""
         # First successful call
@@ -281,7 +281,7 @@ class TestLastFmPlugin:
         assert result.available is False
         assert "api key" in result.error.lower()
     
-    @patch('plugins.last_fm.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_artist_as_string(self, mock_get, sample_manifest, sample_config):
         """Test fetch_data handles artist as string (not dict)."""
         response = {
@@ -311,7 +311,7 @@ class TestLastFmPlugin:
         assert result.available is True
         assert result.data["artist"] == "String Artist"
     
-    @patch('plugins.last_fm.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_single_track_dict(self, mock_get, sample_manifest, sample_config):
         """Test fetch_data handles single track as dict (not list)."""
         response = {
@@ -339,7 +339,7 @@ class TestLastFmPlugin:
         assert result.available is True
         assert result.data["title"] == "Single Song"
     
-    @patch('plugins.last_fm.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_get_formatted_display(self, mock_get, sample_manifest, sample_config, nowplaying_response):
         """Test get_formatted_display returns 6 lines."""
         mock_response = Mock()
@@ -358,7 +358,7 @@ class TestLastFmPlugin:
         assert "Test Song" in lines[2]
         assert "Test Artist" in lines[3]
     
-    @patch('plugins.last_fm.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_get_formatted_display_with_album(self, mock_get, sample_manifest, nowplaying_response):
         """Test get_formatted_display includes album when configured."""
         mock_response = Mock()
@@ -391,7 +391,7 @@ class TestLastFmPlugin:
         assert plugin._cache is None
         assert plugin._cache_time is None
     
-    @patch('plugins.last_fm.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_api_request_params(self, mock_get, sample_manifest, sample_config, nowplaying_response):
         """Test correct API parameters are sent."""
         mock_response = Mock()
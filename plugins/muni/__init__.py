@@ -3,26 +3,39 @@
 Displays Muni transit arrival times with support for multiple stops and lines.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 import logging
-from datetime import datetime, timezone
+import time
 
 from src.plugins.base import PluginBase, PluginResult
 
+if TYPE_CHECKING:
+    from src.data_sources.transit_cache import StopArrivals
+
 logger = logging.getLogger(__name__)
 
 # Colors
 COLOR_RED = 63
 COLOR_ORANGE = 64
 
-
 class MuniPlugin(PluginBase):
     """SF Muni transit plugin.
     
     Fetches arrival predictions from 511.org API via regional transit cache.
     Supports multiple stops with nested line data.
+    
+    fetch_data() keeps the configured stops' arrival records (absolute
+    arrival times) as the result's source; prepare_result() rebuilds the
+    minutes until each arrival and the formatted strings from them on every
+    read, so cached results never show frozen countdowns.
     """
     
+    # Live arrival predictions: never serve them past refresh_seconds
+    SERVE_STALE = False
+    
+    # Minutes are derived from the arrival times on every read
+    TIME_RELATIVE = True
+    
     AGENCY = "SF"
     
     LINE_NAMES = {
@@ -78,6 +91,9 @@ class MuniPlugin(PluginBase):
                 enabled=True
             )
             
+            # Only keep our stops' arrivals from the regional feed
+            cache.subscribe(self._cache_consumer, self.AGENCY, self.config.get("stop_codes", []))
+            
             if not cache.is_ready():
                 cache.start()
             
@@ -87,6 +103,11 @@ class MuniPlugin(PluginBase):
             logger.error(f"Failed to initialize transit cache: {e}")
             return None
     
+    @property
+    def _cache_consumer(self) -> str:
+        """Transit cache subscription id."""
+        return f"plugin:{self.plugin_id}"
+    
     def _normalize_line_code(self, line: str) -> str:
         """Normalize line code to single letter."""
         line_upper = line.upper()
@@ -114,70 +135,35 @@ class MuniPlugin(PluginBase):
         """Get display-friendly line name."""
         return self.LINE_NAMES.get(line_code.upper(), line_code.upper())
     
-    def _calculate_minutes_until(self, iso_timestamp: str) -> Optional[int]:
-        """Calculate minutes until timestamp."""
-        try:
-            arrival_time = datetime.fromisoformat(iso_timestamp.replace('Z', '+00:00'))
-            now = datetime.now(timezone.utc)
-            delta = arrival_time - now
-            return max(0, int(delta.total_seconds() / 60))
-        except Exception:
-            return None
-    
-    def _parse_stop_data(self, visits: List[Dict], stop_code: str) -> Optional[Dict]:
-        """Parse arrival data for a single stop."""
-        if not visits:
+    def _build_stop_data(self, stop: "StopArrivals", now: float) -> Optional[Dict]:
+        """Build display data for a single stop from its parsed arrivals.
+        
+        Arrivals are parsed and sorted by the transit cache once per refresh;
+        only the minutes until each arrival are computed here, at read time.
+        
+        Args:
+            stop: StopArrivals from the transit cache
+            now: Current Unix timestamp
+        """
+        if not stop.arrivals:
             return None
         
         arrivals_by_line = {}
-        stop_name = ""
+        all_arrivals = []  # For all_lines combined view (already in time order)
         
-        for visit in visits:
-            journey = visit.get("MonitoredVehicleJourney", {})
-            
-            published_line = journey.get("PublishedLineName", "")
-            if isinstance(published_line, list):
-                published_line = published_line[0] if published_line else ""
-            if not published_line:
-                continue
-            
-            line_code = self._normalize_line_code(published_line)
-            
-            monitored_call = journey.get("MonitoredCall", {})
-            if not stop_name:
-                stop_point_name = monitored_call.get("StopPointName", "")
-                if isinstance(stop_point_name, list):
-                    stop_point_name = stop_point_name[0] if stop_point_name else ""
-                stop_name = stop_point_name
-            
-            expected_arrival = (
-                monitored_call.get("ExpectedArrivalTime") or
-                monitored_call.get("ExpectedDepartureTime") or
-                monitored_call.get("AimedArrivalTime")
-            )
+        for arrival in stop.arrivals:
+            line_code = self._normalize_line_code(arrival.line)
+            arrival_data = {
+                "minutes": arrival.minutes_until(now),
+                "is_full": arrival.occupancy == "FULL",
+                "is_delayed": arrival.delayed,
+                "line_code": line_code,
+            }
             
-            if expected_arrival:
-                minutes = self._calculate_minutes_until(expected_arrival)
-                if minutes is not None and minutes >= 0:
-                    occupancy = journey.get("Occupancy", "UNKNOWN")
-                    if isinstance(occupancy, list):
-                        occupancy = occupancy[0] if occupancy else "UNKNOWN"
-                    if occupancy is None:
-                        occupancy = "UNKNOWN"
-                    
-                    is_full = str(occupancy).upper() == "FULL"
-                    is_delayed = bool(journey.get("Delay") or journey.get("SituationRef"))
-                    
-                    arrival_data = {
-                        "minutes": minutes,
-                        "is_full": is_full,
-                        "is_delayed": is_delayed,
-                        "line_code": line_code,
-                    }
-                    
-                    if line_code not in arrivals_by_line:
-                        arrivals_by_line[line_code] = []
-                    arrivals_by_line[line_code].append(arrival_data)
+            if line_code not in arrivals_by_line:
+                arrivals_by_line[line_code] = []
+            arrivals_by_line[line_code].append(arrival_data)
+            all_arrivals.append(arrival_data)
         
         if not arrivals_by_line:
             return None
@@ -185,7 +171,6 @@ class MuniPlugin(PluginBase):
         # Build lines dict
         lines = {}
         for line_code, line_arrivals in arrivals_by_line.items():
-            line_arrivals.sort(key=lambda x: x["minutes"])
             top_arrivals = line_arrivals[:3]
             
             is_delayed = any(a.get("is_delayed") for a in top_arrivals)
@@ -206,10 +191,6 @@ class MuniPlugin(PluginBase):
             }
         
         # Combined all_lines view
-        all_arrivals = []
-        for line_arrivals in arrivals_by_line.values():
-            all_arrivals.extend(line_arrivals)
-        all_arrivals.sort(key=lambda x: x["minutes"])
         top_all = all_arrivals[:3]
         
         all_line_codes = sorted(arrivals_by_line.keys())
@@ -226,8 +207,8 @@ class MuniPlugin(PluginBase):
         first_line_data = lines.get(first_line_code, {})
         
         return {
-            "stop_code": stop_code,
-            "stop_name": stop_name[:15] if stop_name else stop_code,
+            "stop_code": stop.stop_code,
+            "stop_name": stop.stop_name[:15] if stop.stop_name else stop.stop_code,
             "lines": lines,
             "all_lines": {
                 "formatted": all_formatted,
@@ -263,55 +244,77 @@ class MuniPlugin(PluginBase):
             )
         
         try:
-            cached_data = cache.get_stops_data(self.AGENCY, stop_codes)
-            stops_data = []
-            
-            for stop_code in stop_codes[:4]:
-                visits = cached_data.get(stop_code, [])
-                if visits:
-                    parsed = self._parse_stop_data(visits, stop_code)
-                    if parsed:
-                        stops_data.append(parsed)
-            
-            if not stops_data:
-                return PluginResult(
-                    available=True,
-                    data={
-                        "stop_count": 0,
-                        "stops": [],
-                        "stop_name": "",
-                        "stop_code": "",
-                        "line": "",
-                        "formatted": "NO ARRIVALS",
-                        "is_delayed": False,
-                    }
-                )
-            
-            # Primary stop
-            primary = stops_data[0]
-            
-            data = {
-                # Primary stop
-                "stop_name": primary["stop_name"],
-                "stop_code": primary["stop_code"],
-                "line": primary["line"],
-                "formatted": primary["formatted"],
-                "is_delayed": primary["is_delayed"],
-                # Aggregate
-                "stop_count": len(stops_data),
-                # Array
-                "stops": stops_data,
-            }
-            
-            self._cache = data
-            return PluginResult(available=True, data=data)
-            
+            # Follow config changes to the stop list
+            cache.subscribe(self._cache_consumer, self.AGENCY, stop_codes)
+            cached_stops = cache.get_arrivals(self.AGENCY, stop_codes)
+            stops = tuple(
+                cached_stops[stop_code] for stop_code in stop_codes[:4]
+                if stop_code in cached_stops
+            )
+            # StopArrivals are immutable, so they can be cached as they are
+            return self._build_result(stops, time.time())
+        
         except Exception as e:
             logger.exception("Error fetching Muni data")
             return PluginResult(available=False, error=str(e))
     
+    def prepare_result(self, result: PluginResult) -> PluginResult:
+        """Rebuild display data with minutes until each arrival as of now."""
+        if not result.available or result.source is None:
+            return result
+        return self._build_result(result.source, time.time())
+    
+    def _build_result(self, stops: Tuple["StopArrivals", ...], now: float) -> PluginResult:
+        """Build the display result for the given stops' arrivals.
+        
+        Args:
+            stops: StopArrivals of the configured stops, in config order
+            now: Current Unix timestamp
+        """
+        stops_data = []
+        for stop in stops:
+            parsed = self._build_stop_data(stop, now)
+            if parsed:
+                stops_data.append(parsed)
+        
+        if not stops_data:
+            return PluginResult(
+                available=True,
+                data={
+                    "stop_count": 0,
+                    "stops": [],
+                    "stop_name": "",
+                    "stop_code": "",
+                    "line": "",
+                    "formatted": "NO ARRIVALS",
+                    "is_delayed": False,
+                },
+                source=stops,
+            )
+        
+        # Primary stop
+        primary = stops_data[0]
+        
+        data = {
+            # Primary stop
+            "stop_name": primary["stop_name"],
+            "stop_code": primary["stop_code"],
+            "line": primary["line"],
+            "formatted": primary["formatted"],
+            "is_delayed": primary["is_delayed"],
+            # Aggregate
+            "stop_count": len(stops_data),
+            # Array
+            "stops": stops_data,
+        }
+        
+        self._cache = data
+        return PluginResult(available=True, data=data, source=stops)
+    
     def cleanup(self) -> None:
         """Cleanup resources."""
+        if self._transit_cache is not None:
+            self._transit_cache.unsubscribe(self._cache_consumer)
         self._transit_cache = None
         self._cache = None
 
@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timezone, timedelta
 import json
+import time
 
 from src.data_sources.muni import MuniSource, get_muni_source, COLOR_RED, COLOR_ORANGE
 
@@ -647,3 +648,96 @@ class TestMuniFormatter:
         
         assert "No arrivals" in result
 
+
+
+class TestMuniPlugin:
+    """Tests for the MuniPlugin class."""
+    
+    @pytest.fixture
+    def muni_manifest(self):
+        """Create a test manifest for the muni plugin."""
+        return {
+            "id": "muni",
+            "name": "SF Muni",
+            "version": "1.0.0",
+            "description": "Muni plugin",
+            "author": "Test",
+            "settings_schema": {},
+            "variables": {"simple": ["line", "formatted"]},
+            "max_lengths": {}
+        }
+    
+    @pytest.fixture
+    def mock_cache(self):
+        """Mock transit cache holding pre-parsed arrivals for one stop."""
+        from src.data_sources.transit_cache import Arrival, StopArrivals
+        
+        now = datetime.now(timezone.utc).timestamp()
+        stop = StopArrivals("15726", "Judah St & 34th Ave", (
+            Arrival("N-JUDAH", now + 125, None, False, "MANY_SEATS"),
+            Arrival("J-CHURCH", now + 370, 120, True, "FULL"),
+            Arrival("N-JUDAH", now + 605, None, False, "UNKNOWN"),
+        ))
+        cache = Mock()
+        cache.is_ready.return_value = True
+        cache.get_arrivals.return_value = {"15726": stop}
+        return cache
+    
+    def test_fetch_data_from_arrivals(self, muni_manifest, mock_cache):
+        """Test building display data from the cache's arrival records."""
+        from plugins.muni import MuniPlugin
+        plugin = MuniPlugin(muni_manifest)
+        plugin._config = {"api_key": "test", "stop_codes": ["15726"]}
+        plugin._transit_cache = mock_cache
+        
+        result = plugin.fetch_data()
+        
+        assert result.available is True
+        stop = result.data["stops"][0]
+        assert stop["stop_name"] == "Judah St & 34th"
+        assert stop["lines"]["N"]["formatted"] == "N-JUDAH: 2, 10 MIN"
+        assert stop["lines"]["J"]["formatted"] == "{63}J-CHURCH: 6 MIN"
+        assert stop["all_lines"]["formatted"] == "{63}J-CHURCH/N-JUDAH: 2, 6, 10 MIN"
+        # Arrival records ride along for prepare_result() but aren't serialized
+        assert result.source == (mock_cache.get_arrivals.return_value["15726"],)
+        assert "source" not in result.to_dict()
+        mock_cache.subscribe.assert_called_once_with("plugin:muni", "SF", ["15726"])
+        mock_cache.get_arrivals.assert_called_once_with("SF", ["15726"])
+    
+    def test_fetch_data_no_arrivals(self, muni_manifest, mock_cache):
+        """Test stops without arrivals."""
+        from plugins.muni import MuniPlugin
+        plugin = MuniPlugin(muni_manifest)
+        plugin._config = {"api_key": "test", "stop_codes": ["15726"]}
+        plugin._transit_cache = mock_cache
+        mock_cache.get_arrivals.return_value = {}
+        
+        result = plugin.fetch_data()
+        
+        assert result.available is True
+        assert result.data["formatted"] == "NO ARRIVALS"
+    
+    def test_cached_result_counts_down(self, muni_manifest, mock_cache):
+        """Test minutes are recomputed from the cached arrival times on every read."""
+        from plugins.muni import MuniPlugin
+        plugin = MuniPlugin(muni_manifest)
+        plugin._config = {"api_key": "test", "stop_codes": ["15726"], "refresh_seconds": 600}
+        plugin._transit_cache = mock_cache
+        
+        first = plugin.fetch_data_cached()
+        with patch("plugins.muni.time.time", return_value=time.time() + 60):
+            later = plugin.fetch_data_cached()
+        
+        assert mock_cache.get_arrivals.call_count == 1
+        assert first.data["stops"][0]["lines"]["N"]["formatted"] == "N-JUDAH: 2, 10 MIN"
+        assert later.data["stops"][0]["lines"]["N"]["formatted"] == "N-JUDAH: 1, 9 MIN"
+    
+    def test_cleanup_unsubscribes(self, muni_manifest, mock_cache):
+        """Test that cleanup drops the plugin's stop subscription."""
+        from plugins.muni import MuniPlugin
+        plugin = MuniPlugin(muni_manifest)
+        plugin._transit_cache = mock_cache
+        
+        plugin.cleanup()
+        
+        mock_cache.unsubscribe.assert_called_once_with("plugin:muni")
@@ -165,7 +165,7 @@ class NearbyAircraftPlugin(PluginBase):
         
         # Request new token
         try:
-            response = requests.post(
+            response = self.http.post(
                 OPENSKY_OAUTH_URL,
                 data={
                     "grant_type": "client_credentials",
@@ -435,7 +435,7 @@ class NearbyAircraftPlugin(PluginBase):
                 "lomax": bbox["lomax"],
             }
             
-            response = requests.get(OPENSKY_STATES_URL, params=params, headers=headers, timeout=10)
+            response = self.http.get(OPENSKY_STATES_URL, params=params, headers=headers, timeout=10)
             
             # Handle rate limiting
             if response.status_code == 429:
@@ -161,7 +161,7 @@ class TestBoundingBox:
 class TestOAuthAuthentication:
     """Test OAuth2 authentication."""
     
-    @patch('plugins.nearby_aircraft.requests.post')
+    @patch('src.plugins.http.HttpSession.post')
     def test_get_access_token_success(self, mock_post, plugin_with_auth):
         """Test successful OAuth token acquisition."""
         mock_response = Mock()
@@ -178,7 +178,7 @@ class TestOAuthAuthentication:
         assert plugin_with_auth._access_token == "test_token_123"
         assert plugin_with_auth._token_expires_at is not None
     
-    @patch('plugins.nearby_aircraft.requests.post')
+    @patch('src.plugins.http.HttpSession.post')
     def test_get_access_token_failure(self, mock_post, plugin_with_auth):
         """Test OAuth token acquisition failure."""
         mock_response = Mock()
@@ -195,7 +195,7 @@ class TestOAuthAuthentication:
         token = plugin._get_access_token()
         assert token is None
     
-    @patch('plugins.nearby_aircraft.requests.post')
+    @patch('src.plugins.http.HttpSession.post')
     def test_get_access_token_cached(self, mock_post, plugin_with_auth):
         """Test OAuth token caching."""
         mock_response = Mock()
@@ -646,7 +646,7 @@ class TestFormatting:
 class TestFetchData:
     """Test data fetching."""
     
-    @patch('plugins.nearby_aircraft.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_success(self, mock_get, plugin, sample_config, mock_opensky_states_response):
         """Test successful data fetch."""
         plugin.config = sample_config
@@ -667,7 +667,7 @@ class TestFetchData:
         assert result.data["headers"] is not None
         assert "CALLSGN" in result.data["headers"]
     
-    @patch('plugins.nearby_aircraft.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_no_aircraft(self, mock_get, plugin, sample_config, mock_opensky_empty_response):
         """Test fetch when no aircraft found."""
         plugin.config = sample_config
@@ -685,7 +685,7 @@ class TestFetchData:
         assert "headers" in result.data
         assert result.data["headers"] == "CALLSGN ALT GS SQWK"
     
-    @patch('plugins.nearby_aircraft.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_rate_limit(self, mock_get, plugin, sample_config):
         """Test handling of rate limit (429)."""
         plugin.config = sample_config
@@ -700,7 +700,7 @@ class TestFetchData:
         assert result.available is False
         assert "rate limit" in result.error.lower()
     
-    @patch('plugins.nearby_aircraft.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_rate_limit_with_cache(self, mock_get, plugin, sample_config, mock_opensky_states_response):
         """Test rate limit with cached data available."""
         plugin.config = sample_config
@@ -722,7 +722,7 @@ class TestFetchData:
         assert result2.available is True
         assert result2.data is not None
     
-    @patch('plugins.nearby_aircraft.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_filters_by_distance(self, mock_get, plugin, sample_config):
         """Test that aircraft are filtered by distance."""
         plugin.config = sample_config
@@ -756,7 +756,7 @@ class TestFetchData:
         assert result.data["aircraft_count"] == 1
         assert result.data["aircraft"][0]["call_sign"] == "CLOSE1"
     
-    @patch('plugins.nearby_aircraft.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_sorts_by_distance(self, mock_get, plugin, sample_config):
         """Test that aircraft are sorted by distance."""
         plugin.config = sample_config
@@ -790,7 +790,7 @@ class TestFetchData:
         assert result.data["aircraft"][0]["call_sign"] == "CLOSE1"
         assert result.data["aircraft"][0]["distance_km"] < result.data["aircraft"][1]["distance_km"]
     
-    @patch('plugins.nearby_aircraft.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_respects_max_aircraft(self, mock_get, plugin, sample_config):
         """Test that max_aircraft limit is respected."""
         plugin.config = {**sample_config, "max_aircraft": 2}
@@ -821,7 +821,7 @@ class TestFetchData:
 class TestFormattedDisplay:
     """Test formatted display."""
     
-    @patch('plugins.nearby_aircraft.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_get_formatted_display(self, mock_get, plugin, sample_config, mock_opensky_states_response):
         """Test formatted display generation."""
         plugin.config = sample_config
@@ -852,7 +852,7 @@ class TestFormattedDisplay:
 class TestCaching:
     """Test caching behavior."""
     
-    @patch('plugins.nearby_aircraft.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_cache_used_when_fresh(self, mock_get, plugin, sample_config, mock_opensky_states_response):
         """Test that cache is used when data is fresh."""
         plugin.config = {**sample_config, "refresh_seconds": 300}
@@ -873,7 +873,7 @@ class TestCaching:
         # Should still be 1 call (cache used)
         assert mock_get.call_count == 1
     
-    @patch('plugins.nearby_aircraft.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_cache_expired_fetches_new(self, mock_get, plugin, sample_config, mock_opensky_states_response):
         """Test that expired cache triggers new fetch."""
         plugin.config = {**sample_config, "refresh_seconds": 60}
@@ -219,7 +219,7 @@ class SportsScoresPlugin(PluginBase):
             full_url = f"{url}?d={today.strftime('%Y-%m-%d')}&s={sport_id}"
             logger.info(f"Fetching {sport_name} scores from: {full_url}")
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.http.get(url, params=params, timeout=10)
             
             if response.status_code == 429:
                 logger.warning(f"Rate limit hit for {sport_name} - API limit exceeded")
@@ -278,7 +278,7 @@ class SportsScoresPlugin(PluginBase):
                 full_url = f"{url}?d={yesterday.strftime('%Y-%m-%d')}&s={sport_id}"
                 logger.info(f"Fetching {sport_name} scores from: {full_url}")
                 
-                response = requests.get(url, params=params, timeout=10)
+                response = self.http.get(url, params=params, timeout=10)
                 if response.status_code == 200:
                     try:
                         data = response.json()
@@ -357,7 +357,7 @@ class SportsScoresPlugin(PluginBase):
                     logger.info(f"Trying day before yesterday ({day_before}) for {sport_name} to find games with scores")
                     params = {"d": day_before.strftime("%Y-%m-%d"), "s": sport_id}
                     try:
-                        response = requests.get(url, params=params, timeout=10)
+                        response = self.http.get(url, params=params, timeout=10)
                         if response.status_code == 200:
                             try:
                                 data = response.json()
@@ -404,7 +404,7 @@ class SportsScoresPlugin(PluginBase):
             url = f"{API_BASE_URL_V2}/livescore/{v2_sport}"
             headers = {"X-API-KEY": api_key}
             
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.http.get(url, headers=headers, timeout=10)
             
             if response.status_code != 200:
                 logger.debug(f"V2 livescore returned {response.status_code} for {sport_name}")
@@ -442,7 +442,7 @@ class SportsScoresPlugin(PluginBase):
             
             logger.info(f"Fetching NFL scores via league endpoint: {url}?id={nfl_league_id}")
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.http.get(url, params=params, timeout=10)
             
             if response.status_code != 200:
                 logger.warning(f"NFL league endpoint returned status {response.status_code}")
@@ -67,7 +67,7 @@ class TestSportsScoresPlugin:
         })
         assert len(errors) > 0
     
-    @patch('plugins.sports_scores.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_success_free_tier(self, mock_get, sample_manifest, sample_config, mock_api_response_nfl):
         """Test successful data fetch with free tier API key."""
         mock_response = Mock()
@@ -89,7 +89,7 @@ class TestSportsScoresPlugin:
         assert result.data["sport_count"] == 2
         assert result.data["game_count"] > 0
     
-    @patch('plugins.sports_scores.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_success_with_api_key(self, mock_get, sample_manifest, sample_config, mock_api_response_nfl):
         """Test successful data fetch with custom API key."""
         mock_response = Mock()
@@ -111,7 +111,7 @@ class TestSportsScoresPlugin:
         call_args = mock_get.call_args
         assert "custom_key_123" in call_args[0][0] or "custom_key_123" in str(call_args)
     
-    @patch('plugins.sports_scores.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_no_sports(self, mock_get, sample_manifest):
         """Test fetch with no sports selected."""
         plugin = SportsScoresPlugin(sample_manifest)
@@ -122,7 +122,7 @@ class TestSportsScoresPlugin:
         assert "sport" in result.error.lower()
         mock_get.assert_not_called()
     
-    @patch('plugins.sports_scores.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_rate_limit(self, mock_get, sample_manifest, sample_config):
         """Test handling of API rate limit (429)."""
         mock_response = Mock()
@@ -137,7 +137,7 @@ class TestSportsScoresPlugin:
         # The plugin should not crash
         assert result is not None
     
-    @patch('plugins.sports_scores.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_network_error(self, mock_get, sample_manifest, sample_config):
         """Test handling of network errors."""
         import requests
@@ -150,7 +150,7 @@ class TestSportsScoresPlugin:
         # Should handle gracefully
         assert result is not None
     
-    @patch('plugins.sports_scores.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_empty_response(self, mock_get, sample_manifest, sample_config, mock_api_response_empty):
         """Test handling of empty API response."""
         mock_response = Mock()
@@ -167,7 +167,7 @@ class TestSportsScoresPlugin:
         # Should handle empty response
         assert result is not None
     
-    @patch('plugins.sports_scores.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_no_events(self, mock_get, sample_manifest, sample_config, mock_api_response_no_events):
         """Test handling when API returns no events."""
         mock_response = Mock()
@@ -184,7 +184,7 @@ class TestSportsScoresPlugin:
         assert result.available is False
         assert "no games" in result.error.lower() or "no events" in result.error.lower()
     
-    @patch('plugins.sports_scores.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_multiple_sports(self, mock_get, sample_manifest, sample_config, mock_api_response_nfl, mock_api_response_nba):
         """Test fetching data for multiple sports."""
         # Return different responses for different sports
@@ -215,7 +215,7 @@ class TestSportsScoresPlugin:
         assert result.data["game_count"] > 0
         assert len(result.data["games"]) > 0
     
-    @patch('plugins.sports_scores.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_parse_event_with_scores(self, mock_get, sample_manifest, sample_config, mock_api_response_nfl):
         """Test parsing event with scores."""
         mock_response = Mock()
@@ -242,7 +242,7 @@ class TestSportsScoresPlugin:
         assert first_game["score1"] >= 0
         assert first_game["score2"] >= 0
     
-    @patch('plugins.sports_scores.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_parse_event_scheduled_game(self, mock_get, sample_manifest, sample_config):
         """Test parsing scheduled game (no scores yet)."""
         mock_response = Mock()
@@ -276,7 +276,7 @@ class TestSportsScoresPlugin:
             assert game["score1"] == 0 or game["score1"] is not None
             assert game["score2"] == 0 or game["score2"] is not None
     
-    @patch('plugins.sports_scores.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_max_games_per_sport_limit(self, mock_get, sample_manifest, sample_config):
         """Test that max_games_per_sport limit is respected."""
         # Create response with many events
@@ -317,7 +317,7 @@ class TestSportsScoresPlugin:
     
     def test_get_formatted_display(self, sample_manifest, sample_config):
         """Test get_formatted_display method."""
-        with patch('plugins.sports_scores.requests.get') as mock_get:
+        with patch('src.plugins.http.HttpSession.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -367,7 +367,7 @@ class TestSportsScoresPlugin:
         
         declared_simple = manifest["variables"]["simple"]
         
-        with patch('plugins.sports_scores.requests.get') as mock_get:
+        with patch('src.plugins.http.HttpSession.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -400,7 +400,7 @@ class TestSportsScoresPlugin:
 class TestPluginEdgeCases:
     """Tests for edge cases and error handling."""
     
-    @patch('plugins.sports_scores.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_malformed_response_handling(self, mock_get, sample_manifest, sample_config):
         """Test handling of malformed API responses."""
         mock_response = Mock()
@@ -417,7 +417,7 @@ class TestPluginEdgeCases:
         # Should handle gracefully
         assert result is not None
     
-    @patch('plugins.sports_scores.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_timeout_handling(self, mock_get, sample_manifest, sample_config):
         """Test handling of request timeouts."""
         import requests
@@ -430,7 +430,7 @@ class TestPluginEdgeCases:
         # Should handle gracefully
         assert result is not None
     
-    @patch('plugins.sports_scores.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_event_missing_teams(self, mock_get, sample_manifest, sample_config):
         """Test handling of events with missing team names."""
         mock_response = Mock()
@@ -460,7 +460,7 @@ class TestPluginEdgeCases:
         # Should skip invalid events
         assert result is not None
     
-    @patch('plugins.sports_scores.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_color_variables_winning_team(self, mock_get, sample_manifest, sample_config):
         """Test that team1_color and team2_color return correct color codes for winning/losing teams."""
         mock_response = Mock()
@@ -497,7 +497,7 @@ class TestPluginEdgeCases:
         # Team 2 (away) is losing, so team2_color should be RED {63}
         assert game["team2_color"] == "{63}"
     
-    @patch('plugins.sports_scores.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_color_variables_losing_team(self, mock_get, sample_manifest, sample_config):
         """Test that team1_color and team2_color return correct color codes when team1 is losing."""
         mock_response = Mock()
@@ -532,7 +532,7 @@ class TestPluginEdgeCases:
         # Team 2 is winning, so team2_color should be GREEN {66}
         assert game["team2_color"] == "{66}"
     
-    @patch('plugins.sports_scores.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_color_variables_tied_game(self, mock_get, sample_manifest, sample_config):
         """Test that team1_color and team2_color return YELLOW for tied games."""
         mock_response = Mock()
@@ -566,7 +566,7 @@ class TestPluginEdgeCases:
         assert game["team1_color"] == "{65}"
         assert game["team2_color"] == "{65}"
     
-    @patch('plugins.sports_scores.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_color_variables_no_scores(self, mock_get, sample_manifest, sample_config):
         """Test that team1_color and team2_color return BLUE when no scores are available."""
         mock_response = Mock()
@@ -657,7 +657,7 @@ class TestPluginEdgeCases:
         assert "? - ?" in formatted
         assert formatted.count("?") >= 2  # Should have at least 2 question marks
     
-    @patch('plugins.sports_scores.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_formatted_string_includes_color_variables(self, mock_get, sample_manifest, sample_config):
         """Test that games include both formatted string and color variables."""
         mock_response = Mock()
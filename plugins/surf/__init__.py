@@ -5,7 +5,6 @@ Displays surf conditions using Open-Meteo Marine API.
 
 from typing import Any, Dict, List, Optional
 import logging
-import requests
 
 from src.plugins.base import PluginBase, PluginResult
 
@@ -68,7 +67,7 @@ class SurfPlugin(PluginBase):
         }
         
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.http.get(url, params=params, timeout=10)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -90,7 +89,7 @@ class SurfPlugin(PluginBase):
         }
         
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.http.get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             current = data.get("current", {})
@@ -5,7 +5,6 @@ Displays commute times using Google Routes API.
 
 from typing import Any, Dict, List, Optional, Tuple
 import logging
-import requests
 
 from src.plugins.base import PluginBase, PluginResult
 
@@ -15,16 +14,23 @@ logger = logging.getLogger(__name__)
 class TrafficPlugin(PluginBase):
     """Traffic and commute time plugin.
     
-    Fetches route times from Google Routes API.
+    Fetches route times from Google Routes API. Routes are written through
+    to the shared traffic cache, which snapshots them to disk; the first
+    fetch after a restart serves the snapshot's routes (refreshing them in
+    the background) instead of waiting on the API.
     """
     
     TRAFFIC_INDEX_YELLOW = 1.2
     TRAFFIC_INDEX_RED = 1.5
     
+    TRAVEL_MODE = "DRIVE"
+    PROVIDER = "google"
+    
     def __init__(self, manifest: Dict[str, Any]):
         """Initialize the traffic plugin."""
         super().__init__(manifest)
         self._cache: Optional[Dict[str, Any]] = None
+        self._traffic_cache = None
     
     @property
     def plugin_id(self) -> str:
@@ -76,8 +82,49 @@ class TrafficPlugin(PluginBase):
                     pass
         return {"address": location}
     
-    def _fetch_single_route(self, origin: str, destination: str, destination_name: str) -> Optional[Dict]:
-        """Fetch traffic data for a single route."""
+    def _get_traffic_cache(self):
+        """Get or initialize the traffic cache."""
+        if self._traffic_cache is not None:
+            return self._traffic_cache
+        
+        try:
+            from src.data_sources.traffic_cache import get_traffic_cache
+            cache = get_traffic_cache()
+            cache.configure(ttl=self.config.get("refresh_seconds", 300), enabled=True)
+            if not cache.get_status()["thread_alive"]:
+                cache.start()
+            self._traffic_cache = cache
+            return cache
+        except Exception as e:
+            logger.error(f"Failed to initialize traffic cache: {e}")
+            return None
+    
+    def _get_route_durations(self, origin: str, destination: str) -> Optional[Dict[str, int]]:
+        """Get a route's durations, keeping the traffic cache up to date."""
+        def fetch() -> Optional[Dict[str, int]]:
+            return self._request_route_durations(origin, destination)
+        
+        cache = self._get_traffic_cache()
+        if cache is None:
+            return fetch()
+        if self.cached_result is None:
+            # First fetch since startup: the route restored from the
+            # snapshot is served while it's refreshed in the background
+            return cache.get_or_fetch(origin, destination, self.TRAVEL_MODE, self.PROVIDER, fetch)
+        
+        # Later fetches are already paced by refresh_seconds; fetch now so
+        # the board doesn't lag a refresh behind, and save for the next start
+        durations = fetch()
+        if durations is not None:
+            cache.set(origin, destination, self.TRAVEL_MODE, self.PROVIDER, durations)
+        return durations
+    
+    def _request_route_durations(self, origin: str, destination: str) -> Optional[Dict[str, int]]:
+        """Request a route from the Google Routes API.
+        
+        Returns:
+            Dict with duration and static_duration in seconds, or None on failure
+        """
         api_key = self.config.get("api_key")
         
         url = "https://routes.googleapis.com/directions/v2:computeRoutes"
@@ -90,12 +137,12 @@ class TrafficPlugin(PluginBase):
         body = {
             "origin": self._build_waypoint(origin),
             "destination": self._build_waypoint(destination),
-            "travelMode": "DRIVE",
+            "travelMode": self.TRAVEL_MODE,
             "routingPreference": "TRAFFIC_AWARE_OPTIMAL",
         }
         
         try:
-            response = requests.post(url, json=body, headers=headers, timeout=10)
+            response = self.http.post(url, json=body, headers=headers, timeout=10)
             
             if response.status_code != 200:
                 logger.error(f"Google Routes API error: {response.status_code}")
@@ -106,8 +153,23 @@ class TrafficPlugin(PluginBase):
                 return None
             
             route = data["routes"][0]
-            duration = self._parse_duration(route.get("duration", "0s"))
-            static_duration = self._parse_duration(route.get("staticDuration", "0s"))
+            return {
+                "duration": self._parse_duration(route.get("duration", "0s")),
+                "static_duration": self._parse_duration(route.get("staticDuration", "0s")),
+            }
+        except Exception as e:
+            logger.error(f"Error fetching traffic from {origin} to {destination}: {e}")
+            return None
+    
+    def _fetch_single_route(self, origin: str, destination: str, destination_name: str) -> Optional[Dict]:
+        """Fetch traffic data for a single route."""
+        try:
+            durations = self._get_route_durations(origin, destination)
+            if not durations:
+                return None
+            
+            duration = durations["duration"]
+            static_duration = durations["static_duration"]
             
             if static_duration == 0:
                 static_duration = duration
@@ -189,6 +251,10 @@ class TrafficPlugin(PluginBase):
         self._cache = data
         return PluginResult(available=True, data=data)
     
+    def on_config_change(self, old_config: Dict[str, Any], new_config: Dict[str, Any]) -> None:
+        """Reconfigure the traffic cache's TTL on the next fetch."""
+        self._traffic_cache = None
+    
     def get_formatted_display(self) -> Optional[List[str]]:
         """Return default formatted display."""
         if not self._cache:
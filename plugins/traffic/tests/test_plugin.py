@@ -279,7 +279,7 @@ class TestTrafficSource:
         assert "location" in waypoint
         assert waypoint["location"]["latLng"]["latitude"] == 37.7749
     
-    @patch('src.data_sources.traffic.requests.post')
+    @patch('src.plugins.http.HttpSession.post')
     def test_fetch_traffic_data_success(self, mock_post):
         """Test successful traffic data fetch."""
         mock_response = Mock()
@@ -315,7 +315,7 @@ class TestTrafficSource:
         assert result["delay_minutes"] == 15
         assert result["formatted_message"] == "WORK: 45m (+15m delay)"
     
-    @patch('src.data_sources.traffic.requests.post')
+    @patch('src.plugins.http.HttpSession.post')
     def test_fetch_traffic_data_no_delay(self, mock_post):
         """Test traffic data with no delay."""
         mock_response = Mock()
@@ -337,7 +337,7 @@ class TestTrafficSource:
         assert result["delay_minutes"] == 0
         assert result["formatted_message"] == "DOWNTOWN: 30m"
     
-    @patch('src.data_sources.traffic.requests.post')
+    @patch('src.plugins.http.HttpSession.post')
     def test_fetch_traffic_data_heavy_traffic(self, mock_post):
         """Test traffic data with heavy traffic."""
         mock_response = Mock()
@@ -359,7 +359,7 @@ class TestTrafficSource:
         assert result["traffic_color"] == "RED"
         assert result["delay_minutes"] == 30
     
-    @patch('src.data_sources.traffic.requests.post')
+    @patch('src.plugins.http.HttpSession.post')
     def test_fetch_traffic_data_api_error(self, mock_post):
         """Test handling of API errors."""
         mock_post.side_effect = Exception("Network error")
@@ -369,7 +369,7 @@ class TestTrafficSource:
         
         assert result is None
     
-    @patch('src.data_sources.traffic.requests.post')
+    @patch('src.plugins.http.HttpSession.post')
     def test_fetch_traffic_data_no_routes(self, mock_post):
         """Test handling of empty routes response."""
         mock_response = Mock()
@@ -382,7 +382,7 @@ class TestTrafficSource:
         
         assert result is None
     
-    @patch('src.data_sources.traffic.requests.post')
+    @patch('src.plugins.http.HttpSession.post')
     def test_fetch_traffic_data_missing_static_duration(self, mock_post):
         """Test handling when staticDuration is missing (uses duration as fallback)."""
         mock_response = Mock()
@@ -475,3 +475,76 @@ class TestTrafficIndexEdgeCases:
             duration_normal=1800
         )
         assert index == 1.03  # Rounded to 2 decimals
+
+
+class TestTrafficPluginCache:
+    """Tests for the traffic plugin's use of the shared traffic cache."""
+    
+    @pytest.fixture(autouse=True)
+    def traffic_cache(self, tmp_path, monkeypatch):
+        """Fresh TrafficCache singleton snapshotting into a temp directory."""
+        import src.data_sources.traffic_cache as traffic_cache_module
+        from src.data_sources.traffic_cache import TrafficCache
+        
+        monkeypatch.setattr(traffic_cache_module, "DEFAULT_SNAPSHOT_DIR", tmp_path)
+        TrafficCache._instance = None
+        traffic_cache_module._cache_instance = None
+        cache = traffic_cache_module.get_traffic_cache()
+        yield cache
+        cache.stop()
+        TrafficCache._instance = None
+        traffic_cache_module._cache_instance = None
+    
+    @pytest.fixture
+    def plugin(self):
+        """Traffic plugin with one configured route."""
+        from plugins.traffic import TrafficPlugin
+        plugin = TrafficPlugin({"id": "traffic"})
+        plugin._config = {
+            "api_key": "test_key",
+            "refresh_seconds": 300,
+            "routes": [{"origin": "Home", "destination": "Work", "destination_name": "WORK"}],
+        }
+        return plugin
+    
+    @staticmethod
+    def _response(duration, static_duration):
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {
+            "routes": [{"duration": f"{duration}s", "staticDuration": f"{static_duration}s"}]
+        }
+        return response
+    
+    @patch('src.plugins.http.HttpSession.post')
+    def test_routes_are_written_through(self, mock_post, plugin, traffic_cache):
+        """Test fetched routes are saved to the cache and later fetches hit the API."""
+        mock_post.return_value = self._response(2700, 1800)
+        first = plugin.fetch_data_cached()
+        
+        assert first.data["formatted"] == "WORK: 45m (+15m)"
+        assert traffic_cache.get("Home", "Work", "DRIVE", "google") == {"duration": 2700, "static_duration": 1800}
+        
+        mock_post.return_value = self._response(1800, 1800)
+        plugin.refresh_cache()
+        
+        assert mock_post.call_count == 2
+        assert traffic_cache.get("Home", "Work", "DRIVE", "google")["duration"] == 1800
+    
+    @patch('src.plugins.http.HttpSession.post')
+    def test_first_fetch_serves_restored_route(self, mock_post, plugin, traffic_cache):
+        """Test the first fetch after a restart uses the cached route without waiting on the API."""
+        import time
+        traffic_cache.set("Home", "Work", "DRIVE", "google", {"duration": 2400, "static_duration": 1800})
+        route_key = traffic_cache._make_route_key("Home", "Work", "DRIVE", "google")
+        traffic_cache._cache[route_key].cached_at -= 400  # Past the TTL, as after a restart
+        mock_post.return_value = self._response(1800, 1800)
+        
+        result = plugin.fetch_data()
+        
+        assert result.data["formatted"] == "WORK: 40m (+10m)"
+        deadline = time.monotonic() + 2
+        while traffic_cache.get("Home", "Work", "DRIVE", "google") is None:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert mock_post.call_count == 1
@@ -9,6 +9,8 @@ import re
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 
+from src.plugins.http import get_http_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -107,7 +109,7 @@ class WeatherSource:
         
         try:
             # Fetch current weather
-            current_response = requests.get(current_url, params=current_params, timeout=10)
+            current_response = get_http_session().get(current_url, params=current_params, timeout=10)
             current_response.raise_for_status()
             current_data = current_response.json()
             
@@ -136,7 +138,7 @@ class WeatherSource:
             
             # Try to fetch forecast data (non-blocking if it fails)
             try:
-                forecast_response = requests.get(forecast_url, params=forecast_params, timeout=10)
+                forecast_response = get_http_session().get(forecast_url, params=forecast_params, timeout=10)
                 forecast_response.raise_for_status()
                 forecast_data = forecast_response.json()
                 
@@ -239,7 +241,7 @@ class WeatherSource:
         
         try:
             # Fetch current weather
-            current_response = requests.get(current_url, params=current_params, timeout=10)
+            current_response = get_http_session().get(current_url, params=current_params, timeout=10)
             current_response.raise_for_status()
             current_data = current_response.json()
             
@@ -277,7 +279,7 @@ class WeatherSource:
                     "cnt": 8  # Get next 8 periods (24 hours)
                 }
                 
-                forecast_response = requests.get(forecast_url, params=forecast_params, timeout=10)
+                forecast_response = get_http_session().get(forecast_url, params=forecast_params, timeout=10)
                 forecast_response.raise_for_status()
                 forecast_data = forecast_response.json()
                 
@@ -37,7 +37,7 @@ class TestWeatherSource:
         )
         assert source.provider == "openweathermap"
     
-    @patch('requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_weather_success(self, mock_get):
         """Test successful weather data fetch."""
         mock_response = Mock()
@@ -69,7 +69,7 @@ class TestWeatherSource:
         assert isinstance(result, dict)
         assert result["temperature"] == 72
     
-    @patch('requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_weather_api_error(self, mock_get):
         """Test handling of API errors."""
         mock_get.side_effect = Exception("Network error")
@@ -84,7 +84,7 @@ class TestWeatherSource:
         # Should return None on error
         assert result is None
     
-    @patch('requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_weather_invalid_location(self, mock_get):
         """Test handling of invalid location."""
         mock_response = Mock()
@@ -189,7 +189,7 @@ class TestWeatherMultipleLocations:
         for name in names:
             assert len(name) <= max_name_length
     
-    @patch('requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_multiple_locations(self, mock_get):
         """Test fetching weather for multiple locations."""
         mock_response = Mock()
@@ -245,7 +245,7 @@ class TestWeatherEdgeCases:
         for wind in high_winds:
             assert wind >= 0
     
-    @patch('requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_empty_response(self, mock_get):
         """Test handling of empty API response."""
         mock_response = Mock()
@@ -263,7 +263,7 @@ class TestWeatherEdgeCases:
         # Should handle gracefully - returns None or dict
         assert result is None or isinstance(result, dict)
     
-    @patch('requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_timeout_handling(self, mock_get):
         """Test handling of request timeout."""
         from requests.exceptions import Timeout
@@ -322,7 +322,7 @@ class TestWeatherPlugin:
         assert result.available is False
         assert result.error is not None
     
-    @patch('requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_fetch_data_success(self, mock_get, weather_manifest):
         """Test fetch_data with valid config."""
         mock_response = Mock()
@@ -374,7 +374,7 @@ class TestWeatherForecastData:
             "max_lengths": {}
         }
     
-    @patch('requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_weatherapi_forecast_data(self, mock_get):
         """Test fetching forecast data from WeatherAPI."""
         # Mock current weather response
@@ -436,7 +436,7 @@ class TestWeatherForecastData:
         assert "high_temp_c" in result
         assert "low_temp_c" in result
     
-    @patch('requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_weatherapi_forecast_fallback(self, mock_get):
         """Test that current weather still works if forecast fails."""
         # Mock current weather response
@@ -475,7 +475,7 @@ class TestWeatherForecastData:
         # Forecast fields may be None
         assert "high_temp" in result or result.get("high_temp") is None
     
-    @patch('requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_openweathermap_forecast_data(self, mock_get):
         """Test fetching forecast data from OpenWeatherMap."""
         from datetime import datetime, timezone
@@ -551,7 +551,7 @@ class TestWeatherForecastData:
         assert source._format_sunset_time("12:00 PM") == "12:00 PM"
         assert source._format_sunset_time("00:00") == "12:00 AM"
     
-    @patch('requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_plugin_includes_forecast_fields(self, mock_get, weather_manifest):
         """Test that plugin includes new forecast fields in data."""
         # Mock current weather response
@@ -614,7 +614,7 @@ class TestWeatherForecastData:
         assert result.data["uv_index"] == 10
         assert result.data["precipitation_chance"] == 0
     
-    @patch('requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_temperature_rounding(self, mock_get):
         """Test that temperatures are rounded to whole numbers."""
         current_response = Mock()
@@ -668,7 +668,7 @@ class TestWeatherForecastData:
         assert result["uv_index"] == 4  # 3.8 rounded (forecast UV is higher than 2.1)
         assert isinstance(result["uv_index"], int)
     
-    @patch('requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_celsius_conversion(self, mock_get):
         """Test Celsius temperature conversion."""
         current_response = Mock()
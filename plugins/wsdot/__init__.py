@@ -155,7 +155,7 @@ class WsdotPlugin(PluginBase):
         p["apiaccesscode"] = code
         headers = {"Accept": "application/json"}
         try:
-            r = requests.get(url, params=p, headers=headers, timeout=REQUEST_TIMEOUT)
+            r = self.http.get(url, params=p, headers=headers, timeout=REQUEST_TIMEOUT)
             r.raise_for_status()
             return r.json()
         except (requests.RequestException, ValueError) as e:
@@ -85,7 +85,7 @@ class TestWsdotFetchData:
         assert result.available is False
         assert "route" in (result.error or "").lower()
 
-    @patch("plugins.wsdot.requests.get")
+    @patch("src.plugins.http.HttpSession.get")
     def test_fetch_data_success(self, mock_get):
         def get_side_effect(url, params=None, **kwargs):
             if "scheduletoday" in url:
@@ -137,7 +137,7 @@ class TestWsdotFetchData:
         assert result.formatted_lines is not None
         assert len(result.formatted_lines) <= 6
 
-    @patch("plugins.wsdot.requests.get")
+    @patch("src.plugins.http.HttpSession.get")
     def test_fetch_data_api_error(self, mock_get):
         mock_get.side_effect = Exception("Network error")
 
@@ -148,7 +148,7 @@ class TestWsdotFetchData:
         assert result.available is False
         assert result.error is not None
 
-    @patch("plugins.wsdot.requests.get")
+    @patch("src.plugins.http.HttpSession.get")
     def test_fetch_data_partial_success(self, mock_get):
         """When one route fails (404), others can still be returned."""
         def get_side_effect(url, params=None, **kwargs):
@@ -190,7 +190,7 @@ class TestWsdotFetchData:
 class TestWsdotDataVariables:
     """Test that returned data matches manifest variables."""
 
-    @patch("plugins.wsdot.requests.get")
+    @patch("src.plugins.http.HttpSession.get")
     def test_variables_match_manifest(self, mock_get):
         def get_side_effect(url, params=None, **kwargs):
             if "scheduletoday" in url:
@@ -339,7 +339,7 @@ class TestGetDriveUpSpace:
 class TestScheduleTerminalCombosAndSpots:
     """Test schedule with TerminalCombos and spots from terminalsailingspace."""
 
-    @patch("plugins.wsdot.requests.get")
+    @patch("src.plugins.http.HttpSession.get")
     def test_formatted_line_has_dash_when_no_spots_for_route(self, mock_get):
         """When terminalsailingspace has no data for a route, formatted line still shows '--' for spots."""
         def get_side_effect(url, params=None, **kwargs):
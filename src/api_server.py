@@ -1,5 +1,6 @@
 """REST API server for FiestaBoard Display Service."""
 
+import asyncio
 import logging
 import logging.handlers
 import threading
@@ -33,6 +34,9 @@ from .schedules.service import get_schedule_service
 from .schedules.models import ScheduleCreate, ScheduleUpdate
 from .templates.engine import get_template_engine, reset_template_engine
 from .text_to_board import text_to_board_array
+from .board_frame import Frame
+from .log_store import get_log_store
+from .persistence import flush_all as flush_pending_writes
 
 logger = logging.getLogger(__name__)
 
@@ -140,81 +144,23 @@ def _read_logs_from_files(
     """
     Read logs from log files with filtering and pagination.
     
+    The in-memory buffer (most recent) comes first, then the files newest-first.
+    Files are read through an incremental index (see log_store), so only new
+    lines and the returned page are parsed.
+    
     Returns: (logs, total_matching, has_more)
     """
-    all_logs = []
-    
-    # Read from current log file and backups
-    log_files = [LOG_FILE]
-    for i in range(1, LOG_BACKUP_COUNT + 1):
-        backup_file = Path(f"{LOG_FILE}.{i}")
-        if backup_file.exists():
-            log_files.append(backup_file)
-    
-    # Read all log entries from files (newest first)
-    for log_file in log_files:
-        if not log_file.exists():
-            continue
-        try:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                for line in reversed(lines):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        entry = json.loads(line)
-                        all_logs.append(entry)
-                    except json.JSONDecodeError:
-                        continue
-        except Exception:
-            continue
-    
-    # Also include in-memory buffer (most recent)
     with _log_lock:
         memory_logs = list(_log_buffer)
     
-    # Merge: memory logs are most recent, then file logs
-    # Deduplicate by timestamp + message
-    seen = set()
-    merged_logs = []
-    
-    for log in reversed(memory_logs):
-        key = (log.get('timestamp'), log.get('message'))
-        if key not in seen:
-            seen.add(key)
-            merged_logs.append(log)
-    
-    for log in all_logs:
-        key = (log.get('timestamp'), log.get('message'))
-        if key not in seen:
-            seen.add(key)
-            merged_logs.append(log)
-    
-    # Apply filters
-    filtered_logs = merged_logs
-    
-    if level:
-        level_upper = level.upper()
-        filtered_logs = [log for log in filtered_logs if log.get('level') == level_upper]
-    
-    if search:
-        search_lower = search.lower()
-        filtered_logs = [
-            log for log in filtered_logs
-            if search_lower in log.get('message', '').lower() or
-               search_lower in log.get('logger', '').lower()
-        ]
-    
-    total_matching = len(filtered_logs)
-    
-    # Apply pagination
-    start = offset
-    end = offset + limit
-    paginated = filtered_logs[start:end]
-    has_more = end < total_matching
-    
-    return paginated, total_matching, has_more
+    store = get_log_store(LOG_FILE, LOG_BACKUP_COUNT)
+    return store.query(
+        limit=limit,
+        offset=offset,
+        level=level,
+        search=search,
+        recent=memory_logs,
+    )
 
 
 class MessageRequest(BaseModel):
@@ -244,6 +190,9 @@ class VersionResponse(BaseModel):
 
 
 # Create FastAPI app
+# Routes that block (outbound HTTP, board sends, page renders, file reads)
+# are declared with plain `def` so FastAPI runs them in its threadpool.
+# Only non-blocking routes are `async def`, since those run on the event loop.
 app = FastAPI(
     title="FiestaBoard Display API",
     description="REST API for controlling and monitoring the FiestaBoard Display Service",
@@ -333,7 +282,7 @@ async def startup_event():
             logger.info("Auto-starting background service...")
             _service_thread = threading.Thread(target=run_service_background, daemon=True)
             _service_thread.start()
-            time.sleep(0.5)  # Give it a moment to start
+            await asyncio.sleep(0.5)  # Give it a moment to start
             
             # Check if it actually started
             if _service_running:
@@ -355,6 +304,8 @@ async def shutdown_event():
     _service_running = False
     if _service:
         _service.running = False
+    # Write out debounced page/schedule/settings saves
+    flush_pending_writes()
 
 
 @app.get("/", response_model=Dict[str, str])
@@ -394,7 +345,7 @@ async def version():
 
 
 @app.get("/logs")
-async def get_logs(
+def get_logs(
     limit: int = Query(default=50, ge=1, le=500, description="Number of log entries to return"),
     offset: int = Query(default=0, ge=0, description="Offset for pagination"),
     level: Optional[str] = Query(default=None, description="Filter by log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)"),
@@ -462,7 +413,7 @@ async def get_status():
 
 
 @app.post("/start")
-async def start_service(background_tasks: BackgroundTasks):
+def start_service(background_tasks: BackgroundTasks):
     """Start the background service."""
     global _service_thread, _service_running, _service
     
@@ -513,7 +464,7 @@ async def stop_service():
 
 
 @app.post("/refresh")
-async def refresh_display():
+def refresh_display():
     """Manually trigger a display refresh."""
     global _dev_mode
     service = get_service()
@@ -535,7 +486,7 @@ async def refresh_display():
 
 
 @app.post("/send-message")
-async def send_message(request: MessageRequest):
+def send_message(request: MessageRequest):
     """Send a custom message to the board."""
     global _dev_mode
     service = get_service()
@@ -593,7 +544,7 @@ async def get_config():
 
 
 @app.post("/send-welcome-message")
-async def send_welcome_message():
+def send_welcome_message():
     """
     Send a colorful welcome message to the board.
     
@@ -715,7 +666,7 @@ async def get_board_config_compat():
 
 
 @app.put("/config/board")
-async def update_board_config(request: dict):
+def update_board_config(request: dict):
     """
     Update board configuration.
     
@@ -751,9 +702,9 @@ async def update_board_config(request: dict):
 
 # Backward compatibility endpoint
 @app.put("/config/board")
-async def update_board_config_compat(request: dict):
+def update_board_config_compat(request: dict):
     """Backward compatibility endpoint. Use /config/board instead."""
-    return await update_board_config(request)
+    return update_board_config(request)
 
 
 @app.get("/config/validate")
@@ -804,7 +755,7 @@ class BoardTestRequest(BaseModel):
 
 
 @app.post("/config/board/test")
-async def test_board_connection(request: BoardTestRequest):
+def test_board_connection(request: BoardTestRequest):
     """
     Test board connection with provided credentials without saving.
     
@@ -924,7 +875,7 @@ class EnablementTokenRequest(BaseModel):
 
 
 @app.post("/config/board/enable-local-api")
-async def enable_local_api(request: EnablementTokenRequest):
+def enable_local_api(request: EnablementTokenRequest):
     """
     Exchange a Local API Enablement Token for a Local API Key.
     
@@ -1040,6 +991,10 @@ async def update_general_config(request: dict):
     - timezone: IANA timezone name (e.g., "America/Los_Angeles")
     - refresh_interval_seconds: Refresh interval in seconds
     - output_target: Output target ("ui", "board", or "both")
+    - plugin_fetch_workers: Max plugins fetched concurrently (<= 1 fetches sequentially)
+    - plugin_fetch_timeout_seconds: Per-plugin fetch deadline
+    - render_deadline_seconds: Overall plugin fetch deadline per render
+    - plugin_prefetch_enabled: Refresh plugin data in the background (applies on service restart)
     """
     config_manager = get_config_manager()
     
@@ -1053,6 +1008,14 @@ async def update_general_config(request: dict):
         general_config["refresh_interval_seconds"] = request["refresh_interval_seconds"]
     if "output_target" in request:
         general_config["output_target"] = request["output_target"]
+    for key in (
+        "plugin_fetch_workers",
+        "plugin_fetch_timeout_seconds",
+        "render_deadline_seconds",
+        "plugin_prefetch_enabled",
+    ):
+        if key in request:
+            general_config[key] = request[key]
     
     # Save back
     success = config_manager.set_general(general_config)
@@ -1136,7 +1099,7 @@ async def list_displays():
 
 
 @app.get("/displays/{display_type}")
-async def get_display(display_type: str):
+def get_display(display_type: str):
     """
     Get formatted output for a specific display type.
     
@@ -1167,7 +1130,7 @@ async def get_display(display_type: str):
 
 
 @app.get("/displays/{display_type}/raw")
-async def get_display_raw(display_type: str):
+def get_display_raw(display_type: str):
     """
     Get raw data from a display source (before formatting).
     
@@ -1195,7 +1158,7 @@ async def get_display_raw(display_type: str):
 
 
 @app.post("/displays/raw/batch")
-async def get_displays_raw_batch(request: dict):
+def get_displays_raw_batch(request: dict):
     """
     Get raw data from multiple display sources in one request.
     
@@ -1234,9 +1197,16 @@ async def get_displays_raw_batch(request: dict):
     display_service = get_display_service()
     results = {}
     
+    # Fetch all requested plugins concurrently
+    try:
+        fetched = display_service.get_displays(display_types)
+    except Exception as e:
+        logger.error(f"Error fetching displays {display_types}: {e}", exc_info=True)
+        fetched = {}
+    
     for display_type in display_types:
         try:
-            result = display_service.get_display(display_type)
+            result = fetched.get(display_type) or display_service.get_display(display_type)
             
             # Skip if enabled_only is true and plugin is not available
             if enabled_only and not result.available:
@@ -1263,7 +1233,7 @@ async def get_displays_raw_batch(request: dict):
 
 
 @app.post("/displays/{display_type}/send")
-async def send_display(
+def send_display(
     display_type: str,
     target: Optional[str] = None
 ):
@@ -1315,7 +1285,7 @@ async def send_display(
     if send_to_board and not _dev_mode:
         transition = settings_service.get_transition_settings()
         # Convert to board array for proper character/color support
-        board_array = text_to_board_array(result.formatted)
+        board_array = result.to_board_array()
         success, was_sent = service.vb_client.send_characters(
             board_array,
             strategy=transition.strategy,
@@ -1341,7 +1311,7 @@ async def send_display(
 # =============================================================================
 
 @app.get("/baywheels/stations")
-async def list_all_baywheels_stations():
+def list_all_baywheels_stations():
     """
     List all Bay Wheels stations with current status.
     
@@ -1402,7 +1372,7 @@ async def list_all_baywheels_stations():
 
 
 @app.get("/baywheels/stations/nearby")
-async def find_nearby_baywheels_stations(
+def find_nearby_baywheels_stations(
     lat: float = Query(..., description="Latitude"),
     lng: float = Query(..., description="Longitude"),
     radius: float = Query(2.0, description="Search radius in kilometers"),
@@ -1468,7 +1438,7 @@ async def find_nearby_baywheels_stations(
 
 
 @app.get("/baywheels/stations/search")
-async def search_baywheels_stations_by_address(
+def search_baywheels_stations_by_address(
     address: str = Query(..., description="Address to search near"),
     radius: float = Query(2.0, description="Search radius in kilometers"),
     limit: int = Query(10, description="Maximum number of results")
@@ -1567,103 +1537,60 @@ async def search_baywheels_stations_by_address(
 # =============================================================================
 
 @app.get("/muni/stops")
-async def list_all_muni_stops():
+def list_all_muni_stops():
     """
     List all SF Muni stops with metadata.
     
-    Returns all stops from the 511.org transit API with cached data (24hr TTL).
+    Returns all stops from the 511.org transit API. The stop catalog is kept
+    on disk (data/catalogs/) and refreshed conditionally every 24 hours.
     """
-    import requests
-    import time
-    
-    # Cache for stop information (24 hour TTL)
-    cache_key = "_muni_stops_cache"
-    cache_time_key = "_muni_stops_cache_time"
-    CACHE_TTL = 24 * 60 * 60  # 24 hours
-    
-    # Check if we have cached data
-    if not hasattr(list_all_muni_stops, cache_key):
-        setattr(list_all_muni_stops, cache_key, None)
-        setattr(list_all_muni_stops, cache_time_key, 0)
-    
-    cached_data = getattr(list_all_muni_stops, cache_key)
-    cache_time = getattr(list_all_muni_stops, cache_time_key)
-    current_time = time.time()
-    
-    # Return cached data if still valid
-    if cached_data and (current_time - cache_time) < CACHE_TTL:
-        return cached_data
+    from src.config import Config
+    from src.data_sources.muni import get_muni_stop_catalog
     
+    catalog = get_muni_stop_catalog()
     try:
-        # Fetch stops from 511.org
-        # Note: 511.org requires an API key for most endpoints
-        # We'll use the configured MUNI API key
-        from src.config import Config
-        api_key = Config.MUNI_API_KEY
-        
-        if not api_key:
-            raise HTTPException(status_code=400, detail="MUNI API key not configured")
-        
-        url = "http://api.511.org/transit/stops"
-        params = {
-            "api_key": api_key,
-            "operator_id": "SF",
-            "format": "json"
-        }
+        # 511.org requires an API key; without one only a stored catalog can be served
+        if not Config.MUNI_API_KEY:
+            cached = catalog.peek()
+            if cached is None:
+                raise HTTPException(status_code=400, detail="MUNI API key not configured")
+            return cached
         
-        response = requests.get(url, params=params, timeout=15)
-        response.raise_for_status()
-        
-        # Handle BOM if present
-        content = response.text
-        if content.startswith('\ufeff'):
-            content = content[1:]
-        
-        import json
-        data = json.loads(content)
-        
-        # Parse stops from the Contents.dataObjects.ScheduledStopPoint array
-        stops = []
-        stop_points = data.get("Contents", {}).get("dataObjects", {}).get("ScheduledStopPoint", [])
-        
-        for stop in stop_points:
-            stop_id = stop.get("id", "")
-            # Extract numeric stop code from ID (format: "SF_####")
-            stop_code = stop_id.split("_")[-1] if "_" in stop_id else stop_id
-            
-            location = stop.get("Location", {})
-            lat = location.get("Latitude")
-            lon = location.get("Longitude")
-            
-            # Get stop name
-            name = stop.get("Name", stop_code)
-            
-            stops.append({
-                "stop_code": stop_code,
-                "stop_id": stop_id,
-                "name": name,
-                "lat": float(lat) if lat else None,
-                "lon": float(lon) if lon else None,
-            })
-        
-        result = {
-            "stops": stops,
-            "total": len(stops)
-        }
-        
-        # Update cache
-        setattr(list_all_muni_stops, cache_key, result)
-        setattr(list_all_muni_stops, cache_time_key, current_time)
-        
-        return result
+        return catalog.get()
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error listing Muni stops: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Spatial index over the Muni stop catalog (rebuilt when the catalog reloads)
+_muni_stop_index = None
+
+
+def _get_muni_stop_index():
+    """Get the spatial index over the cached Muni stop catalog.
+    
+    Built once per catalog load, so nearby searches only measure stops in
+    grid cells around the search location.
+    """
+    global _muni_stop_index
+    from src.data_sources.geo_index import GeoGridIndex
+    
+    stops_data = list_all_muni_stops()
+    index = _muni_stop_index
+    if index is None or index.source is not stops_data:
+        index = GeoGridIndex(
+            ((stop["lat"], stop["lon"], stop) for stop in stops_data["stops"]),
+            source=stops_data,
+        )
+        _muni_stop_index = index
+    return index
+
+
 @app.get("/muni/stops/nearby")
-async def find_nearby_muni_stops(
+def find_nearby_muni_stops(
     lat: float = Query(..., description="Latitude"),
     lng: float = Query(..., description="Longitude"),
     radius: float = Query(0.5, description="Search radius in kilometers"),
@@ -1681,43 +1608,16 @@ async def find_nearby_muni_stops(
     Returns:
         List of nearby stops sorted by distance with live arrival data
     """
-    import math
-    
     try:
-        # Get all stops (from cache if available)
-        stops_data = await list_all_muni_stops()
-        all_stops = stops_data["stops"]
-        
-        # Calculate distance to each stop using haversine formula
-        def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-            """Calculate distance in kilometers between two points."""
-            R = 6371.0  # Earth radius in km
-            
-            lat1_rad = math.radians(lat1)
-            lon1_rad = math.radians(lon1)
-            lat2_rad = math.radians(lat2)
-            lon2_rad = math.radians(lon2)
-            
-            dlat = lat2_rad - lat1_rad
-            dlon = lon2_rad - lon1_rad
-            
-            a = math.sin(dlat / 2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2)**2
-            c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-            
-            return R * c
+        # Get the stop index (catalog from cache if available)
+        index = _get_muni_stop_index()
         
-        # Filter stops within radius and calculate distances
+        # Find stops within radius (only stops in nearby grid cells are measured)
         nearby_stops = []
-        for stop in all_stops:
-            if stop["lat"] is None or stop["lon"] is None:
-                continue
-            
-            distance = haversine_distance(lat, lng, stop["lat"], stop["lon"])
-            
-            if distance <= radius:
-                stop_with_distance = stop.copy()
-                stop_with_distance["distance_km"] = round(distance, 2)
-                nearby_stops.append(stop_with_distance)
+        for distance, stop in index.within(lat, lng, radius):
+            stop_with_distance = stop.copy()
+            stop_with_distance["distance_km"] = round(distance, 2)
+            nearby_stops.append(stop_with_distance)
         
         # Sort by distance and limit
         nearby_stops.sort(key=lambda x: x["distance_km"])
@@ -1729,28 +1629,10 @@ async def find_nearby_muni_stops(
             cache = get_transit_cache()
             
             if cache.is_ready():
-                # Get all cached stop codes for SF agency
-                all_sf_stops = cache.get_all_stops_for_agency("SF")
-                
+                # Route names seen at each stop in the last feed
+                routes_by_stop = cache.get_routes_for_stops("SF", [stop["stop_code"] for stop in nearby_stops])
                 for stop in nearby_stops:
-                    try:
-                        # Get cached visits for this stop
-                        visits = all_sf_stops.get(stop["stop_code"], [])
-                        
-                        # Extract unique route names from cached visits
-                        routes = set()
-                        for visit in visits:
-                            journey = visit.get("MonitoredVehicleJourney", {})
-                            published_line = journey.get("PublishedLineName", "")
-                            if isinstance(published_line, list):
-                                published_line = published_line[0] if published_line else ""
-                            if published_line:
-                                routes.add(published_line.upper())
-                        
-                        stop["routes"] = sorted(list(routes))
-                    except Exception:
-                        # If we can't get routes, just skip
-                        stop["routes"] = []
+                    stop["routes"] = routes_by_stop.get(stop["stop_code"], [])
             else:
                 logger.warning("Regional transit cache not ready, routes unavailable")
                 for stop in nearby_stops:
@@ -1773,7 +1655,7 @@ async def find_nearby_muni_stops(
 
 
 @app.get("/muni/stops/search")
-async def search_muni_stops_by_address(
+def search_muni_stops_by_address(
     address: str = Query(..., description="Address to search near"),
     radius: float = Query(0.5, description="Search radius in kilometers"),
     limit: int = Query(10, description="Maximum number of results")
@@ -1817,7 +1699,7 @@ async def search_muni_stops_by_address(
         lng = float(location["lon"])
         
         # Find nearby stops
-        stops_data = await find_nearby_muni_stops(lat=lat, lng=lng, radius=radius, limit=limit)
+        stops_data = find_nearby_muni_stops(lat=lat, lng=lng, radius=radius, limit=limit)
         
         return {
             "stops": stops_data["stops"],
@@ -1876,7 +1758,7 @@ async def get_transit_cache_status():
 # =============================================================================
 
 @app.get("/stocks/search")
-async def search_stock_symbols(
+def search_stock_symbols(
     query: str = Query(..., description="Search query (symbol or company name)"),
     limit: int = Query(10, ge=1, le=50, description="Maximum number of results")
 ):
@@ -1917,7 +1799,7 @@ async def search_stock_symbols(
 
 
 @app.post("/stocks/validate")
-async def validate_stock_symbol(request: dict):
+def validate_stock_symbol(request: dict):
     """
     Validate if a stock symbol is valid.
     
@@ -1954,7 +1836,7 @@ async def validate_stock_symbol(request: dict):
 # =============================================================================
 
 @app.post("/traffic/routes/geocode")
-async def geocode_address(request: dict):
+def geocode_address(request: dict):
     """
     Geocode an address to coordinates.
     
@@ -2004,7 +1886,7 @@ async def geocode_address(request: dict):
 
 
 @app.post("/traffic/routes/validate")
-async def validate_traffic_route(request: dict):
+def validate_traffic_route(request: dict):
     """
     Validate a traffic route and get basic info.
     
@@ -2175,7 +2057,7 @@ async def get_active_page():
 
 
 @app.put("/settings/active-page")
-async def set_active_page(request: dict):
+def set_active_page(request: dict):
     """
     Set the active page ID.
     
@@ -2215,7 +2097,7 @@ async def set_active_page(request: dict):
             interval_ms = page.transition_interval_ms if page.transition_interval_ms is not None else system_transition.step_interval_ms
             step_size = page.transition_step_size if page.transition_step_size is not None else system_transition.step_size
             
-            board_array = text_to_board_array(result.formatted)
+            board_array = result.to_board_array()
             success, was_sent = service.vb_client.send_characters(
                 board_array,
                 strategy=strategy,
@@ -2252,7 +2134,7 @@ async def update_polling_settings(request: dict):
     Body should include:
     - interval_seconds: Polling interval in seconds (minimum 10)
     
-    Note: Changing this setting requires restarting the service to take effect.
+    The running display service picks up the new interval without a restart.
     """
     if "interval_seconds" not in request:
         raise HTTPException(status_code=400, detail="interval_seconds parameter required")
@@ -2265,7 +2147,7 @@ async def update_polling_settings(request: dict):
         return {
             "status": "success",
             "settings": polling.to_dict(),
-            "requires_restart": True
+            "requires_restart": False
         }
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -2405,7 +2287,7 @@ def _get_board_client():
 
 
 @app.post("/debug/blank")
-async def debug_blank_board():
+def debug_blank_board():
     """Clear the board by filling with space characters (code 0)."""
     global _dev_mode
     
@@ -2423,9 +2305,8 @@ async def debug_blank_board():
         }
     
     try:
-        # Create a 6x22 array filled with spaces (code 0)
-        blank_array = [[0] * 22 for _ in range(6)]
-        success, was_sent = client.send_characters(blank_array, force=True)
+        # Create a 6x22 frame filled with spaces (code 0)
+        success, was_sent = client.send_characters(Frame.filled(0), force=True)
         
         if success:
             return {
@@ -2440,7 +2321,7 @@ async def debug_blank_board():
 
 
 @app.post("/debug/fill")
-async def debug_fill_board(request: dict):
+def debug_fill_board(request: dict):
     """Fill the board with a single character.
     
     Body: {"character_code": number} - code must be 0-71
@@ -2468,9 +2349,8 @@ async def debug_fill_board(request: dict):
         }
     
     try:
-        # Create a 6x22 array filled with the specified character
-        fill_array = [[character_code] * 22 for _ in range(6)]
-        success, was_sent = client.send_characters(fill_array, force=True)
+        # Create a 6x22 frame filled with the specified character
+        success, was_sent = client.send_characters(Frame.filled(character_code), force=True)
         
         if success:
             return {
@@ -2485,7 +2365,7 @@ async def debug_fill_board(request: dict):
 
 
 @app.post("/debug/info")
-async def debug_show_info():
+def debug_show_info():
     """Display debug information on the board."""
     global _dev_mode
     
@@ -2546,7 +2426,7 @@ V{version[:7]} {timestamp}"""
 
 
 @app.post("/debug/test-connection")
-async def debug_test_connection():
+def debug_test_connection():
     """Test connection to the board."""
     client = _get_board_client()
     if not client:
@@ -2617,6 +2497,59 @@ async def debug_get_cache_status():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/debug/frame-history")
+async def debug_get_frame_history(
+    limit: int = Query(50, ge=1, le=1000, description="Maximum number of records to return"),
+    label: Optional[str] = Query(None, description="Only records with this label (page ID)"),
+    event: Optional[str] = Query(None, description="Only records with this event (sent, skipped_unchanged, skipped_below_threshold)"),
+    include_frames: bool = Query(False, description="Include each frame as a 6x22 character array")
+):
+    """Get recent frames sent to the board, newest first, with per-page stats."""
+    service = get_service()
+    if not service:
+        raise HTTPException(status_code=503, detail="Service not initialized")
+    
+    history = service.frame_history
+    return {
+        "status": "success",
+        "records": [entry.to_dict(include_frame=include_frames) for entry in history.query(limit, label, event)],
+        "stats": history.stats()
+    }
+
+
+@app.post("/debug/frame-history/{seq}/replay")
+def debug_replay_frame(seq: int, strategy: Optional[str] = None):
+    """Re-send a frame from the history to the board."""
+    global _dev_mode
+    
+    client = _get_board_client()
+    if not client:
+        raise HTTPException(status_code=400, detail="Board not configured")
+    
+    if client.history is None or client.history.get(seq) is None:
+        raise HTTPException(status_code=404, detail=f"Frame history record {seq} not found")
+    
+    settings_service = get_settings_service()
+    if not settings_service.should_send_to_board(_dev_mode):
+        return {
+            "status": "success",
+            "message": f"Frame {seq} replayed (preview only - dev mode active)"
+        }
+    
+    try:
+        success, was_sent = client.replay(seq, strategy=strategy)
+    except Exception as e:
+        logger.error(f"Error replaying frame {seq}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    if not success:
+        raise HTTPException(status_code=500, detail=f"Failed to replay frame {seq}")
+    return {
+        "status": "success",
+        "message": f"Frame {seq} replayed"
+    }
+
+
 @app.get("/debug/system-info")
 async def debug_get_system_info():
     """Get system information without sending to board."""
@@ -2762,8 +2695,28 @@ async def delete_page(page_id: str):
     return response
 
 
+@app.get("/pages/{page_id}/layout")
+def get_page_layout(page_id: str):
+    """
+    Get the worst-case layout of a template page.
+    
+    Reports each line's maximum rendered width, which lines wrap and which
+    may overflow, based on the max lengths of the variables it uses.
+    """
+    page_service = get_page_service()
+    page = page_service.get_page(page_id)
+    if not page:
+        raise HTTPException(status_code=404, detail=f"Page not found: {page_id}")
+    
+    layout = page_service.get_page_layout(page_id)
+    if layout is None:
+        raise HTTPException(status_code=400, detail="Layout analysis is only available for template pages")
+    
+    return {"page_id": page_id, **layout.to_dict()}
+
+
 @app.post("/pages/{page_id}/preview")
-async def preview_page(
+def preview_page(
     page_id: str,
     force_refresh: bool = Query(default=False, description="Force fresh render, bypass cache")
 ):
@@ -2806,7 +2759,7 @@ async def preview_page(
 
 
 @app.post("/pages/preview/batch")
-async def preview_pages_batch(request: dict):
+def preview_pages_batch(request: dict):
     """
     Preview multiple pages in a single request.
     
@@ -2876,7 +2829,8 @@ async def get_page_cache_stats():
     Get preview cache statistics.
     
     Returns information about the preview cache including size,
-    cached page IDs, and TTL configuration.
+    cached page IDs, and the plugin data versions each cached preview
+    was rendered from.
     """
     page_service = get_page_service()
     return page_service.get_cache_stats()
@@ -2916,7 +2870,7 @@ async def clear_page_cache(request: dict = None):
 
 
 @app.post("/pages/{page_id}/send")
-async def send_page(page_id: str, target: Optional[str] = None):
+def send_page(page_id: str, target: Optional[str] = None):
     """
     Send a page to the configured target.
     
@@ -2975,7 +2929,7 @@ async def send_page(page_id: str, target: Optional[str] = None):
             step_size = page.transition_step_size if page.transition_step_size is not None else system_transition.step_size
             
             # Convert to board array for proper character/color support
-            board_array = text_to_board_array(result.formatted)
+            board_array = result.to_board_array()
             success, was_sent = service.vb_client.send_characters(
                 board_array,
                 strategy=strategy,
@@ -3337,7 +3291,7 @@ async def validate_template(request: dict):
 
 
 @app.post("/templates/render")
-async def render_template(request: dict):
+def render_template(request: dict):
     """
     Render a template with current data.
     
@@ -3447,7 +3401,7 @@ async def get_runtime_config():
 
 
 @app.post("/force-refresh")
-async def force_refresh():
+def force_refresh():
     """
     Force a display refresh, ignoring the cache.
     
@@ -3483,7 +3437,7 @@ async def force_refresh():
 # =============================================================================
 
 @app.get("/home-assistant/entities")
-async def get_home_assistant_entities():
+def get_home_assistant_entities():
     """
     Get all available entities from Home Assistant.
     
@@ -3534,10 +3488,12 @@ async def get_home_assistant_entities():
 # Import plugin system
 try:
     from .plugins import get_plugin_registry
+    from .plugins.prefetch import get_plugin_prefetcher
     PLUGIN_SYSTEM_AVAILABLE = True
 except ImportError:
     PLUGIN_SYSTEM_AVAILABLE = False
     get_plugin_registry = None
+    get_plugin_prefetcher = None
 
 
 class PluginConfigRequest(BaseModel):
@@ -3656,7 +3612,7 @@ async def get_plugin_manifest(plugin_id: str):
 
 
 @app.put("/plugins/{plugin_id}/config")
-async def update_plugin_config(plugin_id: str, request: PluginConfigRequest):
+def update_plugin_config(plugin_id: str, request: PluginConfigRequest):
     """
     Update configuration for a plugin.
     
@@ -3718,7 +3674,7 @@ async def update_plugin_config(plugin_id: str, request: PluginConfigRequest):
 
 
 @app.post("/plugins/{plugin_id}/enable")
-async def enable_plugin(plugin_id: str):
+def enable_plugin(plugin_id: str):
     """
     Enable a plugin.
     
@@ -3810,7 +3766,7 @@ async def disable_plugin(plugin_id: str):
 
 
 @app.get("/plugins/{plugin_id}/data")
-async def get_plugin_data(plugin_id: str):
+def get_plugin_data(plugin_id: str):
     """
     Fetch current data from a plugin.
     
@@ -3902,6 +3858,64 @@ async def get_all_plugin_variables():
     }
 
 
+@app.get("/plugins/cache/stats")
+async def get_plugin_cache_stats():
+    """
+    Get plugin result cache statistics.
+    
+    Returns per-plugin hit/miss counters, TTL and the age of the cached
+    result for each enabled plugin, plus the background prefetcher's
+    schedule and failure counts.
+    """
+    if not PLUGIN_SYSTEM_AVAILABLE:
+        return {
+            "plugins": {},
+            "plugin_system_enabled": False
+        }
+    
+    registry = get_plugin_registry()
+    
+    return {
+        "plugins": registry.get_cache_stats(),
+        "prefetch": get_plugin_prefetcher().get_status(),
+        "plugin_system_enabled": True
+    }
+
+
+@app.post("/plugins/cache/clear")
+async def clear_plugin_cache(request: dict = None):
+    """
+    Clear cached plugin results.
+    
+    Request body (optional):
+        {
+            "plugin_id": "weather"  // Clear specific plugin, omit to clear all
+        }
+    """
+    if not PLUGIN_SYSTEM_AVAILABLE:
+        raise HTTPException(
+            status_code=503,
+            detail="Plugin system is not available."
+        )
+    
+    plugin_id = None
+    if request:
+        plugin_id = request.get("plugin_id")
+    
+    get_plugin_registry().clear_cache(plugin_id)
+    
+    if plugin_id:
+        return {
+            "status": "success",
+            "message": f"Cache cleared for plugin {plugin_id}"
+        }
+    else:
+        return {
+            "status": "success",
+            "message": "All plugin caches cleared"
+        }
+
+
 @app.get("/plugins/errors")
 async def get_plugin_errors():
     """
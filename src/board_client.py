@@ -15,8 +15,19 @@ Cloud API Reference:
 
 import logging
 import re
+import time
 import requests
-from typing import Optional, List, Tuple, Literal
+from typing import Any, Dict, Optional, List, Tuple, Literal, Union
+
+from .board_diff import BoardDiff, diff_boards, fastest_strategy
+from .board_frame import Frame
+from .board_history import (
+    EVENT_SENT,
+    EVENT_SKIPPED_BELOW_THRESHOLD,
+    EVENT_SKIPPED_UNCHANGED,
+    FrameHistory,
+    FrameRecord,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +74,10 @@ VALID_STRATEGIES = [
     "row", "diagonal", "random"
 ]
 
+# Pseudo-strategy for send_characters(): use whichever strategy settles the
+# changed tiles in the fewest steps
+AUTO_STRATEGY = "auto"
+
 
 class BoardClient:
     """Client for the board with support for Local and Cloud APIs.
@@ -71,6 +86,9 @@ class BoardClient:
     - Local API: Fast updates with transition animations (requires local network)
     - Cloud API: Remote access via internet (fallback option)
     - Client-side caching to skip sending unchanged messages
+    - Tile-level diffs against the last sent frame, with an optional
+      minimum-change threshold and per-label churn stats
+    - Optional history of sent frames with latency, for stats and replay
     - Transition animations (Local API only)
     """
     
@@ -82,7 +100,9 @@ class BoardClient:
         api_key: str,
         host: Optional[str] = None,
         use_cloud: bool = False,
-        skip_unchanged: bool = True
+        skip_unchanged: bool = True,
+        min_changed_tiles: int = 1,
+        history: Optional[FrameHistory] = None
     ):
         """
         Initialize board API client.
@@ -92,6 +112,9 @@ class BoardClient:
             host: IP or hostname of board for Local API (e.g., "192.168.0.11")
             use_cloud: If True, use Cloud API instead of Local API
             skip_unchanged: If True (default), skip sending if message hasn't changed
+            min_changed_tiles: With skip_unchanged, skip character sends that
+                               change fewer tiles than this (default 1 = any change)
+            history: Frame history to record character sends and skips in
         """
         if not api_key:
             raise ValueError("api_key is required")
@@ -99,6 +122,8 @@ class BoardClient:
         self.api_key = api_key
         self.use_cloud = use_cloud
         self.skip_unchanged = skip_unchanged
+        self.min_changed_tiles = max(1, min_changed_tiles)
+        self.history = history
         
         if use_cloud:
             # Cloud API mode
@@ -122,7 +147,32 @@ class BoardClient:
         
         # Client-side cache to avoid sending unchanged messages
         self._last_text: Optional[str] = None
-        self._last_characters: Optional[List[List[int]]] = None
+        self._last_characters: Optional[Frame] = None
+        
+        # Tile churn stats
+        self._last_diff: Optional[BoardDiff] = None
+        self._diff_stats: Dict[str, int] = self._new_diff_stats()
+        self._label_stats: Dict[str, Dict[str, int]] = {}
+    
+    @staticmethod
+    def _new_diff_stats() -> Dict[str, int]:
+        """Create an empty churn stats counter."""
+        return {"sends": 0, "tiles_changed": 0, "skipped_unchanged": 0, "skipped_below_threshold": 0}
+    
+    def _record_diff(self, label: Optional[str], key: str, diff: Optional[BoardDiff] = None) -> None:
+        """Count a send or skip in the global and per-label churn stats."""
+        targets = [self._diff_stats]
+        if label:
+            targets.append(self._label_stats.setdefault(label, self._new_diff_stats()))
+        for stats in targets:
+            stats[key] += 1
+            if diff is not None:
+                stats["tiles_changed"] += diff.change_count
+    
+    def _record_history(self, frame: Frame, event: str, label: Optional[str], **kwargs) -> None:
+        """Record a character send or skip in the frame history, if enabled."""
+        if self.history is not None:
+            self.history.record(frame, event=event, label=label, **kwargs)
     
     def send_text(
         self,
@@ -181,17 +231,23 @@ class BoardClient:
     
     def send_characters(
         self,
-        characters: List[List[int]],
+        characters: Union[Frame, List[List[int]]],
         strategy: Optional[TransitionStrategy] = None,
         step_interval_ms: Optional[int] = None,
         step_size: Optional[int] = None,
-        force: bool = False
+        force: bool = False,
+        min_changes: Optional[int] = None,
+        label: Optional[str] = None
     ) -> Tuple[bool, bool]:
         """
         Send message using character array format (6x22 grid) with optional transitions.
         
+        The new frame is diffed tile-by-tile against the last one sent. With
+        skip_unchanged, sends that change nothing (or fewer tiles than the
+        threshold) are skipped; skipped changes accumulate until they cross it.
+        
         Args:
-            characters: 6x22 array of character codes
+            characters: 6x22 array of character codes (or a Frame)
             strategy: Transition animation type:
                 - "column": Wave (left-to-right)
                 - "reverse-column": Drift (right-to-left)
@@ -199,36 +255,50 @@ class BoardClient:
                 - "row": Top-to-bottom (API only)
                 - "diagonal": Corner-to-corner (API only)
                 - "random": Random tiles (API only)
+                - "auto": Whichever of the above settles the changed tiles fastest
             step_interval_ms: Delay between animation steps (ms). None = as fast as possible.
             step_size: How many rows/columns animate at once. None = 1 at a time.
             force: If True, send even if characters unchanged (default: False)
+            min_changes: Minimum changed tiles for this send (default: min_changed_tiles)
+            label: Name to track churn stats under (e.g. the page ID)
             
         Returns:
             Tuple of (success, was_sent):
             - success: True if message was sent successfully OR skipped because unchanged
             - was_sent: True if message was actually sent to the board
         """
-        # Validate grid size
-        if len(characters) != 6:
-            logger.error(f"Invalid grid: expected 6 rows, got {len(characters)}")
+        # Validate grid size and pack into a compact frame
+        try:
+            frame = Frame.from_rows(characters)
+        except (TypeError, ValueError) as e:
+            logger.error(str(e))
             return (False, False)
         
-        for i, row in enumerate(characters):
-            if len(row) != 22:
-                logger.error(f"Invalid row {i}: expected 22 columns, got {len(row)}")
-                return (False, False)
-        
         # Validate strategy if provided
-        if strategy is not None and strategy not in VALID_STRATEGIES:
+        if strategy is not None and strategy != AUTO_STRATEGY and strategy not in VALID_STRATEGIES:
             logger.error(f"Invalid strategy: {strategy}. Must be one of {VALID_STRATEGIES}")
             return (False, False)
         
-        # Check if characters have changed (client-side caching)
-        if self.skip_unchanged and not force and self._last_characters == characters:
-            logger.debug("Character array unchanged, skipping send")
-            return (True, False)
+        # Check which tiles have changed (client-side caching)
+        diff = diff_boards(self._last_characters, frame)
+        if self.skip_unchanged and not force:
+            if diff.is_empty:
+                logger.debug("Character array unchanged, skipping send")
+                self._record_diff(label, "skipped_unchanged")
+                self._record_history(frame, EVENT_SKIPPED_UNCHANGED, label)
+                return (True, False)
+            threshold = min_changes if min_changes is not None else self.min_changed_tiles
+            if not diff.full and diff.change_count < threshold:
+                logger.debug(f"Only {diff.change_count} tile(s) changed (threshold {threshold}), skipping send")
+                self._record_diff(label, "skipped_below_threshold")
+                self._record_history(frame, EVENT_SKIPPED_BELOW_THRESHOLD, label, tiles_changed=diff.change_count)
+                return (True, False)
+        
+        if strategy == AUTO_STRATEGY:
+            strategy = fastest_strategy(diff, step_size)
         
         # Build payload - format differs between Cloud and Local API
+        characters = frame.to_rows()
         if self.use_cloud:
             # Cloud API (Read/Write API) expects the array directly
             payload = characters
@@ -243,6 +313,7 @@ class BoardClient:
                 payload["step_size"] = step_size
         
         try:
+            started = time.perf_counter()
             response = requests.post(
                 self.base_url,
                 headers=self.headers,
@@ -250,9 +321,16 @@ class BoardClient:
                 timeout=10
             )
             response.raise_for_status()
+            latency_ms = (time.perf_counter() - started) * 1000
             
-            self._last_characters = [row[:] for row in characters]
+            self._last_characters = frame
             self._last_text = None
+            self._last_diff = diff
+            self._record_diff(label, "sends", diff)
+            self._record_history(
+                frame, EVENT_SENT, label,
+                strategy=strategy, tiles_changed=diff.change_count, latency_ms=latency_ms
+            )
             
             transition_info = ""
             if strategy:
@@ -260,7 +338,7 @@ class BoardClient:
                 if step_interval_ms:
                     transition_info += f" ({step_interval_ms}ms interval)"
             
-            logger.info(f"Character array sent successfully to board{transition_info}")
+            logger.info(f"Character array sent successfully to board{transition_info} ({diff.change_count} tiles changed)")
             return (True, True)
             
         except requests.exceptions.RequestException as e:
@@ -298,9 +376,12 @@ class BoardClient:
             
             # Optionally sync the cache with current board state
             if sync_cache and characters:
-                self._last_characters = [row[:] for row in characters]
-                self._last_text = None
-                logger.info("Cache synced with current board state")
+                try:
+                    self._last_characters = Frame.from_rows(characters)
+                    self._last_text = None
+                    logger.info("Cache synced with current board state")
+                except (TypeError, ValueError) as e:
+                    logger.warning(f"Could not sync cache with board state: {e}")
             
             return characters
             
@@ -320,10 +401,40 @@ class BoardClient:
             "has_cached_text": self._last_text is not None,
             "has_cached_characters": self._last_characters is not None,
             "skip_unchanged_enabled": self.skip_unchanged,
-            "cached_text_preview": self._last_text[:50] + "..." if self._last_text and len(self._last_text) > 50 else self._last_text
+            "cached_text_preview": self._last_text[:50] + "..." if self._last_text and len(self._last_text) > 50 else self._last_text,
+            "diff": self.get_diff_stats()
         }
     
-    def would_send(self, text: str = None, characters: List[List[int]] = None) -> bool:
+    def get_diff_stats(self) -> Dict[str, Any]:
+        """Get tile churn stats for sends made through this client.
+        
+        Returns:
+            Dict with totals, the minimum-change threshold, the last sent
+            diff, and the same totals broken down by send label
+        """
+        return {
+            **self._diff_stats,
+            "min_changed_tiles": self.min_changed_tiles,
+            "last_diff": self._last_diff.to_dict() if self._last_diff else None,
+            "by_label": {label: dict(stats) for label, stats in self._label_stats.items()},
+        }
+    
+    def get_last_frame(self) -> Optional[Frame]:
+        """Get the last frame sent to (or synced from) the board, or None."""
+        return self._last_characters
+    
+    def diff(self, characters: Union[Frame, List[List[int]]]) -> BoardDiff:
+        """Diff a character array against the last one sent.
+        
+        Args:
+            characters: 6x22 array of character codes (or a Frame)
+            
+        Returns:
+            BoardDiff of the tiles that would change
+        """
+        return diff_boards(self._last_characters, characters)
+    
+    def would_send(self, text: str = None, characters: Union[Frame, List[List[int]]] = None) -> bool:
         """
         Check if a message would actually be sent (i.e., is it different from cached).
         
@@ -342,9 +453,34 @@ class BoardClient:
         if text is not None:
             return self._last_text != text
         if characters is not None:
-            return self._last_characters != characters
+            diff = self.diff(characters)
+            return diff.full or diff.change_count >= self.min_changed_tiles
         return True
     
+    def replay(self, seq: int, strategy: Optional[TransitionStrategy] = None) -> Tuple[bool, bool]:
+        """
+        Re-send a frame from the history.
+        
+        Args:
+            seq: Sequence number of the history record to replay
+            strategy: Transition to use (default: the one originally used)
+            
+        Returns:
+            Tuple of (success, was_sent) as for send_characters()
+            
+        Raises:
+            KeyError: If there is no history or the record has been dropped
+        """
+        entry: Optional[FrameRecord] = self.history.get(seq) if self.history is not None else None
+        if entry is None:
+            raise KeyError(f"No frame history record {seq}")
+        return self.send_characters(
+            entry.frame,
+            strategy=strategy or entry.strategy,
+            force=True,
+            label="replay"
+        )
+    
     def test_connection(self) -> bool:
         """
         Test the connection to the board.
@@ -0,0 +1,171 @@
+"""Tile-level diffs between board frames.
+
+The board only flips tiles whose character changes, so a diff between the
+last frame sent and the next one tells us how much an update really costs:
+how many tiles flap, where they are, and how long each transition strategy
+takes to settle. BoardClient uses this to skip redundant or insignificant
+sends and to track how much each page churns.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .board_frame import COLS as BOARD_COLS, ROWS as BOARD_ROWS, Frame
+
+# Strategies whose step order is deterministic, so settle time can be computed
+# ("random" is left out)
+PREDICTABLE_STRATEGIES = ("column", "reverse-column", "edges-to-center", "row", "diagonal")
+
+
+def _step_index(strategy: str, row: int, col: int) -> int:
+    """Get the animation step at which a strategy reaches a tile."""
+    if strategy == "column":
+        return col
+    if strategy == "reverse-column":
+        return BOARD_COLS - 1 - col
+    if strategy == "edges-to-center":
+        return min(col, BOARD_COLS - 1 - col)
+    if strategy == "row":
+        return row
+    if strategy == "diagonal":
+        return row + col
+    raise ValueError(f"Strategy has no fixed step order: {strategy}")
+
+
+@dataclass(frozen=True)
+class TileRun:
+    """A horizontal run of adjacent changed tiles in one row."""
+    row: int
+    start_col: int
+    end_col: int  # inclusive
+    
+    @property
+    def length(self) -> int:
+        """Number of tiles in the run."""
+        return self.end_col - self.start_col + 1
+
+
+@dataclass
+class BoardDiff:
+    """Tiles that differ between two board frames.
+    
+    Attributes:
+        changed_tiles: (row, col) of each changed tile, in row-major order
+        full: True if there was no previous frame to compare against
+    """
+    changed_tiles: List[Tuple[int, int]] = field(default_factory=list)
+    full: bool = False
+    
+    @property
+    def change_count(self) -> int:
+        """Number of tiles that flip."""
+        return len(self.changed_tiles)
+    
+    @property
+    def is_empty(self) -> bool:
+        """True if the frames are identical."""
+        return not self.changed_tiles
+    
+    @property
+    def changed_rows(self) -> List[int]:
+        """Rows containing at least one changed tile."""
+        return sorted({row for row, _ in self.changed_tiles})
+    
+    def regions(self) -> List[TileRun]:
+        """Group changed tiles into horizontal runs."""
+        runs: List[TileRun] = []
+        for row, col in self.changed_tiles:
+            last = runs[-1] if runs else None
+            if last and last.row == row and last.end_col == col - 1:
+                runs[-1] = TileRun(row, last.start_col, col)
+            else:
+                runs.append(TileRun(row, col, col))
+        return runs
+    
+    def bounding_box(self) -> Optional[Tuple[int, int, int, int]]:
+        """Get (top_row, left_col, bottom_row, right_col) of the changes, or None."""
+        if not self.changed_tiles:
+            return None
+        rows = [row for row, _ in self.changed_tiles]
+        cols = [col for _, col in self.changed_tiles]
+        return (min(rows), min(cols), max(rows), max(cols))
+    
+    def settle_steps(self, strategy: str, step_size: Optional[int] = None) -> int:
+        """Get the number of animation steps until the last changed tile flips.
+        
+        Args:
+            strategy: A strategy from PREDICTABLE_STRATEGIES
+            step_size: Rows/columns animated per step (None = 1)
+        
+        Returns:
+            Number of steps (0 if nothing changes)
+        """
+        if not self.changed_tiles:
+            return 0
+        last_step = max(_step_index(strategy, row, col) for row, col in self.changed_tiles)
+        return last_step // max(step_size or 1, 1) + 1
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable summary."""
+        return {
+            "change_count": self.change_count,
+            "full": self.full,
+            "changed_rows": self.changed_rows,
+            "bounding_box": self.bounding_box(),
+            "regions": [
+                {"row": run.row, "start_col": run.start_col, "end_col": run.end_col}
+                for run in self.regions()
+            ],
+        }
+
+
+def diff_boards(
+    previous: Optional[Union[Frame, Sequence[Sequence[int]]]],
+    current: Union[Frame, Sequence[Sequence[int]]],
+) -> BoardDiff:
+    """Compute the tiles that change from one frame to the next.
+    
+    Args:
+        previous: Last frame sent (None if unknown)
+        current: Frame about to be sent
+    
+    Returns:
+        BoardDiff; every tile counts as changed when previous is None
+    """
+    if previous is None:
+        return BoardDiff(
+            changed_tiles=[(r, c) for r in range(BOARD_ROWS) for c in range(BOARD_COLS)],
+            full=True,
+        )
+    try:
+        return BoardDiff(changed_tiles=Frame.from_rows(current).changed_tiles(Frame.from_rows(previous)))
+    except (TypeError, ValueError):
+        # Not a valid board grid - nothing can be matched tile-for-tile
+        return BoardDiff(
+            changed_tiles=[(r, c) for r, row in enumerate(current) for c in range(len(row))],
+            full=True,
+        )
+
+
+def fastest_strategy(
+    diff: BoardDiff,
+    step_size: Optional[int] = None,
+    candidates: Sequence[str] = PREDICTABLE_STRATEGIES,
+) -> Optional[str]:
+    """Pick the transition strategy that settles a diff in the fewest steps.
+    
+    Every strategy flips the same tiles; they differ in the order, so the one
+    that reaches the last changed tile soonest finishes first. Ties go to the
+    earlier candidate.
+    
+    Args:
+        diff: The changes to animate
+        step_size: Rows/columns animated per step (None = 1)
+        candidates: Strategies to choose from (must be predictable)
+    
+    Returns:
+        Strategy name, or None if nothing changes
+    """
+    if diff.is_empty or not candidates:
+        return None
+    return min(candidates, key=lambda strategy: diff.settle_steps(strategy, step_size))
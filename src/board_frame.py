@@ -0,0 +1,133 @@
+"""Compact, immutable representation of one board frame.
+
+A frame is the 6x22 grid of character codes shown on the board. Codes are
+0-71, so a frame fits in 132 bytes instead of six lists of Python ints:
+hashing and equality are single bytes operations, diffs are an XOR, and
+snapshots (e.g. for history) cost nothing since frames are immutable.
+
+The API's nested-list format is only produced at the wire boundary with
+to_rows().
+"""
+
+from typing import Iterable, List, Sequence, Tuple, Union
+
+ROWS = 6
+COLS = 22
+SIZE = ROWS * COLS
+
+RowsLike = Sequence[Sequence[int]]
+
+
+class Frame:
+    """Immutable 6x22 board frame backed by 132 bytes."""
+    
+    __slots__ = ("_data",)
+    
+    def __init__(self, data: bytes):
+        """Initialize from raw bytes (row-major, one byte per tile).
+        
+        Args:
+            data: Exactly 132 bytes
+        
+        Raises:
+            ValueError: If data is not 132 bytes long
+        """
+        if len(data) != SIZE:
+            raise ValueError(f"Frame needs {SIZE} bytes, got {len(data)}")
+        self._data = bytes(data)
+    
+    @classmethod
+    def from_rows(cls, rows: Union["Frame", RowsLike]) -> "Frame":
+        """Build a frame from a 6x22 nested list of character codes.
+        
+        Args:
+            rows: 6 rows of 22 codes (a Frame is returned as-is)
+        
+        Returns:
+            Frame
+        
+        Raises:
+            ValueError: If the grid has the wrong shape or a code is out of range
+        """
+        if isinstance(rows, Frame):
+            return rows
+        if len(rows) != ROWS:
+            raise ValueError(f"Invalid grid: expected {ROWS} rows, got {len(rows)}")
+        data = bytearray()
+        for i, row in enumerate(rows):
+            if len(row) != COLS:
+                raise ValueError(f"Invalid row {i}: expected {COLS} columns, got {len(row)}")
+            data.extend(row)  # Raises ValueError for codes outside 0-255
+        return cls(bytes(data))
+    
+    @classmethod
+    def filled(cls, code: int = 0) -> "Frame":
+        """Build a frame with every tile set to one code (0 = blank)."""
+        return cls(bytes([code]) * SIZE)
+    
+    def to_rows(self) -> List[List[int]]:
+        """Convert to the API's 6x22 nested-list format."""
+        data = self._data
+        return [list(data[r * COLS:(r + 1) * COLS]) for r in range(ROWS)]
+    
+    def row(self, index: int) -> bytes:
+        """Get one row's codes."""
+        return self._data[index * COLS:(index + 1) * COLS]
+    
+    def tile(self, row: int, col: int) -> int:
+        """Get the code at a position."""
+        return self._data[row * COLS + col]
+    
+    def with_tiles(self, row: int, col: int, codes: Iterable[int]) -> "Frame":
+        """Get a copy with a run of tiles replaced.
+        
+        Args:
+            row: Row of the first tile
+            col: Column of the first tile
+            codes: Codes to write left-to-right (clipped at the end of the row)
+        
+        Returns:
+            New Frame
+        """
+        data = bytearray(self._data)
+        start = row * COLS + col
+        codes = bytes(codes)[:COLS - col]
+        data[start:start + len(codes)] = codes
+        return Frame(bytes(data))
+    
+    def changed_indices(self, other: "Frame") -> List[int]:
+        """Get the row-major indices of tiles that differ from another frame.
+        
+        Args:
+            other: Frame to compare against
+        
+        Returns:
+            Ascending tile indices (row * 22 + col)
+        """
+        if self._data == other._data:
+            return []
+        mask = (int.from_bytes(self._data, "big") ^ int.from_bytes(other._data, "big")).to_bytes(SIZE, "big")
+        return [i for i, byte in enumerate(mask) if byte]
+    
+    def changed_tiles(self, other: "Frame") -> List[Tuple[int, int]]:
+        """Get (row, col) of tiles that differ from another frame, row-major."""
+        return [divmod(i, COLS) for i in self.changed_indices(other)]
+    
+    def __bytes__(self) -> bytes:
+        return self._data
+    
+    def __hash__(self) -> int:
+        return hash(self._data)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Frame):
+            return self._data == other._data
+        if isinstance(other, (list, tuple)):
+            try:
+                return self._data == Frame.from_rows(other)._data
+            except (TypeError, ValueError):
+                return False
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"Frame({self._data.hex()})"
@@ -0,0 +1,266 @@
+"""Bounded history of frames sent to the board.
+
+Every send (and skip) that goes through BoardClient can be recorded here with
+its page label, transition, tile churn and send latency. Records hold the
+132-byte Frame rather than nested lists, and identical frames are interned so
+a page that keeps re-rendering the same content stores it once. Consecutive
+skips of the same kind and label are merged into one counted record, so an
+unchanged page polled every few seconds doesn't push real sends out of the
+buffer. With the default size the whole history costs tens of kilobytes.
+
+The history can optionally mirror sends (not skips) to a JSON-lines file (one
+object per line, frame as hex) for analysis after a restart.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Union
+
+from .board_frame import Frame
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY_SIZE = 500
+
+# Record events
+EVENT_SENT = "sent"
+EVENT_SKIPPED_UNCHANGED = "skipped_unchanged"
+EVENT_SKIPPED_BELOW_THRESHOLD = "skipped_below_threshold"
+
+
+@dataclass(frozen=True)
+class FrameRecord:
+    """One send (or skipped send) of a frame.
+    
+    Attributes:
+        seq: Sequence number, increasing for the lifetime of the history
+        timestamp: Unix time of the send
+        frame: Frame that was sent (or would have been)
+        event: EVENT_SENT or one of the skip events
+        label: Send label (usually the page ID)
+        strategy: Transition strategy used, if any
+        tiles_changed: Tiles that changed against the previous sent frame
+        latency_ms: Time the board API took to accept the send
+        count: Consecutive skips merged into this record (1 for sends)
+        last_timestamp: Unix time of the latest merged skip, if count > 1
+    """
+    seq: int
+    timestamp: float
+    frame: Frame
+    event: str
+    label: Optional[str] = None
+    strategy: Optional[str] = None
+    tiles_changed: int = 0
+    latency_ms: Optional[float] = None
+    count: int = 1
+    last_timestamp: Optional[float] = None
+    
+    def to_dict(self, include_frame: bool = False) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict.
+        
+        Args:
+            include_frame: Include the frame as a 6x22 nested list
+        """
+        data = {
+            "seq": self.seq,
+            "timestamp": self.timestamp,
+            "event": self.event,
+            "label": self.label,
+            "strategy": self.strategy,
+            "tiles_changed": self.tiles_changed,
+            "latency_ms": self.latency_ms,
+            "count": self.count,
+            "last_timestamp": self.last_timestamp,
+        }
+        if include_frame:
+            data["characters"] = self.frame.to_rows()
+        return data
+
+
+class FrameHistory:
+    """Thread-safe ring buffer of FrameRecords with per-label stats."""
+    
+    def __init__(self, max_entries: int = DEFAULT_HISTORY_SIZE, log_path: Optional[Union[str, Path]] = None):
+        """Initialize the history.
+        
+        Args:
+            max_entries: Records kept in memory (oldest are dropped first)
+            log_path: Optional JSON-lines file to append every send to
+        """
+        self.max_entries = max(1, max_entries)
+        self.log_path = Path(log_path) if log_path else None
+        self._records: Deque[FrameRecord] = deque(maxlen=self.max_entries)
+        self._frames: Dict[Frame, List[Any]] = {}  # frame -> [interned frame, record count]
+        self._next_seq = 1
+        self._lock = threading.Lock()
+    
+    def record(
+        self,
+        frame: Frame,
+        event: str = EVENT_SENT,
+        label: Optional[str] = None,
+        strategy: Optional[str] = None,
+        tiles_changed: int = 0,
+        latency_ms: Optional[float] = None,
+    ) -> FrameRecord:
+        """Append a record, dropping the oldest one if the history is full.
+        
+        A skip with the same event and label as the newest record is merged
+        into it (count + 1, latest frame) instead of taking a new slot.
+        
+        Returns:
+            The new or merged FrameRecord
+        """
+        now = time.time()
+        with self._lock:
+            frame = self._intern(frame)
+            last = self._records[-1] if self._records else None
+            if event != EVENT_SENT and last is not None and last.event == event and last.label == label:
+                self._release(last.frame)
+                entry = replace(
+                    last,
+                    frame=frame,
+                    tiles_changed=tiles_changed,
+                    count=last.count + 1,
+                    last_timestamp=now,
+                )
+                self._records[-1] = entry
+                return entry
+            
+            entry = FrameRecord(
+                seq=self._next_seq,
+                timestamp=now,
+                frame=frame,
+                event=event,
+                label=label,
+                strategy=strategy,
+                tiles_changed=tiles_changed,
+                latency_ms=round(latency_ms, 1) if latency_ms is not None else None,
+            )
+            self._next_seq += 1
+            if len(self._records) == self.max_entries:
+                self._release(self._records[0].frame)
+            self._records.append(entry)
+        
+        if self.log_path and event == EVENT_SENT:
+            self._append_to_log(entry)
+        return entry
+    
+    def _intern(self, frame: Frame) -> Frame:
+        """Get the shared instance of a frame, counting one more reference."""
+        slot = self._frames.get(frame)
+        if slot is None:
+            slot = self._frames[frame] = [frame, 0]
+        slot[1] += 1
+        return slot[0]
+    
+    def _release(self, frame: Frame) -> None:
+        """Drop one reference to an interned frame."""
+        slot = self._frames[frame]
+        slot[1] -= 1
+        if slot[1] == 0:
+            del self._frames[frame]
+    
+    def _append_to_log(self, entry: FrameRecord) -> None:
+        """Append one record to the on-disk log."""
+        line = entry.to_dict()
+        line["frame"] = bytes(entry.frame).hex()
+        try:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.log_path, "a") as f:
+                f.write(json.dumps(line) + "\n")
+        except OSError as e:
+            logger.warning(f"Could not append to frame history log {self.log_path}: {e}")
+    
+    def get(self, seq: int) -> Optional[FrameRecord]:
+        """Get a record by sequence number, or None if it was dropped."""
+        with self._lock:
+            if not self._records:
+                return None
+            index = seq - self._records[0].seq
+            if 0 <= index < len(self._records):
+                return self._records[index]
+        return None
+    
+    def query(
+        self,
+        limit: int = 50,
+        label: Optional[str] = None,
+        event: Optional[str] = None,
+    ) -> List[FrameRecord]:
+        """Get records newest-first.
+        
+        Args:
+            limit: Maximum number of records to return
+            label: Only records with this label
+            event: Only records with this event
+        """
+        with self._lock:
+            records = list(self._records)
+        matches = []
+        for entry in reversed(records):
+            if label is not None and entry.label != label:
+                continue
+            if event is not None and entry.event != event:
+                continue
+            matches.append(entry)
+            if len(matches) >= limit:
+                break
+        return matches
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cadence, skip rate, churn and latency stats per label.
+        
+        Returns:
+            Dict with history totals and a "by_label" breakdown
+        """
+        with self._lock:
+            records = list(self._records)
+            unique_frames = len(self._frames)
+        
+        by_label: Dict[str, Dict[str, Any]] = {}
+        for entry in records:
+            stats = by_label.setdefault(entry.label or "", {
+                "sends": 0, "skips": 0, "tiles_changed": 0,
+                "_latencies": [], "_send_times": [],
+            })
+            if entry.event == EVENT_SENT:
+                stats["sends"] += 1
+                stats["tiles_changed"] += entry.tiles_changed
+                stats["_send_times"].append(entry.timestamp)
+                if entry.latency_ms is not None:
+                    stats["_latencies"].append(entry.latency_ms)
+            else:
+                stats["skips"] += entry.count
+        
+        for stats in by_label.values():
+            latencies = stats.pop("_latencies")
+            send_times = stats.pop("_send_times")
+            total = stats["sends"] + stats["skips"]
+            stats["skip_rate"] = round(stats["skips"] / total, 3) if total else 0.0
+            stats["avg_tiles_changed"] = round(stats["tiles_changed"] / stats["sends"], 1) if stats["sends"] else 0.0
+            stats["avg_latency_ms"] = round(sum(latencies) / len(latencies), 1) if latencies else None
+            stats["max_latency_ms"] = max(latencies) if latencies else None
+            stats["avg_send_interval_seconds"] = (
+                round((send_times[-1] - send_times[0]) / (len(send_times) - 1), 1)
+                if len(send_times) > 1 else None
+            )
+        
+        return {
+            "entries": len(records),
+            "max_entries": self.max_entries,
+            "unique_frames": unique_frames,
+            "log_path": str(self.log_path) if self.log_path else None,
+            "by_label": by_label,
+        }
+    
+    def clear(self) -> None:
+        """Drop all in-memory records (the on-disk log is kept)."""
+        with self._lock:
+            self._records.clear()
+            self._frames.clear()
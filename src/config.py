@@ -17,6 +17,8 @@ class Config:
     
     This class provides class attributes for accessing configuration values.
     Values are read from the ConfigManager which persists to config.json.
+    Reads use the ConfigManager's read-only snapshot, so they take no lock
+    and copy nothing; values that are lists or dicts must not be mutated.
     """
     
     # Valid transition strategies
@@ -32,18 +34,18 @@ class Config:
     
     @classmethod
     def _get_board(cls) -> Dict:
-        """Get board config section."""
-        return cls._get_cm().get_board()
+        """Get board config section (read-only snapshot)."""
+        return cls._get_cm().get_board_view()
     
     @classmethod
     def _get_feature(cls, name: str) -> Dict:
-        """Get a feature config section."""
-        return cls._get_cm().get_feature(name) or {}
+        """Get a feature config section (read-only snapshot)."""
+        return cls._get_cm().get_feature_view(name) or {}
     
     @classmethod
     def _get_general(cls) -> Dict:
-        """Get general config section."""
-        return cls._get_cm().get_general()
+        """Get general config section (read-only snapshot)."""
+        return cls._get_cm().get_general_view()
     
     # ==================== Board API Configuration ====================
     
@@ -228,6 +230,66 @@ class Config:
         """Refresh interval in seconds."""
         return cls._get_general().get("refresh_interval_seconds", 300)
     
+    @classmethod
+    @property
+    def PLUGIN_FETCH_WORKERS(cls) -> int:
+        """Max plugins fetched concurrently (<= 1 disables concurrent fetching)."""
+        return int(cls._get_general().get("plugin_fetch_workers", 4))
+    
+    @classmethod
+    @property
+    def PLUGIN_FETCH_TIMEOUT_SECONDS(cls) -> float:
+        """Per-plugin fetch deadline in seconds."""
+        return float(cls._get_general().get("plugin_fetch_timeout_seconds", 10))
+    
+    @classmethod
+    @property
+    def RENDER_DEADLINE_SECONDS(cls) -> float:
+        """Overall deadline in seconds for fetching the plugin data of one render."""
+        return float(cls._get_general().get("render_deadline_seconds", 15))
+    
+    @classmethod
+    @property
+    def PLUGIN_PREFETCH_ENABLED(cls) -> bool:
+        """Whether plugin data is refreshed in the background ahead of renders."""
+        return bool(cls._get_general().get("plugin_prefetch_enabled", True))
+    
+    @classmethod
+    @property
+    def FRAME_HISTORY_SIZE(cls) -> int:
+        """Number of sent frames kept in memory."""
+        return int(cls._get_general().get("frame_history_size", 500))
+    
+    @classmethod
+    @property
+    def FRAME_HISTORY_LOG(cls) -> Optional[str]:
+        """Path of the JSON-lines frame history log, or None if disabled."""
+        return cls._get_general().get("frame_history_log") or None
+    
+    @classmethod
+    @property
+    def BOARD_MIN_CHANGED_TILES(cls) -> int:
+        """Minimum number of changed tiles for a character send to go out."""
+        return max(1, int(cls._get_general().get("board_min_changed_tiles", 1)))
+    
+    @classmethod
+    @property
+    def PERSISTENCE_DEBOUNCE_SECONDS(cls) -> float:
+        """Delay before saving pages/schedules/settings, coalescing bursts of edits."""
+        return max(0.0, float(cls._get_general().get("persistence_debounce_ms", 500)) / 1000)
+    
+    @classmethod
+    @property
+    def PERSISTENCE_FSYNC(cls) -> bool:
+        """Whether saved files are flushed to disk before the save completes."""
+        return bool(cls._get_general().get("persistence_fsync", True))
+    
+    @classmethod
+    @property
+    def PERSISTENCE_COMPACT(cls) -> bool:
+        """Whether saved JSON files are written without indentation."""
+        return bool(cls._get_general().get("persistence_compact", False))
+    
     # ==================== Star Trek Quotes Configuration ====================
     
     @classmethod
@@ -697,6 +759,15 @@ class Config:
             "step_size": cls.FB_TRANSITION_STEP_SIZE,
         }
     
+    @classmethod
+    def get_persistence_settings(cls) -> Dict:
+        """Get options for saving data files (see persistence.get_writer)."""
+        return {
+            "debounce_seconds": cls.PERSISTENCE_DEBOUNCE_SECONDS,
+            "fsync": cls.PERSISTENCE_FSYNC,
+            "compact": cls.PERSISTENCE_COMPACT,
+        }
+    
     @classmethod
     def reload(cls) -> None:
         """Reload configuration from file."""
@@ -3,6 +3,11 @@
 Manages reading and writing configuration to a JSON file with validation
 and thread-safe file operations.
 
+Reads are lock-free: every write publishes an immutable snapshot of the
+whole configuration (FrozenDict/FrozenList), swapped in with a single
+attribute assignment. The *_view() getters return parts of the current
+snapshot without copying; the other getters return mutable copies.
+
 Supports:
 - Legacy features (config.features.*) for backward compatibility
 - Plugin system (config.plugins.*) for data source integrations
@@ -15,6 +20,7 @@ import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .persistence import get_writer, read_json
 # Import TimeService for migration
 from .time_service import get_time_service
 
@@ -192,6 +198,22 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         "timezone": "America/Los_Angeles",  # User's timezone for display purposes
         "refresh_interval_seconds": 300,
         "output_target": "board",
+        # Concurrent plugin fetching (workers <= 1 fetches plugins one after another)
+        "plugin_fetch_workers": 4,
+        "plugin_fetch_timeout_seconds": 10,  # Per-plugin deadline
+        "render_deadline_seconds": 15,  # Overall deadline for fetching a render's plugin data
+        # Refresh plugin data in the background so renders read warm caches
+        "plugin_prefetch_enabled": True,
+        # Frames sent to the board kept in memory for debugging (GET /debug/frame-history)
+        "frame_history_size": 500,
+        "frame_history_log": "",  # Optional JSON-lines file to append every send (not skips) to
+        # Skip character sends that change fewer board tiles than this (1 = any change)
+        "board_min_changed_tiles": 1,
+        # Saving pages/schedules/settings: bursts of edits within the debounce
+        # window are written once; fsync makes each write durable
+        "persistence_debounce_ms": 500,
+        "persistence_fsync": True,
+        "persistence_compact": False,  # Write JSON files without indentation
     },
     # Plugin configurations
     # Each plugin's config is stored under plugins.<plugin_id>
@@ -214,6 +236,60 @@ SENSITIVE_FIELDS = {
 }
 
 
+class FrozenDict(dict):
+    """Read-only dict used for configuration snapshots.
+    
+    Still a dict (isinstance checks and JSON encoding work), but every
+    mutating method raises TypeError. copy() returns a plain dict.
+    """
+    
+    __slots__ = ()
+    
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Configuration snapshots are read-only")
+    
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    
+    def __hash__(self):
+        return id(self)
+    
+    def __reduce__(self):
+        # copy.deepcopy() and pickle produce a plain, mutable dict
+        return (dict, (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only list used for configuration snapshots (see FrozenDict)."""
+    
+    __slots__ = ()
+    
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Configuration snapshots are read-only")
+    
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = remove = pop = clear = sort = reverse = _readonly
+    
+    def __hash__(self):
+        return id(self)
+    
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def freeze(obj: Any) -> Any:
+    """Create a read-only deep copy of a nested dict/list structure."""
+    if isinstance(obj, dict):
+        return FrozenDict((k, freeze(v)) for k, v in obj.items())
+    elif isinstance(obj, list):
+        return FrozenList(freeze(item) for item in obj)
+    return obj
+
+
+_EMPTY = FrozenDict()
+_DEFAULT_FEATURES = freeze(DEFAULT_CONFIG["features"])
+
+
 class ConfigManager:
     """Manages configuration file read/write operations."""
 
@@ -250,6 +326,8 @@ class ConfigManager:
             self._config_path = data_dir / "config.json"
         
         self._config: Dict[str, Any] = {}
+        self._snapshot: FrozenDict = _EMPTY
+        self._version = 0
         self._load_or_create()
         self._apply_env_overrides()
         self._initialized = True
@@ -259,8 +337,7 @@ class ConfigManager:
         with self._file_lock:
             if self._config_path.exists():
                 try:
-                    with open(self._config_path, "r") as f:
-                        self._config = json.load(f)
+                    self._config = read_json(self._config_path)
                     logger.info(f"Loaded config from {self._config_path}")
                     
                     # Merge with defaults to handle missing keys
@@ -309,11 +386,22 @@ class ConfigManager:
         
         return merge(result, config)
 
+    def _publish(self) -> None:
+        """Publish the current config as the snapshot readers see (called from locked context).
+        
+        Every new snapshot gets a new version, whether or not it is saved.
+        """
+        self._snapshot = freeze(self._config)
+        self._version += 1
+
     def _save_internal(self) -> None:
         """Internal save without acquiring lock (called from locked context)."""
+        self._publish()
         try:
-            with open(self._config_path, "w") as f:
-                json.dump(self._config, f, indent=2)
+            # Written synchronously (config changes are rare and other
+            # processes may read the file); the snapshot is immutable, so
+            # it can be serialized without copying
+            get_writer(self._config_path).write(self._snapshot)
             logger.debug(f"Saved config to {self._config_path}")
         except IOError as e:
             logger.error(f"Failed to save config: {e}")
@@ -497,9 +585,20 @@ class ConfigManager:
             changed = True
         
         # Save if any changes were made
-        if changed:
-            with self._file_lock:
+        with self._file_lock:
+            if changed:
                 self._save_internal()
+            else:
+                self._publish()
+    
+    @property
+    def version(self) -> int:
+        """Change counter, incremented every time a new configuration snapshot is published.
+        
+        Lets caches of derived data (e.g. rendered previews) detect config
+        changes without comparing contents.
+        """
+        return self._version
     
     def reload(self) -> None:
         """Reload configuration from file."""
@@ -507,10 +606,16 @@ class ConfigManager:
         self._apply_env_overrides()
         logger.info("Configuration reloaded from file")
 
+    def snapshot(self) -> FrozenDict:
+        """Get a read-only snapshot of the full configuration (includes secrets).
+        
+        The snapshot never changes; writes publish a new one.
+        """
+        return self._snapshot
+
     def get_all(self) -> Dict[str, Any]:
         """Get full configuration (internal use - includes secrets)."""
-        with self._file_lock:
-            return self._deep_copy(self._config)
+        return self._deep_copy(self._snapshot)
 
     def get_all_masked(self) -> Dict[str, Any]:
         """Get full configuration with sensitive fields masked."""
@@ -533,12 +638,15 @@ class ConfigManager:
             return [self._mask_sensitive(item, path) for item in obj]
         return obj
 
+    def get_board_view(self) -> FrozenDict:
+        """Get board configuration from the current snapshot (read-only, no copy)."""
+        snapshot = self._snapshot
+        # Support both old "board_legacy" and new "board" keys for migration
+        return snapshot.get("board") or snapshot.get("board_legacy", _EMPTY)
+
     def get_board(self) -> Dict[str, Any]:
         """Get board configuration."""
-        with self._file_lock:
-            # Support both old "board_legacy" and new "board" keys for migration
-            config = self._config.get("board") or self._config.get("board_legacy", {})
-            return self._deep_copy(config)
+        return self._deep_copy(self.get_board_view())
 
     def set_board(self, settings: Dict[str, Any]) -> None:
         """Update board configuration.
@@ -580,14 +688,22 @@ class ConfigManager:
         Returns:
             Feature configuration dict or None if not found.
         """
-        with self._file_lock:
-            features = self._config.get("features", {})
-            if feature_name in features:
-                return self._deep_copy(features[feature_name])
-            # If feature not in config but exists in defaults, return default
-            if feature_name in DEFAULT_CONFIG.get("features", {}):
-                return self._deep_copy(DEFAULT_CONFIG["features"][feature_name])
-            return None
+        return self._deep_copy(self.get_feature_view(feature_name))
+
+    def get_feature_view(self, feature_name: str) -> Optional[FrozenDict]:
+        """Get a feature's configuration from the current snapshot (read-only, no copy).
+        
+        Args:
+            feature_name: Name of the feature (e.g., 'weather', 'guest_wifi').
+            
+        Returns:
+            Feature configuration or None if not found.
+        """
+        features = self._snapshot.get("features", _EMPTY)
+        if feature_name in features:
+            return features[feature_name]
+        # If feature not in config but exists in defaults, return default
+        return _DEFAULT_FEATURES.get(feature_name)
 
     def set_feature(self, feature_name: str, settings: Dict[str, Any]) -> bool:
         """Update configuration for a specific feature.
@@ -629,10 +745,13 @@ class ConfigManager:
         logger.info(f"Feature '{feature_name}' settings updated")
         return True
 
+    def get_general_view(self) -> FrozenDict:
+        """Get general configuration from the current snapshot (read-only, no copy)."""
+        return self._snapshot.get("general", _EMPTY)
+
     def get_general(self) -> Dict[str, Any]:
         """Get general configuration."""
-        with self._file_lock:
-            return self._deep_copy(self._config.get("general", {}))
+        return self._deep_copy(self.get_general_view())
 
     def set_general(self, settings: Dict[str, Any]) -> bool:
         """Update general configuration.
@@ -672,7 +791,7 @@ class ConfigManager:
         Returns:
             True if feature is enabled, False otherwise.
         """
-        feature = self.get_feature(feature_name)
+        feature = self.get_feature_view(feature_name)
         if feature:
             return feature.get("enabled", False)
         return False
@@ -691,11 +810,11 @@ class ConfigManager:
         Returns:
             List of color rule dicts, or empty list if none defined.
         """
-        feature = self.get_feature(feature_name)
+        feature = self.get_feature_view(feature_name)
         if not feature:
             return []
         
-        color_rules = feature.get("color_rules", {})
+        color_rules = feature.get("color_rules", _EMPTY)
         return color_rules.get(field_name, [])
 
     def validate(self) -> tuple[bool, list[str]]:
@@ -809,11 +928,18 @@ class ConfigManager:
         Returns:
             Plugin configuration dict or None if not found.
         """
-        with self._file_lock:
-            plugins = self._config.get("plugins", {})
-            if plugin_id in plugins:
-                return self._deep_copy(plugins[plugin_id])
-            return None
+        return self._deep_copy(self.get_plugin_config_view(plugin_id))
+    
+    def get_plugin_config_view(self, plugin_id: str) -> Optional[FrozenDict]:
+        """Get a plugin's configuration from the current snapshot (read-only, no copy).
+        
+        Args:
+            plugin_id: Plugin identifier (e.g., 'weather', 'stocks').
+            
+        Returns:
+            Plugin configuration or None if not found.
+        """
+        return self._snapshot.get("plugins", _EMPTY).get(plugin_id)
     
     def set_plugin_config(self, plugin_id: str, config: Dict[str, Any]) -> bool:
         """Set configuration for a specific plugin.
@@ -880,7 +1006,7 @@ class ConfigManager:
         Returns:
             True if plugin is enabled, False otherwise.
         """
-        config = self.get_plugin_config(plugin_id)
+        config = self.get_plugin_config_view(plugin_id)
         if config:
             return config.get("enabled", False)
         return False
@@ -913,8 +1039,7 @@ class ConfigManager:
         Returns:
             Dict mapping plugin_id to configuration.
         """
-        with self._file_lock:
-            return self._deep_copy(self._config.get("plugins", {}))
+        return self._deep_copy(self._snapshot.get("plugins", _EMPTY))
     
     def get_all_plugin_configs_masked(self) -> Dict[str, Dict[str, Any]]:
         """Get all plugin configurations with sensitive fields masked.
@@ -932,7 +1057,7 @@ class ConfigManager:
             List of plugin IDs that are enabled.
         """
         enabled = []
-        for plugin_id, config in self.get_all_plugin_configs().items():
+        for plugin_id, config in self._snapshot.get("plugins", _EMPTY).items():
             if config.get("enabled", False):
                 enabled.append(plugin_id)
         return enabled
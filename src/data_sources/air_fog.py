@@ -6,6 +6,7 @@ import requests
 from typing import Optional, Dict, Tuple
 
 from ..config import Config
+from ..plugins.http import get_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -204,7 +205,7 @@ class AirFogSource:
                 }
             
             headers = {"X-API-Key": self.purpleair_api_key}
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = get_http_session().get(url, params=params, headers=headers, timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -270,7 +271,7 @@ class AirFogSource:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = get_http_session().get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -5,12 +5,14 @@ Provides electric and classic bike counts with color-coded status based on avail
 Supports multiple stations with aggregate statistics and location-based discovery.
 """
 
+import json
 import logging
 import requests
-import time
-import math
 from typing import Optional, Dict, List, Tuple
 from ..config import Config
+from ..plugins.http import get_http_session
+from .catalog_store import CatalogStore
+from .geo_index import GeoGridIndex
 
 logger = logging.getLogger(__name__)
 
@@ -19,40 +21,12 @@ GBFS_BASE_URL = "https://gbfs.baywheels.com/gbfs/en"
 STATION_STATUS_URL = f"{GBFS_BASE_URL}/station_status.json"
 STATION_INFORMATION_URL = f"{GBFS_BASE_URL}/station_information.json"
 
-# Cache for station information (24 hour TTL)
-_station_info_cache: Optional[Dict] = None
-_station_info_cache_time: float = 0
+# Station information is kept on disk and refreshed every 24 hours
 STATION_INFO_CACHE_TTL = 24 * 60 * 60  # 24 hours in seconds
+_station_catalog: Optional[CatalogStore] = None
 
-
-def _haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """
-    Calculate the great circle distance between two points on Earth in kilometers.
-    
-    Args:
-        lat1, lon1: Latitude and longitude of first point
-        lat2, lon2: Latitude and longitude of second point
-        
-    Returns:
-        Distance in kilometers
-    """
-    # Earth radius in kilometers
-    R = 6371.0
-    
-    # Convert to radians
-    lat1_rad = math.radians(lat1)
-    lon1_rad = math.radians(lon1)
-    lat2_rad = math.radians(lat2)
-    lon2_rad = math.radians(lon2)
-    
-    # Haversine formula
-    dlat = lat2_rad - lat1_rad
-    dlon = lon2_rad - lon1_rad
-    
-    a = math.sin(dlat / 2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2)**2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    
-    return R * c
+# Spatial index over the cached station information (rebuilt when it reloads)
+_station_index: Optional[GeoGridIndex] = None
 
 
 class BayWheelsSource:
@@ -74,57 +48,41 @@ class BayWheelsSource:
     @staticmethod
     def _get_station_information() -> Optional[Dict]:
         """
-        Fetch and cache station information (names, addresses, coordinates).
-        Caches for 24 hours to reduce API calls.
+        Get station information (names, addresses, coordinates).
+        Served from the persistent station catalog, refreshed every 24 hours.
         
         Returns:
-            Dictionary mapping station_id to station info, or None if fetch failed
+            Dictionary mapping station_id to station info, or None if unavailable
         """
-        global _station_info_cache, _station_info_cache_time
-        
-        current_time = time.time()
-        
-        # Return cached data if still valid
-        if _station_info_cache is not None and (current_time - _station_info_cache_time) < STATION_INFO_CACHE_TTL:
-            return _station_info_cache
-        
         try:
-            response = requests.get(STATION_INFORMATION_URL, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            stations = data.get("data", {}).get("stations", [])
-            
-            # Build a dictionary mapping station_id to station info
-            station_info_map = {}
-            for station in stations:
-                station_id = station.get("station_id")
-                if station_id:
-                    station_info_map[station_id] = {
-                        "station_id": station_id,
-                        "name": station.get("name", station_id),
-                        "lat": station.get("lat"),
-                        "lon": station.get("lon"),
-                        "address": station.get("address", ""),
-                        "capacity": station.get("capacity", 0),
-                    }
-            
-            # Update cache
-            _station_info_cache = station_info_map
-            _station_info_cache_time = current_time
-            
-            logger.debug(f"Cached {len(station_info_map)} stations from station_information.json")
-            return station_info_map
-            
+            return get_station_catalog().get()
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to fetch station information: {e}")
-            return _station_info_cache  # Return stale cache if available
         except (KeyError, ValueError) as e:
             logger.error(f"Unexpected response format from station_information.json: {e}")
-            return _station_info_cache  # Return stale cache if available
         except Exception as e:
             logger.error(f"Error fetching station information: {e}")
-            return _station_info_cache  # Return stale cache if available
+        return None
+    
+    @staticmethod
+    def _get_station_index(station_info: Dict[str, Dict]) -> GeoGridIndex:
+        """Get the spatial index over station information, building it if needed.
+        
+        Args:
+            station_info: Station ID -> station info, as from _get_station_information()
+        """
+        global _station_index
+        
+        index = _station_index
+        if index is None or index.source is not station_info:
+            index = GeoGridIndex(
+                ((info.get("lat"), info.get("lon"), (station_id, info))
+                 for station_id, info in station_info.items()),
+                source=station_info,
+            )
+            _station_index = index
+            logger.debug(f"Indexed {len(index)} station locations")
+        return index
     
     def _parse_station_status(self, station_data: Dict) -> Optional[Dict]:
         """
@@ -220,7 +178,7 @@ class BayWheelsSource:
             return []
         
         try:
-            response = requests.get(STATION_STATUS_URL, timeout=10)
+            response = get_http_session().get(STATION_STATUS_URL, timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -323,27 +281,19 @@ class BayWheelsSource:
             logger.warning("Station information not available for location search")
             return []
         
-        # Calculate distance to each station
+        # Only stations in grid cells near the location are measured
+        index = cls._get_station_index(station_info)
         stations_with_distance = []
-        for station_id, info in station_info.items():
-            station_lat = info.get("lat")
-            station_lon = info.get("lon")
-            
-            if station_lat is None or station_lon is None:
-                continue
-            
-            distance = _haversine_distance(lat, lng, station_lat, station_lon)
-            
-            if distance <= radius_km:
-                stations_with_distance.append({
-                    "station_id": station_id,
-                    "name": info.get("name", station_id),
-                    "lat": station_lat,
-                    "lon": station_lon,
-                    "address": info.get("address", ""),
-                    "capacity": info.get("capacity", 0),
-                    "distance_km": round(distance, 2),
-                })
+        for distance, (station_id, info) in index.within(lat, lng, radius_km):
+            stations_with_distance.append({
+                "station_id": station_id,
+                "name": info.get("name", station_id),
+                "lat": info.get("lat"),
+                "lon": info.get("lon"),
+                "address": info.get("address", ""),
+                "capacity": info.get("capacity", 0),
+                "distance_km": round(distance, 2),
+            })
         
         # Sort by distance and limit results
         stations_with_distance.sort(key=lambda x: x["distance_km"])
@@ -367,6 +317,41 @@ class BayWheelsSource:
             return "yellow"
 
 
+def parse_station_information(content: str) -> Dict[str, Dict]:
+    """Parse station_information.json into a station_id -> station info map."""
+    stations = json.loads(content).get("data", {}).get("stations", [])
+    
+    station_info_map = {}
+    for station in stations:
+        station_id = station.get("station_id")
+        if station_id:
+            station_info_map[station_id] = {
+                "station_id": station_id,
+                "name": station.get("name", station_id),
+                "lat": station.get("lat"),
+                "lon": station.get("lon"),
+                "address": station.get("address", ""),
+                "capacity": station.get("capacity", 0),
+            }
+    
+    logger.debug(f"Parsed {len(station_info_map)} stations from station_information.json")
+    return station_info_map
+
+
+def get_station_catalog() -> CatalogStore:
+    """Get the persistent station information catalog (stored in data/catalogs/)."""
+    global _station_catalog
+    if _station_catalog is None:
+        _station_catalog = CatalogStore(
+            name="baywheels_stations",
+            url=STATION_INFORMATION_URL,
+            parse=parse_station_information,
+            ttl_seconds=STATION_INFO_CACHE_TTL,
+            timeout=10,
+        )
+    return _station_catalog
+
+
 def get_baywheels_source() -> Optional[BayWheelsSource]:
     """Get configured Bay Wheels source instance."""
     if not Config.BAYWHEELS_ENABLED:
@@ -0,0 +1,298 @@
+"""Persistent cache for slowly-changing remote catalogs.
+
+The Muni stop list (511.org) and Bay Wheels station information (GBFS)
+change rarely but take seconds to download and parse. CatalogStore keeps
+the parsed catalog in memory and in a compact JSON file under
+data/catalogs/, so a restart serves it immediately instead of downloading
+it again.
+
+- Refreshes are conditional (If-None-Match / If-Modified-Since), so an
+  unchanged catalog costs a 304 instead of a full download. A 304 only
+  rewrites a small <name>.meta.json file with the new fetch time, not the
+  catalog itself.
+- Once a catalog is past refresh_ahead of its TTL, reads trigger a
+  background refresh, so callers rarely wait for the network.
+- If a refresh fails, the last good catalog is served, however old.
+"""
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+from ..persistence import read_json, write_json_atomic
+from ..plugins.http import get_http_session
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout changes; older files are ignored
+FORMAT_VERSION = 1
+
+# Fraction of the TTL after which reads refresh in the background
+DEFAULT_REFRESH_AHEAD = 0.8
+
+# After a failed refresh, serve the cached catalog this long before retrying
+RETRY_INTERVAL_SECONDS = 60
+
+DEFAULT_CATALOG_DIR = Path(__file__).parent.parent.parent / "data" / "catalogs"
+
+
+class CatalogStore:
+    """A parsed remote catalog cached in memory and on disk.
+    
+    Attributes:
+        name: Catalog name (also the file name)
+        url: Catalog URL
+        ttl_seconds: Age after which the catalog is refreshed before use
+        path: File the catalog is stored in
+        meta_path: File the time of the last 304 revalidation is stored in
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        parse: Callable[[str], Any],
+        ttl_seconds: float,
+        params: Optional[Callable[[], Dict[str, Any]]] = None,
+        path: Optional[Union[str, Path]] = None,
+        timeout: float = 15,
+        refresh_ahead: float = DEFAULT_REFRESH_AHEAD,
+    ):
+        """Initialize the store (nothing is read until the catalog is used).
+        
+        Args:
+            name: Catalog name
+            url: Catalog URL
+            parse: Turns the response body into the JSON-serializable catalog
+            ttl_seconds: Age after which the catalog is refreshed before use
+            params: Returns the query parameters for a download (e.g. API key)
+            path: File to store the catalog in. Defaults to data/catalogs/<name>.json
+            timeout: Download timeout in seconds
+            refresh_ahead: Fraction of the TTL after which reads refresh in the background
+        """
+        self.name = name
+        self.url = url
+        self.ttl_seconds = ttl_seconds
+        self.path = Path(path) if path else DEFAULT_CATALOG_DIR / f"{name}.json"
+        self.meta_path = self.path.with_suffix(".meta.json")
+        self._parse = parse
+        self._params = params
+        self._timeout = timeout
+        self._refresh_ahead = refresh_ahead
+        
+        self._data: Any = None
+        self._fetched_at: float = 0
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._last_failure: float = 0
+        self._loaded = False
+        self._lock = threading.Lock()  # Guards loading from disk
+        self._refresh_lock = threading.Lock()  # One download at a time
+        self._background: Optional[threading.Thread] = None
+    
+    @property
+    def age(self) -> Optional[float]:
+        """Seconds since the catalog was last confirmed current, or None if there is none."""
+        if self._data is None:
+            return None
+        return max(0.0, time.time() - self._fetched_at)
+    
+    def peek(self) -> Any:
+        """Get the catalog from memory or disk without any network access.
+        
+        Returns:
+            The catalog, however old, or None if there is none yet
+        """
+        self._ensure_loaded()
+        return self._data
+    
+    def get(self) -> Any:
+        """Get the catalog, refreshing it if it has expired.
+        
+        Returns:
+            The catalog. If a refresh fails, the previous catalog is returned.
+        
+        Raises:
+            Exception: If there's no catalog yet and downloading one fails
+        """
+        self._ensure_loaded()
+        age = self.age
+        if age is not None and (age < self.ttl_seconds or self._retry_pending()):
+            data = self._data
+            if age >= self.ttl_seconds * self._refresh_ahead and not self._retry_pending():
+                self.refresh_in_background()
+            return data
+        
+        with self._refresh_lock:
+            # Another caller may have refreshed while we waited
+            age = self.age
+            if age is not None and age < self.ttl_seconds:
+                return self._data
+            try:
+                self._refresh_locked()
+            except Exception as e:
+                if self._data is None:
+                    raise
+                logger.warning(f"Failed to refresh {self.name} catalog, serving cached copy: {e}")
+        return self._data
+    
+    def _retry_pending(self) -> bool:
+        """Whether a refresh failed too recently to try again."""
+        return time.time() - self._last_failure < RETRY_INTERVAL_SECONDS
+    
+    def refresh(self) -> bool:
+        """Download the catalog if it changed since the last download.
+        
+        Returns:
+            True if a new catalog was downloaded, False if it was unchanged
+        
+        Raises:
+            Exception: If the download or parsing fails
+        """
+        self._ensure_loaded()
+        with self._refresh_lock:
+            return self._refresh_locked()
+    
+    def refresh_in_background(self) -> bool:
+        """Start a background refresh unless one is running.
+        
+        Returns:
+            True if a refresh was started
+        """
+        with self._lock:
+            if self._background is not None and self._background.is_alive():
+                return False
+            self._background = threading.Thread(
+                target=self._refresh_quietly, name=f"catalog-{self.name}", daemon=True
+            )
+            self._background.start()
+        return True
+    
+    def _refresh_quietly(self) -> None:
+        """Background refresh: log failures instead of raising."""
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.warning(f"Background refresh of {self.name} catalog failed: {e}")
+    
+    def _refresh_locked(self) -> bool:
+        """Conditional download (called with _refresh_lock held)."""
+        try:
+            return self._download()
+        except Exception:
+            self._last_failure = time.time()
+            raise
+    
+    def _download(self) -> bool:
+        """Download and store the catalog unless the server reports it unchanged."""
+        headers = {}
+        if self._data is not None:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+        
+        params = self._params() if self._params else None
+        response = get_http_session().get(self.url, params=params, headers=headers, timeout=self._timeout)
+        
+        if response.status_code == 304 and self._data is not None:
+            self._fetched_at = time.time()
+            self._save_meta()
+            logger.debug(f"{self.name} catalog unchanged")
+            return False
+        
+        response.raise_for_status()
+        content = response.text
+        if content.startswith('\ufeff'):
+            content = content[1:]
+        data = self._parse(content)
+        
+        self._data = data
+        self._fetched_at = time.time()
+        self._etag = response.headers.get("ETag")
+        self._last_modified = response.headers.get("Last-Modified")
+        self._save()
+        logger.info(f"Downloaded {self.name} catalog")
+        return True
+    
+    def _ensure_loaded(self) -> None:
+        """Load the stored catalog from disk the first time it's needed."""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._load()
+            self._loaded = True
+    
+    def _load(self) -> None:
+        """Read the stored catalog, ignoring missing or unreadable files."""
+        if not self.path.exists():
+            return
+        try:
+            stored = read_json(self.path)
+        except (ValueError, IOError) as e:
+            logger.warning(f"Ignoring unreadable {self.name} catalog file: {e}")
+            return
+        if not isinstance(stored, dict) or stored.get("format") != FORMAT_VERSION:
+            logger.info(f"Ignoring {self.name} catalog file with an old format")
+            return
+        
+        self._data = stored.get("data")
+        self._fetched_at = float(stored.get("fetched_at", 0))
+        self._etag = stored.get("etag")
+        self._last_modified = stored.get("last_modified")
+        self._load_meta()
+        logger.info(f"Loaded {self.name} catalog from {self.path} (age {self.age or 0:.0f}s)")
+    
+    def _load_meta(self) -> None:
+        """Apply the fetch time of a later 304 revalidation of the stored catalog."""
+        if not self.meta_path.exists():
+            return
+        try:
+            meta = read_json(self.meta_path)
+        except (ValueError, IOError) as e:
+            logger.warning(f"Ignoring unreadable {self.name} catalog metadata: {e}")
+            return
+        # Only trust metadata written for the version of the catalog we loaded
+        if (
+            not isinstance(meta, dict)
+            or meta.get("format") != FORMAT_VERSION
+            or meta.get("etag") != self._etag
+            or meta.get("last_modified") != self._last_modified
+        ):
+            return
+        self._fetched_at = max(self._fetched_at, float(meta.get("fetched_at", 0)))
+    
+    def _save_meta(self) -> None:
+        """Store the fetch time after a 304 without rewriting the catalog."""
+        meta = {
+            "format": FORMAT_VERSION,
+            "fetched_at": self._fetched_at,
+            "etag": self._etag,
+            "last_modified": self._last_modified,
+        }
+        try:
+            self.meta_path.parent.mkdir(parents=True, exist_ok=True)
+            write_json_atomic(self.meta_path, meta, fsync=False, compact=True)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to store {self.name} catalog metadata: {e}")
+    
+    def _save(self) -> None:
+        """Store the catalog on disk (failures only cost a download after restart)."""
+        stored = {
+            "format": FORMAT_VERSION,
+            "url": self.url,
+            "fetched_at": self._fetched_at,
+            "etag": self._etag,
+            "last_modified": self._last_modified,
+            "data": self._data,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Catalogs can always be downloaded again, so skip fsync
+            write_json_atomic(self.path, stored, fsync=False, compact=True)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to store {self.name} catalog: {e}")
@@ -0,0 +1,204 @@
+"""Spatial index for nearby-location searches.
+
+The setup UI looks up Muni stops and Bay Wheels stations near a point on
+every map move and keystroke. Catalogs hold thousands of entries, so
+instead of computing the distance to every one, GeoGridIndex buckets them
+into a grid of small lat/lon cells when the catalog loads. A query only
+measures entries in the cells that can overlap the search radius.
+"""
+
+import math
+from typing import Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+EARTH_RADIUS_KM = 6371.0
+
+# Kilometers per degree of latitude
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+# Default cell size (~1.1 km north-south); typical searches span a few cells
+DEFAULT_CELL_DEGREES = 0.01
+
+# Latitude beyond which longitude cells are treated as if at this latitude
+_MAX_LATITUDE = 89.0
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Calculate the great circle distance between two points in kilometers."""
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    dlat = lat2_rad - lat1_rad
+    dlon = math.radians(lon2 - lon1)
+    
+    a = math.sin(dlat / 2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2)**2
+    return 2 * EARTH_RADIUS_KM * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+class GeoGridIndex(Generic[T]):
+    """Grid of lat/lon cells holding catalog entries.
+    
+    Attributes:
+        source: Catalog the index was built from (lets callers detect a
+                reloaded catalog by identity)
+        cell_degrees: Cell size in degrees of latitude and longitude
+    """
+    
+    def __init__(
+        self,
+        points: Iterable[Tuple[Optional[float], Optional[float], T]],
+        cell_degrees: float = DEFAULT_CELL_DEGREES,
+        source: object = None,
+    ):
+        """Build the index.
+        
+        Args:
+            points: (lat, lon, item) tuples; entries without coordinates are skipped
+            cell_degrees: Cell size in degrees
+            source: Catalog the points came from
+        """
+        self.source = source
+        self.cell_degrees = cell_degrees
+        # (row, col) -> [(order, lat, lon, item)]
+        self._cells: Dict[Tuple[int, int], List[Tuple[int, float, float, T]]] = {}
+        self._size = 0
+        
+        for lat, lon, item in points:
+            if lat is None or lon is None:
+                continue
+            lat, lon = float(lat), float(lon)
+            self._cells.setdefault(self._cell(lat, lon), []).append((self._size, lat, lon, item))
+            self._size += 1
+        
+        if self._cells:
+            rows = [row for row, _ in self._cells]
+            cols = [col for _, col in self._cells]
+            self._row_range = (min(rows), max(rows))
+            self._col_range = (min(cols), max(cols))
+            # Narrowest cell width anywhere in the index (longitude cells
+            # narrow away from the equator), with a little slack for the
+            # difference between great circles and parallels
+            max_lat = min(max(abs(min(rows)), abs(max(rows) + 1)) * cell_degrees, _MAX_LATITUDE)
+            self._min_cell_km = 0.99 * cell_degrees * KM_PER_DEGREE * math.cos(math.radians(max_lat))
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        """Get the cell containing a point."""
+        return (math.floor(lat / self.cell_degrees), math.floor(lon / self.cell_degrees))
+    
+    def within(self, lat: float, lon: float, radius_km: float) -> List[Tuple[float, T]]:
+        """Find entries within a radius of a point.
+        
+        Args:
+            lat: Latitude
+            lon: Longitude
+            radius_km: Search radius in kilometers
+        
+        Returns:
+            (distance_km, item) pairs in the order the catalog listed them
+        """
+        if not self._cells or radius_km < 0:
+            return []
+        
+        dlat = radius_km / KM_PER_DEGREE
+        max_lat = min(abs(lat) + dlat, _MAX_LATITUDE)
+        dlon = min(radius_km / (KM_PER_DEGREE * math.cos(math.radians(max_lat))), 180.0)
+        
+        row_min, col_min = self._cell(lat - dlat, lon - dlon)
+        row_max, col_max = self._cell(lat + dlat, lon + dlon)
+        row_min, row_max = max(row_min, self._row_range[0]), min(row_max, self._row_range[1])
+        col_min, col_max = max(col_min, self._col_range[0]), min(col_max, self._col_range[1])
+        
+        matches = []
+        for row in range(row_min, row_max + 1):
+            for col in range(col_min, col_max + 1):
+                for order, item_lat, item_lon, item in self._cells.get((row, col), ()):
+                    distance = haversine_km(lat, lon, item_lat, item_lon)
+                    if distance <= radius_km:
+                        matches.append((order, distance, item))
+        
+        matches.sort(key=lambda match: match[0])
+        return [(distance, item) for _, distance, item in matches]
+    
+    def nearest(
+        self,
+        lat: float,
+        lon: float,
+        k: int,
+        max_radius_km: Optional[float] = None,
+    ) -> List[Tuple[float, T]]:
+        """Find the k entries nearest to a point.
+        
+        Scans rings of cells outward from the point's cell and stops once no
+        unscanned cell can hold anything closer than the k-th match. Rings
+        start at the first one that reaches the data extent and are clipped
+        to it, so points far outside the catalog's area cost no more than
+        points inside it.
+        
+        Args:
+            lat: Latitude
+            lon: Longitude
+            k: Maximum number of entries
+            max_radius_km: Optional search radius in kilometers
+        
+        Returns:
+            (distance_km, item) pairs, nearest first
+        """
+        if not self._cells or k <= 0:
+            return []
+        
+        center_row, center_col = self._cell(lat, lon)
+        # Rings closer than the data extent are empty
+        min_ring = max(
+            0,
+            self._row_range[0] - center_row, center_row - self._row_range[1],
+            self._col_range[0] - center_col, center_col - self._col_range[1],
+        )
+        max_ring = max(
+            abs(center_row - self._row_range[0]), abs(center_row - self._row_range[1]),
+            abs(center_col - self._col_range[0]), abs(center_col - self._col_range[1]),
+        )
+        
+        candidates: List[Tuple[float, int, T]] = []
+        for ring in range(min_ring, max_ring + 1):
+            for row, col in self._ring_cells(center_row, center_col, ring):
+                for order, item_lat, item_lon, item in self._cells.get((row, col), ()):
+                    distance = haversine_km(lat, lon, item_lat, item_lon)
+                    if max_radius_km is None or distance <= max_radius_km:
+                        candidates.append((distance, order, item))
+            
+            # Anything in ring + 1 or beyond is at least this far away
+            bound = ring * self._min_cell_km
+            if max_radius_km is not None and bound > max_radius_km:
+                break
+            if len(candidates) >= k:
+                candidates.sort(key=lambda candidate: candidate[:2])
+                del candidates[k:]
+                if candidates[-1][0] <= bound:
+                    break
+        
+        candidates.sort(key=lambda candidate: candidate[:2])
+        return [(distance, item) for distance, _, item in candidates[:k]]
+    
+    def _ring_cells(self, center_row: int, center_col: int, ring: int) -> Iterable[Tuple[int, int]]:
+        """Get the cells on the square ring at a distance from a center cell, within the data extent."""
+        row_min, row_max = self._row_range
+        col_min, col_max = self._col_range
+        if ring == 0:
+            if row_min <= center_row <= row_max and col_min <= center_col <= col_max:
+                yield (center_row, center_col)
+            return
+        # Top and bottom edges (including corners)
+        cols = range(max(center_col - ring, col_min), min(center_col + ring, col_max) + 1)
+        for row in (center_row - ring, center_row + ring):
+            if row_min <= row <= row_max:
+                for col in cols:
+                    yield (row, col)
+        # Left and right edges
+        rows = range(max(center_row - ring + 1, row_min), min(center_row + ring - 1, row_max) + 1)
+        for col in (center_col - ring, center_col + ring):
+            if col_min <= col <= col_max:
+                for row in rows:
+                    yield (row, col)
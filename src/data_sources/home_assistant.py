@@ -4,6 +4,7 @@ import logging
 import requests
 from typing import Optional, Dict, List
 from ..config import Config
+from ..plugins.http import get_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +42,7 @@ class HomeAssistantSource:
         """
         try:
             url = f"{self.api_url}/states/{entity_id}"
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = get_http_session().get(url, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -104,7 +105,7 @@ class HomeAssistantSource:
         """
         try:
             url = f"{self.api_url}/states"
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = get_http_session().get(url, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
             entities = response.json()
             
@@ -131,7 +132,7 @@ class HomeAssistantSource:
         """
         try:
             url = f"{self.api_url}/"
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = get_http_session().get(url, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
             return True
         except requests.exceptions.RequestException as e:
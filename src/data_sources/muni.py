@@ -6,14 +6,23 @@ transit data once every 90 seconds, then serves Muni data from cache).
 Supports multiple stop monitoring.
 """
 
+import json
 import logging
 from typing import Optional, Dict, List, Any
 from datetime import datetime, timezone
 from ..config import Config
+from .catalog_store import CatalogStore
 from .transit_cache import get_transit_cache
 
 logger = logging.getLogger(__name__)
 
+# Stop catalog (names and locations of all SF Muni stops)
+MUNI_STOPS_URL = "http://api.511.org/transit/stops"
+MUNI_STOPS_CACHE_TTL = 24 * 60 * 60  # 24 hours in seconds
+
+# Transit cache subscription id for the configured stops
+MUNI_CACHE_CONSUMER = "source:muni"
+
 
 # Board color codes
 COLOR_RED = 63    # Delay indicator
@@ -537,10 +546,6 @@ def get_muni_source() -> Optional[MuniSource]:
         enabled=cache_enabled
     )
     
-    # Start cache if not already running
-    if cache_enabled and not cache.is_ready():
-        cache.start()
-    
     # Support both new (MUNI_STOP_CODES list) and old (MUNI_STOP_CODE string) config
     stop_codes = getattr(Config, 'MUNI_STOP_CODES', None)
     
@@ -553,6 +558,13 @@ def get_muni_source() -> Optional[MuniSource]:
             # No stops configured yet, but return source anyway so variables show in UI
             stop_codes = []
     
+    # Only keep our stops' arrivals from the regional feed
+    cache.subscribe(MUNI_CACHE_CONSUMER, MuniSource.AGENCY, stop_codes)
+    
+    # Start cache if not already running
+    if cache_enabled and not cache.is_ready():
+        cache.start()
+    
     # Return source even with empty stop_codes so template variables are available
     return MuniSource(
         api_key=Config.MUNI_API_KEY,
@@ -560,3 +572,58 @@ def get_muni_source() -> Optional[MuniSource]:
         line_name=Config.MUNI_LINE_NAME if Config.MUNI_LINE_NAME else None
     )
 
+
+def parse_muni_stops(content: str) -> Dict[str, Any]:
+    """Parse the 511.org stops response into the stop catalog.
+    
+    Args:
+        content: Response body of the stops endpoint
+        
+    Returns:
+        Dict with "stops" (stop_code, stop_id, name, lat, lon) and "total"
+    """
+    data = json.loads(content)
+    
+    # Parse stops from the Contents.dataObjects.ScheduledStopPoint array
+    stops = []
+    stop_points = data.get("Contents", {}).get("dataObjects", {}).get("ScheduledStopPoint", [])
+    
+    for stop in stop_points:
+        stop_id = stop.get("id", "")
+        # Extract numeric stop code from ID (format: "SF_####")
+        stop_code = stop_id.split("_")[-1] if "_" in stop_id else stop_id
+        
+        location = stop.get("Location", {})
+        lat = location.get("Latitude")
+        lon = location.get("Longitude")
+        
+        stops.append({
+            "stop_code": stop_code,
+            "stop_id": stop_id,
+            "name": stop.get("Name", stop_code),
+            "lat": float(lat) if lat else None,
+            "lon": float(lon) if lon else None,
+        })
+    
+    return {
+        "stops": stops,
+        "total": len(stops)
+    }
+
+
+# Singleton stop catalog
+_muni_stop_catalog: Optional[CatalogStore] = None
+
+
+def get_muni_stop_catalog() -> CatalogStore:
+    """Get the persistent Muni stop catalog (stored in data/catalogs/)."""
+    global _muni_stop_catalog
+    if _muni_stop_catalog is None:
+        _muni_stop_catalog = CatalogStore(
+            name="muni_stops",
+            url=MUNI_STOPS_URL,
+            parse=parse_muni_stops,
+            ttl_seconds=MUNI_STOPS_CACHE_TTL,
+            params=lambda: {"api_key": Config.MUNI_API_KEY, "operator_id": "SF", "format": "json"},
+        )
+    return _muni_stop_catalog
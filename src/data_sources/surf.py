@@ -6,6 +6,7 @@ Fetches marine/surf conditions for Ocean Beach, San Francisco.
 import logging
 import requests
 from typing import Optional, Dict
+from ..plugins.http import get_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -67,7 +68,7 @@ class SurfSource:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = get_http_session().get(url, params=params, timeout=10)
             response.raise_for_status()
             marine_data = response.json()
             
@@ -157,7 +158,7 @@ class SurfSource:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = get_http_session().get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             
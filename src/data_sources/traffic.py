@@ -8,6 +8,7 @@ import requests
 from typing import Optional, Dict, Tuple, List
 
 from ..config import Config
+from ..plugins.http import get_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -246,7 +247,7 @@ class TrafficSource:
             body["routingPreference"] = "TRAFFIC_AWARE_OPTIMAL"
         
         try:
-            response = requests.post(url, json=body, headers=headers, timeout=10)
+            response = get_http_session().post(url, json=body, headers=headers, timeout=10)
             
             # Handle specific HTTP errors with helpful messages
             if response.status_code == 403:
@@ -6,17 +6,34 @@ it caches route data for a configurable TTL (default 300s / 5 minutes).
 
 The cache supports multiple providers (Google Routes API, HERE Routing API, etc.)
 and automatically refreshes data in the background.
+
+Entries are snapshotted to disk (debounced) and restored with their original
+age on first use after a restart. get_or_fetch() serves entries past their
+TTL (up to STALE_MAX_AGE) immediately while refreshing them in the
+background, so a restart doesn't cost a round of API calls or blank routes.
 """
 
 import logging
 import threading
 import time
 import hashlib
-from typing import Optional, Dict, List, Any, Tuple
+from pathlib import Path
+from typing import Optional, Callable, Dict, List, Any, Set, Tuple
 from datetime import datetime
 
+from ..persistence import get_writer, read_json
+
 logger = logging.getLogger(__name__)
 
+# Snapshots of cached routes are stored here (see TrafficCache.snapshot_path)
+DEFAULT_SNAPSHOT_DIR = Path(__file__).parent.parent.parent / "data" / "cache"
+
+# Bump when the snapshot layout changes; older files are ignored
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Changes within this many seconds are saved together
+SNAPSHOT_DEBOUNCE_SECONDS = 5.0
+
 
 class TrafficCache:
     """Singleton service that caches traffic/routing data."""
@@ -28,6 +45,7 @@ class TrafficCache:
     DEFAULT_TTL = 300  # 5 minutes in seconds
     STALE_WARNING_THRESHOLD = 600  # 10 minutes - warn if cache entry is this old
     MAX_CACHE_SIZE = 100  # Maximum number of routes to cache
+    STALE_MAX_AGE = 3600  # 1 hour - get_or_fetch() serves expired entries up to this age
     
     def __new__(cls) -> "TrafficCache":
         """Singleton pattern to ensure only one cache instance exists."""
@@ -52,9 +70,18 @@ class TrafficCache:
         # Statistics
         self._cache_hits: int = 0
         self._cache_misses: int = 0
+        self._stale_hits: int = 0
         self._api_calls: int = 0
         self._error_count: int = 0
         
+        # Snapshot file for warm starts (None disables snapshots)
+        self.snapshot_path: Optional[Path] = DEFAULT_SNAPSHOT_DIR / "traffic.json"
+        self._restore_checked: bool = False
+        self._restored_count: int = 0
+        
+        # Route keys being refreshed in the background
+        self._refreshing: Set[str] = set()
+        
         # Configuration
         self._ttl: int = self.DEFAULT_TTL
         self._enabled: bool = True
@@ -80,11 +107,13 @@ class TrafficCache:
             logger.info(f"TrafficCache configured: enabled={enabled}, ttl={ttl}s")
     
     def start(self):
-        """Start the background cleanup thread."""
+        """Start the background cleanup thread (restoring the last snapshot first)."""
         if not self._enabled:
             logger.warning("TrafficCache not started - disabled in configuration")
             return
         
+        self._ensure_restored()
+        
         with self._lock:
             if self._refresh_thread is not None and self._refresh_thread.is_alive():
                 logger.warning("TrafficCache cleanup thread already running")
@@ -122,12 +151,13 @@ class TrafficCache:
         logger.info("TrafficCache cleanup loop stopped")
     
     def _cleanup_expired(self):
-        """Remove expired entries from cache."""
+        """Remove entries too old to serve, even as stale data."""
         with self._data_lock:
             now = time.time()
+            max_age = self._max_age()
             expired_keys = [
                 key for key, cached_route in self._cache.items()
-                if now - cached_route.cached_at > self._ttl
+                if now - cached_route.cached_at > max_age
             ]
             
             for key in expired_keys:
@@ -147,6 +177,81 @@ class TrafficCache:
                 for key, _ in to_remove:
                     del self._cache[key]
                 logger.debug(f"Evicted {len(to_remove)} old cache entries (max size: {self.MAX_CACHE_SIZE})")
+                expired_keys.extend(key for key, _ in to_remove)
+        
+        if expired_keys:
+            self._save_snapshot()
+    
+    def _max_age(self) -> float:
+        """Age after which an entry can't be served at all."""
+        return max(self._ttl, self.STALE_MAX_AGE)
+    
+    def _ensure_restored(self):
+        """Load the snapshot saved by a previous run, the first time the cache is used."""
+        if self._restore_checked:
+            return
+        with self._data_lock:
+            if self._restore_checked:
+                return
+            self._restore_checked = True
+            self._restore_snapshot()
+    
+    def _restore_snapshot(self):
+        """Load entries from the snapshot, keeping their original cache times."""
+        path = self.snapshot_path
+        if path is None or not path.exists():
+            return
+        try:
+            stored = read_json(path)
+        except (ValueError, IOError) as e:
+            logger.warning(f"Ignoring unreadable TrafficCache snapshot: {e}")
+            return
+        if not isinstance(stored, dict) or stored.get("format") != SNAPSHOT_FORMAT_VERSION:
+            logger.info("Ignoring TrafficCache snapshot with an old format")
+            return
+        
+        now = time.time()
+        max_age = self._max_age()
+        restored = 0
+        for entry in stored.get("routes", []):
+            try:
+                cached_route = CachedRoute.from_dict(entry)
+            except (KeyError, TypeError, ValueError):
+                continue
+            if now - cached_route.cached_at > max_age:
+                continue
+            # Never replace an entry cached since startup
+            if cached_route.route_key not in self._cache:
+                self._cache[cached_route.route_key] = cached_route
+                restored += 1
+        
+        self._restored_count = restored
+        logger.info(f"Restored {restored} TrafficCache entries from snapshot")
+    
+    def _save_snapshot(self):
+        """Save entries for the next start (debounced; failures only cost a cold start)."""
+        if self.snapshot_path is None:
+            return
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            # Snapshots can always be fetched again, so skip fsync
+            writer = get_writer(
+                self.snapshot_path,
+                debounce_seconds=SNAPSHOT_DEBOUNCE_SECONDS,
+                fsync=False,
+                compact=True,
+            )
+            writer.write(self._snapshot_data)
+        except OSError as e:
+            logger.warning(f"Failed to save TrafficCache snapshot: {e}")
+    
+    def _snapshot_data(self) -> Dict[str, Any]:
+        """Build the snapshot file contents."""
+        with self._data_lock:
+            return {
+                "format": SNAPSHOT_FORMAT_VERSION,
+                "routes": [cached_route.to_dict() for cached_route in self._cache.values()],
+            }
     
     @staticmethod
     def _make_route_key(origin: str, destination: str, travel_mode: str, provider: str = "google") -> str:
@@ -198,6 +303,7 @@ class TrafficCache:
                 self._cache_misses += 1
             return None
         
+        self._ensure_restored()
         route_key = self._make_route_key(origin, destination, travel_mode, provider)
         
         with self._data_lock:
@@ -213,8 +319,9 @@ class TrafficCache:
             if age > self._ttl:
                 self._cache_misses += 1
                 logger.debug(f"Cache EXPIRED: {route_key} (age: {age:.0f}s)")
-                # Remove expired entry
-                del self._cache[route_key]
+                # Remove the entry unless get_or_fetch() can still serve it stale
+                if age > self._max_age():
+                    del self._cache[route_key]
                 return None
             
             # Cache hit
@@ -248,6 +355,7 @@ class TrafficCache:
         if not self._enabled:
             return
         
+        self._ensure_restored()
         route_key = self._make_route_key(origin, destination, travel_mode, provider)
         
         with self._data_lock:
@@ -262,6 +370,94 @@ class TrafficCache:
             )
             self._api_calls += 1
             logger.debug(f"Cached route: {route_key}")
+        
+        self._save_snapshot()
+    
+    def get_or_fetch(
+        self,
+        origin: str,
+        destination: str,
+        travel_mode: str,
+        provider: str,
+        fetch: Callable[[], Optional[Dict[str, Any]]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get route data, serving stale data while it's refreshed in the background.
+        
+        Fresh entries are returned as-is. Entries past their TTL (up to
+        STALE_MAX_AGE) are returned immediately and fetch() runs in a
+        background thread to replace them. Without an entry, fetch() runs
+        now and its result is cached.
+        
+        Args:
+            origin: Origin address or coordinates
+            destination: Destination address or coordinates
+            travel_mode: Travel mode (DRIVE, BICYCLE, etc.)
+            provider: API provider (google, here, etc.)
+            fetch: Calls the API; returns route data, or None on failure
+            
+        Returns:
+            Route data, or None if there's no entry and fetch() returned None
+        """
+        if not self._enabled:
+            return fetch()
+        
+        self._ensure_restored()
+        route_key = self._make_route_key(origin, destination, travel_mode, provider)
+        
+        with self._data_lock:
+            cached_route = self._cache.get(route_key)
+            if cached_route is not None:
+                age = time.time() - cached_route.cached_at
+                if age <= self._ttl:
+                    self._cache_hits += 1
+                    return cached_route.data
+                if age <= self._max_age():
+                    self._cache_hits += 1
+                    self._stale_hits += 1
+                    logger.debug(f"Cache STALE: {route_key} (age: {age:.0f}s), refreshing in background")
+                    self._refresh_in_background(route_key, origin, destination, travel_mode, provider, fetch)
+                    return cached_route.data
+            self._cache_misses += 1
+        
+        data = self._fetch(route_key, fetch)
+        if data is not None:
+            self.set(origin, destination, travel_mode, provider, data)
+        return data
+    
+    def _refresh_in_background(
+        self,
+        route_key: str,
+        origin: str,
+        destination: str,
+        travel_mode: str,
+        provider: str,
+        fetch: Callable[[], Optional[Dict[str, Any]]]
+    ):
+        """Start refreshing an entry unless it's already being refreshed (called with _data_lock held)."""
+        if route_key in self._refreshing:
+            return
+        self._refreshing.add(route_key)
+        
+        def refresh():
+            try:
+                data = self._fetch(route_key, fetch)
+                if data is not None:
+                    self.set(origin, destination, travel_mode, provider, data)
+            finally:
+                with self._data_lock:
+                    self._refreshing.discard(route_key)
+        
+        threading.Thread(target=refresh, daemon=True, name=f"TrafficCache-{route_key}").start()
+    
+    def _fetch(self, route_key: str, fetch: Callable[[], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """Call fetch(), counting and logging failures."""
+        try:
+            return fetch()
+        except Exception as e:
+            self.increment_error_count()
+            logger.error(f"Error fetching route {route_key}: {e}")
+            return None
     
     def invalidate(self, origin: str, destination: str, travel_mode: str = None, provider: str = None):
         """
@@ -295,6 +491,9 @@ class TrafficCache:
             
             if keys_to_remove:
                 logger.info(f"Invalidated {len(keys_to_remove)} cache entries")
+        
+        if keys_to_remove:
+            self._save_snapshot()
     
     def clear(self):
         """Clear all cached data."""
@@ -302,6 +501,8 @@ class TrafficCache:
             count = len(self._cache)
             self._cache.clear()
             logger.info(f"Cleared {count} cache entries")
+        
+        self._save_snapshot()
     
     def get_status(self) -> Dict[str, Any]:
         """
@@ -321,9 +522,11 @@ class TrafficCache:
                 "max_cache_size": self.MAX_CACHE_SIZE,
                 "cache_hits": self._cache_hits,
                 "cache_misses": self._cache_misses,
+                "stale_hits": self._stale_hits,
                 "hit_rate_percent": round(hit_rate, 1),
                 "api_calls_made": self._api_calls,
                 "error_count": self._error_count,
+                "restored_entries": self._restored_count,
                 "thread_alive": self._refresh_thread.is_alive() if self._refresh_thread else False,
             }
     
@@ -362,6 +565,31 @@ class CachedRoute:
         self.provider = provider
         self.data = data
         self.cached_at = cached_at
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "route_key": self.route_key,
+            "origin": self.origin,
+            "destination": self.destination,
+            "travel_mode": self.travel_mode,
+            "provider": self.provider,
+            "data": self.data,
+            "cached_at": self.cached_at,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CachedRoute":
+        """Create from a dict made by to_dict()."""
+        return cls(
+            route_key=data["route_key"],
+            origin=data["origin"],
+            destination=data["destination"],
+            travel_mode=data["travel_mode"],
+            provider=data["provider"],
+            data=data["data"],
+            cached_at=float(data["cached_at"]),
+        )
 
 
 # Global singleton instance getter
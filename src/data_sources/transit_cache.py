@@ -6,18 +6,317 @@ from potentially 100+ per hour to ~40 per hour, staying well within the 60/hour
 
 The cache fetches ALL Bay Area transit data using agency=RG, then serves filtered
 data to specific transit sources (Muni, BART, etc.) from the cache.
+
+The agency feed holds every stop, but consumers only ever read a handful.
+Consumers subscribe to the stops they display, and each refresh streams the
+response through iter_stop_visits(), keeping visits only for subscribed
+stops plus a small stop -> route names index (for the nearby-stops lookup).
+The full document is never held in memory.
+
+Subscribed stops are also parsed once per refresh into compact, sorted
+Arrival records (see get_arrivals()), so consumers only compute "minutes
+until" when they render instead of re-parsing raw visits on every fetch.
+
+After every successful refresh the indexed stops are saved to a snapshot
+file. start() reloads a recent snapshot, serves it right away (with its
+real age) and refreshes in the background when it's due, so a restart
+neither blanks the board nor costs an extra API call.
 """
 
+import codecs
 import logging
+import re
 import requests
 import json
 import threading
 import time
-from typing import Optional, Dict, List, Any
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Dict, FrozenSet, Iterable, Iterator, List, Any, Set, Tuple
 from datetime import datetime, timezone
+from ..persistence import get_writer, read_json
+from ..plugins.http import get_http_session
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from the response per chunk while streaming
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# Key of the visit array in StopMonitoring responses
+_VISITS_KEY = '"MonitoredStopVisit"'
+
+# Snapshots of indexed data are stored here (see TransitCache.snapshot_path)
+DEFAULT_SNAPSHOT_DIR = Path(__file__).parent.parent.parent / "data" / "cache"
+
+# Bump when the snapshot layout changes; older files are ignored
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Snapshots older than this are ignored at startup (predictions are outdated)
+SNAPSHOT_MAX_AGE = 30 * 60
+
+# Restored arrivals that left more than this many seconds ago are dropped
+DEPARTED_GRACE_SECONDS = 60
+
+# Stops read without a subscription are kept this long after their last read
+REQUESTED_STOP_TTL = 15 * 60
+
+# ISO 8601 durations as used for SIRI Delay, e.g. "PT2M30S" or "-PT45S"
+_DURATION_PATTERN = re.compile(r"^(-)?P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?)?$")
+
+# Subscription: (agency, stop_code, line filter or None for all lines)
+LineFilter = Optional[FrozenSet[str]]
+Subscription = Tuple[str, str, LineFilter]
+
+
+@dataclass(frozen=True, slots=True)
+class Arrival:
+    """One predicted arrival, parsed once per refresh.
+    
+    Attributes:
+        line: Published line name, uppercased (e.g. "N-JUDAH")
+        arrival: Expected arrival as a Unix timestamp
+        delay: Reported delay in seconds (negative if early), None if not reported
+        delayed: Whether a delay or service disruption is reported
+        occupancy: Uppercased occupancy, e.g. "FULL" or "UNKNOWN"
+    """
+    line: str
+    arrival: float
+    delay: Optional[int]
+    delayed: bool
+    occupancy: str
+    
+    def minutes_until(self, now: float) -> int:
+        """Whole minutes from now until the arrival (0 if it's due or past)."""
+        return max(0, int((self.arrival - now) / 60))
+
+
+@dataclass(frozen=True, slots=True)
+class StopArrivals:
+    """Parsed arrivals at one stop.
+    
+    Attributes:
+        stop_code: Stop code
+        stop_name: Stop name from the feed ("" if not reported)
+        arrivals: Arrivals ordered by arrival time
+    """
+    stop_code: str
+    stop_name: str
+    arrivals: Tuple[Arrival, ...]
+    
+    def for_lines(self, lines: LineFilter) -> "StopArrivals":
+        """Keep only arrivals on the given lines (see line_matches())."""
+        if lines is None:
+            return self
+        arrivals = tuple(a for a in self.arrivals if line_matches(a.line, lines))
+        return StopArrivals(self.stop_code, self.stop_name, arrivals)
+
+
+def line_matches(line: str, lines: FrozenSet[str]) -> bool:
+    """Whether a published line name matches a line filter.
+    
+    Filter entries match the whole name or either half of a hyphenated one,
+    so "N", "JUDAH" and "N-JUDAH" all match "N-JUDAH".
+    """
+    if line in lines:
+        return True
+    if "-" in line:
+        code, _, name = line.partition("-")
+        return code in lines or name in lines
+    return False
+
+
+def _line_filter(lines: Optional[Iterable[str]]) -> LineFilter:
+    """Normalize a line filter (None or empty means all lines)."""
+    if not lines:
+        return None
+    return frozenset(line.strip().upper() for line in lines if line and line.strip()) or None
+
+
+def _first(value: Any, default: Any = "") -> Any:
+    """Unwrap SIRI fields that may be given as a list."""
+    if isinstance(value, list):
+        return value[0] if value else default
+    return value
+
+
+def _parse_timestamp(iso_timestamp: str) -> Optional[float]:
+    """Parse an ISO 8601 timestamp into a Unix timestamp (None if invalid)."""
+    try:
+        return datetime.fromisoformat(iso_timestamp.replace('Z', '+00:00')).timestamp()
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+def _parse_duration(duration: Any) -> Optional[int]:
+    """Parse an ISO 8601 duration such as "PT2M30S" into seconds (None if invalid)."""
+    if not isinstance(duration, str):
+        return None
+    match = _DURATION_PATTERN.match(duration.strip())
+    if not match:
+        return None
+    sign, days, hours, minutes, seconds = match.groups()
+    total = int(days or 0) * 86400 + int(hours or 0) * 3600 + int(minutes or 0) * 60 + float(seconds or 0)
+    return -int(total) if sign else int(total)
+
+
+def _parse_stop_visits(
+    stop_code: str,
+    visits: List[Dict[str, Any]],
+    not_before: Optional[float] = None,
+) -> StopArrivals:
+    """Parse a stop's visits into sorted Arrival records.
+    
+    Visits without a line name or a valid expected (or aimed) time are
+    skipped, as are arrivals before not_before if given.
+    """
+    stop_name = ""
+    arrivals = []
+    for visit in visits:
+        journey = visit.get("MonitoredVehicleJourney", {})
+        monitored_call = journey.get("MonitoredCall", {})
+        if not stop_name:
+            stop_name = _first(monitored_call.get("StopPointName", "")) or ""
+        
+        line = _first(journey.get("PublishedLineName", ""))
+        expected = (
+            monitored_call.get("ExpectedArrivalTime") or
+            monitored_call.get("ExpectedDepartureTime") or
+            monitored_call.get("AimedArrivalTime")
+        )
+        arrival = _parse_timestamp(expected) if expected else None
+        if not line or arrival is None or (not_before is not None and arrival < not_before):
+            continue
+        
+        delay_info = journey.get("Delay")
+        occupancy = _first(journey.get("Occupancy"), None) or "UNKNOWN"
+        arrivals.append(Arrival(
+            line=str(line).upper(),
+            arrival=arrival,
+            delay=_parse_duration(delay_info),
+            delayed=bool(delay_info or journey.get("SituationRef")),
+            occupancy=str(occupancy).upper(),
+        ))
+    
+    arrivals.sort(key=lambda a: a.arrival)
+    return StopArrivals(stop_code, stop_name, tuple(arrivals))
+
+
+def iter_stop_visits(chunks: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+    """Stream MonitoredStopVisit entries out of a StopMonitoring response.
+    
+    Only the visit being decoded is held in memory, so a feed of several MB
+    never exists as one string or document. Like the non-streaming parser,
+    only the first MonitoredStopVisit value is read (a single object is
+    yielded as one visit).
+    
+    Args:
+        chunks: Raw response body chunks (UTF-8, optionally with a BOM)
+        
+    Yields:
+        MonitoredStopVisit dicts in feed order
+        
+    Raises:
+        ValueError: If the response ends early or isn't valid JSON
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    chunk_iter = iter(chunks)
+    json_decoder = json.JSONDecoder()
+    buf = ""
+    
+    def read_more() -> bool:
+        nonlocal buf
+        for chunk in chunk_iter:
+            text = decoder.decode(chunk)
+            if text:
+                buf += text
+                return True
+        text = decoder.decode(b"", final=True)
+        buf += text
+        return bool(text)
+    
+    def next_char(pos: int) -> int:
+        """Position of the next non-whitespace character (-1 at end of input)."""
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buf):
+                return pos
+            if not read_more():
+                return -1
+    
+    # Find the visits key, keeping only a key-length tail while searching
+    while True:
+        pos = buf.find(_VISITS_KEY)
+        if pos >= 0:
+            pos += len(_VISITS_KEY)
+            break
+        buf = buf[-len(_VISITS_KEY):]
+        if not read_more():
+            return
+    
+    pos = next_char(pos)
+    if pos < 0 or buf[pos] != ":":
+        raise ValueError("Malformed StopMonitoring response: expected ':' after MonitoredStopVisit")
+    pos = next_char(pos + 1)
+    if pos < 0:
+        raise ValueError("StopMonitoring response ended early")
+    
+    single = buf[pos] != "["
+    if not single:
+        pos += 1
+    
+    while True:
+        pos = next_char(pos)
+        if pos < 0:
+            raise ValueError("StopMonitoring response ended early")
+        if not single:
+            if buf[pos] == "]":
+                return
+            if buf[pos] == ",":
+                pos += 1
+                continue
+        
+        # Decode one element, reading more until it's complete
+        while True:
+            try:
+                visit, end = json_decoder.raw_decode(buf, pos)
+                break
+            except ValueError:
+                if not read_more():
+                    raise
+        
+        buf = buf[end:]
+        pos = 0
+        if isinstance(visit, dict):
+            yield visit
+        if single:
+            return
+
+
+def _visit_stop(visit: Dict[str, Any]) -> Tuple[str, str, Dict[str, Any]]:
+    """Get the (agency, stop_code, journey) of a MonitoredStopVisit."""
+    journey = visit.get("MonitoredVehicleJourney", {})
+    monitored_call = journey.get("MonitoredCall", {})
+    
+    # Extract agency from OperatorRef or other fields
+    # Format is typically like "SF" for Muni, "BA" for BART, etc.
+    operator_ref = journey.get("OperatorRef", "")
+    if isinstance(operator_ref, list):
+        operator_ref = operator_ref[0] if operator_ref else ""
+    
+    # Extract stop code from StopPointRef
+    stop_ref = monitored_call.get("StopPointRef", "")
+    if isinstance(stop_ref, list):
+        stop_ref = stop_ref[0] if stop_ref else ""
+    
+    # Parse stop code (format is usually "AGENCY_STOPCODE" like "SF_15210")
+    if "_" in stop_ref:
+        agency, stop_code = stop_ref.split("_", 1)
+    else:
+        agency = operator_ref or "UNKNOWN"
+        stop_code = stop_ref
+    return agency, stop_code, journey
+
 
 class TransitCache:
     """Singleton service that caches regional transit data from 511.org."""
@@ -51,21 +350,34 @@ class TransitCache:
         self._data_lock = threading.RLock()
         
         # Cache storage
-        self._raw_data: Optional[Dict[str, Any]] = None
         self._last_refresh: float = 0
         self._last_success: float = 0
+        self._last_attempt: float = 0  # Schedules the next refresh
+        self._restored: bool = False  # Serving data restored from a snapshot
         self._refresh_count: int = 0
         self._error_count: int = 0
         self._cache_hits: int = 0
         
         # Parsed cache by agency and stop
         self._stops_by_agency: Dict[str, Dict[str, List[Dict]]] = {}  # agency -> stop_code -> [visits]
+        self._routes_by_stop: Dict[str, Dict[str, Tuple[str, ...]]] = {}  # agency -> stop_code -> route names
+        self._visits_seen: int = 0  # Visits in the last feed (retained or not)
+        # Parsed arrivals: (agency, stop_code, line filter) -> StopArrivals
+        self._arrivals: Dict[Subscription, StopArrivals] = {}
+        
+        # Stops to keep visits for: consumer id -> {(agency, stop_code, line filter)}
+        self._subscriptions: Dict[str, Set[Subscription]] = {}
+        # Stops read without a subscription: (agency, stop_code) -> last read time
+        self._requested: Dict[Tuple[str, str], float] = {}
         
         # Configuration
         self._api_key: Optional[str] = None
         self._refresh_interval: int = self.DEFAULT_REFRESH_INTERVAL
         self._enabled: bool = False
         
+        # Snapshot file for warm starts (None disables snapshots)
+        self.snapshot_path: Optional[Path] = DEFAULT_SNAPSHOT_DIR / "transit.json"
+        
         # Background refresh thread
         self._refresh_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
@@ -89,7 +401,12 @@ class TransitCache:
             logger.info(f"TransitCache configured: enabled={enabled}, interval={refresh_interval}s")
     
     def start(self):
-        """Start the background refresh thread."""
+        """Start the background refresh thread.
+        
+        A recent snapshot is served right away and refreshed in the
+        background once it's due. Without one, the first refresh happens
+        before this returns.
+        """
         if not self._enabled:
             logger.warning("TransitCache not started - disabled in configuration")
             return
@@ -103,13 +420,14 @@ class TransitCache:
                 logger.warning("TransitCache refresh thread already running")
                 return
             
+            if not self.is_ready() and not self._restore_snapshot():
+                # Nothing to serve yet: do the first refresh now
+                self._refresh_data()
+            
             logger.info(f"Starting TransitCache refresh thread (interval: {self._refresh_interval}s)")
             self._stop_event.clear()
             self._refresh_thread = threading.Thread(target=self._refresh_loop, daemon=True, name="TransitCache")
             self._refresh_thread.start()
-            
-            # Do an immediate first refresh
-            self._refresh_data()
     
     def stop(self):
         """Stop the background refresh thread."""
@@ -122,14 +440,16 @@ class TransitCache:
         """Background thread that refreshes cache periodically."""
         logger.info("TransitCache refresh loop started")
         
-        while not self._stop_event.is_set():
+        while True:
+            # Wait until the last attempt is an interval old (or until stop event)
+            delay = max(0.0, self._refresh_interval - (time.time() - self._last_attempt))
+            if self._stop_event.wait(delay):
+                break
+            
             try:
                 self._refresh_data()
             except Exception as e:
                 logger.error(f"Error in TransitCache refresh loop: {e}", exc_info=True)
-            
-            # Wait for next refresh interval (or until stop event)
-            self._stop_event.wait(self._refresh_interval)
         
         logger.info("TransitCache refresh loop stopped")
     
@@ -140,6 +460,7 @@ class TransitCache:
             return
         
         start_time = time.time()
+        self._last_attempt = start_time
         
         try:
             params = {
@@ -149,25 +470,22 @@ class TransitCache:
             }
             
             logger.debug(f"Fetching regional transit data from 511.org (agency={self.REGIONAL_AGENCY})")
-            response = requests.get(self.API_BASE_URL, params=params, timeout=15)
-            response.raise_for_status()
-            
-            # Handle BOM if present
-            content = response.text
-            if content.startswith('\ufeff'):
-                content = content[1:]
-            
-            data = json.loads(content)
-            
-            # Parse and index the data
-            self._parse_and_index(data)
+            response = get_http_session().get(self.API_BASE_URL, params=params, timeout=15, stream=True)
+            try:
+                response.raise_for_status()
+                # Parse and index the visits as they arrive
+                self._index_visits(iter_stop_visits(response.iter_content(chunk_size=STREAM_CHUNK_SIZE)))
+            finally:
+                response.close()
             
             # Update cache metadata
             with self._data_lock:
-                self._raw_data = data
                 self._last_refresh = time.time()
                 self._last_success = time.time()
                 self._refresh_count += 1
+                self._restored = False
+            
+            self._save_snapshot()
             
             elapsed = time.time() - start_time
             logger.info(f"TransitCache refreshed successfully in {elapsed:.2f}s (refresh #{self._refresh_count})")
@@ -199,7 +517,7 @@ class TransitCache:
     
     def _parse_and_index(self, data: Dict[str, Any]):
         """
-        Parse regional transit data and index by agency and stop code.
+        Parse a decoded StopMonitoring response and index it by agency and stop code.
         
         Args:
             data: Raw JSON response from 511.org StopMonitoring API
@@ -214,58 +532,237 @@ class TransitCache:
                 stop_monitoring = stop_monitoring[0] if stop_monitoring else {}
             
             monitored_visits = stop_monitoring.get("MonitoredStopVisit", [])
+            if isinstance(monitored_visits, dict):
+                monitored_visits = [monitored_visits]
             
-            # Index by agency and stop code
-            indexed: Dict[str, Dict[str, List[Dict]]] = {}
-            
-            for visit in monitored_visits:
-                try:
-                    journey = visit.get("MonitoredVehicleJourney", {})
-                    monitored_call = journey.get("MonitoredCall", {})
-                    
-                    # Extract agency from OperatorRef or other fields
-                    # Format is typically like "SF" for Muni, "BA" for BART, etc.
-                    operator_ref = journey.get("OperatorRef", "")
-                    if isinstance(operator_ref, list):
-                        operator_ref = operator_ref[0] if operator_ref else ""
-                    
-                    # Extract stop code from StopPointRef
-                    stop_ref = monitored_call.get("StopPointRef", "")
-                    if isinstance(stop_ref, list):
-                        stop_ref = stop_ref[0] if stop_ref else ""
-                    
-                    # Parse stop code (format is usually "AGENCY_STOPCODE" like "SF_15210")
-                    if "_" in stop_ref:
-                        agency, stop_code = stop_ref.split("_", 1)
-                    else:
-                        agency = operator_ref or "UNKNOWN"
-                        stop_code = stop_ref
-                    
-                    # Index the visit
-                    if agency not in indexed:
-                        indexed[agency] = {}
-                    if stop_code not in indexed[agency]:
-                        indexed[agency][stop_code] = []
-                    
-                    indexed[agency][stop_code].append(visit)
-                    
-                except Exception as e:
-                    logger.debug(f"Error indexing transit visit: {e}")
-                    continue
-            
-            # Update indexed cache
-            with self._data_lock:
-                self._stops_by_agency = indexed
-            
-            # Log statistics
-            total_agencies = len(indexed)
-            total_stops = sum(len(stops) for stops in indexed.values())
-            total_visits = sum(sum(len(visits) for visits in stops.values()) for stops in indexed.values())
-            logger.debug(f"Indexed {total_visits} visits across {total_stops} stops from {total_agencies} agencies")
+            self._index_visits(monitored_visits)
             
         except Exception as e:
             logger.error(f"Error parsing and indexing regional transit data: {e}", exc_info=True)
     
+    def _index_visits(self, visits: Iterable[Dict[str, Any]]):
+        """
+        Index visits by agency and stop code, keeping only subscribed stops.
+        
+        Every stop's route names are indexed; visits are kept for subscribed
+        stops only (or for all stops while nothing is subscribed).
+        
+        Args:
+            visits: MonitoredStopVisit dicts (may be a stream)
+        """
+        wanted = self._wanted_stops()
+        indexed: Dict[str, Dict[str, List[Dict]]] = {}
+        routes: Dict[str, Dict[str, Set[str]]] = {}
+        seen = 0
+        
+        for visit in visits:
+            seen += 1
+            try:
+                agency, stop_code, journey = _visit_stop(visit)
+                
+                published_line = journey.get("PublishedLineName", "")
+                if isinstance(published_line, list):
+                    published_line = published_line[0] if published_line else ""
+                stop_routes = routes.setdefault(agency, {}).setdefault(stop_code, set())
+                if published_line:
+                    stop_routes.add(published_line.upper())
+                
+                if wanted is None or (agency, stop_code) in wanted:
+                    indexed.setdefault(agency, {}).setdefault(stop_code, []).append(visit)
+                
+            except Exception as e:
+                logger.debug(f"Error indexing transit visit: {e}")
+                continue
+        
+        route_index = {
+            agency: {stop_code: tuple(sorted(names)) for stop_code, names in stops.items()}
+            for agency, stops in routes.items()
+        }
+        arrivals = self._parse_arrivals(indexed)
+        
+        # Update indexed cache
+        with self._data_lock:
+            self._stops_by_agency = indexed
+            self._routes_by_stop = route_index
+            self._arrivals = arrivals
+            self._visits_seen = seen
+        
+        # Log statistics
+        total_stops = sum(len(stops) for stops in indexed.values())
+        total_visits = sum(sum(len(visits) for visits in stops.values()) for stops in indexed.values())
+        logger.debug(f"Kept {total_visits} of {seen} visits for {total_stops} stops from {len(indexed)} agencies")
+    
+    def _parse_arrivals(
+        self,
+        indexed: Dict[str, Dict[str, List[Dict]]],
+        not_before: Optional[float] = None,
+    ) -> Dict[Subscription, StopArrivals]:
+        """
+        Parse subscribed stops' visits into arrival records, once per stop.
+        
+        Each subscribed line filter gets its own pre-filtered entry.
+        
+        Args:
+            indexed: agency -> stop_code -> visits
+            not_before: Optionally drop arrivals before this Unix timestamp
+            
+        Returns:
+            (agency, stop_code, line filter) -> StopArrivals
+        """
+        with self._data_lock:
+            subscriptions = self._all_subscriptions()
+        
+        parsed: Dict[Subscription, StopArrivals] = {}
+        for agency, stop_code, lines in subscriptions:
+            visits = indexed.get(agency, {}).get(stop_code)
+            if not visits:
+                continue
+            unfiltered = parsed.get((agency, stop_code, None))
+            if unfiltered is None:
+                unfiltered = parsed[(agency, stop_code, None)] = _parse_stop_visits(stop_code, visits, not_before)
+            parsed[(agency, stop_code, lines)] = unfiltered.for_lines(lines)
+        return parsed
+    
+    def _save_snapshot(self):
+        """Save the indexed data for the next start (failures only cost a cold start)."""
+        if self.snapshot_path is None:
+            return
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            # Snapshots can always be fetched again, so skip fsync
+            get_writer(self.snapshot_path, fsync=False, compact=True).write(self._snapshot_data)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to save TransitCache snapshot: {e}")
+    
+    def _snapshot_data(self) -> Dict[str, Any]:
+        """Build the snapshot file contents."""
+        with self._data_lock:
+            return {
+                "format": SNAPSHOT_FORMAT_VERSION,
+                "agency": self.REGIONAL_AGENCY,
+                "fetched_at": self._last_success,
+                "visits_in_feed": self._visits_seen,
+                "restored_from_snapshot": self._restored,
+                "stops": self._stops_by_agency,
+                "routes": self._routes_by_stop,
+            }
+    
+    def _restore_snapshot(self) -> bool:
+        """
+        Load a recent snapshot saved by a previous run.
+        
+        The snapshot keeps its original age, so status, staleness warnings
+        and the refresh schedule treat it as the refresh it came from.
+        
+        Returns:
+            True if data was restored
+        """
+        path = self.snapshot_path
+        if path is None or not path.exists():
+            return False
+        try:
+            stored = read_json(path)
+        except (ValueError, IOError) as e:
+            logger.warning(f"Ignoring unreadable TransitCache snapshot: {e}")
+            return False
+        if (not isinstance(stored, dict) or stored.get("format") != SNAPSHOT_FORMAT_VERSION
+                or stored.get("agency") != self.REGIONAL_AGENCY):
+            logger.info("Ignoring TransitCache snapshot with an old format")
+            return False
+        
+        now = time.time()
+        fetched_at = float(stored.get("fetched_at") or 0)
+        age = now - fetched_at
+        if fetched_at <= 0 or age > SNAPSHOT_MAX_AGE:
+            logger.info(f"Ignoring outdated TransitCache snapshot (age {age:.0f}s)")
+            return False
+        
+        indexed = stored.get("stops") or {}
+        routes = {
+            agency: {stop_code: tuple(names) for stop_code, names in stops.items()}
+            for agency, stops in (stored.get("routes") or {}).items()
+        }
+        arrivals = self._parse_arrivals(indexed, not_before=now - DEPARTED_GRACE_SECONDS)
+        
+        with self._data_lock:
+            if self._last_success > 0:
+                return False  # A refresh beat us to it
+            self._stops_by_agency = indexed
+            self._routes_by_stop = routes
+            self._arrivals = arrivals
+            self._visits_seen = int(stored.get("visits_in_feed") or 0)
+            self._last_refresh = fetched_at
+            self._last_success = fetched_at
+            self._last_attempt = fetched_at
+            self._restored = True
+        
+        logger.info(f"Restored TransitCache snapshot (age {age:.0f}s)")
+        return True
+    
+    def subscribe(
+        self,
+        consumer_id: str,
+        agency: str,
+        stop_codes: Iterable[str],
+        lines: Optional[Iterable[str]] = None,
+    ):
+        """
+        Set the stops a consumer reads, replacing its previous subscription.
+        
+        Visits are kept, and parsed into arrivals, for the union of all
+        subscriptions from the next refresh on; until anything is
+        subscribed, every stop is kept.
+        
+        Args:
+            consumer_id: Identifies the consumer (e.g. "plugin:muni")
+            agency: Agency code (e.g., "SF" for Muni)
+            stop_codes: Stop codes the consumer reads
+            lines: Optional line filter (e.g. ["N"]), see line_matches()
+        """
+        line_filter = _line_filter(lines)
+        with self._data_lock:
+            self._subscriptions[consumer_id] = {(agency, str(code), line_filter) for code in stop_codes if code}
+            for _, stop_code, _ in self._subscriptions[consumer_id]:
+                self._requested.pop((agency, stop_code), None)
+    
+    def unsubscribe(self, consumer_id: str):
+        """
+        Remove a consumer's subscription.
+        
+        Args:
+            consumer_id: Consumer passed to subscribe()
+        """
+        with self._data_lock:
+            self._subscriptions.pop(consumer_id, None)
+            if not self._subscriptions:
+                self._requested.clear()
+    
+    def _all_subscriptions(self) -> Set[Subscription]:
+        """Get the union of all subscriptions and unexpired requested stops (called with _data_lock held)."""
+        cutoff = time.time() - REQUESTED_STOP_TTL
+        for key in [key for key, read_at in self._requested.items() if read_at < cutoff]:
+            del self._requested[key]
+        subscriptions = set().union(*self._subscriptions.values()) if self._subscriptions else set()
+        subscriptions.update((agency, stop_code, None) for agency, stop_code in self._requested)
+        return subscriptions
+    
+    def _wanted_stops(self) -> Optional[Set[Tuple[str, str]]]:
+        """Get the subscribed (agency, stop_code) pairs, or None to keep every stop."""
+        with self._data_lock:
+            if not self._subscriptions:
+                return None
+            return {(agency, stop_code) for agency, stop_code, _ in self._all_subscriptions()}
+    
+    def _keep_requested(self, agency: str, stop_codes: List[str]):
+        """Keep stops read without a subscription for REQUESTED_STOP_TTL from the next refresh on (called with _data_lock held)."""
+        if not self._subscriptions:
+            return
+        subscribed = {(sub_agency, stop_code) for subs in self._subscriptions.values() for sub_agency, stop_code, _ in subs}
+        now = time.time()
+        for code in stop_codes:
+            if (agency, code) not in subscribed:
+                self._requested[(agency, code)] = now
+    
     def get_stops_data(self, agency: str, stop_codes: List[str]) -> Dict[str, List[Dict[str, Any]]]:
         """
         Get cached transit data for specific stops from a specific agency.
@@ -280,6 +777,8 @@ class TransitCache:
         with self._data_lock:
             self._cache_hits += 1
             
+            self._keep_requested(agency, stop_codes)
+            
             # Check cache age and warn if stale
             age = time.time() - self._last_success if self._last_success > 0 else float('inf')
             if age > self.STALE_WARNING_THRESHOLD:
@@ -296,10 +795,52 @@ class TransitCache:
             
             return result
     
+    def get_arrivals(
+        self,
+        agency: str,
+        stop_codes: List[str],
+        lines: Optional[Iterable[str]] = None,
+    ) -> Dict[str, StopArrivals]:
+        """
+        Get parsed arrivals for specific stops.
+        
+        Records for subscribed (agency, stop_code, lines) combinations are
+        built once per refresh; other line filters are applied on the fly.
+        Stops without arrivals are left out.
+        
+        Args:
+            agency: Agency code (e.g., "SF" for Muni)
+            stop_codes: Stop codes to retrieve
+            lines: Optional line filter (e.g. ["N"]), see line_matches()
+            
+        Returns:
+            Dictionary mapping stop_code -> StopArrivals
+        """
+        line_filter = _line_filter(lines)
+        result = {}
+        with self._data_lock:
+            self._cache_hits += 1
+            self._keep_requested(agency, stop_codes)
+            for stop_code in stop_codes:
+                stop = self._arrivals.get((agency, stop_code, line_filter))
+                if stop is None:
+                    stop = self._arrivals.get((agency, stop_code, None))
+                    if stop is None:
+                        visits = self._stops_by_agency.get(agency, {}).get(stop_code)
+                        if not visits:
+                            continue
+                        # Not subscribed: parse now, and keep for this refresh
+                        stop = self._arrivals[(agency, stop_code, None)] = _parse_stop_visits(stop_code, visits)
+                    stop = stop.for_lines(line_filter)
+                result[stop_code] = stop
+        return result
+    
     def get_all_stops_for_agency(self, agency: str) -> Dict[str, List[Dict[str, Any]]]:
         """
         Get all cached transit data for an agency.
         
+        Only subscribed stops are kept, see subscribe().
+        
         Args:
             agency: Agency code (e.g., "SF" for Muni)
             
@@ -309,6 +850,21 @@ class TransitCache:
         with self._data_lock:
             return self._stops_by_agency.get(agency, {}).copy()
     
+    def get_routes_for_stops(self, agency: str, stop_codes: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Get the routes seen at stops in the last feed (for any stop, subscribed or not).
+        
+        Args:
+            agency: Agency code (e.g., "SF" for Muni)
+            stop_codes: Stop codes to look up
+            
+        Returns:
+            Dictionary mapping stop_code -> sorted route names (empty if none)
+        """
+        with self._data_lock:
+            agency_routes = self._routes_by_stop.get(agency, {})
+            return {stop_code: list(agency_routes.get(stop_code, ())) for stop_code in stop_codes}
+    
     def get_status(self) -> Dict[str, Any]:
         """
         Get cache status and statistics.
@@ -322,6 +878,7 @@ class TransitCache:
             
             agencies = list(self._stops_by_agency.keys())
             total_stops = sum(len(stops) for stops in self._stops_by_agency.values())
+            subscribed = self._wanted_stops()
             
             return {
                 "enabled": self._enabled,
@@ -335,6 +892,9 @@ class TransitCache:
                 "cache_hits": self._cache_hits,
                 "agencies_cached": agencies,
                 "total_stops_cached": total_stops,
+                "subscribed_stops": len(subscribed) if subscribed is not None else None,
+                "visits_in_feed": self._visits_seen,
+                "restored_from_snapshot": self._restored,
                 "thread_alive": self._refresh_thread.is_alive() if self._refresh_thread else False,
             }
     
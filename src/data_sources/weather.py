@@ -4,6 +4,7 @@ import logging
 import requests
 from typing import Optional, Dict, List
 from ..config import Config
+from ..plugins.http import get_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -104,7 +105,7 @@ class WeatherSource:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = get_http_session().get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -136,7 +137,7 @@ class WeatherSource:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = get_http_session().get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -6,18 +6,21 @@ from each display source via the plugin system.
 
 import logging
 from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from ..formatters.message_formatter import get_message_formatter
+from ..text_to_board import text_to_board_array
+from ..tiles import TileGrid
 
 # Import plugin system
 try:
-    from ..plugins import get_plugin_registry, PluginRegistry
+    from ..plugins import get_plugin_registry, PluginRegistry, PluginResult
     PLUGIN_SYSTEM_AVAILABLE = True
 except ImportError:
     PLUGIN_SYSTEM_AVAILABLE = False
     get_plugin_registry = None
     PluginRegistry = None
+    PluginResult = None
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +33,20 @@ class DisplayResult:
     raw: Dict[str, Any]
     available: bool
     error: Optional[str] = None
+    # Tiles from renderers that produce them directly (e.g. template pages)
+    tiles: Optional[TileGrid] = field(default=None, repr=False, compare=False)
+    
+    def to_board_array(self) -> List[List[int]]:
+        """Get the 6x22 board array for this result.
+        
+        Uses the rendered tiles when available, otherwise parses formatted.
+        
+        Returns:
+            A new 6x22 array of character codes (safe to modify)
+        """
+        if self.tiles is not None:
+            return self.tiles.to_board_array()
+        return text_to_board_array(self.formatted)
 
 
 class DisplayService:
@@ -121,29 +138,7 @@ class DisplayService:
         
         try:
             plugin_result = self._plugin_registry.fetch_plugin_data(display_type)
-            
-            if plugin_result.available:
-                # Convert PluginResult to DisplayResult
-                formatted_lines = plugin_result.formatted_lines
-                if formatted_lines:
-                    formatted = "\n".join(formatted_lines)
-                else:
-                    formatted = str(plugin_result.data.get("formatted", "")) if plugin_result.data else ""
-                
-                return DisplayResult(
-                    display_type=display_type,
-                    formatted=formatted,
-                    raw=plugin_result.data or {},
-                    available=True
-                )
-            else:
-                return DisplayResult(
-                    display_type=display_type,
-                    formatted="",
-                    raw={},
-                    available=False,
-                    error=plugin_result.error
-                )
+            return self._to_display_result(display_type, plugin_result)
         except Exception as e:
             logger.error(f"Error fetching data for plugin {display_type}: {e}", exc_info=True)
             return DisplayResult(
@@ -153,6 +148,61 @@ class DisplayService:
                 available=False,
                 error=f"Error fetching data: {e}"
             )
+    
+    def get_displays(self, display_types: List[str]) -> Dict[str, DisplayResult]:
+        """Get formatted and raw data for several display types at once.
+        
+        Known plugins are fetched concurrently via the plugin registry, so
+        the total latency is that of the slowest plugin rather than the sum.
+        
+        Args:
+            display_types: Plugin IDs
+            
+        Returns:
+            Dictionary mapping display type to DisplayResult
+        """
+        if not self._plugin_registry:
+            return {display_type: self.get_display(display_type) for display_type in display_types}
+        
+        known = [dt for dt in display_types if self._plugin_registry.get_plugin(dt)]
+        try:
+            plugin_results = self._plugin_registry.fetch_plugins_concurrently(known)
+        except Exception as e:
+            logger.error(f"Error fetching plugin data concurrently: {e}", exc_info=True)
+            plugin_results = {}
+        
+        results: Dict[str, DisplayResult] = {}
+        for display_type in display_types:
+            if display_type in plugin_results:
+                results[display_type] = self._to_display_result(display_type, plugin_results[display_type])
+            else:
+                # Unknown types (and fetch failures) get the single-display error handling
+                results[display_type] = self.get_display(display_type)
+        return results
+    
+    def _to_display_result(self, display_type: str, plugin_result: PluginResult) -> DisplayResult:
+        """Convert a PluginResult to a DisplayResult."""
+        if plugin_result.available:
+            formatted_lines = plugin_result.formatted_lines
+            if formatted_lines:
+                formatted = "\n".join(formatted_lines)
+            else:
+                formatted = str(plugin_result.data.get("formatted", "")) if plugin_result.data else ""
+            
+            return DisplayResult(
+                display_type=display_type,
+                formatted=formatted,
+                raw=plugin_result.data or {},
+                available=True
+            )
+        
+        return DisplayResult(
+            display_type=display_type,
+            formatted="",
+            raw={},
+            available=False,
+            error=plugin_result.error
+        )
 
 
 # Singleton instance
@@ -0,0 +1,354 @@
+"""Indexed reader for the rotating JSON-lines log files.
+
+The API server writes logs as one JSON object per line to app.log, rotated
+to app.log.1 ... app.log.N. LogStore keeps a compact per-file index (byte
+offset of every line plus per-level entry lists) so /logs requests don't
+re-read and re-parse every file:
+
+- Files are indexed incrementally: only bytes appended since the last
+  request are read. Rotation renames files without changing their inode,
+  so rotated backups keep their index.
+- Pages are served newest-first by seeking straight to the requested lines.
+- Level filters use the per-level lists; substring searches scan raw bytes
+  in bounded chunks and only parse candidate lines.
+"""
+
+import json
+import logging
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# JSON escapes these, so raw-byte search can't be used for needles containing them
+_JSON_ESCAPED = {'"', '\\'}
+
+# Bytes read at a time when searching a file
+SEARCH_CHUNK_BYTES = 1 << 20
+
+
+@dataclass
+class FileIndex:
+    """Index of one log file.
+    
+    Attributes:
+        offsets: Byte offset of each indexed entry's line
+        levels: Level name -> ascending entry numbers with that level
+        size: Bytes indexed so far (always at a line boundary)
+    """
+    offsets: array = field(default_factory=lambda: array("Q"))
+    levels: Dict[str, array] = field(default_factory=dict)
+    size: int = 0
+
+
+@dataclass
+class _Segment:
+    """Matching entries of one file for a query."""
+    path: Path
+    index: FileIndex
+    positions: Sequence[int]  # Ascending entry numbers that match
+
+
+class LogStore:
+    """Newest-first, filterable access to rotating JSON-lines log files."""
+    
+    def __init__(self, log_file: Path, backup_count: int):
+        """Initialize the store.
+        
+        Args:
+            log_file: Path of the current log file (backups are log_file.1 ...)
+            backup_count: Number of rotated backups to include
+        """
+        self.log_file = Path(log_file)
+        self.backup_count = backup_count
+        self._indexes: Dict[Tuple[int, int], FileIndex] = {}
+        self._lock = threading.Lock()
+    
+    def query(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        level: Optional[str] = None,
+        search: Optional[str] = None,
+        recent: Optional[List[Dict[str, Any]]] = None,
+    ) -> Tuple[List[Dict[str, Any]], int, bool]:
+        """Get a page of log entries, newest first.
+        
+        Args:
+            limit: Maximum number of entries to return
+            offset: Number of matching entries to skip
+            level: Only include entries with this level
+            search: Case-insensitive substring of the message or logger name
+            recent: In-memory entries (oldest first) that precede the files'
+                    entries; file entries duplicating them are skipped
+        
+        Returns:
+            (logs, total_matching, has_more)
+        """
+        level = level.upper() if level else None
+        search = search.lower() if search else None
+        
+        def matches(entry: Dict[str, Any]) -> bool:
+            if level and entry.get("level") != level:
+                return False
+            if search:
+                return (search in entry.get("message", "").lower() or
+                        search in entry.get("logger", "").lower())
+            return True
+        
+        # In-memory entries come first, deduplicated
+        seen: Set[Tuple[Any, Any]] = set()
+        memory_logs = []
+        for entry in reversed(recent or []):
+            key = (entry.get("timestamp"), entry.get("message"))
+            if key not in seen:
+                seen.add(key)
+                memory_logs.append(entry)
+        memory_matches = [entry for entry in memory_logs if matches(entry)]
+        
+        with self._lock:
+            files = self._update_indexes()
+            
+            # The buffer only holds the most recent entries, so duplicates
+            # can only be among the newest len(memory_logs) file entries
+            duplicates = self._find_duplicates(files, seen, len(memory_logs), matches)
+            
+            segments = [
+                _Segment(path, index, self._match_positions(path, index, level, search))
+                for path, index in files
+            ]
+            file_total = sum(len(segment.positions) for segment in segments) - len(duplicates)
+            
+            page = memory_matches[offset:offset + limit]
+            file_offset = max(0, offset - len(memory_matches))
+            file_limit = limit - len(page)
+            if file_limit > 0:
+                page.extend(self._read_page(segments, duplicates, file_offset, file_limit))
+        
+        total = len(memory_matches) + file_total
+        return page, total, offset + limit < total
+    
+    def _log_files(self) -> List[Path]:
+        """Existing log files, newest first."""
+        paths = [self.log_file] + [
+            Path(f"{self.log_file}.{i}") for i in range(1, self.backup_count + 1)
+        ]
+        return [path for path in paths if path.exists()]
+    
+    def _update_indexes(self) -> List[Tuple[Path, FileIndex]]:
+        """Bring every file's index up to date and drop indexes of deleted files."""
+        files = []
+        live = {}
+        for path in self._log_files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            key = (stat.st_dev, stat.st_ino)
+            index = self._indexes.get(key)
+            if index is None or stat.st_size < index.size:
+                index = FileIndex()  # New or truncated file
+            try:
+                self._index_new_lines(path, index)
+            except OSError as e:
+                logger.debug(f"Could not index {path}: {e}")
+                continue
+            live[key] = index
+            files.append((path, index))
+        self._indexes = live
+        return files
+    
+    @staticmethod
+    def _index_new_lines(path: Path, index: FileIndex) -> None:
+        """Index complete lines appended since the last update."""
+        with open(path, "rb") as f:
+            f.seek(index.size)
+            data = f.read()
+        
+        pos = 0
+        while True:
+            end = data.find(b"\n", pos)
+            if end < 0:
+                break  # Partial last line - index it once it's complete
+            line = data[pos:end].strip()
+            if line:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    entry = None
+                if isinstance(entry, dict):
+                    level = str(entry.get("level", ""))
+                    index.levels.setdefault(level, array("I")).append(len(index.offsets))
+                    index.offsets.append(index.size + pos)
+            pos = end + 1
+        index.size += pos
+    
+    def _match_positions(
+        self,
+        path: Path,
+        index: FileIndex,
+        level: Optional[str],
+        search: Optional[str],
+    ) -> Sequence[int]:
+        """Get the ascending entry numbers in a file matching the filters.
+        
+        Searches read the file in line-aligned chunks of about
+        SEARCH_CHUNK_BYTES, starting at the next entry the level filter
+        selects, so memory stays bounded and unselected stretches are skipped.
+        """
+        if level:
+            positions: Sequence[int] = index.levels.get(level, array("I"))
+        else:
+            positions = range(len(index.offsets))
+        if not search or not positions:
+            return positions
+        
+        raw_search = search.isascii() and not (_JSON_ESCAPED & set(search)) and search.isprintable()
+        needle = search.encode()
+        offsets = index.offsets
+        result = array("I")
+        with open(path, "rb") as f:
+            i = 0
+            while i < len(positions):
+                # Chunk = whole lines from the next selected entry on
+                first = positions[i]
+                start = offsets[first]
+                last = bisect_left(offsets, start + SEARCH_CHUNK_BYTES, first + 1)
+                end = offsets[last] if last < len(offsets) else index.size
+                chunk_end = bisect_left(positions, last, i)
+                f.seek(start)
+                data = f.read(end - start)
+                
+                if raw_search:
+                    # Find candidate lines in the raw bytes, then confirm on the parsed entry
+                    selected = set(positions[i:chunk_end]) if level else None
+                    candidates = []
+                    haystack = data.lower()
+                    found = haystack.find(needle)
+                    while found >= 0:
+                        number = bisect_right(offsets, start + found, first, last) - 1
+                        if (not candidates or candidates[-1] != number) and (
+                                selected is None or number in selected):
+                            candidates.append(number)
+                        found = haystack.find(needle, found + 1)
+                else:
+                    candidates = positions[i:chunk_end]
+                
+                for number in candidates:
+                    entry = self._parse(data, offsets[number] - start)
+                    if entry and (search in entry.get("message", "").lower() or
+                                  search in entry.get("logger", "").lower()):
+                        result.append(number)
+                i = chunk_end
+        return result
+    
+    @staticmethod
+    def _parse(data: bytes, start: int) -> Optional[Dict[str, Any]]:
+        """Parse the entry whose line starts at `start` in a chunk of a file."""
+        end = data.find(b"\n", start)
+        try:
+            return json.loads(data[start:end if end >= 0 else len(data)])
+        except ValueError:
+            return None
+    
+    def _find_duplicates(
+        self,
+        files: List[Tuple[Path, FileIndex]],
+        seen: Set[Tuple[Any, Any]],
+        count: int,
+        matches,
+    ) -> Set[Tuple[Path, int]]:
+        """Find matching entries among the newest `count` that repeat in-memory ones."""
+        duplicates: Set[Tuple[Path, int]] = set()
+        remaining = count
+        for path, index in files:
+            if remaining <= 0:
+                break
+            numbers = range(len(index.offsets) - 1, max(len(index.offsets) - remaining, 0) - 1, -1)
+            remaining -= len(numbers)
+            for number, entry in zip(numbers, self._read_entries(path, index, numbers)):
+                if (entry.get("timestamp"), entry.get("message")) in seen and matches(entry):
+                    duplicates.add((path, number))
+        return duplicates
+    
+    def _read_page(
+        self,
+        segments: List[_Segment],
+        duplicates: Set[Tuple[Path, int]],
+        skip: int,
+        take: int,
+    ) -> List[Dict[str, Any]]:
+        """Read `take` matching entries after skipping `skip`, newest first."""
+        page = []
+        for segment in segments:
+            if take <= 0:
+                break
+            positions = segment.positions
+            seg_dups = sorted(
+                (n for (path, n) in duplicates if path == segment.path), reverse=True
+            )
+            if not seg_dups:
+                if skip >= len(positions):
+                    skip -= len(positions)
+                    continue
+                end = len(positions) - skip
+                start = max(end - take, 0)
+                numbers = [positions[i] for i in range(end - 1, start - 1, -1)]
+                skip = 0
+            else:
+                numbers = []
+                dup_set = set(seg_dups)
+                for i in range(len(positions) - 1, -1, -1):
+                    if positions[i] in dup_set:
+                        continue
+                    if skip:
+                        skip -= 1
+                        continue
+                    numbers.append(positions[i])
+                    if len(numbers) == take:
+                        break
+            page.extend(self._read_entries(segment.path, segment.index, numbers))
+            take -= len(numbers)
+        return page
+    
+    @staticmethod
+    def _read_entries(path: Path, index: FileIndex, numbers: Sequence[int]) -> List[Dict[str, Any]]:
+        """Read and parse specific entries of a file by seeking to them."""
+        entries = []
+        if not numbers:
+            return entries
+        with open(path, "rb") as f:
+            for number in numbers:
+                f.seek(index.offsets[number])
+                try:
+                    entries.append(json.loads(f.readline()))
+                except ValueError:
+                    entries.append({})
+        return entries
+
+
+# Singleton instance
+_log_store: Optional[LogStore] = None
+_log_store_lock = threading.Lock()
+
+
+def get_log_store(log_file: Path, backup_count: int) -> LogStore:
+    """Get the log store for a log file, creating it on first use.
+    
+    Args:
+        log_file: Path of the current log file
+        backup_count: Number of rotated backups
+    
+    Returns:
+        LogStore for the given file (recreated if the path changed)
+    """
+    global _log_store
+    with _log_store_lock:
+        if (_log_store is None or _log_store.log_file != Path(log_file)
+                or _log_store.backup_count != backup_count):
+            _log_store = LogStore(log_file, backup_count)
+        return _log_store
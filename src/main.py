@@ -4,6 +4,7 @@ import logging
 import sys
 import time
 import signal
+import threading
 from datetime import datetime
 from typing import Optional
 
@@ -11,9 +12,10 @@ import schedule
 
 from .config import Config
 from .board_client import BoardClient
+from .board_history import FrameHistory
 from .board_chars import BoardChars
-from .text_to_board import text_to_board_array, format_board_array_preview
-from .settings.service import get_settings_service
+from .text_to_board import format_board_array_preview
+from .settings.service import SettingsSnapshot, get_settings_service
 from .pages.service import get_page_service
 from .schedules.service import get_schedule_service
 
@@ -35,12 +37,25 @@ class DisplayService:
         self.running = True
         self.vb_client: Optional[BoardClient] = None
         
+        # Sent-frame history, kept across board client reinitialization
+        self.frame_history = FrameHistory(
+            max_entries=Config.FRAME_HISTORY_SIZE,
+            log_path=Config.FRAME_HISTORY_LOG
+        )
+        
         # Active page polling state
         self._last_active_page_content: Optional[str] = None
         self._last_active_page_id: Optional[str] = None
         self._last_silence_mode_active: bool = False
         self._snoozing_message_sent: bool = False
         
+        # Polling schedule; settings changes are flagged by a settings
+        # listener and applied by the main loop
+        self._polling_job: Optional[schedule.Job] = None
+        self._polling_interval: Optional[int] = None
+        self._schedule_enabled: Optional[bool] = None
+        self._settings_changed = threading.Event()
+        
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -67,7 +82,9 @@ class DisplayService:
                 api_key=Config.get_board_api_key(),
                 host=Config.BOARD_HOST if not use_cloud else None,
                 use_cloud=use_cloud,
-                skip_unchanged=True
+                skip_unchanged=True,
+                min_changed_tiles=Config.BOARD_MIN_CHANGED_TILES,
+                history=self.frame_history
             )
             # Sync cache with current board state
             self.vb_client.read_current_message(sync_cache=True)
@@ -93,7 +110,9 @@ class DisplayService:
                 api_key=Config.get_board_api_key(),
                 host=Config.BOARD_HOST if not use_cloud else None,
                 use_cloud=use_cloud,
-                skip_unchanged=True  # Default: skip sending unchanged messages
+                skip_unchanged=True,  # Default: skip sending unchanged messages
+                min_changed_tiles=Config.BOARD_MIN_CHANGED_TILES,
+                history=self.frame_history
             )
             # Sync cache with current board state to avoid unnecessary initial update
             logger.info("Syncing cache with current board state...")
@@ -255,8 +274,8 @@ class DisplayService:
             interval_ms = page.transition_interval_ms if page.transition_interval_ms is not None else system_transition.step_interval_ms
             step_size = page.transition_step_size if page.transition_step_size is not None else system_transition.step_size
             
-            # Send to board
-            board_array = text_to_board_array(content_to_send)
+            # Send to board (template pages convert their rendered tiles directly)
+            board_array = result.to_board_array()
             
             # If in silence mode, add "SNOOZING" indicator to bottom right
             if silence_mode_active:
@@ -271,7 +290,8 @@ class DisplayService:
                 board_array,
                 strategy=strategy,
                 step_interval_ms=interval_ms,
-                step_size=step_size
+                step_size=step_size,
+                label=active_page_id
             )
             
             if success:
@@ -307,14 +327,19 @@ class DisplayService:
             logger.error("Initialization failed, exiting")
             sys.exit(1)
         
-        # Get polling interval from settings
-        settings_service = get_settings_service()
-        polling_interval = settings_service.get_polling_interval()
-        
         # Schedule active page polling based on configured interval
         # This is the ONLY way content gets sent to the board - via configured pages
-        schedule.every(polling_interval).seconds.do(lambda: self.check_and_send_active_page(dev_mode=False))
-        logger.info(f"Active page polling scheduled every {polling_interval} seconds")
+        settings_service = get_settings_service()
+        snapshot = settings_service.get_snapshot()
+        self._schedule_polling(snapshot.polling.interval_seconds)
+        self._schedule_enabled = snapshot.schedule.enabled
+        
+        # Pick up polling interval and schedule mode changes without a restart
+        unsubscribe = settings_service.subscribe(self._on_settings_changed)
+        
+        # Keep plugin data warm in the background so board updates only
+        # render from in-memory snapshots
+        prefetcher = self._start_plugin_prefetcher()
         
         # Send initial active page on startup
         logger.info("Sending initial active page...")
@@ -324,12 +349,70 @@ class DisplayService:
         logger.info("Service started, waiting for scheduled updates...")
         try:
             while self.running:
+                if self._settings_changed.is_set():
+                    self._apply_settings_changes()
                 schedule.run_pending()
                 time.sleep(1)  # Check every second
         except KeyboardInterrupt:
             logger.info("Keyboard interrupt received")
         finally:
+            unsubscribe()
+            if prefetcher:
+                prefetcher.stop()
             logger.info("Service stopped")
+    
+    def _schedule_polling(self, interval_seconds: int) -> None:
+        """(Re)schedule active page polling every interval_seconds."""
+        if self._polling_job is not None:
+            schedule.cancel_job(self._polling_job)
+        self._polling_job = schedule.every(interval_seconds).seconds.do(
+            lambda: self.check_and_send_active_page(dev_mode=False)
+        )
+        self._polling_interval = interval_seconds
+        logger.info(f"Active page polling scheduled every {interval_seconds} seconds")
+    
+    def _on_settings_changed(self, previous: SettingsSnapshot, snapshot: SettingsSnapshot) -> None:
+        """Settings listener: flag changes the main loop has to apply.
+        
+        Runs on the thread that changed the settings (usually an API
+        request), so it only sets a flag; the scheduler is only touched
+        from the main loop.
+        """
+        if (previous.polling.interval_seconds != snapshot.polling.interval_seconds
+                or previous.schedule.enabled != snapshot.schedule.enabled):
+            self._settings_changed.set()
+    
+    def _apply_settings_changes(self) -> None:
+        """Apply polling interval and schedule mode changes from the settings snapshot."""
+        self._settings_changed.clear()
+        snapshot = get_settings_service().get_snapshot()
+        
+        if snapshot.polling.interval_seconds != self._polling_interval:
+            self._schedule_polling(snapshot.polling.interval_seconds)
+        
+        if snapshot.schedule.enabled != self._schedule_enabled:
+            self._schedule_enabled = snapshot.schedule.enabled
+            mode = "enabled" if snapshot.schedule.enabled else "disabled"
+            logger.info(f"Schedule mode {mode}, updating board")
+            self.check_and_send_active_page(dev_mode=False)
+    
+    def _start_plugin_prefetcher(self):
+        """Start background plugin prefetching if enabled.
+        
+        Returns:
+            The running PluginPrefetcher, or None if disabled or unavailable
+        """
+        if not Config.PLUGIN_PREFETCH_ENABLED:
+            logger.info("Plugin prefetching disabled, plugin data is fetched at render time")
+            return None
+        try:
+            from .plugins.prefetch import get_plugin_prefetcher
+            prefetcher = get_plugin_prefetcher()
+            prefetcher.start()
+            return prefetcher
+        except Exception as e:
+            logger.warning(f"Plugin prefetcher not started: {e}")
+            return None
 
 
 def main():
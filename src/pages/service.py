@@ -4,24 +4,24 @@ Provides high-level operations on pages including preview and send.
 """
 
 import logging
+import threading
 import time
-from typing import List, Optional, Tuple, Dict
+from typing import List, Optional, Set, Tuple, Dict
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .models import Page, PageCreate, PageUpdate, RowConfig
 from .storage import PageStorage
 from ..displays.service import get_display_service, DisplayResult
 from ..templates.engine import get_template_engine
+from ..templates.layout import PageLayout
 from ..settings.service import get_settings_service
+from ..config_manager import get_config_manager
+from ..plugins import get_plugin_registry
 
 logger = logging.getLogger(__name__)
 
 
-# Cache TTL in seconds - previews are cached for 5 minutes
-PREVIEW_CACHE_TTL = 300
-
-
 # Default welcome page template (6 lines for board)
 DEFAULT_PAGE_TEMPLATE = [
     "      Welcome to      ",
@@ -45,20 +45,32 @@ class DeleteResult:
 
 @dataclass
 class CachedPreview:
-    """Cached preview result for a page."""
+    """Cached preview result for a page.
+    
+    Entries record the version of every input the render consumed and stay
+    valid until one of them changes; there is no time-based expiry.
+    """
     result: DisplayResult
     page_updated_at: Optional[datetime]  # Timestamp when page was last updated
     cached_at: float  # Unix timestamp when this was cached
+    dependencies: Dict[str, Optional[int]] = field(default_factory=dict)  # plugin_id -> data version
+    config_version: Optional[int] = None  # ConfigManager.version (color rules etc.)
     
-    def is_valid(self, page: Page, ttl_seconds: int = PREVIEW_CACHE_TTL) -> bool:
+    def is_valid(
+        self,
+        page: Page,
+        dependencies: Dict[str, Optional[int]],
+        config_version: Optional[int] = None,
+    ) -> bool:
         """Check if this cache entry is still valid.
         
         Args:
             page: The page to check against
-            ttl_seconds: Time-to-live in seconds
+            dependencies: Current data version of each plugin the page uses
+            config_version: Current configuration version
             
         Returns:
-            True if cache is still valid, False otherwise
+            True if the page, its plugin data and the config are unchanged
         """
         # Check if page was updated after cache was created
         if page.updated_at and self.page_updated_at:
@@ -68,9 +80,13 @@ class CachedPreview:
             # One is None and the other isn't
             return False
         
-        # Check TTL
-        age = time.time() - self.cached_at
-        return age < ttl_seconds
+        if config_version != self.config_version:
+            return False
+        
+        # None marks data that may change on every fetch (e.g. clocks)
+        if None in dependencies.values():
+            return False
+        return dependencies == self.dependencies
 
 
 class PageService:
@@ -90,6 +106,7 @@ class PageService:
         """
         self.storage = storage or PageStorage()
         self._preview_cache: Dict[str, CachedPreview] = {}
+        self._preview_lock = threading.Lock()  # Preview routes run in the threadpool
         logger.info("PageService initialized")
     
     # CRUD operations
@@ -341,10 +358,16 @@ class PageService:
         try:
             template_engine = get_template_engine()
             
+            # Compile once per page version; later renders only fill variable slots
+            compiled = template_engine.compile_template(
+                page.template, cache_key=page.id, version=page.updated_at
+            )
+            
             # Render the template lines with variable substitution
-            # The template engine already handles tile-aware truncation in render_lines()
-            # via _truncate_to_tiles() - color codes like {63} count as 1 tile each
-            formatted = template_engine.render_lines(page.template)
+            # The template engine already handles tile-aware truncation in render_compiled_tiles()
+            # (see src/tiles.py) - color codes like {63} count as 1 tile each
+            tiles = template_engine.render_compiled_tiles(compiled)
+            formatted = tiles.text
             
             # Note: We do NOT truncate/pad by character count here because:
             # - Color codes like {63} are 4 characters but represent 1 tile
@@ -355,7 +378,8 @@ class PageService:
                 display_type="page:template",
                 formatted=formatted,
                 raw={"page_id": page.id, "template": page.template},
-                available=True
+                available=True,
+                tiles=tiles
             )
         except Exception as e:
             logger.error(f"Failed to render template: {e}", exc_info=True)
@@ -367,12 +391,32 @@ class PageService:
                 error=f"Template rendering failed: {str(e)}"
             )
     
+    def get_page_layout(self, page_id: str) -> Optional[PageLayout]:
+        """Get the worst-case layout of a template page.
+        
+        The analysis is cached with the page's compiled template, so repeated
+        calls (e.g. from the editor) are cheap until the page, plugins or
+        configuration change.
+        
+        Args:
+            page_id: The page ID
+            
+        Returns:
+            PageLayout, or None if the page doesn't exist or isn't a template page
+        """
+        page = self.get_page(page_id)
+        if not page or page.type != "template" or not page.template:
+            return None
+        return get_template_engine().analyze_layout(
+            page.template, cache_key=page.id, version=page.updated_at
+        )
+    
     def preview_page(self, page_id: str, force_refresh: bool = False) -> Optional[DisplayResult]:
         """Preview a page by ID.
         
-        Uses cached preview if available and valid, unless force_refresh is True.
-        The cache speeds up preview requests for page grids while ensuring
-        active pages and edits always get fresh data.
+        Uses the cached preview unless force_refresh is True or something the
+        cached render consumed has changed since: the page itself, the data
+        version of any plugin it references, or the configuration.
         
         Args:
             page_id: The page ID
@@ -385,47 +429,87 @@ class PageService:
         if not page:
             return None
         
-        # Check cache first if not forcing refresh
+        # Check cache first if not forcing refresh. Only cached plugin data
+        # versions are read here, so the check never waits on a data source.
         if not force_refresh:
-            cached = self._preview_cache.get(page_id)
-            if cached and cached.is_valid(page):
+            with self._preview_lock:
+                cached = self._preview_cache.get(page_id)
+            if cached and cached.is_valid(page, self._get_data_versions(page), get_config_manager().version):
                 logger.debug(f"Using cached preview for page {page_id}")
                 return cached.result
         
         # Render fresh
         logger.debug(f"Rendering fresh preview for page {page_id} (force_refresh={force_refresh})")
+        config_version = get_config_manager().version
         result = self.render_page(page)
         
-        # Cache the result
-        self._preview_cache[page_id] = CachedPreview(
+        # Cache the result with the versions it was rendered from
+        preview = CachedPreview(
             result=result,
             page_updated_at=page.updated_at,
-            cached_at=time.time()
+            cached_at=time.time(),
+            dependencies=self._get_data_versions(page),
+            config_version=config_version,
         )
+        with self._preview_lock:
+            self._preview_cache[page_id] = preview
         
         return result
     
+    def _get_plugin_ids(self, page: Page) -> Set[str]:
+        """Get the IDs of the plugins a page's render reads from."""
+        if page.type == "single":
+            return {page.display_type} if page.display_type else set()
+        if page.type == "composite":
+            return {row.source for row in page.rows or []}
+        if page.type == "template" and page.template:
+            compiled = get_template_engine().compile_template(
+                page.template, cache_key=page.id, version=page.updated_at
+            )
+            return set(compiled.plugin_ids)
+        return set()
+    
+    def _get_data_versions(self, page: Page) -> Dict[str, Optional[int]]:
+        """Get the cached data version of each plugin a page uses (never fetches).
+        
+        Returns:
+            Dictionary mapping plugin_id to data version (None = changed or
+            expired, so a render is needed)
+        """
+        plugin_ids = self._get_plugin_ids(page)
+        if not plugin_ids:
+            return {}
+        return get_plugin_registry().get_data_versions(plugin_ids, fetch=False)
+    
     def _invalidate_cache(self, page_id: Optional[str] = None) -> None:
         """Invalidate preview cache.
         
         Args:
             page_id: Specific page ID to invalidate, or None to clear all
         """
-        if page_id:
-            self._preview_cache.pop(page_id, None)
-        else:
-            self._preview_cache.clear()
+        with self._preview_lock:
+            if page_id:
+                self._preview_cache.pop(page_id, None)
+            else:
+                self._preview_cache.clear()
+        get_template_engine().invalidate_compiled(page_id)
     
     def get_cache_stats(self) -> Dict[str, any]:
         """Get cache statistics for monitoring.
         
         Returns:
-            Dict with cache size and entry info
+            Dict with cache size and the plugin data versions each entry
+            was rendered from
         """
+        with self._preview_lock:
+            entries = list(self._preview_cache.items())
         return {
-            "cache_size": len(self._preview_cache),
-            "cached_pages": list(self._preview_cache.keys()),
-            "ttl_seconds": PREVIEW_CACHE_TTL
+            "cache_size": len(entries),
+            "cached_pages": [page_id for page_id, _ in entries],
+            "dependencies": {
+                page_id: dict(entry.dependencies)
+                for page_id, entry in entries
+            },
         }
 
 
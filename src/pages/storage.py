@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from ..persistence import get_writer, read_json
 from .models import Page
 
 logger = logging.getLogger(__name__)
@@ -38,6 +39,10 @@ class PageStorage:
         # In-memory cache
         self._pages: Dict[str, Page] = {}
         
+        # Saves are atomic and coalesced (see src/persistence.py)
+        from ..config import Config
+        self._writer = get_writer(self.storage_file, **Config.get_persistence_settings())
+        
         # Load existing pages
         self._load()
         
@@ -50,8 +55,7 @@ class PageStorage:
             return
         
         try:
-            with open(self.storage_file, 'r') as f:
-                data = json.load(f)
+            data = read_json(self.storage_file)
             
             self._pages = {}
             for page_data in data.get("pages", []):
@@ -74,28 +78,37 @@ class PageStorage:
             self._pages = {}
     
     def _save(self) -> None:
-        """Save pages to storage file."""
+        """Save pages to storage file.
+        
+        The write is atomic. With a debounce delay configured it happens in
+        the background, so a burst of changes is serialized and written once.
+        The pages to save are captured here, in the calling thread; page
+        objects are replaced rather than modified, so the background
+        serialization never sees a change in progress.
+        """
+        pages = list(self._pages.values())
         try:
-            data = {
-                "pages": [page.model_dump() for page in self._pages.values()]
-            }
-            
-            # Convert datetime objects to ISO strings for JSON serialization
-            for page_data in data["pages"]:
-                if page_data.get("created_at"):
-                    page_data["created_at"] = page_data["created_at"].isoformat()
-                if page_data.get("updated_at"):
-                    page_data["updated_at"] = page_data["updated_at"].isoformat()
-            
-            with open(self.storage_file, 'w') as f:
-                json.dump(data, f, indent=2)
-            
-            logger.debug(f"Saved {len(self._pages)} pages to storage")
-            
+            self._writer.write(lambda: self._serialize(pages))
         except IOError as e:
             logger.error(f"Failed to save pages file: {e}")
             raise
     
+    def _serialize(self, pages: List[Page]) -> dict:
+        """Build the storage file contents from a snapshot of the pages."""
+        data = {
+            "pages": [page.model_dump() for page in pages]
+        }
+        
+        # Convert datetime objects to ISO strings for JSON serialization
+        for page_data in data["pages"]:
+            if page_data.get("created_at"):
+                page_data["created_at"] = page_data["created_at"].isoformat()
+            if page_data.get("updated_at"):
+                page_data["updated_at"] = page_data["updated_at"].isoformat()
+        
+        logger.debug(f"Saving {len(pages)} pages to storage")
+        return data
+    
     def list_all(self) -> List[Page]:
         """Get all stored pages.
         
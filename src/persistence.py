@@ -0,0 +1,306 @@
+"""Atomic, debounced JSON file persistence.
+
+Pages, schedules, settings and the config are each kept in memory and saved
+to a JSON file after every change. JsonFileWriter makes those saves:
+
+- Atomic: data is written to a temporary file in the same directory and
+  renamed over the target, so a crash or power cut mid-write leaves either
+  the old or the new file, never a truncated one.
+- Durable (optional): the temporary file is fsynced before the rename and
+  the directory after it.
+- Debounced (optional): a burst of changes (bulk imports, rapid UI edits)
+  is written once, debounce_seconds after the last change, instead of once
+  per change. Data may be passed as a callable so it's only serialized when
+  the write actually happens.
+
+Writers are shared per file (see get_writer()), and read_json() flushes a
+pending write before reading, so a file written and read again in the same
+process never looks stale. Pending writes are flushed at exit.
+"""
+
+import atexit
+import json
+import logging
+import os
+import stat
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEBOUNCE_SECONDS = 0.5
+
+# Sentinel for "nothing pending" (None is valid JSON data)
+_NOTHING = object()
+
+# Process umask, read once (reading it means briefly changing it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def write_json_atomic(path: Union[str, Path], data: Any, fsync: bool = True, compact: bool = False) -> None:
+    """Write JSON to a file by writing a temporary file and renaming it.
+
+    Args:
+        path: Target file
+        data: JSON-serializable data
+        fsync: Flush the data (and the rename) to disk before returning
+        compact: Write without indentation or whitespace
+
+    Raises:
+        IOError: If the file can't be written (the target is left unchanged)
+        TypeError: If the data isn't JSON-serializable
+    """
+    path = Path(path)
+    if compact:
+        text = json.dumps(data, separators=(",", ":"))
+    else:
+        text = json.dumps(data, indent=2)
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        # mkstemp creates the file as 0600; keep the target's mode (or the
+        # umask default for a new file) so other readers keep their access
+        os.chmod(tmp_path, _file_mode(path))
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    if fsync:
+        _fsync_directory(path.parent)
+
+
+def _file_mode(path: Path) -> int:
+    """Get the permission bits a rewrite of a file should have."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush a rename in a directory to disk (no-op where unsupported)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class JsonFileWriter:
+    """Writes one JSON file atomically, optionally coalescing bursts of writes.
+
+    Attributes:
+        path: Target file
+        debounce_seconds: Delay before a write happens; 0 writes synchronously
+        fsync: Flush each write to disk
+        compact: Write without indentation or whitespace
+        writes: Number of writes made to disk
+        coalesced: Number of write() calls merged into a later write
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        debounce_seconds: float = 0.0,
+        fsync: bool = True,
+        compact: bool = False,
+    ):
+        """Initialize the writer.
+
+        Args:
+            path: Target file
+            debounce_seconds: Delay before a write happens; 0 writes synchronously
+            fsync: Flush each write to disk
+            compact: Write without indentation or whitespace
+        """
+        self.path = Path(path)
+        self.debounce_seconds = max(0.0, debounce_seconds)
+        self.fsync = fsync
+        self.compact = compact
+        self.writes = 0
+        self.coalesced = 0
+        self._pending: Any = _NOTHING
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()  # Guards _pending and _timer
+        self._write_lock = threading.Lock()  # Serializes writes to the file
+
+    @property
+    def pending(self) -> bool:
+        """Whether a debounced write hasn't been made yet."""
+        return self._pending is not _NOTHING
+
+    def write(self, data: Union[Any, Callable[[], Any]]) -> None:
+        """Save data to the file, now or after the debounce delay.
+
+        Args:
+            data: JSON-serializable data, or a callable returning it. A
+                  callable is only called when the write happens, so
+                  superseded data is never serialized.
+
+        Raises:
+            IOError: If a synchronous write fails
+        """
+        if self.debounce_seconds <= 0:
+            with self._lock:
+                self._cancel_timer()
+                self._pending = _NOTHING
+            self._write(data)
+            return
+
+        with self._lock:
+            if self._pending is not _NOTHING:
+                self.coalesced += 1
+            self._pending = data
+            self._cancel_timer()
+            self._timer = threading.Timer(self.debounce_seconds, self._flush_in_background)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> bool:
+        """Make a pending write now.
+
+        Returns:
+            True if there was a pending write
+
+        Raises:
+            IOError: If the write fails (the data stays pending)
+        """
+        with self._lock:
+            data = self._pending
+            if data is _NOTHING:
+                return False
+            self._pending = _NOTHING
+            self._cancel_timer()
+
+        try:
+            self._write(data)
+        except Exception:
+            with self._lock:
+                # Keep the data for the next flush unless newer data arrived
+                if self._pending is _NOTHING:
+                    self._pending = data
+            raise
+        return True
+
+    def discard(self) -> None:
+        """Drop a pending write without making it."""
+        with self._lock:
+            self._pending = _NOTHING
+            self._cancel_timer()
+
+    def _flush_in_background(self) -> None:
+        """Timer callback: make the pending write, logging failures."""
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Failed to save {self.path}: {e}")
+
+    def _cancel_timer(self) -> None:
+        """Cancel the scheduled write (called with _lock held)."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _write(self, data: Union[Any, Callable[[], Any]]) -> None:
+        """Serialize and atomically write data."""
+        with self._write_lock:
+            if callable(data):
+                data = data()
+            write_json_atomic(self.path, data, fsync=self.fsync, compact=self.compact)
+            self.writes += 1
+
+
+_writers: Dict[Path, JsonFileWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def _key(path: Union[str, Path]) -> Path:
+    """Registry key for a path."""
+    return Path(os.path.abspath(path))
+
+
+def get_writer(
+    path: Union[str, Path],
+    debounce_seconds: float = 0.0,
+    fsync: bool = True,
+    compact: bool = False,
+) -> JsonFileWriter:
+    """Get the shared writer for a file, creating it if needed.
+
+    Options apply to the writer from now on, so the latest caller wins.
+
+    Args:
+        path: Target file
+        debounce_seconds: Delay before a write happens; 0 writes synchronously
+        fsync: Flush each write to disk
+        compact: Write without indentation or whitespace
+    """
+    key = _key(path)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = _writers[key] = JsonFileWriter(key, debounce_seconds, fsync, compact)
+        else:
+            writer.debounce_seconds = max(0.0, debounce_seconds)
+            writer.fsync = fsync
+            writer.compact = compact
+    return writer
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """Read a JSON file, first making any pending write to it.
+
+    Raises:
+        IOError: If the file can't be read
+        json.JSONDecodeError: If the file isn't valid JSON
+    """
+    with _writers_lock:
+        writer = _writers.get(_key(path))
+    if writer is not None:
+        try:
+            writer.flush()
+        except Exception as e:
+            logger.error(f"Failed to save {writer.path} before reading it: {e}")
+
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def flush_all() -> None:
+    """Make all pending writes (called at exit)."""
+    with _writers_lock:
+        writers = list(_writers.values())
+    for writer in writers:
+        try:
+            writer.flush()
+        except Exception as e:
+            logger.error(f"Failed to save {writer.path}: {e}")
+
+
+def reset_writers() -> None:
+    """Drop all writers and their pending writes (for testing)."""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.discard()
+
+
+atexit.register(flush_all)
@@ -5,6 +5,7 @@ Each plugin is self-contained with its own manifest, code, and documentation.
 """
 
 from .base import PluginBase, PluginResult
+from .http import HttpSession, get_http_session
 from .registry import PluginRegistry, get_plugin_registry
 from .loader import PluginLoader
 from .manifest import PluginManifest, validate_manifest
@@ -12,6 +13,8 @@ from .manifest import PluginManifest, validate_manifest
 __all__ = [
     "PluginBase",
     "PluginResult",
+    "HttpSession",
+    "get_http_session",
     "PluginRegistry",
     "get_plugin_registry",
     "PluginLoader",
@@ -7,9 +7,20 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 import logging
+import threading
+import time
+
+from .http import HttpSession, get_http_session
 
 logger = logging.getLogger(__name__)
 
+# Failed fetches are cached for at most this long (capped by the plugin's TTL)
+NEGATIVE_CACHE_SECONDS = 30
+
+# Stale results are served (while refreshing in the background) for up to
+# this multiple of the TTL past expiry before a fetch blocks again
+STALE_WHILE_REVALIDATE_FACTOR = 1.0
+
 
 @dataclass
 class PluginResult:
@@ -20,11 +31,14 @@ class PluginResult:
         data: The fetched data dictionary (raw data for template variables)
         error: Error message if fetch failed
         formatted_lines: Optional pre-formatted display lines (6 lines for board)
+        source: Optional source records that prepare_result() rebuilds
+                time-relative fields of data from (not serialized)
     """
     available: bool
     data: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     formatted_lines: Optional[List[str]] = None
+    source: Any = field(default=None, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API responses."""
@@ -36,6 +50,59 @@ class PluginResult:
         }
 
 
+@dataclass
+class CachedResult:
+    """A cached plugin fetch result.
+    
+    Attributes:
+        result: The PluginResult returned by fetch_data()
+        fetched_at: Monotonic time of the fetch
+        version: Incremented on every fetch, so consumers can detect changes
+    """
+    result: PluginResult
+    fetched_at: float
+    version: int = 0
+    
+    @property
+    def age(self) -> float:
+        """Seconds since this result was fetched."""
+        return time.monotonic() - self.fetched_at
+
+
+@dataclass
+class _Fetch:
+    """A fetch_data() call in progress, shared by concurrent cache misses.
+    
+    Attributes:
+        generation: Cache generation the fetch started in
+        done: Set when result is available
+        result: The fetched result
+    """
+    generation: int
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Optional[PluginResult] = None
+
+
+@dataclass
+class CacheStats:
+    """Per-plugin result cache counters."""
+    hits: int = 0
+    misses: int = 0
+    stale_hits: int = 0
+    negative_hits: int = 0
+    errors: int = 0
+    
+    def to_dict(self) -> Dict[str, int]:
+        """Convert to dictionary for API responses."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_hits": self.stale_hits,
+            "negative_hits": self.negative_hits,
+            "errors": self.errors,
+        }
+
+
 @dataclass
 class PluginInfo:
     """Plugin metadata from manifest.
@@ -70,8 +137,29 @@ class PluginBase(ABC):
     - get_formatted_display(): Return pre-formatted 6-line display
     - on_config_change(): Called when configuration is updated
     - cleanup(): Called when plugin is disabled/unloaded
+    
+    HTTP requests should go through self.http, the shared pooled session.
+    
+    Results of fetch_data() are cached by fetch_data_cached() for the
+    plugin's refresh_seconds (see get_refresh_seconds()), so plugins don't
+    need to implement their own TTL caching.
+    
+    Plugins whose output depends on the current time (countdowns, "x min
+    ago") set TIME_RELATIVE and derive those fields in prepare_result(),
+    which runs on every read of a cached result. fetch_data() still returns
+    complete display data (as of the fetch) so direct callers can render
+    it; it keeps whatever prepare_result() needs in PluginResult.source.
+    Plugins whose data must never be served past its TTL set
+    SERVE_STALE = False.
     """
     
+    # Serve expired results while refreshing in the background
+    SERVE_STALE = True
+    
+    # prepare_result() derives fields from the current time, so results
+    # differ between reads even when the cached data doesn't
+    TIME_RELATIVE = False
+    
     def __init__(self, manifest: Dict[str, Any]):
         """Initialize plugin with its manifest.
         
@@ -81,6 +169,14 @@ class PluginBase(ABC):
         self._manifest = manifest
         self._config: Dict[str, Any] = {}
         self._enabled = False
+        self._result_cache: Optional[CachedResult] = None
+        self._cache_version = 0
+        self._cache_generation = 0  # Bumped by clear_cache(); older fetches aren't stored
+        self._cache_stats = CacheStats()
+        self._cache_lock = threading.Lock()
+        self._revalidating = False
+        self._retry_at = 0.0  # No background revalidation before this (after a failed one)
+        self._inflight: Optional[_Fetch] = None
         logger.debug(f"Plugin initialized: {self.plugin_id}")
     
     @property
@@ -110,6 +206,15 @@ class PluginBase(ABC):
             documentation=self._manifest.get("documentation", "README.md"),
         )
     
+    @property
+    def http(self) -> HttpSession:
+        """Return the shared pooled HTTP session.
+        
+        Use this instead of module-level requests.get()/requests.post()
+        so connections are reused across fetches and plugins.
+        """
+        return get_http_session()
+    
     @property
     def config(self) -> Dict[str, Any]:
         """Return current plugin configuration."""
@@ -121,6 +226,7 @@ class PluginBase(ABC):
         old_config = self._config
         self._config = value
         if old_config != value:
+            self.clear_cache()
             self.on_config_change(old_config, value)
     
     @property
@@ -137,6 +243,7 @@ class PluginBase(ABC):
                 logger.info(f"Plugin enabled: {self.plugin_id}")
             else:
                 logger.info(f"Plugin disabled: {self.plugin_id}")
+                self.clear_cache()
                 self.cleanup()
     
     @abstractmethod
@@ -153,6 +260,227 @@ class PluginBase(ABC):
         """
         pass
     
+    def get_refresh_seconds(self) -> Optional[float]:
+        """Return the cache TTL for this plugin's data.
+        
+        Uses the configured refresh_seconds, falling back to the default
+        declared in the manifest's settings schema. Plugins without a
+        refresh_seconds setting (e.g. clocks) are not cached.
+        
+        Returns:
+            TTL in seconds, or None if results should not be cached
+        """
+        refresh = self._config.get("refresh_seconds")
+        if refresh is None:
+            properties = self.get_settings_schema().get("properties", {})
+            refresh = properties.get("refresh_seconds", {}).get("default")
+        try:
+            refresh = float(refresh)
+        except (TypeError, ValueError):
+            return None
+        return refresh if refresh > 0 else None
+    
+    def fetch_data_cached(self) -> PluginResult:
+        """Return fetch_data() results, cached for get_refresh_seconds().
+        
+        - Fresh results are returned without fetching.
+        - Failed fetches are cached for up to NEGATIVE_CACHE_SECONDS.
+        - Expired successful results are served stale for up to
+          STALE_WHILE_REVALIDATE_FACTOR x TTL while a background refresh
+          runs, unless the plugin sets SERVE_STALE = False.
+        - A failed refresh doesn't replace a successful result that can
+          still be served; the next refresh is retried after up to
+          NEGATIVE_CACHE_SECONDS.
+        
+        Every returned result goes through prepare_result(), so
+        time-relative fields are current even when the data is cached.
+        
+        Returns:
+            PluginResult from cache or from a fresh fetch
+        """
+        return self.prepare_result(self._get_cached_result())
+    
+    def _get_cached_result(self) -> PluginResult:
+        """Look up the cache, fetching on a miss (see fetch_data_cached())."""
+        ttl = self.get_refresh_seconds()
+        if ttl is None:
+            with self._cache_lock:
+                self._cache_stats.misses += 1
+            return self._fetch_and_store()
+        
+        with self._cache_lock:
+            entry = self._result_cache
+            if entry is not None:
+                age = entry.age
+                if entry.result.available:
+                    if age < ttl:
+                        self._cache_stats.hits += 1
+                        return entry.result
+                    if self.SERVE_STALE and age < ttl * (1 + STALE_WHILE_REVALIDATE_FACTOR):
+                        self._cache_stats.stale_hits += 1
+                        self._start_revalidation()
+                        return entry.result
+                elif age < min(ttl, NEGATIVE_CACHE_SECONDS):
+                    self._cache_stats.negative_hits += 1
+                    return entry.result
+            self._cache_stats.misses += 1
+        
+        return self._fetch_and_store()
+    
+    def prepare_result(self, result: PluginResult) -> PluginResult:
+        """Derive time-relative fields from a (possibly cached) result.
+        
+        Called on every fetch_data_cached() read. Override together with
+        TIME_RELATIVE = True; rebuild from result.source and return a new
+        PluginResult rather than modifying the cached one. Results without
+        a source (e.g. errors) should be returned as they are. The default
+        returns the result unchanged.
+        
+        Args:
+            result: Result as returned by fetch_data()
+            
+        Returns:
+            Result to render
+        """
+        return result
+    
+    def refresh_cache(self) -> PluginResult:
+        """Fetch fresh data into the cache regardless of its age.
+        
+        Used by the background prefetcher to keep the cache warm so that
+        renders never wait on the data source.
+        
+        Returns:
+            The freshly fetched PluginResult
+        """
+        return self._fetch_and_store()
+    
+    def _fetch_and_store(self) -> PluginResult:
+        """Call fetch_data() and store the result in the cache.
+        
+        Concurrent callers share one fetch_data() call. A result fetched
+        before clear_cache() (e.g. with the old config) is returned to its
+        callers but not stored, and so is a failed result while the cached
+        successful one can still be served.
+        """
+        with self._cache_lock:
+            fetch = self._inflight
+            leader = fetch is None or fetch.generation != self._cache_generation
+            if leader:
+                fetch = self._inflight = _Fetch(generation=self._cache_generation)
+        
+        if not leader:
+            fetch.done.wait()
+            return fetch.result
+        
+        result = PluginResult(available=False, error="Fetch interrupted")
+        try:
+            try:
+                result = self.fetch_data()
+            except Exception as e:
+                logger.exception(f"Error fetching data from {self.plugin_id}")
+                result = PluginResult(available=False, error=str(e))
+            
+            with self._cache_lock:
+                keep = None
+                if not result.available:
+                    self._cache_stats.errors += 1
+                    keep = self._servable_entry()
+                if fetch.generation != self._cache_generation:
+                    logger.debug(f"Discarding {self.plugin_id} result fetched before the cache was cleared")
+                elif keep is not None:
+                    # Transient upstream error: keep serving the good result
+                    logger.warning(f"Keeping cached {self.plugin_id} data after failed refresh: {result.error}")
+                    self._retry_at = time.monotonic() + min(self.get_refresh_seconds(), NEGATIVE_CACHE_SECONDS)
+                else:
+                    self._cache_version += 1
+                    self._result_cache = CachedResult(
+                        result=result,
+                        fetched_at=time.monotonic(),
+                        version=self._cache_version,
+                    )
+        finally:
+            with self._cache_lock:
+                if self._inflight is fetch:
+                    self._inflight = None
+            fetch.result = result
+            fetch.done.set()
+        return result
+    
+    def _servable_entry(self) -> Optional[CachedResult]:
+        """Get the cached successful result if it can still be served (called with _cache_lock held)."""
+        ttl = self.get_refresh_seconds()
+        entry = self._result_cache
+        if ttl is None or entry is None or not entry.result.available:
+            return None
+        max_age = ttl * (1 + STALE_WHILE_REVALIDATE_FACTOR) if self.SERVE_STALE else ttl
+        return entry if entry.age < max_age else None
+    
+    def _start_revalidation(self) -> None:
+        """Refresh the cache in a background thread (called with _cache_lock held)."""
+        if self._revalidating or time.monotonic() < self._retry_at:
+            return
+        self._revalidating = True
+        
+        def revalidate():
+            try:
+                self._fetch_and_store()
+            finally:
+                with self._cache_lock:
+                    self._revalidating = False
+        
+        threading.Thread(
+            target=revalidate, name=f"revalidate-{self.plugin_id}", daemon=True
+        ).start()
+    
+    @property
+    def cached_result(self) -> Optional[CachedResult]:
+        """Return the current cache entry, if any."""
+        return self._result_cache
+    
+    @property
+    def cache_generation(self) -> int:
+        """Return the cache generation, bumped by every clear_cache()."""
+        return self._cache_generation
+    
+    def is_cache_fresh(self) -> bool:
+        """Check whether fetch_data_cached() would return the cache entry as-is.
+        
+        Returns:
+            True if a cached result exists and is within its TTL (or within
+            the negative-cache window for failed fetches)
+        """
+        ttl = self.get_refresh_seconds()
+        entry = self._result_cache
+        if ttl is None or entry is None:
+            return False
+        if entry.result.available:
+            return entry.age < ttl
+        return entry.age < min(ttl, NEGATIVE_CACHE_SECONDS)
+    
+    def clear_cache(self) -> None:
+        """Drop the cached result so the next fetch hits the data source.
+        
+        Fetches already in flight won't store their results.
+        """
+        with self._cache_lock:
+            self._result_cache = None
+            self._cache_generation += 1
+            self._retry_at = 0.0
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Return cache counters and the current entry's age.
+        
+        Returns:
+            Dictionary with hit/miss counters, ttl_seconds and age_seconds
+        """
+        with self._cache_lock:
+            stats = self._cache_stats.to_dict()
+            entry = self._result_cache
+        stats["ttl_seconds"] = self.get_refresh_seconds()
+        stats["age_seconds"] = round(entry.age, 1) if entry else None
+        return stats
+    
     def validate_config(self, config: Dict[str, Any]) -> List[str]:
         """Validate configuration before use.
         
@@ -0,0 +1,120 @@
+"""Shared HTTP session for plugins and data sources.
+
+Calling module-level requests.get()/requests.post() opens a new connection
+(and TLS handshake) for every request. All plugins and data sources should
+use the shared session instead, which provides:
+
+- Per-host connection pools with keep-alive
+- Automatic retries with exponential backoff for transient failures
+  (connection errors and 5xx responses; idempotent methods only)
+- A global cap on concurrent in-flight requests
+- A default timeout for requests that don't pass one
+
+Plugins get the session through PluginBase.http; other code calls
+get_http_session().
+"""
+
+import logging
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Singleton instance
+_session: Optional["HttpSession"] = None
+_session_lock = threading.Lock()
+
+DEFAULT_TIMEOUT = 10  # seconds, used when a request doesn't pass timeout=
+DEFAULT_MAX_CONCURRENT_REQUESTS = 8  # across all plugins and data sources
+DEFAULT_POOL_CONNECTIONS = 16  # number of per-host pools kept
+DEFAULT_POOL_MAXSIZE = 4  # keep-alive connections per host
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF_FACTOR = 0.5  # seconds, doubled for each retry
+# 429 is left to the caller: rate-limited APIs (e.g. OpenSky) can ask for
+# Retry-After delays far longer than a fetch should block
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+
+class HttpSession(requests.Session):
+    """requests.Session with pooling, retries and a global concurrency cap.
+    
+    Drop-in replacement for the requests module functions:
+    session.get(url, params=..., timeout=...) behaves like requests.get().
+    """
+    
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        retries: int = DEFAULT_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        """Initialize the session.
+        
+        Args:
+            max_concurrent: Max requests in flight at once (others wait)
+            retries: Max retries for transient failures
+            backoff_factor: Base delay between retries
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Keep-alive connections per host
+            timeout: Default request timeout in seconds
+        """
+        super().__init__()
+        self.default_timeout = timeout
+        self._semaphore = threading.BoundedSemaphore(max(1, max_concurrent))
+        
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            respect_retry_after_header=False,
+            raise_on_status=False,  # Return the last response; callers raise_for_status()
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+    
+    def request(self, method, url, **kwargs) -> requests.Response:
+        """Send a request, waiting for a free concurrency slot first."""
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.default_timeout
+        with self._semaphore:
+            return super().request(method, url, **kwargs)
+
+
+def get_http_session() -> HttpSession:
+    """Get or create the shared HTTP session singleton.
+    
+    Returns:
+        The global HttpSession instance
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = HttpSession()
+                logger.debug("Shared HTTP session created")
+    return _session
+
+
+def reset_http_session() -> None:
+    """Close and discard the shared HTTP session.
+    
+    Use this in tests or to drop all pooled connections.
+    """
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
@@ -0,0 +1,254 @@
+"""Background prefetching of plugin data.
+
+The PluginPrefetcher keeps the PluginBase result caches warm so that
+rendering a page (and therefore sending it to the board) reads in-memory
+snapshots instead of waiting on upstream APIs.
+
+Each enabled plugin with a refresh_seconds TTL is refreshed on its own
+cadence, slightly before its cached result expires. Refresh times are
+jittered so plugins sharing a TTL don't all hit the network at once, and
+failing plugins back off exponentially instead of being retried every tick.
+The loop is modelled on TransitCache._refresh_loop.
+"""
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from .base import PluginBase
+
+logger = logging.getLogger(__name__)
+
+# Singleton instance
+_prefetcher: Optional["PluginPrefetcher"] = None
+
+PREFETCH_LEAD_FACTOR = 0.8  # refresh at 80% of the TTL, before entries expire
+PREFETCH_JITTER = 0.1  # +/- fraction of the TTL added to each refresh time
+BACKOFF_BASE_SECONDS = 5.0  # first retry delay after a failed refresh
+BACKOFF_MAX_SECONDS = 300.0  # cap on the retry delay
+MAX_LOOP_SLEEP = 5.0  # re-check for new/re-enabled plugins at least this often
+
+
+class PluginPrefetcher:
+    """Refreshes enabled plugins' cached data in the background."""
+    
+    def __init__(self, registry, workers: int = 2):
+        """Initialize the prefetcher (not started).
+        
+        Args:
+            registry: PluginRegistry whose enabled plugins are refreshed
+            workers: Max plugins refreshed concurrently
+        """
+        self._registry = registry
+        self._workers = max(1, workers)
+        self._lock = threading.Lock()
+        
+        # Scheduling state
+        self._next_due: Dict[str, float] = {}
+        self._failures: Dict[str, int] = {}
+        self._inflight: Dict[str, Future] = {}
+        self._refresh_count = 0
+        self._error_count = 0
+        
+        # Background thread
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+    
+    @property
+    def running(self) -> bool:
+        """Return whether the prefetch loop is running."""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> None:
+        """Start the background prefetch thread."""
+        with self._lock:
+            if self.running:
+                logger.warning("Plugin prefetcher already running")
+                return
+            
+            logger.info(f"Starting plugin prefetcher ({self._workers} workers)")
+            self._stop_event.clear()
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._workers, thread_name_prefix="plugin-prefetch"
+            )
+            self._thread = threading.Thread(
+                target=self._prefetch_loop, daemon=True, name="PluginPrefetcher"
+            )
+            self._thread.start()
+    
+    def stop(self) -> None:
+        """Stop the background prefetch thread."""
+        logger.info("Stopping plugin prefetcher")
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    def wake(self) -> None:
+        """Re-check schedules now (e.g. after a plugin was enabled or reconfigured)."""
+        self._wake_event.set()
+    
+    def _prefetch_loop(self) -> None:
+        """Background thread that refreshes plugins as they come due."""
+        logger.info("Plugin prefetch loop started")
+        
+        while not self._stop_event.is_set():
+            try:
+                sleep_for = self.run_pending()
+            except Exception as e:
+                logger.error(f"Error in plugin prefetch loop: {e}", exc_info=True)
+                sleep_for = MAX_LOOP_SLEEP
+            
+            # Wait for the next refresh (or until woken / stopped)
+            self._wake_event.wait(sleep_for)
+            self._wake_event.clear()
+        
+        logger.info("Plugin prefetch loop stopped")
+    
+    def run_pending(self) -> float:
+        """Submit refreshes for every plugin that is due.
+        
+        Returns:
+            Seconds until the next plugin comes due (capped at MAX_LOOP_SLEEP)
+        """
+        now = time.monotonic()
+        sleep_for = MAX_LOOP_SLEEP
+        enabled = self._registry.enabled_plugins
+        due_plugins: Dict[str, PluginBase] = {}
+        
+        with self._lock:
+            # Forget plugins that were disabled or unloaded
+            for plugin_id in list(self._next_due):
+                if plugin_id not in enabled:
+                    self._next_due.pop(plugin_id, None)
+                    self._failures.pop(plugin_id, None)
+            
+            for plugin_id, plugin in enabled.items():
+                if plugin.get_refresh_seconds() is None:
+                    continue  # Uncached plugins (clocks etc.) are computed at render time
+                future = self._inflight.get(plugin_id)
+                if future is not None and not future.done():
+                    continue
+                
+                due = self._next_due.get(plugin_id, now)
+                if plugin.cached_result is None:
+                    due = now  # Cache was cleared (config change, enable, ...)
+                if due <= now:
+                    self._next_due[plugin_id] = float("inf")
+                    due_plugins[plugin_id] = plugin
+                else:
+                    sleep_for = min(sleep_for, due - now)
+        
+        for plugin_id, plugin in due_plugins.items():
+            future = self._submit(plugin_id, plugin)
+            with self._lock:
+                self._inflight[plugin_id] = future
+        
+        return max(sleep_for, 0.0)
+    
+    def _submit(self, plugin_id: str, plugin: PluginBase) -> Future:
+        """Run a refresh in the pool, or inline if the prefetcher isn't started."""
+        executor = self._executor
+        if executor is None:
+            future: Future = Future()
+            future.set_result(self._refresh(plugin_id, plugin))
+            return future
+        return executor.submit(self._refresh, plugin_id, plugin)
+    
+    def _refresh(self, plugin_id: str, plugin: PluginBase) -> bool:
+        """Pool worker: refresh one plugin and schedule its next run."""
+        try:
+            success = plugin.refresh_cache().available
+        except Exception as e:
+            logger.error(f"Error prefetching plugin {plugin_id}: {e}", exc_info=True)
+            success = False
+        
+        ttl = plugin.get_refresh_seconds() or MAX_LOOP_SLEEP
+        with self._lock:
+            self._refresh_count += 1
+            if success:
+                self._failures.pop(plugin_id, None)
+                delay = self._next_delay(ttl)
+            else:
+                self._error_count += 1
+                failures = self._failures.get(plugin_id, 0) + 1
+                self._failures[plugin_id] = failures
+                delay = self._backoff_delay(failures)
+                logger.warning(
+                    f"Prefetch failed for {plugin_id} ({failures} in a row), "
+                    f"retrying in {delay:.0f}s"
+                )
+            self._next_due[plugin_id] = time.monotonic() + delay
+        
+        self._wake_event.set()
+        return success
+    
+    @staticmethod
+    def _next_delay(ttl: float) -> float:
+        """Delay until the next refresh after a success, with jitter."""
+        jitter = random.uniform(-PREFETCH_JITTER, PREFETCH_JITTER)
+        return max(ttl * (PREFETCH_LEAD_FACTOR + jitter), 1.0)
+    
+    @staticmethod
+    def _backoff_delay(failures: int) -> float:
+        """Exponential backoff delay after consecutive failures, with jitter."""
+        delay = min(BACKOFF_BASE_SECONDS * 2 ** (failures - 1), BACKOFF_MAX_SECONDS)
+        return delay * random.uniform(1 - PREFETCH_JITTER, 1 + PREFETCH_JITTER)
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Get prefetcher status for monitoring.
+        
+        Returns:
+            Dictionary with running state, counters and per-plugin schedules
+        """
+        now = time.monotonic()
+        with self._lock:
+            plugins = {
+                plugin_id: {
+                    "next_refresh_in_seconds": (
+                        round(max(due - now, 0.0), 1) if due != float("inf") else None
+                    ),
+                    "consecutive_failures": self._failures.get(plugin_id, 0),
+                }
+                for plugin_id, due in self._next_due.items()
+            }
+            return {
+                "running": self.running,
+                "refresh_count": self._refresh_count,
+                "error_count": self._error_count,
+                "plugins": plugins,
+            }
+
+
+def get_plugin_prefetcher() -> PluginPrefetcher:
+    """Get or create the global plugin prefetcher singleton.
+    
+    Returns:
+        The global PluginPrefetcher instance (not started)
+    """
+    global _prefetcher
+    if _prefetcher is None:
+        from .registry import get_plugin_registry
+        try:
+            from ..config import Config
+            workers = Config.PLUGIN_FETCH_WORKERS
+        except Exception:
+            workers = 2
+        _prefetcher = PluginPrefetcher(get_plugin_registry(), workers=workers)
+    return _prefetcher
+
+
+def reset_plugin_prefetcher() -> None:
+    """Stop and discard the global plugin prefetcher."""
+    global _prefetcher
+    if _prefetcher is not None:
+        _prefetcher.stop()
+    _prefetcher = None
@@ -8,8 +8,11 @@ The PluginRegistry is the central point for:
 """
 
 import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .base import PluginBase, PluginResult
 from .loader import PluginLoader
@@ -20,6 +23,12 @@ logger = logging.getLogger(__name__)
 # Singleton instance
 _registry: Optional["PluginRegistry"] = None
 
+# Concurrent fetch defaults (overridable via general config)
+DEFAULT_FETCH_WORKERS = 4
+DEFAULT_PLUGIN_FETCH_TIMEOUT = 10.0  # seconds, per plugin
+DEFAULT_RENDER_DEADLINE = 15.0  # seconds, for all plugins of one render
+FETCH_POLL_INTERVAL = 0.05  # seconds between deadline checks while fetches are queued
+
 
 class PluginRegistry:
     """Central registry for all loaded plugins.
@@ -42,6 +51,16 @@ class PluginRegistry:
         self._manifests: Dict[str, PluginManifest] = {}
         self._configs: Dict[str, Dict[str, Any]] = {}
         self._enabled: Dict[str, bool] = {}
+        self._manifest_version = 0
+        
+        # Concurrent fetching state
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_workers = 0
+        self._executor_lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self._fetch_started: Dict[str, float] = {}
+        # plugin_id -> (cache generation, raw result) of the last successful fetch
+        self._last_good: Dict[str, Tuple[int, PluginResult]] = {}
         
         logger.info("PluginRegistry initialized")
     
@@ -50,6 +69,15 @@ class PluginRegistry:
         """Return all loaded plugins."""
         return self._plugins.copy()
     
+    @property
+    def manifest_version(self) -> int:
+        """Change counter, incremented whenever plugins are loaded or reloaded.
+        
+        Lets caches derived from manifests (e.g. variable max lengths) detect
+        changes without comparing contents.
+        """
+        return self._manifest_version
+    
     @property
     def enabled_plugins(self) -> Dict[str, PluginBase]:
         """Return only enabled plugins."""
@@ -102,6 +130,7 @@ class PluginRegistry:
                 else:
                     logger.debug(f"Loaded plugin (disabled): {plugin_id}")
         
+        self._manifest_version += 1
         enabled_count = sum(1 for e in self._enabled.values() if e)
         logger.info(f"Initialized {len(self._plugins)} plugins ({enabled_count} enabled)")
     
@@ -177,6 +206,7 @@ class PluginRegistry:
         plugin = self._plugins[plugin_id]
         plugin.enabled = False
         self._enabled[plugin_id] = False
+        self._last_good.pop(plugin_id, None)
         
         logger.info(f"Disabled plugin: {plugin_id}")
         return True
@@ -243,7 +273,7 @@ class PluginRegistry:
         plugin = self._plugins[plugin_id]
         
         try:
-            return plugin.fetch_data()
+            return plugin.fetch_data_cached()
         except Exception as e:
             logger.exception(f"Error fetching data from {plugin_id}")
             return PluginResult(
@@ -274,16 +304,19 @@ class PluginRegistry:
         
         return variables
     
-    def get_all_max_lengths(self) -> Dict[str, int]:
+    def get_all_max_lengths(self, include_disabled: bool = False) -> Dict[str, int]:
         """Get all max lengths from enabled plugins.
         
+        Args:
+            include_disabled: Include disabled plugins too (e.g. for validation)
+        
         Returns:
             Dictionary mapping "plugin_id.variable" to max length
         """
         max_lengths: Dict[str, int] = {}
         
         for plugin_id in self._plugins:
-            if not self._enabled.get(plugin_id, False):
+            if not include_disabled and not self._enabled.get(plugin_id, False):
                 continue
             
             manifest = self._manifests.get(plugin_id)
@@ -297,6 +330,73 @@ class PluginRegistry:
         
         return max_lengths
     
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get result cache statistics for enabled plugins.
+        
+        Returns:
+            Dictionary mapping plugin_id to cache counters
+        """
+        return {
+            plugin_id: plugin.get_cache_stats()
+            for plugin_id, plugin in self.enabled_plugins.items()
+        }
+    
+    def get_data_versions(self, plugin_ids: Iterable[str], fetch: bool = True) -> Dict[str, Optional[int]]:
+        """Get the cache version of the data each plugin would render with now.
+        
+        With fetch=True, plugins whose cache entry is missing or expired are
+        fetched first (concurrently), so an unchanged version means unchanged
+        data. With fetch=False only the cache is read and such plugins
+        report None, so the call never blocks on a data source.
+        
+        Args:
+            plugin_ids: Plugin IDs to check
+            fetch: Fetch plugins without fresh cached data first
+            
+        Returns:
+            Dictionary mapping plugin_id to its data version. Disabled or
+            unknown plugins report 0; plugins without a cache or with
+            time-relative output (whose data may change on every fetch)
+            and plugins without any (fresh, if fetch=False) data report None.
+        """
+        versions: Dict[str, Optional[int]] = {}
+        refresh = []
+        for plugin_id in set(plugin_ids):
+            plugin = self._plugins.get(plugin_id)
+            if plugin is None or not self._enabled.get(plugin_id, False):
+                versions[plugin_id] = 0
+            elif plugin.get_refresh_seconds() is None or plugin.TIME_RELATIVE:
+                versions[plugin_id] = None
+            elif not plugin.is_cache_fresh():
+                if fetch:
+                    refresh.append(plugin_id)
+                else:
+                    versions[plugin_id] = None
+        
+        if refresh:
+            self.fetch_plugins_concurrently(refresh)
+        
+        for plugin_id in set(plugin_ids) - versions.keys():
+            entry = self._plugins[plugin_id].cached_result
+            versions[plugin_id] = entry.version if entry else None
+        return versions
+    
+    def clear_cache(self, plugin_id: Optional[str] = None) -> None:
+        """Clear cached plugin results.
+        
+        Args:
+            plugin_id: Specific plugin to clear, or None to clear all
+        """
+        if plugin_id is not None:
+            plugin = self._plugins.get(plugin_id)
+            if plugin:
+                plugin.clear_cache()
+            self._last_good.pop(plugin_id, None)
+            return
+        for plugin in self._plugins.values():
+            plugin.clear_cache()
+        self._last_good.clear()
+    
     def get_variables_schema(self, plugin_id: str) -> Optional[Dict[str, Any]]:
         """Get the variables schema for a plugin.
         
@@ -352,6 +452,7 @@ class PluginRegistry:
         config = self._configs.get(plugin_id, {})
         
         # Unload
+        self._manifest_version += 1
         if plugin_id in self._plugins:
             self._plugins[plugin_id].cleanup()
             del self._plugins[plugin_id]
@@ -384,22 +485,168 @@ class PluginRegistry:
         """
         return self._loader.load_errors
     
-    def build_template_context(self) -> Dict[str, Any]:
+    def build_template_context(self, plugin_ids: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """Build context dictionary for template rendering.
         
-        Fetches data from all enabled plugins.
+        Fetches data from enabled plugins. When plugin_ids is given, only
+        those plugins are fetched (unknown or disabled IDs are skipped), so
+        a page referencing {{date_time.time}} doesn't trigger every other
+        plugin's network calls.
+        
+        Plugins are fetched concurrently (see fetch_plugins_concurrently);
+        a plugin that misses its deadline contributes its last good data,
+        or nothing so its variables render as "???".
+        
+        Args:
+            plugin_ids: Optional subset of plugin IDs to fetch. None fetches
+                        all enabled plugins.
         
         Returns:
             Dictionary mapping plugin_id to plugin data
         """
         context: Dict[str, Any] = {}
         
-        for plugin_id in self.enabled_plugins:
-            result = self.fetch_plugin_data(plugin_id)
+        enabled = self.enabled_plugins
+        if plugin_ids is not None:
+            wanted = set(plugin_ids)
+            enabled = {pid: plugin for pid, plugin in enabled.items() if pid in wanted}
+        
+        results = self.fetch_plugins_concurrently(list(enabled))
+        for plugin_id, result in results.items():
             if result.available and result.data:
                 context[plugin_id] = result.data
         
         return context
+    
+    def fetch_plugins_concurrently(
+        self,
+        plugin_ids: List[str],
+        plugin_timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, PluginResult]:
+        """Fetch data from several plugins using a bounded thread pool.
+        
+        Each plugin gets plugin_timeout seconds from when its fetch starts,
+        and all fetches together get deadline seconds. A plugin that misses
+        either deadline yields its last good result (or an unavailable
+        result) while its fetch keeps running in the background; a later
+        call reuses that in-flight fetch instead of starting another one.
+        
+        Args:
+            plugin_ids: Plugin identifiers to fetch
+            plugin_timeout: Per-plugin deadline in seconds (default from config)
+            deadline: Overall deadline in seconds (default from config)
+            
+        Returns:
+            Dictionary mapping plugin_id to PluginResult, in request order
+        """
+        workers, default_timeout, default_deadline = self._get_fetch_settings()
+        plugin_timeout = default_timeout if plugin_timeout is None else plugin_timeout
+        deadline = default_deadline if deadline is None else deadline
+        
+        if workers <= 1:
+            # Sequential mode
+            return {pid: self.fetch_plugin_data(pid) for pid in plugin_ids}
+        
+        futures = {pid: self._submit_fetch(pid, workers) for pid in dict.fromkeys(plugin_ids)}
+        plugin_of = {future: pid for pid, future in futures.items()}
+        deadline_at = time.monotonic() + deadline
+        
+        def expires_at(future: Future) -> float:
+            # Queued fetches only count against the overall deadline
+            started = self._fetch_started.get(plugin_of[future])
+            if started is None:
+                return deadline_at
+            return min(deadline_at, started + plugin_timeout)
+        
+        pending = set(plugin_of)
+        while pending:
+            now = time.monotonic()
+            pending = {future for future in pending if expires_at(future) > now}
+            if not pending:
+                break
+            timeout = min(expires_at(future) for future in pending) - now
+            if any(self._fetch_started.get(plugin_of[future]) is None for future in pending):
+                # Re-check soon so per-plugin deadlines apply once queued fetches start
+                timeout = min(timeout, FETCH_POLL_INTERVAL)
+            _, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        
+        results: Dict[str, PluginResult] = {}
+        for pid, future in futures.items():
+            if future.done():
+                results[pid] = future.result()
+            else:
+                logger.warning(f"Plugin fetch timed out: {pid}")
+                results[pid] = self._get_last_good(pid) or PluginResult(
+                    available=False,
+                    error=f"Plugin fetch timed out: {pid}"
+                )
+        return results
+    
+    def _submit_fetch(self, plugin_id: str, workers: int) -> Future:
+        """Submit a plugin fetch to the pool, reusing an in-flight fetch."""
+        with self._executor_lock:
+            inflight = self._inflight.get(plugin_id)
+            if inflight is not None and not inflight.done():
+                return inflight
+            
+            if self._executor is None or self._executor_workers != workers:
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
+                self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="plugin-fetch")
+                self._executor_workers = workers
+            
+            self._fetch_started.pop(plugin_id, None)
+            future = self._executor.submit(self._run_fetch, plugin_id)
+            self._inflight[plugin_id] = future
+            return future
+    
+    def _run_fetch(self, plugin_id: str) -> PluginResult:
+        """Pool worker: fetch a plugin and remember its last good result.
+        
+        The raw cached result is kept (not the one prepare_result() made
+        from it), so a fallback shows current time-relative fields.
+        """
+        self._fetch_started[plugin_id] = time.monotonic()
+        result = self.fetch_plugin_data(plugin_id)
+        plugin = self._plugins.get(plugin_id)
+        if plugin is None or not result.available:
+            return result
+        # Generation first: an entry cleared in between is then never served
+        generation = plugin.cache_generation
+        entry = plugin.cached_result
+        if entry is not None and entry.result.available and entry.result.data:
+            self._last_good[plugin_id] = (generation, entry.result)
+        return result
+    
+    def _get_last_good(self, plugin_id: str) -> Optional[PluginResult]:
+        """Get a plugin's last good result for a timed-out fetch.
+        
+        Results fetched before the plugin's cache was last cleared (e.g.
+        under an old config) are dropped.
+        """
+        last = self._last_good.get(plugin_id)
+        plugin = self._plugins.get(plugin_id)
+        if last is None or plugin is None:
+            return None
+        generation, result = last
+        if generation != plugin.cache_generation or not self._enabled.get(plugin_id, False):
+            self._last_good.pop(plugin_id, None)
+            return None
+        return plugin.prepare_result(result)
+    
+    def _get_fetch_settings(self) -> tuple:
+        """Get (workers, plugin_timeout, deadline) from general config."""
+        try:
+            from ..config import Config
+            return (
+                Config.PLUGIN_FETCH_WORKERS,
+                Config.PLUGIN_FETCH_TIMEOUT_SECONDS,
+                Config.RENDER_DEADLINE_SECONDS,
+            )
+        except Exception as e:
+            logger.debug(f"Using default plugin fetch settings: {e}")
+            return DEFAULT_FETCH_WORKERS, DEFAULT_PLUGIN_FETCH_TIMEOUT, DEFAULT_RENDER_DEADLINE
 
 
 def get_plugin_registry() -> PluginRegistry:
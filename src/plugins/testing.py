@@ -129,10 +129,11 @@ def mock_requests_get(url_responses: Dict[str, Any]):
         url_responses: Dict mapping URL patterns to response data
         
     Returns:
-        Mock function suitable for patching requests.get
+        Mock function suitable for patching requests.get or the shared
+        session's HttpSession.get
         
     Usage:
-        with patch('requests.get', mock_requests_get({
+        with patch('src.plugins.http.HttpSession.get', mock_requests_get({
             'api.example.com/data': {'key': 'value'},
             'api.example.com/error': None,  # Will return 500
         })):
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from ..persistence import get_writer, read_json
 from .models import ScheduleEntry
 
 logger = logging.getLogger(__name__)
@@ -39,6 +40,10 @@ class ScheduleStorage:
         self._schedules: Dict[str, ScheduleEntry] = {}
         self._default_page_id: Optional[str] = None
         
+        # Saves are atomic and coalesced (see src/persistence.py)
+        from ..config import Config
+        self._writer = get_writer(self.storage_file, **Config.get_persistence_settings())
+        
         # Load existing schedules
         self._load()
         
@@ -55,8 +60,7 @@ class ScheduleStorage:
             return
         
         try:
-            with open(self.storage_file, 'r') as f:
-                data = json.load(f)
+            data = read_json(self.storage_file)
             
             self._schedules = {}
             for schedule_data in data.get("schedules", []):
@@ -83,29 +87,39 @@ class ScheduleStorage:
             self._default_page_id = None
     
     def _save(self) -> None:
-        """Save schedules to storage file."""
+        """Save schedules to storage file.
+        
+        The write is atomic. With a debounce delay configured it happens in
+        the background, so a burst of changes is serialized and written once.
+        The schedules to save are captured here, in the calling thread; schedule
+        objects are replaced rather than modified, so the background
+        serialization never sees a change in progress.
+        """
+        schedules = list(self._schedules.values())
+        default_page_id = self._default_page_id
         try:
-            data = {
-                "schedules": [schedule.model_dump() for schedule in self._schedules.values()],
-                "default_page_id": self._default_page_id
-            }
-            
-            # Convert datetime objects to ISO strings for JSON serialization
-            for schedule_data in data["schedules"]:
-                if schedule_data.get("created_at"):
-                    schedule_data["created_at"] = schedule_data["created_at"].isoformat()
-                if schedule_data.get("updated_at"):
-                    schedule_data["updated_at"] = schedule_data["updated_at"].isoformat()
-            
-            with open(self.storage_file, 'w') as f:
-                json.dump(data, f, indent=2)
-            
-            logger.debug(f"Saved {len(self._schedules)} schedules to storage")
-            
+            self._writer.write(lambda: self._serialize(schedules, default_page_id))
         except IOError as e:
             logger.error(f"Failed to save schedules file: {e}")
             raise
     
+    def _serialize(self, schedules: List[ScheduleEntry], default_page_id: Optional[str]) -> dict:
+        """Build the storage file contents from a snapshot of the schedules."""
+        data = {
+            "schedules": [schedule.model_dump() for schedule in schedules],
+            "default_page_id": default_page_id
+        }
+        
+        # Convert datetime objects to ISO strings for JSON serialization
+        for schedule_data in data["schedules"]:
+            if schedule_data.get("created_at"):
+                schedule_data["created_at"] = schedule_data["created_at"].isoformat()
+            if schedule_data.get("updated_at"):
+                schedule_data["updated_at"] = schedule_data["updated_at"].isoformat()
+        
+        logger.debug(f"Saving {len(schedules)} schedules to storage")
+        return data
+    
     def list_all(self) -> List[ScheduleEntry]:
         """Get all stored schedules.
         
@@ -1,8 +1,8 @@
 """Settings management module."""
 
-from .service import SettingsService, get_settings_service
+from .service import SettingsService, SettingsSnapshot, get_settings_service
 
-__all__ = ["SettingsService", "get_settings_service"]
+__all__ = ["SettingsService", "SettingsSnapshot", "get_settings_service"]
 
 
 
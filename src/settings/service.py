@@ -2,15 +2,22 @@
 
 This service allows runtime modification of settings like transition
 animations and output targets, which can be controlled from the UI.
+
+Every change publishes a new versioned SettingsSnapshot and notifies
+subscribers, so long-running consumers (e.g. the display loop) can react
+without polling the service or re-reading the settings file.
 """
 
 import json
 import logging
 import os
-from dataclasses import dataclass, asdict
-from typing import Optional, Literal
+import threading
+from dataclasses import dataclass, asdict, replace
+from typing import Callable, List, Optional, Literal
 from pathlib import Path
 
+from ..persistence import get_writer, read_json
+
 logger = logging.getLogger(__name__)
 
 # Valid values
@@ -122,6 +129,37 @@ class ScheduleSettings:
         return cls(enabled=data.get("enabled", False))
 
 
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    """All runtime settings at one version.
+    
+    Holds copies of the service's settings objects, so it never changes
+    after it's published; treat the settings objects as read-only.
+    """
+    version: int
+    transition: TransitionSettings
+    output: OutputSettings
+    active_page: ActivePageSettings
+    polling: PollingSettings
+    board: BoardSettings
+    schedule: ScheduleSettings
+    
+    def to_dict(self) -> dict:
+        return {
+            "version": self.version,
+            "transitions": self.transition.to_dict(),
+            "output": self.output.to_dict(),
+            "active_page": self.active_page.to_dict(),
+            "polling": self.polling.to_dict(),
+            "board": self.board.to_dict(),
+            "schedule": self.schedule.to_dict(),
+        }
+
+
+# Called with (previous snapshot, new snapshot) after every change
+SettingsListener = Callable[[SettingsSnapshot, SettingsSnapshot], None]
+
+
 class SettingsService:
     """Service for managing runtime settings.
     
@@ -144,13 +182,22 @@ class SettingsService:
         else:
             self.settings_file = Path(settings_file)
         
-        # Load initial settings from env/file
-        self._transition = self._load_transition_settings()
-        self._output = self._load_output_settings()
-        self._active_page = self._load_active_page_settings()
-        self._polling = self._load_polling_settings()
-        self._board = self._load_board_settings()
-        self._schedule = self._load_schedule_settings()
+        # Saves are atomic and coalesced (see src/persistence.py)
+        from ..config import Config
+        self._writer = get_writer(self.settings_file, **Config.get_persistence_settings())
+        
+        # Load initial settings from env/file (the file is read once)
+        file_data = self._load_from_file()
+        self._transition = self._load_transition_settings(file_data)
+        self._output = self._load_output_settings(file_data)
+        self._active_page = self._load_active_page_settings(file_data)
+        self._polling = self._load_polling_settings(file_data)
+        self._board = self._load_board_settings(file_data)
+        self._schedule = self._load_schedule_settings(file_data)
+        
+        self._listeners: List[SettingsListener] = []
+        self._listeners_lock = threading.Lock()
+        self._snapshot = self._make_snapshot(version=1)
         
         logger.info(f"SettingsService initialized (file: {self.settings_file})")
     
@@ -158,8 +205,7 @@ class SettingsService:
         """Load settings from JSON file."""
         if self.settings_file.exists():
             try:
-                with open(self.settings_file, 'r') as f:
-                    return json.load(f)
+                return read_json(self.settings_file)
             except (json.JSONDecodeError, IOError) as e:
                 logger.warning(f"Failed to load settings file: {e}")
         return {}
@@ -175,16 +221,78 @@ class SettingsService:
                 "board": self._board.to_dict(),
                 "schedule": self._schedule.to_dict()
             }
-            with open(self.settings_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._writer.write(data)
             logger.debug("Settings saved to file")
         except IOError as e:
             logger.error(f"Failed to save settings file: {e}")
     
-    def _load_transition_settings(self) -> TransitionSettings:
+    def _commit(self) -> None:
+        """Save and publish the settings after a change."""
+        self._save_to_file()
+        self._publish()
+    
+    # Snapshots and change notification
+    def _make_snapshot(self, version: int) -> SettingsSnapshot:
+        """Copy the current settings into a snapshot."""
+        return SettingsSnapshot(
+            version=version,
+            transition=replace(self._transition),
+            output=replace(self._output),
+            active_page=replace(self._active_page),
+            polling=replace(self._polling),
+            board=replace(self._board),
+            schedule=replace(self._schedule),
+        )
+    
+    def _publish(self) -> None:
+        """Publish a new snapshot and notify subscribers."""
+        with self._listeners_lock:
+            previous = self._snapshot
+            self._snapshot = self._make_snapshot(previous.version + 1)
+            snapshot = self._snapshot
+            listeners = list(self._listeners)
+        
+        for listener in listeners:
+            try:
+                listener(previous, snapshot)
+            except Exception as e:
+                logger.error(f"Settings listener failed: {e}", exc_info=True)
+    
+    @property
+    def version(self) -> int:
+        """Settings version, incremented on every change."""
+        return self._snapshot.version
+    
+    def get_snapshot(self) -> SettingsSnapshot:
+        """Get the current settings snapshot (no file access)."""
+        return self._snapshot
+    
+    def subscribe(self, listener: SettingsListener) -> Callable[[], None]:
+        """Register a listener called after every settings change.
+        
+        Listeners run on the thread that made the change, with the previous
+        and the new snapshot, so they should be quick. Errors are logged.
+        
+        Args:
+            listener: Callable taking (previous, new) SettingsSnapshots
+            
+        Returns:
+            Function that unsubscribes the listener
+        """
+        with self._listeners_lock:
+            self._listeners.append(listener)
+        
+        def unsubscribe() -> None:
+            with self._listeners_lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+        return unsubscribe
+    
+    def _load_transition_settings(self, file_data: Optional[dict] = None) -> TransitionSettings:
         """Load transition settings from file or env."""
+        if file_data is None:
+            file_data = self._load_from_file()
         # Try file first
-        file_data = self._load_from_file()
         if "transitions" in file_data:
             return TransitionSettings.from_dict(file_data["transitions"])
         
@@ -196,10 +304,11 @@ class SettingsService:
             step_size=Config.FB_TRANSITION_STEP_SIZE
         )
     
-    def _load_output_settings(self) -> OutputSettings:
+    def _load_output_settings(self, file_data: Optional[dict] = None) -> OutputSettings:
         """Load output settings from file or env."""
+        if file_data is None:
+            file_data = self._load_from_file()
         # Try file first
-        file_data = self._load_from_file()
         if "output" in file_data:
             return OutputSettings.from_dict(file_data["output"])
         
@@ -207,30 +316,34 @@ class SettingsService:
         from ..config import Config
         return OutputSettings(target=Config.OUTPUT_TARGET)
     
-    def _load_active_page_settings(self) -> ActivePageSettings:
+    def _load_active_page_settings(self, file_data: Optional[dict] = None) -> ActivePageSettings:
         """Load active page settings from file."""
-        file_data = self._load_from_file()
+        if file_data is None:
+            file_data = self._load_from_file()
         if "active_page" in file_data:
             return ActivePageSettings.from_dict(file_data["active_page"])
         return ActivePageSettings()
     
-    def _load_polling_settings(self) -> PollingSettings:
+    def _load_polling_settings(self, file_data: Optional[dict] = None) -> PollingSettings:
         """Load polling settings from file."""
-        file_data = self._load_from_file()
+        if file_data is None:
+            file_data = self._load_from_file()
         if "polling" in file_data:
             return PollingSettings.from_dict(file_data["polling"])
         return PollingSettings()  # Default to 60 seconds
     
-    def _load_board_settings(self) -> BoardSettings:
+    def _load_board_settings(self, file_data: Optional[dict] = None) -> BoardSettings:
         """Load board settings from file."""
-        file_data = self._load_from_file()
+        if file_data is None:
+            file_data = self._load_from_file()
         if "board" in file_data:
             return BoardSettings.from_dict(file_data["board"])
         return BoardSettings()  # Default to black board
     
-    def _load_schedule_settings(self) -> ScheduleSettings:
+    def _load_schedule_settings(self, file_data: Optional[dict] = None) -> ScheduleSettings:
         """Load schedule settings from file."""
-        file_data = self._load_from_file()
+        if file_data is None:
+            file_data = self._load_from_file()
         if "schedule" in file_data:
             return ScheduleSettings.from_dict(file_data["schedule"])
         return ScheduleSettings()  # Default to disabled
@@ -269,7 +382,7 @@ class SettingsService:
         if step_size is not ...:
             self._transition.step_size = step_size
         
-        self._save_to_file()
+        self._commit()
         logger.info(f"Transition settings updated: {self._transition}")
         return self._transition
     
@@ -291,7 +404,7 @@ class SettingsService:
             raise ValueError(f"Invalid target: {target}. Must be one of {VALID_OUTPUT_TARGETS}")
         
         self._output.target = target
-        self._save_to_file()
+        self._commit()
         logger.info(f"Output target set to: {target}")
         return self._output
     
@@ -342,7 +455,7 @@ class SettingsService:
             Updated ActivePageSettings
         """
         self._active_page.page_id = page_id
-        self._save_to_file()
+        self._commit()
         logger.info(f"Active page set to: {page_id}")
         return self._active_page
     
@@ -376,7 +489,7 @@ class SettingsService:
             raise ValueError("Polling interval must be at least 10 seconds")
         
         self._polling.interval_seconds = interval_seconds
-        self._save_to_file()
+        self._commit()
         logger.info(f"Polling interval set to: {interval_seconds} seconds")
         return self._polling
     
@@ -410,7 +523,7 @@ class SettingsService:
             raise ValueError(f"Invalid board_type: {board_type}. Must be 'black' or 'white'")
         
         self._board.board_type = board_type
-        self._save_to_file()
+        self._commit()
         logger.info(f"Board type set to: {board_type}")
         return self._board
     
@@ -444,7 +557,7 @@ class SettingsService:
             Updated ScheduleSettings
         """
         self._schedule.enabled = enabled
-        self._save_to_file()
+        self._commit()
         mode = "enabled" if enabled else "disabled"
         logger.info(f"Schedule mode {mode}")
         return self._schedule
@@ -0,0 +1,90 @@
+"""Compiled color rules.
+
+Color rules (from config or plugin manifest defaults) pick a color tile for
+a variable based on its raw value, e.g. red when a temperature is > 90.
+They are compiled once per (plugin, field) into a ColorRuleEvaluator so
+rendering doesn't re-read configuration or re-parse rule values for every
+substituted variable.
+
+See TemplateEngine._get_color_rules().
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Test on a raw value -> whether the rule matches
+_Predicate = Callable[[Any], bool]
+
+_NUMERIC_CONDITIONS = {
+    ">": lambda a, b: a > b,
+    "<": lambda a, b: a < b,
+    ">=": lambda a, b: a >= b,
+    "<=": lambda a, b: a <= b,
+}
+
+
+def _never(actual: Any) -> bool:
+    """Predicate for rules that can never match."""
+    return False
+
+
+def _compile_condition(condition: Any, expected: Any) -> _Predicate:
+    """Compile one rule condition into a predicate on the raw value.
+    
+    Numeric conditions compare as floats (never matching values that aren't
+    numbers); == and != compare case-insensitive strings.
+    """
+    compare = _NUMERIC_CONDITIONS.get(condition) if isinstance(condition, str) else None
+    if compare is not None:
+        try:
+            expected_num = float(expected)
+        except (ValueError, TypeError):
+            return _never
+        
+        def numeric(actual: Any) -> bool:
+            try:
+                return compare(float(actual), expected_num)
+            except (ValueError, TypeError):
+                return False
+        return numeric
+    
+    expected_str = str(expected).lower()
+    if condition == "==":
+        return lambda actual: str(actual).lower() == expected_str
+    if condition == "!=":
+        return lambda actual: str(actual).lower() != expected_str
+    return _never
+
+
+class ColorRuleEvaluator:
+    """Ordered color rules for one field, compiled for evaluation."""
+    
+    __slots__ = ("_rules",)
+    
+    def __init__(self, rules: List[Dict[str, Any]], color_codes: Dict[str, int]):
+        """Compile rules.
+        
+        Args:
+            rules: Rule dicts with condition, value and color
+            color_codes: Color name -> tile code
+        """
+        compiled: List[Tuple[_Predicate, Optional[int]]] = []
+        for rule in rules:
+            color = rule.get("color", "")
+            if isinstance(color, str):
+                code = color_codes.get(color.lower())
+            else:
+                code = color if isinstance(color, int) else None
+            compiled.append((_compile_condition(rule.get("condition", "=="), rule.get("value")), code))
+        self._rules = tuple(compiled)
+    
+    def color_code(self, raw_value: Any) -> Optional[int]:
+        """Get the color tile code of the first matching rule.
+        
+        Returns:
+            Tile code, or None if no rule matches (or the matching rule
+            has no valid color)
+        """
+        for matches, code in self._rules:
+            if matches(raw_value):
+                return code
+        return None
@@ -0,0 +1,128 @@
+"""Compiled template intermediate representation.
+
+Template pages are parsed once into a CompiledTemplate: per-line literal
+segments (colors normalized, symbols already substituted), variable slots
+with pre-parsed filters, alignment, wrap flags and fill_space markers.
+Rendering then only resolves variable slots against the data context.
+
+See TemplateEngine.compile_template() and TemplateEngine.render_compiled().
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import FrozenSet, Optional, Tuple, Union
+
+
+# Pre-parsed filter: (filter_name, numeric_argument), e.g. ("pad", 3)
+FilterOp = Tuple[str, int]
+
+
+# One step of a variable's data path: (key, lowercased key, list index or None)
+PathStep = Tuple[str, str, Optional[int]]
+
+
+@dataclass(frozen=True)
+class VariableAccessor:
+    """A variable expression resolved once into how to read its value.
+
+    Attributes:
+        kind: 'path' (walk dicts/lists from the source), 'color' (color tile
+              for a field, from a _color suffix), 'ha' (Home Assistant
+              entity attribute), 'static' (fixed value) or 'invalid'
+        source: Lowercased plugin ID the value is read from
+        path: Steps below the source for 'path' accessors
+        field: Base field for 'color' accessors, attribute for 'ha' accessors
+        entity_ids: Candidate Home Assistant entity IDs, in lookup order
+        static_value: Value of 'static' accessors
+    """
+    kind: str
+    source: str = ""
+    path: Tuple[PathStep, ...] = ()
+    field: str = ""
+    entity_ids: Tuple[str, ...] = ()
+    static_value: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class VariableSlot:
+    """A {{...}} variable reference inside a template line.
+
+    Attributes:
+        expr: Stripped expression between the braces (e.g. 'weather.temp|pad:3')
+        var_part: Variable portion without filters (e.g. 'weather.temp')
+        filter_expr: Raw filter chain after the first '|', or None if unfiltered
+        filter_op: Pre-parsed filter, or None if the filter is a no-op
+        static_value: Pre-resolved value for variables that don't depend on
+                      plugin data (fill_space markers)
+        accessor: Pre-resolved accessor for var_part
+    """
+    expr: str
+    var_part: str
+    filter_expr: Optional[str] = None
+    filter_op: Optional[FilterOp] = None
+    static_value: Optional[str] = None
+    accessor: Optional[VariableAccessor] = None
+
+
+Segment = Union[str, VariableSlot]
+
+
+@dataclass(frozen=True)
+class CompiledText:
+    """A run of literal segments and variable slots.
+
+    Attributes:
+        segments: Literal strings and VariableSlots in template order
+        needs_symbol_pass: True if a {symbol} shortcut could be split across
+                           a literal and a variable value, so the filled
+                           text must be re-scanned for symbols
+    """
+    segments: Tuple[Segment, ...] = ()
+    needs_symbol_pass: bool = False
+
+
+@dataclass(frozen=True)
+class CompiledLine:
+    """One compiled template line.
+
+    Attributes:
+        alignment: 'left', 'center', or 'right'
+        wrap: Whether the line wraps onto following empty lines
+        wrap_capacity: Number of lines the wrap may fill (this line plus
+                       the empty lines directly below it)
+        body: Compiled content for normal and line-level wrap rendering
+        wrap_slot: Variable carrying a |wrap filter (variable-level wrap)
+        wrap_filters: Other filters applied to the wrap_slot value
+        prefix: Text before the wrap_slot
+        suffix: Text after the wrap_slot
+        has_fill_space: Whether the line contains fill_space markers
+    """
+    alignment: str = "left"
+    wrap: bool = False
+    wrap_capacity: int = 1
+    body: CompiledText = field(default_factory=CompiledText)
+    wrap_slot: Optional[VariableSlot] = None
+    wrap_filters: Tuple[FilterOp, ...] = ()
+    prefix: CompiledText = field(default_factory=CompiledText)
+    suffix: CompiledText = field(default_factory=CompiledText)
+    has_fill_space: bool = False
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """A page template compiled for cheap repeated rendering.
+
+    Attributes:
+        source: The template lines this was compiled from
+        lines: Exactly 6 compiled lines
+        plugin_ids: Plugin IDs referenced by the template
+        version: Page updated_at the compilation corresponds to (cache key)
+    """
+    source: Tuple[str, ...]
+    lines: Tuple[CompiledLine, ...]
+    plugin_ids: FrozenSet[str] = frozenset()
+    version: Optional[datetime] = None
+
+    def matches(self, template_lines: Tuple[str, ...], version: Optional[datetime]) -> bool:
+        """Check whether this compilation is current for the given page state."""
+        return self.version == version and self.source == template_lines
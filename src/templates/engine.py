@@ -27,10 +27,15 @@ Plugin IDs are used as template namespaces (e.g., {{weather.temp}}, {{stocks.sym
 
 import re
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
 from dataclasses import dataclass
+from datetime import datetime
 
 from ..plugins import get_plugin_registry
+from .compiled import CompiledLine, CompiledTemplate, CompiledText, FilterOp, VariableAccessor, VariableSlot
+from .color_rules import ColorRuleEvaluator
+from .layout import BOARD_WIDTH, LineLayout, PageLayout, VariableWidthIndex
+from ..tiles import TileGrid, align_tiles, count_tiles, is_end_tag, pad_tiles, tokenize, truncate_tiles
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +76,17 @@ SYMBOL_PATTERN = re.compile(r'\{(sun|star|cloud|rain|snow|storm|fog|partly|heart
 ALIGNMENT_PATTERN = re.compile(r'^\{(left|center|right)\}', re.IGNORECASE)
 FILL_SPACE_PATTERN = re.compile(r'\{\{fill_space\}\}', re.IGNORECASE)
 FILL_SPACE_REPEAT_PATTERN = re.compile(r'\{\{fill_space_repeat:(.+?)\}\}', re.IGNORECASE)
+WRAP_VAR_PATTERN = re.compile(r'\{\{([^}]+\|wrap(?:\|[^}]*)?)\}\}')  # {{source.field|wrap}}
+COLOR_CODE_VALUE_PATTERN = re.compile(r'^\{(\d+)\}$')  # Value that is itself a color code
+# Partial {symbol} shortcuts at the edge of a literal that a variable value could complete
+SYMBOL_HEAD_PATTERN = re.compile(r'\{[a-z]*$', re.IGNORECASE)
+SYMBOL_TAIL_PATTERN = re.compile(r'[a-z]*\}', re.IGNORECASE)
+# Max distinct expressions whose accessor is cached outside compiled templates
+ACCESSOR_CACHE_SIZE = 4096
+# Max distinct lines whose validation width is cached
+LINE_WIDTH_CACHE_SIZE = 1024
+# fill_space markers left in rendered text for _fill_space_tiles() to expand
+FILL_MARKER_PATTERN = re.compile(r'\x00FILL_SPACE(?:_REPEAT:(.+?))?\x00')
 
 
 @dataclass
@@ -100,6 +116,17 @@ class TemplateEngine:
         self._display_service = None
         self._config_manager = None
         self._plugin_registry = None
+        self._compiled_cache: Dict[str, CompiledTemplate] = {}
+        self._accessor_cache: Dict[str, VariableAccessor] = {}
+        
+        # Compiled color rules per (plugin_id, field), for one plugin/config version
+        self._color_rules: Dict[Tuple[str, str], Optional[ColorRuleEvaluator]] = {}
+        self._color_rules_key: Optional[Tuple] = None
+        
+        # Validation: variable widths per plugin/config version, and results derived from them
+        self._width_index: Optional[VariableWidthIndex] = None
+        self._line_width_cache: Dict[str, int] = {}
+        self._layout_cache: Dict[str, Tuple[CompiledTemplate, PageLayout]] = {}
         
         try:
             self._plugin_registry = get_plugin_registry()
@@ -113,6 +140,10 @@ class TemplateEngine:
         self._display_service = None
         self._config_manager = None
         self._plugin_registry = get_plugin_registry()
+        self._compiled_cache.clear()
+        self._color_rules.clear()
+        self._color_rules_key = None
+        self._clear_layout_caches()
         logger.info("TemplateEngine cache reset")
     
     @property
@@ -143,7 +174,7 @@ class TemplateEngine:
             Rendered string with all substitutions applied
         """
         if context is None:
-            context = self._build_context()
+            context = self._build_context(self.get_referenced_plugins([template]))
         
         result = template
         
@@ -159,264 +190,383 @@ class TemplateEngine:
         
         return result
     
-    def _count_tiles(self, text: str) -> int:
-        """Count the number of tiles in a text string.
+    def render_lines(self, template_lines: List[str], context: Optional[Dict[str, Any]] = None) -> str:
+        """Render a list of template lines (for template pages).
         
-        Color markers like {66} count as 1 tile each, not their character length.
+        Handles:
+        - The special |wrap filter which allows content to flow across multiple lines
+        - Alignment directives {left}, {center}, {right}
+        - The {{fill_space}} variable for flexible spacing
         
         Args:
-            text: Rendered text string (may contain color markers like {66})
+            template_lines: List of up to 6 template lines
+            context: Optional pre-fetched context
             
         Returns:
-            Number of tiles (characters + color markers, where each marker = 1 tile)
+            Rendered string with newlines
         """
-        tile_count = 0
-        i = 0
-        
-        while i < len(text):
-            # Check for color marker
-            if text[i] == "{":
-                closing_brace = text.find("}", i)
-                if closing_brace != -1:
-                    content = text[i + 1:closing_brace]
-                    # Check if it's a color code (numeric 63-70 or named)
-                    if content.isdigit():
-                        code = int(content)
-                        if 63 <= code <= 70:
-                            # Numeric color code like {66} or {70}
-                            tile_count += 1
-                            i = closing_brace + 1
-                            continue
-                    elif content.lower() in COLOR_CODES:
-                        # Named color like {green}
-                        tile_count += 1
-                        i = closing_brace + 1
-                        continue
-                    elif content.startswith("/"):
-                        # End tag - skip it (doesn't count as a tile)
-                        i = closing_brace + 1
-                        continue
-            
-            # Regular character
-            tile_count += 1
-            i += 1
-        
-        return tile_count
+        return self.render_compiled(self.compile_template(template_lines), context)
     
-    def _truncate_to_tiles(self, text: str, max_tiles: int = 22) -> str:
-        """Truncate text to max_tiles, where color markers count as 1 tile each.
+    def compile_template(
+        self,
+        template_lines: List[str],
+        cache_key: Optional[str] = None,
+        version: Optional[datetime] = None,
+    ) -> CompiledTemplate:
+        """Compile template lines into a reusable intermediate representation.
+        
+        When cache_key is given (typically a page ID), the compiled template
+        is cached and reused as long as version (the page's updated_at) and
+        the template lines are unchanged.
         
         Args:
-            text: Rendered text string (may contain color markers like {66})
-            max_tiles: Maximum number of tiles (characters + color markers)
+            template_lines: List of up to 6 template lines
+            cache_key: Optional cache key, e.g. the page ID
+            version: Version of the template, e.g. the page's updated_at
             
         Returns:
-            Truncated string that fits within max_tiles
+            CompiledTemplate ready for render_compiled()
         """
-        # Count tiles (characters + color markers) and truncate appropriately
-        result = []
-        tile_count = 0
-        i = 0
-        
-        while i < len(text) and tile_count < max_tiles:
-            # Check for color marker
-            if text[i] == "{":
-                closing_brace = text.find("}", i)
-                if closing_brace != -1:
-                    content = text[i + 1:closing_brace]
-                    # Check if it's a color code (numeric 63-70 or named)
-                    if content.isdigit():
-                        code = int(content)
-                        if 63 <= code <= 70:
-                            # Numeric color code like {66} or {70}
-                            result.append(text[i:closing_brace + 1])
-                            tile_count += 1
-                            i = closing_brace + 1
-                            continue
-                    elif content.lower() in COLOR_CODES:
-                        # Named color like {green}
-                        result.append(text[i:closing_brace + 1])
-                        tile_count += 1
-                        i = closing_brace + 1
-                        continue
-                    elif content.startswith("/"):
-                        # End tag - skip it
-                        i = closing_brace + 1
-                        continue
+        source = tuple(template_lines[:6])
+        
+        if cache_key is not None:
+            cached = self._compiled_cache.get(cache_key)
+            if cached is not None and cached.matches(source, version):
+                return cached
+        
+        # Pad to 6 lines
+        lines = list(source)
+        while len(lines) < 6:
+            lines.append("")
+        
+        compiled_lines = []
+        for i, line in enumerate(lines):
+            # Extract alignment and wrap directives
+            alignment, wrap_enabled, content = self._extract_alignment(line)
+            
+            # Check if wrap is enabled (either via {wrap} prefix or |wrap filter for backward compatibility)
+            has_wrap = wrap_enabled or '|wrap}}' in content or '|wrap|' in content
             
-            # Regular character
-            result.append(text[i])
-            tile_count += 1
-            i += 1
+            if not has_wrap:
+                body = self._compile_text(content)
+                compiled_lines.append(CompiledLine(
+                    alignment=alignment,
+                    body=body,
+                    has_fill_space=self._has_fill_space(body),
+                ))
+                continue
+            
+            # Wrap capacity: the current line plus the empty lines directly below it
+            # This ensures we don't truncate content at the bottom
+            wrap_capacity = 1
+            for j in range(i + 1, 6):
+                _, _, line_content = self._extract_alignment(lines[j])
+                if line_content.strip() != "":
+                    break  # Stop at first non-empty line
+                wrap_capacity += 1
+            
+            match = WRAP_VAR_PATTERN.search(content)
+            if match:
+                # Variable-level wrap: wrap only the variable with |wrap filter
+                parts = match.group(1).split('|')
+                var_part = parts[0].strip()
+                wrap_filters = tuple(
+                    op for op in (self._parse_filter(p) for p in parts[1:] if p.lower() != 'wrap')
+                    if op is not None
+                )
+                prefix = self._compile_text(content[:match.start()])
+                suffix = self._compile_text(content[match.end():])
+                compiled_lines.append(CompiledLine(
+                    alignment=alignment,
+                    wrap=True,
+                    wrap_capacity=wrap_capacity,
+                    wrap_slot=VariableSlot(
+                        expr=var_part,
+                        var_part=var_part,
+                        accessor=self._compile_accessor(var_part),
+                    ),
+                    wrap_filters=wrap_filters,
+                    prefix=prefix,
+                    suffix=suffix,
+                    has_fill_space=(
+                        self._has_fill_space(prefix)
+                        or self._has_fill_space(suffix)
+                        or self._is_fill_space(var_part)
+                    ),
+                ))
+            else:
+                # Line-level wrap: the entire rendered content is wrapped
+                body = self._compile_text(content)
+                compiled_lines.append(CompiledLine(
+                    alignment=alignment,
+                    wrap=True,
+                    wrap_capacity=wrap_capacity,
+                    body=body,
+                    has_fill_space=self._has_fill_space(body),
+                ))
+        
+        compiled = CompiledTemplate(
+            source=source,
+            lines=tuple(compiled_lines),
+            plugin_ids=frozenset(self.get_referenced_plugins(source)),
+            version=version,
+        )
         
-        return "".join(result)
+        if cache_key is not None:
+            self._compiled_cache[cache_key] = compiled
+        
+        return compiled
     
-    def render_lines(self, template_lines: List[str], context: Optional[Dict[str, Any]] = None) -> str:
-        """Render a list of template lines (for template pages).
+    def invalidate_compiled(self, cache_key: Optional[str] = None) -> None:
+        """Drop cached compiled templates.
         
-        Handles:
-        - The special |wrap filter which allows content to flow across multiple lines
-        - Alignment directives {left}, {center}, {right}
-        - The {{fill_space}} variable for flexible spacing
+        Args:
+            cache_key: Specific cache key (page ID) to drop, or None to clear all
+        """
+        if cache_key is None:
+            self._compiled_cache.clear()
+            self._layout_cache.clear()
+        else:
+            self._compiled_cache.pop(cache_key, None)
+            self._layout_cache.pop(cache_key, None)
+    
+    def render_compiled(self, compiled: CompiledTemplate, context: Optional[Dict[str, Any]] = None) -> str:
+        """Render a compiled template by filling its variable slots.
         
         Args:
-            template_lines: List of up to 6 template lines
-            context: Optional pre-fetched context
+            compiled: Template compiled by compile_template()
+            context: Optional pre-fetched context. If not provided, only the
+                     plugins referenced by the template are fetched.
             
         Returns:
             Rendered string with newlines
         """
-        if context is None:
-            context = self._build_context()
+        return self.render_compiled_tiles(compiled, context).text
+    
+    def render_compiled_tiles(self, compiled: CompiledTemplate, context: Optional[Dict[str, Any]] = None) -> TileGrid:
+        """Render a compiled template straight to tiles.
         
-        # Pad to 6 lines
-        lines = list(template_lines[:6])
-        while len(lines) < 6:
-            lines.append("")
+        Use this when the result goes to the board: TileGrid.to_board_array()
+        converts the tokens directly instead of re-parsing the rendered text,
+        and the text is only joined if .text is read.
         
-        # Process lines, handling |wrap specially
-        rendered = [""] * 6
-        skip_until = -1  # Track lines filled by wrap overflow
+        Args:
+            compiled: Template compiled by compile_template()
+            context: Optional pre-fetched context. If not provided, only the
+                     plugins referenced by the template are fetched.
+            
+        Returns:
+            TileGrid with one token list per line
+        """
+        if context is None:
+            context = self._build_context(compiled.plugin_ids)
         
-        for i, line in enumerate(lines):
+        # Process lines, handling wrap specially
+        rendered: List[List[str]] = [[] for _ in range(6)]
+        skip_until = -1  # Track lines filled by wrap or multi-line overflow
+        
+        for i, line in enumerate(compiled.lines):
             if i <= skip_until:
-                # This line was filled by wrap overflow, already set
+                # This line was filled by overflow, already set
                 continue
             
-            # Extract alignment and wrap directives
-            alignment, wrap_enabled, content = self._extract_alignment(line)
-            
-            # Check if wrap is enabled (either via {wrap} prefix or |wrap filter for backward compatibility)
-            has_wrap = wrap_enabled or '|wrap}}' in content or '|wrap|' in content
-            
-            if has_wrap:
-                # Calculate wrap capacity: count empty lines from current line to line 6
-                # This ensures we don't truncate content at the bottom
-                empty_count = 0
-                for j in range(i, 6):  # Start from current line (i) to line 6
-                    if j == i:
-                        # Current line counts as 1 line for wrap
-                        empty_count = 1
-                    else:
-                        # Check if line is empty (after extracting alignment and wrap)
-                        _, _, line_content = self._extract_alignment(lines[j])
-                        if line_content.strip() == "":
-                            empty_count += 1
-                        else:
-                            break  # Stop at first non-empty line
-                
-                # Render the wrap content, respecting capacity
-                wrapped_lines = self._render_with_wrap(content, context, max_lines=empty_count)
+            if line.wrap:
+                wrapped_lines = self._render_compiled_wrap(line, context)
                 
                 # Fill in the lines with alignment
                 for k, wrapped_line in enumerate(wrapped_lines):
                     if i + k < 6:
-                        # Process fill_space first
-                        processed = self._process_fill_space(wrapped_line, width=22)
-                        # Then apply alignment
-                        rendered[i + k] = self._apply_alignment(processed, alignment, width=22)
+                        rendered[i + k] = self._finish_line(wrapped_line, line)
                 
                 skip_until = i + len(wrapped_lines) - 1
+                continue
+            
+            rendered_line = self._fill_text(line.body, context)
+            
+            # Check if the rendered line contains newlines (from multi-line variables)
+            if '\n' in rendered_line:
+                # Split into multiple lines and fill subsequent output lines
+                split_lines = rendered_line.split('\n')
+                for line_idx, split_line in enumerate(split_lines):
+                    if i + line_idx >= 6:
+                        break  # Don't exceed 6 lines
+                    rendered[i + line_idx] = self._finish_line(split_line, line)
+                # Mark subsequent lines as filled (skip them in future iterations)
+                if len(split_lines) > 1:
+                    skip_until = min(i + len(split_lines) - 1, 5)
             else:
-                # Normal rendering
-                rendered_line = self.render(content, context)
-                
-                # Check if the rendered line contains newlines (from multi-line variables)
-                if '\n' in rendered_line:
-                    # Split into multiple lines and fill subsequent output lines
-                    split_lines = rendered_line.split('\n')
-                    for line_idx, split_line in enumerate(split_lines):
-                        if i + line_idx >= 6:
-                            break  # Don't exceed 6 lines
-                        # Process fill_space first
-                        processed_line = self._process_fill_space(split_line, width=22)
-                        # Apply alignment (this also truncates if needed)
-                        rendered[i + line_idx] = self._apply_alignment(processed_line, alignment, width=22)
-                    # Mark subsequent lines as filled (skip them in future iterations)
-                    if len(split_lines) > 1:
-                        skip_until = min(i + len(split_lines) - 1, 5)
-                else:
-                    # Process fill_space first
-                    rendered_line = self._process_fill_space(rendered_line, width=22)
-                    # Apply alignment (this also truncates if needed)
-                    rendered[i] = self._apply_alignment(rendered_line, alignment, width=22)
+                rendered[i] = self._finish_line(rendered_line, line)
         
-        return '\n'.join(rendered)
+        return TileGrid(rendered)
     
-    def _render_with_wrap(self, template: str, context: Dict[str, Any], max_lines: int = 1) -> List[str]:
-        """Render a template line that should wrap across multiple lines.
+    def _finish_line(self, text: str, line: CompiledLine) -> List[str]:
+        """Expand fill_space markers, then apply alignment (which also truncates).
+        
+        The line is tokenized once; both steps work on the same tiles.
+        """
+        if line.has_fill_space:
+            tokens = self._fill_space_tiles(text, width=22)
+        else:
+            tokens = tokenize(text)
+        return pad_tiles(tokens, line.alignment, width=22)
+    
+    def _render_compiled_wrap(self, line: CompiledLine, context: Dict[str, Any]) -> List[str]:
+        """Render a compiled line that should wrap across multiple lines.
         
         Handles two cases:
         1. Line-level wrap (via {wrap} prefix): wraps the entire rendered content
         2. Variable-level wrap (via |wrap filter): wraps only the variable with |wrap
         
         Args:
-            template: Template string that may contain |wrap filter or should be wrapped entirely
+            line: Compiled line with wrap enabled
             context: Data context
-            max_lines: Maximum number of lines to fill
             
         Returns:
-            List of rendered lines (up to max_lines)
+            List of rendered lines (up to line.wrap_capacity)
         """
-        # First, check if there's a variable with |wrap filter (variable-level wrap)
-        wrap_pattern = re.compile(r'\{\{([^}]+\|wrap(?:\|[^}]*)?)\}\}')
-        match = wrap_pattern.search(template)
+        max_lines = line.wrap_capacity
         
-        if match:
-            # Variable-level wrap: wrap only the variable with |wrap filter
-            # Get the variable expression (without |wrap)
-            expr = match.group(1)
-            # Remove |wrap from the filter chain
-            parts = expr.split('|')
-            var_part = parts[0].strip()
-            other_filters = [p for p in parts[1:] if p.lower() != 'wrap']
-            
-            # Get the raw value
-            value = self._get_variable_value(var_part, context)
-            
-            # Apply any other filters (except wrap)
-            for f in other_filters:
-                value = self._apply_filter(value, f)
-            
-            # Get prefix and suffix around the variable
-            prefix = template[:match.start()]
-            suffix = template[match.end():]
-            
-            # Render prefix and suffix (they may have other variables)
-            prefix = self.render(prefix, context)
-            suffix = self.render(suffix, context)
-            
-            # Calculate available width for wrapped content using tile counts, not character counts
-            # Color markers like {67} are 4 characters but only 1 tile
-            prefix_tiles = self._count_tiles(prefix)
-            suffix_tiles = self._count_tiles(suffix)
-            
-            # First line has prefix and suffix
-            first_line_width = max(1, 22 - prefix_tiles - suffix_tiles)  # Ensure at least 1 tile available
-            # Subsequent lines have full width
-            subsequent_width = 22
-            
-            # Word-wrap the value
-            wrapped = self._word_wrap(value, first_line_width, subsequent_width, max_lines)
-            
-            # Build result lines
-            result = []
-            for idx, wrapped_line in enumerate(wrapped):
-                if idx == 0:
-                    result.append(f"{prefix}{wrapped_line}{suffix}")
-                else:
-                    result.append(wrapped_line)
-            
-            return result
+        if line.wrap_slot is None:
+            # Line-level wrap: render the entire line first, then wrap the result
+            # Use tile-based wrapping; full width available on all lines
+            rendered = self._fill_text(line.body, context)
+            return self._word_wrap_tiles(rendered, first_width=22, subsequent_width=22, max_lines=max_lines)
+        
+        # Variable-level wrap: wrap only the variable with |wrap filter
+        value = self._get_variable_value(line.wrap_slot.var_part, context, line.wrap_slot.accessor)
+        
+        # Apply any other filters (except wrap)
+        for op in line.wrap_filters:
+            value = self._apply_filter_op(value, op)
+        
+        # Render prefix and suffix (they may have other variables)
+        prefix = self._fill_text(line.prefix, context)
+        suffix = self._fill_text(line.suffix, context)
+        
+        # Calculate available width for wrapped content using tile counts, not character counts
+        # Color markers like {67} are 4 characters but only 1 tile
+        prefix_tiles = count_tiles(tokenize(prefix))
+        suffix_tiles = count_tiles(tokenize(suffix))
+        
+        # First line has prefix and suffix; ensure at least 1 tile available
+        first_line_width = max(1, 22 - prefix_tiles - suffix_tiles)
+        # Subsequent lines have full width
+        subsequent_width = 22
+        
+        # Word-wrap the value
+        wrapped = self._word_wrap(value, first_line_width, subsequent_width, max_lines)
+        
+        # Build result lines
+        result = []
+        for idx, wrapped_line in enumerate(wrapped):
+            if idx == 0:
+                result.append(f"{prefix}{wrapped_line}{suffix}")
+            else:
+                result.append(wrapped_line)
+        
+        return result
+    
+    def _compile_text(self, template: str) -> CompiledText:
+        """Compile a template fragment into literal segments and variable slots.
+        
+        Mirrors render(): colors are normalized first so VAR_PATTERN doesn't
+        match them, and symbols are substituted into the literal segments.
+        """
+        normalized = self._normalize_colors(template)
+        
+        segments: List[Any] = []
+        needs_symbol_pass = False
+        pos = 0
+        for match in VAR_PATTERN.finditer(normalized):
+            literal = normalized[pos:match.start()]
+            if literal:
+                # A symbol like {sun} could be completed by the variable value
+                if SYMBOL_HEAD_PATTERN.search(literal):
+                    needs_symbol_pass = True
+                segments.append(self._render_symbols(literal))
+            segments.append(self._compile_slot(match.group(1).strip()))
+            pos = match.end()
+            if SYMBOL_TAIL_PATTERN.match(normalized, pos):
+                needs_symbol_pass = True
+        
+        tail = normalized[pos:]
+        if tail:
+            segments.append(self._render_symbols(tail))
+        
+        return CompiledText(segments=tuple(segments), needs_symbol_pass=needs_symbol_pass)
+    
+    def _compile_slot(self, expr: str) -> VariableSlot:
+        """Compile a variable expression (the text between {{ and }})."""
+        if '|' in expr:
+            var_part, filter_part = expr.split('|', 1)
+            var_part = var_part.strip()
+            filter_expr = filter_part.strip()
+            filter_op = self._parse_filter(filter_expr)
         else:
-            # Line-level wrap: render the entire template first, then wrap the result
-            rendered = self.render(template, context)
-            
-            # Use tile-based wrapping for the entire rendered content
-            # Full width available on all lines
-            wrapped = self._word_wrap_tiles(rendered, first_width=22, subsequent_width=22, max_lines=max_lines)
-            
-            return wrapped
+            var_part = expr
+            filter_expr = None
+            filter_op = None
+        
+        accessor = self._compile_accessor(var_part)
+        
+        return VariableSlot(
+            expr=expr,
+            var_part=var_part,
+            filter_expr=filter_expr,
+            filter_op=filter_op,
+            static_value=accessor.static_value,
+            accessor=accessor,
+        )
+    
+    @staticmethod
+    def _is_fill_space(var_part: str) -> bool:
+        """Check if a variable is a fill_space or fill_space_repeat marker."""
+        lowered = var_part.lower()
+        return lowered == 'fill_space' or lowered.startswith('fill_space_repeat:')
+    
+    def _has_fill_space(self, text: CompiledText) -> bool:
+        """Check if compiled text contains a fill_space slot."""
+        return any(
+            isinstance(seg, VariableSlot) and self._is_fill_space(seg.var_part)
+            for seg in text.segments
+        )
+    
+    def _fill_text(self, text: CompiledText, context: Dict[str, Any]) -> str:
+        """Fill a compiled text's variable slots from the context."""
+        parts = []
+        rescan = text.needs_symbol_pass
+        for seg in text.segments:
+            if isinstance(seg, str):
+                parts.append(seg)
+                continue
+            value = self._resolve_slot(seg, context)
+            if not rescan and ('{' in value or '}' in value):
+                # Values may themselves contain {symbol} shortcuts
+                rescan = True
+            parts.append(value)
+        
+        result = "".join(parts)
+        return self._render_symbols(result) if rescan else result
+    
+    def _resolve_slot(self, slot: VariableSlot, context: Dict[str, Any]) -> str:
+        """Resolve a variable slot to its rendered value (see _render_variables)."""
+        if slot.static_value is not None:
+            value = slot.static_value
+        else:
+            value = self._get_variable_value(slot.var_part, context, slot.accessor)
+        
+        if slot.filter_expr is not None:
+            filtered = self._apply_filter_op(value, slot.filter_op)
+            # Apply color rules to the variable (before filtering changed it)
+            color_prefix = self._get_color_for_value(slot.var_part, context)
+            return f"{color_prefix}{filtered}" if color_prefix else filtered
+        
+        # Plugins may return color codes like {66} directly
+        if isinstance(value, str) and self._is_color_code_value(value):
+            return value
+        
+        color_prefix = self._get_color_for_value(slot.expr, context)
+        return f"{color_prefix}{value}" if color_prefix else value
     
     def _word_wrap(self, text: str, first_width: int, subsequent_width: int, max_lines: int) -> List[str]:
         """Word-wrap text across multiple lines.
@@ -467,55 +617,12 @@ class TemplateEngine:
         
         return lines
     
-    def _split_into_tokens(self, text: str) -> List[str]:
-        """Split text into tokens (complete color markers or single characters).
-        
-        This ensures color markers are never split in the middle.
-        
-        Args:
-            text: Text to split (may contain color markers like {67})
-            
-        Returns:
-            List of tokens, where each token is either a complete color marker
-            (like {67} or {red}) or a single character
-        """
-        tokens = []
-        i = 0
-        
-        while i < len(text):
-            if text[i] == "{":
-                # Found a potential color marker
-                closing_brace = text.find("}", i)
-                if closing_brace != -1:
-                    content = text[i + 1:closing_brace]
-                    # Check if it's a color code
-                    if content.isdigit() and 63 <= int(content) <= 70:
-                        # It's a numeric color marker
-                        tokens.append(text[i:closing_brace + 1])
-                        i = closing_brace + 1
-                        continue
-                    elif content.lower() in COLOR_CODES:
-                        # Named color marker
-                        tokens.append(text[i:closing_brace + 1])
-                        i = closing_brace + 1
-                        continue
-                    elif content.startswith("/"):
-                        # End tag - treat as single token
-                        tokens.append(text[i:closing_brace + 1])
-                        i = closing_brace + 1
-                        continue
-            
-            # Regular character
-            tokens.append(text[i])
-            i += 1
-        
-        return tokens
-    
     def _word_wrap_tiles(self, text: str, first_width: int, subsequent_width: int, max_lines: int) -> List[str]:
         """Word-wrap text across multiple lines using tile counts instead of character counts.
         
         This is used for line-level wrap where the text may contain color markers
-        like {67} which are 4 characters but only 1 tile.
+        like {67} which are 4 characters but only 1 tile. The text is tokenized
+        once and words are wrapped as token lists, so markers are never split.
         
         Args:
             text: Text to wrap (may contain color markers like {67})
@@ -529,97 +636,42 @@ class TemplateEngine:
         if not text:
             return [""]
         
-        # Split into words, preserving color markers
-        # We'll split on spaces but keep color markers with adjacent text
-        words = []
-        current_word = ""
-        i = 0
-        
-        while i < len(text):
-            if text[i] == "{":
-                # Found a potential color marker
-                closing_brace = text.find("}", i)
-                if closing_brace != -1:
-                    content = text[i + 1:closing_brace]
-                    # Check if it's a color code
-                    if content.isdigit() and 63 <= int(content) <= 70:
-                        # It's a color marker - add to current word
-                        current_word += text[i:closing_brace + 1]
-                        i = closing_brace + 1
-                        continue
-                    elif content.lower() in COLOR_CODES:
-                        # Named color marker
-                        current_word += text[i:closing_brace + 1]
-                        i = closing_brace + 1
-                        continue
-            
-            if text[i].isspace():
+        # Split into words on whitespace; color markers stay with adjacent text
+        words: List[List[str]] = []
+        current_word: List[str] = []
+        for token in tokenize(text):
+            if len(token) == 1 and token.isspace():
                 if current_word:
                     words.append(current_word)
-                    current_word = ""
+                    current_word = []
             else:
-                current_word += text[i]
-            i += 1
-        
+                current_word.append(token)
         if current_word:
             words.append(current_word)
         
         # Now wrap using tile counts
-        lines = []
-        current_line = ""
+        lines: List[List[str]] = []
+        current_line: List[str] = []
+        current_line_tiles = 0
         current_width = first_width
         
         for word in words:
-            word_tiles = self._count_tiles(word)
-            current_line_tiles = self._count_tiles(current_line) if current_line else 0
+            word_tiles = count_tiles(word)
             
             if not current_line:
                 # First word on line
                 if word_tiles <= current_width:
                     current_line = word
+                    current_line_tiles = word_tiles
                 else:
-                    # Word too long - break it across multiple lines using tokens
-                    remaining_word = word
-                    while remaining_word and len(lines) < max_lines:
-                        # Split into tokens to avoid breaking color markers
-                        tokens = self._split_into_tokens(remaining_word)
-                        test_line = ""
-                        tokens_to_take = 0
-                        
-                        for token in tokens:
-                            test_with_token = test_line + token
-                            if self._count_tiles(test_with_token) > current_width:
-                                break
-                            test_line = test_with_token
-                            tokens_to_take += 1
-                        
-                        if tokens_to_take > 0:
-                            # Reconstruct the line from tokens
-                            current_line = "".join(tokens[:tokens_to_take])
-                            remaining_word = "".join(tokens[tokens_to_take:])
-                            lines.append(current_line)
-                            if len(lines) >= max_lines:
-                                break
-                            current_line = ""
-                            current_width = subsequent_width
-                        else:
-                            # Can't fit even one token (shouldn't happen, but handle it)
-                            # Force at least one token to prevent infinite loop
-                            if tokens:
-                                current_line = tokens[0]
-                                remaining_word = "".join(tokens[1:])
-                                lines.append(current_line)
-                                if len(lines) >= max_lines:
-                                    break
-                                current_line = ""
-                                current_width = subsequent_width
-                            else:
-                                break
-                    # Set current_line to any remaining part
-                    current_line = remaining_word if remaining_word else ""
+                    # Word too long - break it across multiple lines
+                    remaining, current_width = self._break_word_tiles(word, lines, current_width, subsequent_width, max_lines)
+                    current_line = remaining
+                    current_line_tiles = count_tiles(remaining)
             elif current_line_tiles + 1 + word_tiles <= current_width:
                 # Word fits on current line
-                current_line += " " + word
+                current_line = current_line + [" "] + word
+                current_line_tiles += 1 + word_tiles
             else:
                 # Start new line
                 lines.append(current_line)
@@ -628,44 +680,12 @@ class TemplateEngine:
                 # Try to fit word on new line
                 if word_tiles <= subsequent_width:
                     current_line = word
+                    current_line_tiles = word_tiles
                 else:
-                    # Word too long - break it across multiple lines using tokens
-                    remaining_word = word
-                    current_line = ""
-                    current_width = subsequent_width
-                    while remaining_word and len(lines) < max_lines:
-                        # Split into tokens to avoid breaking color markers
-                        tokens = self._split_into_tokens(remaining_word)
-                        test_line = ""
-                        tokens_to_take = 0
-                        
-                        for token in tokens:
-                            test_with_token = test_line + token
-                            if self._count_tiles(test_with_token) > current_width:
-                                break
-                            test_line = test_with_token
-                            tokens_to_take += 1
-                        
-                        if tokens_to_take > 0:
-                            # Reconstruct the line from tokens
-                            current_line = "".join(tokens[:tokens_to_take])
-                            remaining_word = "".join(tokens[tokens_to_take:])
-                            lines.append(current_line)
-                            if len(lines) >= max_lines:
-                                break
-                            current_line = ""
-                        else:
-                            # Can't fit even one token - force at least one to prevent infinite loop
-                            if tokens:
-                                current_line = tokens[0]
-                                remaining_word = "".join(tokens[1:])
-                                lines.append(current_line)
-                                if len(lines) >= max_lines:
-                                    break
-                                current_line = ""
-                            else:
-                                break
-                    current_line = remaining_word if remaining_word else ""
+                    # Word too long - break it across multiple lines
+                    remaining, _ = self._break_word_tiles(word, lines, subsequent_width, subsequent_width, max_lines)
+                    current_line = remaining
+                    current_line_tiles = count_tiles(remaining)
                 current_width = subsequent_width
         
         # Don't forget the last line
@@ -674,12 +694,81 @@ class TemplateEngine:
         
         # Ensure we have at least one line
         if not lines:
-            lines = [""]
+            return [""]
         
-        return lines
+        return ["".join(line) for line in lines]
     
-    def _build_context(self) -> Dict[str, Any]:
-        """Build context by fetching all available data from enabled plugins.
+    @staticmethod
+    def _break_word_tiles(
+        word: List[str],
+        lines: List[List[str]],
+        width: int,
+        subsequent_width: int,
+        max_lines: int
+    ) -> Tuple[List[str], int]:
+        """Break a word too long for one line into full lines of tiles.
+        
+        Args:
+            word: Word tokens
+            lines: Wrapped lines so far; full lines are appended
+            width: Tile width available on the current line
+            subsequent_width: Tile width available on later lines
+            max_lines: Maximum number of lines
+            
+        Returns:
+            Tuple of (tokens left over for the current line, width for it)
+        """
+        remaining = word
+        while remaining and len(lines) < max_lines:
+            # Take as many tokens as fit (end tags take no room)
+            taken = 0
+            tiles = 0
+            for token in remaining:
+                token_tiles = 0 if is_end_tag(token) else 1
+                if tiles + token_tiles > width:
+                    break
+                tiles += token_tiles
+                taken += 1
+            # Can't fit even one token - force at least one to prevent infinite loop
+            taken = max(taken, 1)
+            
+            lines.append(remaining[:taken])
+            remaining = remaining[taken:]
+            if len(lines) >= max_lines:
+                break
+            width = subsequent_width
+        return remaining, width
+    
+    def get_referenced_plugins(self, template_lines: Iterable[str]) -> Set[str]:
+        """Statically extract the plugin IDs referenced by template lines.
+        
+        Scans for {{plugin.field}} expressions (including filters and
+        _color variants). Color tiles and fill_space markers are ignored
+        since they don't need plugin data.
+        
+        Args:
+            template_lines: Template lines to scan
+            
+        Returns:
+            Set of lowercased plugin IDs used as variable namespaces
+        """
+        plugin_ids: Set[str] = set()
+        for line in template_lines:
+            if not line or '{{' not in line:
+                continue
+            for match in VAR_PATTERN.finditer(line):
+                var_part = match.group(1).split('|', 1)[0].strip()
+                if '.' not in var_part or var_part.lower().startswith('fill_space'):
+                    continue
+                plugin_ids.add(var_part.split('.', 1)[0].lower())
+        return plugin_ids
+    
+    def _build_context(self, plugin_ids: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Build context by fetching data from enabled plugins.
+        
+        Args:
+            plugin_ids: Optional set of plugin IDs to fetch. None fetches
+                        every enabled plugin.
         
         Returns:
             Dictionary mapping plugin_id to plugin data
@@ -687,7 +776,14 @@ class TemplateEngine:
         if not self._plugin_registry:
             return {}
         
-        return self._plugin_registry.build_template_context()
+        if plugin_ids is None:
+            return self._plugin_registry.build_template_context()
+        
+        plugin_ids = set(plugin_ids)
+        if not plugin_ids:
+            return {}
+        
+        return self._plugin_registry.build_template_context(plugin_ids)
     
     def _render_variables(self, template: str, context: Dict[str, Any]) -> str:
         """Replace {{source.field}} variables with values from context.
@@ -710,14 +806,9 @@ class TemplateEngine:
                 # Check if the value itself is a color code (e.g., {66})
                 # This allows plugins to return color codes directly
                 # Only recognize color codes, not color names (to avoid issues with team names like "Green Hornets")
-                if isinstance(value, str):
-                    # Check if value is already a color code like {66}
-                    color_code_match = re.match(r'^\{(\d+)\}$', value)
-                    if color_code_match:
-                        code = int(color_code_match.group(1))
-                        if 63 <= code <= 70:
-                            # Already a valid color code, return as-is
-                            return value
+                if isinstance(value, str) and self._is_color_code_value(value):
+                    # Already a valid color code, return as-is
+                    return value
                 
                 # Apply color rules
                 color_prefix = self._get_color_for_value(expr, context)
@@ -725,6 +816,12 @@ class TemplateEngine:
         
         return VAR_PATTERN.sub(replace_var, template)
     
+    @staticmethod
+    def _is_color_code_value(value: str) -> bool:
+        """Check if a value is exactly a color code like {66}."""
+        color_code_match = COLOR_CODE_VALUE_PATTERN.match(value)
+        return bool(color_code_match) and 63 <= int(color_code_match.group(1)) <= 70
+    
     def _get_color_for_value(self, expr: str, context: Dict[str, Any]) -> str:
         """Get color tile prefix based on plugin color rules.
         
@@ -747,18 +844,8 @@ class TemplateEngine:
         if field in ("uv_index", "temperature"):
             return ""
         
-        # Try to get color rules from config manager first (for legacy features)
-        rules = self.config_manager.get_color_rules(plugin_id, field)
-        
-        # If not found, try to get from plugin manifest
-        if not rules and self._plugin_registry:
-            manifest = self._plugin_registry.get_manifest(plugin_id)
-            if manifest and manifest.color_rules_schema:
-                field_schema = manifest.color_rules_schema.get(field)
-                if field_schema and isinstance(field_schema, dict):
-                    rules = field_schema.get("default_rules", [])
-        
-        if not rules:
+        rules = self._get_color_rules(plugin_id, field)
+        if rules is None:
             return ""
         
         # Map field name for data lookup (e.g., 'temp' -> 'temperature' for weather)
@@ -772,66 +859,62 @@ class TemplateEngine:
         if raw_value is None:
             return ""
         
-        # Evaluate rules in order (first match wins)
-        for rule in rules:
-            condition = rule.get("condition", "==")
-            rule_value = rule.get("value")
-            color = rule.get("color", "")
-            
-            if self._evaluate_condition(raw_value, condition, rule_value):
-                # Return color code with space
-                color_code = COLOR_CODES.get(color.lower(), color)
-                if isinstance(color_code, int):
-                    return f"{{{color_code}}} "
-                return ""
-        
-        return ""
+        color_code = rules.color_code(raw_value)
+        return f"{{{color_code}}} " if color_code is not None else ""
     
-    def _evaluate_condition(self, actual: Any, condition: str, expected: Any) -> bool:
-        """Evaluate a color rule condition.
+    def _get_color_rules(self, plugin_id: str, field: str) -> Optional[ColorRuleEvaluator]:
+        """Get the compiled color rules for a field.
+        
+        Rules come from the config (for legacy features) or else the plugin
+        manifest's defaults. They're compiled on first use and kept until
+        plugins or the configuration change.
         
-        Args:
-            actual: The actual value from data
-            condition: Comparison operator (==, !=, >, <, >=, <=)
-            expected: The expected value from rule
-            
         Returns:
-            True if condition matches
+            ColorRuleEvaluator, or None if the field has no color rules
         """
+        key = self._get_versions_key()
+        if self._color_rules_key != key:
+            self._color_rules.clear()
+            self._color_rules_key = key
+        
+        cache_key = (plugin_id, field)
+        if cache_key in self._color_rules:
+            return self._color_rules[cache_key]
+        
+        rules = None
         try:
-            # Try numeric comparison first
-            if condition in (">", "<", ">=", "<="):
-                actual_num = float(actual)
-                expected_num = float(expected)
-                
-                if condition == ">":
-                    return actual_num > expected_num
-                elif condition == "<":
-                    return actual_num < expected_num
-                elif condition == ">=":
-                    return actual_num >= expected_num
-                elif condition == "<=":
-                    return actual_num <= expected_num
-            
-            # String comparison
-            actual_str = str(actual).lower()
-            expected_str = str(expected).lower()
+            # Try to get color rules from config manager first (for legacy features)
+            rules = self.config_manager.get_color_rules(plugin_id, field)
             
-            if condition == "==":
-                return actual_str == expected_str
-            elif condition == "!=":
-                return actual_str != expected_str
-            
-        except (ValueError, TypeError):
-            # Fall back to string comparison
-            if condition == "==":
-                return str(actual).lower() == str(expected).lower()
-            elif condition == "!=":
-                return str(actual).lower() != str(expected).lower()
-        
-        return False
+            # If not found, try to get from plugin manifest
+            if not rules and self._plugin_registry:
+                manifest = self._plugin_registry.get_manifest(plugin_id)
+                if manifest and manifest.color_rules_schema:
+                    field_schema = manifest.color_rules_schema.get(field)
+                    if field_schema and isinstance(field_schema, dict):
+                        rules = field_schema.get("default_rules", [])
+        except Exception as e:
+            logger.debug(f"Could not load color rules for {plugin_id}.{field}: {e}")
+        
+        evaluator = ColorRuleEvaluator(rules, COLOR_CODES) if rules else None
+        self._color_rules[cache_key] = evaluator
+        return evaluator
+    
+    def _get_versions_key(self) -> Tuple:
+        """Get a key that changes whenever plugins or the configuration change."""
+        try:
+            config_version = self.config_manager.version
+        except Exception:
+            config_version = None
+        registry = self._plugin_registry
+        return (id(registry), getattr(registry, "manifest_version", None), config_version)
     
-    def _get_variable_value(self, expr: str, context: Dict[str, Any]) -> str:
+    def _get_variable_value(
+        self,
+        expr: str,
+        context: Dict[str, Any],
+        accessor: Optional[VariableAccessor] = None,
+    ) -> str:
         """Get value from context using dot notation (source.field).
         
         Also supports _color suffix to get just the color tile for a field.
@@ -848,145 +931,74 @@ class TemplateEngine:
         Special variables:
         - fill_space: Returns a placeholder that will be expanded later
         
+        Args:
+            expr: Variable expression without filters
+            context: Template context
+            accessor: Pre-resolved accessor for expr (see _compile_accessor)
+        
         Returns "???" if variable is unavailable (API error, missing data, etc.)
         """
-        # Handle special fill_space variable
-        if expr.lower() == 'fill_space':
-            return '\x00FILL_SPACE\x00'  # Special marker to be processed later
+        if accessor is None:
+            accessor = self._get_accessor(expr)
+        kind = accessor.kind
         
-        # Handle fill_space_repeat:char/string variable
-        if expr.lower().startswith('fill_space_repeat:'):
-            repeat_str = expr.split(':', 1)[1] if ':' in expr else ' '
-            return f'\x00FILL_SPACE_REPEAT:{repeat_str}\x00'  # Special marker with repeat pattern
-        
-        parts = expr.split('.')
-        
-        if len(parts) < 2:
-            return "???"  # Invalid expression
-        
-        source = parts[0].lower()
-        
-        # Special handling for home_assistant with entity_id syntax
-        # Format: home_assistant.entity_id.attribute (3 parts minimum)
-        if source == 'home_assistant' and len(parts) >= 3:
-            # Convert underscores back to dots for entity_id
-            # (entity_id uses dots like sensor.temperature, but dots can't be in template syntax)
-            # So we expect: home_assistant.sensor_temperature.state
-            # Which maps to: entity_id=sensor.temperature, attribute=state
-            entity_id_part = parts[1]
-            attribute = parts[2]
+        if kind == 'path':
+            if accessor.source not in context:
+                return "???"  # Source not available (API failed, not configured, etc.)
             
-            # Get home_assistant context data first
+            # Navigate to the field, supporting array access
+            value = context[accessor.source]
+            for key, key_lower, index in accessor.path:
+                if isinstance(value, dict):
+                    value = value.get(key, value.get(key_lower))
+                    if value is None:
+                        return "???"  # Field not found in data
+                elif isinstance(value, list):
+                    # Array access: stations.0 or stations[0]
+                    if index is None or not 0 <= index < len(value):
+                        return "???"  # Invalid array access or index out of range
+                    value = value[index]
+                else:
+                    return "???"  # Invalid path
+            return self._format_value(value)
+        
+        if kind == 'ha':
             ha_data = context.get('home_assistant', {})
-            
-            # Smart entity_id conversion: try different underscore positions
-            # Some domains have underscores (media_player, binary_sensor, device_tracker, etc.)
-            # Try to find the entity by testing different split points
-            entity_id = None
             entity_data = {}
-            
-            if '_' in entity_id_part:
-                # Try each underscore position as a potential domain/entity split
-                parts_split = entity_id_part.split('_')
-                for i in range(1, len(parts_split)):
-                    # Try domain as first i parts, rest as entity name
-                    test_domain = '_'.join(parts_split[:i])
-                    test_entity = '_'.join(parts_split[i:])
-                    test_entity_id = f"{test_domain}.{test_entity}"
-                    
-                    if test_entity_id in ha_data:
-                        entity_id = test_entity_id
-                        entity_data = ha_data[test_entity_id]
-                        break
-                
-                # Fallback to old behavior if no match found (replace first underscore)
-                if not entity_data:
-                    entity_id = entity_id_part.replace('_', '.', 1)
-                    entity_data = ha_data.get(entity_id, {})
-            else:
-                entity_id = entity_id_part
-                entity_data = ha_data.get(entity_id, {})
+            for entity_id in accessor.entity_ids:
+                if entity_id in ha_data:
+                    entity_data = ha_data[entity_id]
+                    break
             
             if not entity_data:
                 return "???"  # Entity not found
             
             # Check if requesting the state directly
+            attribute = accessor.field
             if attribute == 'state':
                 return str(entity_data.get('state', '???'))
             
-            # Check if requesting an attribute
+            # Check if requesting an attribute, then the top level
             attributes = entity_data.get('attributes', {})
             if attribute in attributes:
-                value = attributes[attribute]
-                # Convert to string
-                if value is None:
-                    return "???"
-                if isinstance(value, bool):
-                    return "Yes" if value else "No"
-                if isinstance(value, (int, float)):
-                    return str(int(value) if float(value).is_integer() else round(value, 1))
-                return str(value)
-            
-            # Check if attribute exists at top level
+                return self._format_value(attributes[attribute])
             if attribute in entity_data:
-                value = entity_data[attribute]
-                if value is None:
-                    return "???"
-                if isinstance(value, bool):
-                    return "Yes" if value else "No"
-                if isinstance(value, (int, float)):
-                    return str(int(value) if float(value).is_integer() else round(value, 1))
-                return str(value)
-            
+                return self._format_value(entity_data[attribute])
             return "???"  # Attribute not found
         
-        field = parts[1]
-        
-        # Check if this is a _color request (case-insensitive)
-        field_lower = field.lower()
-        if field_lower.endswith('_color'):
-            base_field = field_lower[:-6]  # Remove '_color' suffix (already lowercased)
-            color_result = self._get_color_only(source, base_field, context)
+        if kind == 'color':
+            color_result = self._get_color_only(accessor.source, accessor.field, context)
             # If color lookup fails, return empty string (no color tile)
             return color_result if color_result else ""
         
-        if source not in context:
-            return "???"  # Source not available (API failed, not configured, etc.)
-        
-        # Navigate to the field, supporting array access
-        value = context[source]
-        for part in parts[1:]:
-            if isinstance(value, dict):
-                value = value.get(part, value.get(part.lower()))
-                if value is None:
-                    return "???"  # Field not found in data
-            elif isinstance(value, list):
-                # Handle array access: stations.0 or stations[0]
-                try:
-                    # Try to parse as integer index
-                    if part.isdigit():
-                        index = int(part)
-                        if 0 <= index < len(value):
-                            value = value[index]
-                        else:
-                            return "???"  # Index out of range
-                    else:
-                        # Try bracket notation: stations[0]
-                        if '[' in part and ']' in part:
-                            index_str = part[part.index('[') + 1:part.index(']')]
-                            index = int(index_str)
-                            if 0 <= index < len(value):
-                                value = value[index]
-                            else:
-                                return "???"  # Index out of range
-                        else:
-                            return "???"  # Invalid array access
-                except (ValueError, IndexError):
-                    return "???"  # Invalid index
-            else:
-                return "???"  # Invalid path
+        if kind == 'static':
+            return accessor.static_value
         
-        # Convert to string
+        return "???"  # Invalid expression
+    
+    @staticmethod
+    def _format_value(value: Any) -> str:
+        """Convert a data value to its display string."""
         if value is None:
             return "???"  # Null value
         if isinstance(value, bool):
@@ -995,6 +1007,76 @@ class TemplateEngine:
             return str(int(value) if float(value).is_integer() else round(value, 1))
         return str(value)
     
+    def _get_accessor(self, expr: str) -> VariableAccessor:
+        """Get the accessor for an expression, compiling it on first use."""
+        accessor = self._accessor_cache.get(expr)
+        if accessor is None:
+            if len(self._accessor_cache) >= ACCESSOR_CACHE_SIZE:
+                self._accessor_cache.clear()
+            accessor = self._accessor_cache[expr] = self._compile_accessor(expr)
+        return accessor
+    
+    @staticmethod
+    def _compile_accessor(expr: str) -> VariableAccessor:
+        """Resolve a variable expression into a VariableAccessor.
+        
+        All string splitting happens here, once per expression, so rendering
+        only does dict lookups.
+        """
+        # Handle special fill_space variable
+        lowered = expr.lower()
+        if lowered == 'fill_space':
+            return VariableAccessor(kind='static', static_value='\x00FILL_SPACE\x00')  # Expanded later
+        
+        # Handle fill_space_repeat:char/string variable
+        if lowered.startswith('fill_space_repeat:'):
+            repeat_str = expr.split(':', 1)[1]
+            return VariableAccessor(kind='static', static_value=f'\x00FILL_SPACE_REPEAT:{repeat_str}\x00')
+        
+        parts = expr.split('.')
+        if len(parts) < 2:
+            return VariableAccessor(kind='invalid')
+        
+        source = parts[0].lower()
+        
+        # Special handling for home_assistant with entity_id syntax
+        # Format: home_assistant.entity_id.attribute (3 parts minimum)
+        if source == 'home_assistant' and len(parts) >= 3:
+            # Entity IDs use dots (sensor.temperature), which can't appear in
+            # template syntax, so home_assistant.sensor_temperature.state maps
+            # to entity_id=sensor.temperature, attribute=state. Some domains
+            # have underscores (media_player, binary_sensor, ...), so every
+            # split point is a candidate, tried left to right.
+            entity_id_part = parts[1]
+            if '_' in entity_id_part:
+                words = entity_id_part.split('_')
+                candidates = tuple(
+                    f"{'_'.join(words[:i])}.{'_'.join(words[i:])}"
+                    for i in range(1, len(words))
+                )
+            else:
+                candidates = (entity_id_part,)
+            return VariableAccessor(kind='ha', source=source, field=parts[2], entity_ids=candidates)
+        
+        # Check if this is a _color request (case-insensitive)
+        field_lower = parts[1].lower()
+        if field_lower.endswith('_color'):
+            return VariableAccessor(kind='color', source=source, field=field_lower[:-6])
+        
+        path = []
+        for part in parts[1:]:
+            index = None
+            try:
+                if part.isdigit():
+                    index = int(part)
+                elif '[' in part and ']' in part:
+                    # Bracket notation: stations[0]
+                    index = int(part[part.index('[') + 1:part.index(']')])
+            except ValueError:
+                pass  # Not a valid index; only usable as a dict key
+            path.append((part, part.lower(), index))
+        return VariableAccessor(kind='path', source=source, path=tuple(path))
+    
     def _get_color_only(self, plugin_id: str, field: str, context: Dict[str, Any]) -> str:
         """Get just the color tile for a field based on color rules.
         
@@ -1006,18 +1088,8 @@ class TemplateEngine:
         Returns:
             Color tile like '{65}' or empty string if no rule matches
         """
-        # Try to get color rules from config manager first (for legacy features)
-        rules = self.config_manager.get_color_rules(plugin_id, field)
-        
-        # If not found, try to get from plugin manifest
-        if not rules and self._plugin_registry:
-            manifest = self._plugin_registry.get_manifest(plugin_id)
-            if manifest and manifest.color_rules_schema:
-                field_schema = manifest.color_rules_schema.get(field)
-                if field_schema and isinstance(field_schema, dict):
-                    rules = field_schema.get("default_rules", [])
-        
-        if not rules:
+        rules = self._get_color_rules(plugin_id, field)
+        if rules is None:
             return ""
         
         # Map field name for data lookup (e.g., 'temp' -> 'temperature' for weather)
@@ -1031,19 +1103,8 @@ class TemplateEngine:
         if raw_value is None:
             return ""
         
-        # Evaluate rules in order (first match wins)
-        for rule in rules:
-            condition = rule.get("condition", "==")
-            rule_value = rule.get("value")
-            color = rule.get("color", "")
-            
-            if self._evaluate_condition(raw_value, condition, rule_value):
-                color_code = COLOR_CODES.get(color.lower(), color)
-                if isinstance(color_code, int):
-                    return f"{{{color_code}}}"
-                return ""
-        
-        return ""
+        color_code = rules.color_code(raw_value)
+        return f"{{{color_code}}}" if color_code is not None else ""
     
     def _map_field_for_data_lookup(self, source: str, field: str) -> str:
         """Map field name from config to data field name.
@@ -1072,25 +1133,35 @@ class TemplateEngine:
         - pad:N - Pad to N characters
         - truncate:N - Truncate to N characters
         """
-        if ':' in filter_expr:
-            filter_name, arg = filter_expr.split(':', 1)
-            filter_name = filter_name.lower()
-            
-            if filter_name == 'pad':
-                try:
-                    width = int(arg)
-                    return value.ljust(width)[:width]
-                except ValueError:
-                    return value
-            
-            elif filter_name == 'truncate':
-                try:
-                    length = int(arg)
-                    return value[:length]
-                except ValueError:
-                    return value
+        return self._apply_filter_op(value, self._parse_filter(filter_expr))
+    
+    @staticmethod
+    def _parse_filter(filter_expr: str) -> Optional[FilterOp]:
+        """Parse a filter expression like 'pad:3' into (name, arg).
         
-        return value
+        Returns:
+            Parsed filter, or None if the filter is unknown or malformed
+        """
+        if ':' not in filter_expr:
+            return None
+        filter_name, arg = filter_expr.split(':', 1)
+        filter_name = filter_name.lower()
+        if filter_name not in ('pad', 'truncate'):
+            return None
+        try:
+            return (filter_name, int(arg))
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def _apply_filter_op(value: str, op: Optional[FilterOp]) -> str:
+        """Apply a pre-parsed filter to a value."""
+        if op is None:
+            return value
+        filter_name, width = op
+        if filter_name == 'pad':
+            return value.ljust(width)[:width]
+        return value[:width]
     
     def _render_symbols(self, template: str) -> str:
         """Replace {symbol} shortcuts with characters."""
@@ -1157,27 +1228,25 @@ class TemplateEngine:
         Returns:
             Text padded/aligned to the specified width
         """
-        # Calculate actual tile count (color markers count as 1 tile)
-        tile_count = self._count_tiles(text)
-        
-        if tile_count >= width:
-            # Already at or over width, truncate
-            return self._truncate_to_tiles(text, width)
-        
-        padding_needed = width - tile_count
-        
-        if alignment == 'center':
-            left_pad = padding_needed // 2
-            right_pad = padding_needed - left_pad
-            return ' ' * left_pad + text + ' ' * right_pad
-        elif alignment == 'right':
-            return ' ' * padding_needed + text
-        else:  # left (default)
-            return text + ' ' * padding_needed
+        return align_tiles(tokenize(text), alignment, width)
     
     def _process_fill_space(self, text: str, width: int = 22) -> str:
         """Process fill_space markers, expanding them to fill available space.
         
+        See _fill_space_tiles().
+        
+        Args:
+            text: Rendered text with fill_space markers
+            width: Target width (default 22 for board)
+            
+        Returns:
+            Text with fill_space markers replaced by appropriate padding
+        """
+        return "".join(self._fill_space_tiles(text, width))
+    
+    def _fill_space_tiles(self, text: str, width: int = 22) -> List[str]:
+        """Expand fill_space markers into tile tokens that fill available space.
+        
         If multiple fill_space markers exist, space is distributed evenly.
         The fill_space markers are represented by the special marker '\x00FILL_SPACE\x00'
         or '\x00FILL_SPACE_REPEAT:pattern\x00' after variable substitution.
@@ -1191,63 +1260,51 @@ class TemplateEngine:
             width: Target width (default 22 for board)
             
         Returns:
-            Text with fill_space markers replaced by appropriate padding
+            Tile tokens with fill_space markers replaced by appropriate padding
         """
         from ..board_chars import BoardChars
         
-        # The fill_space marker patterns
-        FILL_MARKER = '\x00FILL_SPACE\x00'
-        FILL_REPEAT_PREFIX = '\x00FILL_SPACE_REPEAT:'
-        
-        # Find all fill markers (both regular and repeat)
-        fill_pattern = re.compile(r'\x00FILL_SPACE(?:_REPEAT:(.+?))?\x00')
-        fill_matches = list(fill_pattern.finditer(text))
-        fill_count = len(fill_matches)
-        
-        if fill_count == 0:
-            return text
+        # Tokenize the text between markers, remembering where each fill goes
+        tokens: List[str] = []
+        fills: List[Tuple[int, str]] = []
+        pos = 0
+        for match in FILL_MARKER_PATTERN.finditer(text):
+            tokens.extend(tokenize(text[pos:match.start()]))
+            fills.append((len(tokens), match.group(1) or ' '))
+            pos = match.end()
+        tokens.extend(tokenize(text[pos:]))
         
-        # Calculate text width without fill_space markers
-        text_without_fills = fill_pattern.sub('', text)
-        tile_count = self._count_tiles(text_without_fills)
+        if not fills:
+            return tokens
         
+        tile_count = count_tiles(tokens)
         if tile_count >= width:
             # No room for fills, remove them
-            return self._truncate_to_tiles(text_without_fills, width)
+            return truncate_tiles(tokens, width)
         
         # Calculate space to distribute
         total_fill_space = width - tile_count
-        base_fill = total_fill_space // fill_count
-        extra = total_fill_space % fill_count
+        base_fill = total_fill_space // len(fills)
+        extra = total_fill_space % len(fills)
         
-        # Replace each fill_space marker with calculated padding
-        result = text
-        for i, match in enumerate(fill_matches):
+        result: List[str] = []
+        start = 0
+        for i, (index, repeat_pattern) in enumerate(fills):
             # Distribute extra space to earlier fills
             fill_width = base_fill + (1 if i < extra else 0)
-            
-            # Get the repeat pattern (group 1 from regex, or space as default)
-            repeat_pattern = match.group(1) if match.group(1) else ' '
+            result.extend(tokens[start:index])
+            start = index
             
             # Check if pattern is a color name
             color_code = BoardChars.get_color_code(repeat_pattern)
             if color_code is not None:
                 # Repeat color tiles using the special color marker
-                fill_content = f'{{{color_code}}}' * fill_width
+                result.extend([f'{{{color_code}}}'] * fill_width)
             else:
-                # Calculate how many times to repeat the text pattern
-                pattern_len = len(repeat_pattern)
-                if pattern_len > 0:
-                    # Repeat pattern to fill width, may be truncated
-                    full_repeats = fill_width // pattern_len
-                    remainder = fill_width % pattern_len
-                    fill_content = (repeat_pattern * full_repeats) + repeat_pattern[:remainder]
-                else:
-                    fill_content = ' ' * fill_width
-            
-            # Replace this specific match with the repeated pattern
-            result = result.replace(match.group(0), fill_content, 1)
-        
+                # Repeat the text pattern to fill width, may be truncated
+                full_repeats, remainder = divmod(fill_width, len(repeat_pattern))
+                result.extend(tokenize((repeat_pattern * full_repeats) + repeat_pattern[:remainder]))
+        result.extend(tokens[start:])
         return result
     
     def get_available_variables(self) -> Dict[str, List[str]]:
@@ -1332,6 +1389,29 @@ class TemplateEngine:
             return set()
         return set(self._plugin_registry.plugins.keys())
     
+    def _clear_layout_caches(self) -> None:
+        """Drop the variable width index and everything derived from it."""
+        self._width_index = None
+        self._line_width_cache.clear()
+        self._layout_cache.clear()
+    
+    def _get_width_index(self) -> VariableWidthIndex:
+        """Get the variable width index, rebuilding it if plugins or config changed."""
+        key = self._get_versions_key()
+        
+        if self._width_index is None or self._width_index.key != key:
+            self._clear_layout_caches()
+            self._width_index = VariableWidthIndex(
+                key=key,
+                max_lengths=self._get_max_lengths_for_validation(),
+                has_color_rules=self._has_color_rules,
+            )
+        return self._width_index
+    
+    def _has_color_rules(self, plugin_id: str, field: str) -> bool:
+        """Check whether a variable gets a color tile from config or manifest rules."""
+        return self._get_color_rules(plugin_id, field) is not None
+    
     def _calculate_max_line_length(self, line: str) -> int:
         """Calculate maximum possible rendered length of a template line.
         
@@ -1350,58 +1430,94 @@ class TemplateEngine:
         # If line has |wrap, it handles overflow automatically
         if '|wrap}}' in line or '|wrap|' in line:
             return 22  # Wrap ensures lines don't overflow
+        return self._estimate_width(line)
+    
+    def _estimate_width(self, text: str) -> int:
+        """Get the worst-case rendered width of template text, ignoring wrapping.
         
-        # Start with the line
-        result = line
+        Results are cached until plugins or the configuration change.
+        """
+        index = self._get_width_index()
+        width = self._line_width_cache.get(text)
+        if width is not None:
+            return width
         
         # Remove color markers (they become single tiles, count as 1 char each)
         # Replace {color} with single char placeholder
-        result = re.sub(r'\{(red|orange|yellow|green|blue|violet|purple|white|black|6[3-9]|70)\}', 'C', result, flags=re.IGNORECASE)
+        result = re.sub(r'\{(red|orange|yellow|green|blue|violet|purple|white|black|6[3-9]|70)\}', 'C', text, flags=re.IGNORECASE)
         result = re.sub(r'\{/(red|orange|yellow|green|blue|violet|purple|white|black)?\}', '', result, flags=re.IGNORECASE)
         
         # Replace symbols with their character equivalent (usually 1-2 chars)
-        for symbol, char in SYMBOL_CHARS.items():
-            result = re.sub(rf'\{{{symbol}\}}', char, result, flags=re.IGNORECASE)
-        
-        # Get max lengths from appropriate source
-        max_lengths = self._get_max_lengths_for_validation()
+        result = SYMBOL_PATTERN.sub(lambda match: SYMBOL_CHARS[match.group(1).lower()], result)
+        
+        # Replace variables with their max length (plus color tile prefix)
+        width = 0
+        last = 0
+        for match in VAR_PATTERN.finditer(result):
+            width += match.start() - last
+            width += index.width(match.group(1).split('|')[0].strip().lower())
+            last = match.end()
+        width += len(result) - last
+        
+        # Editor validation sees a new string on every keystroke; keep the cache bounded
+        if len(self._line_width_cache) >= LINE_WIDTH_CACHE_SIZE:
+            self._line_width_cache.clear()
+        self._line_width_cache[text] = width
+        return width
+    
+    def analyze_layout(
+        self,
+        template_lines: List[str],
+        cache_key: Optional[str] = None,
+        version: Optional[datetime] = None,
+    ) -> PageLayout:
+        """Get the worst-case layout of a template page.
+        
+        With a cache_key (page ID) the analysis is cached alongside the
+        compiled template and reused until the page, plugins or
+        configuration change.
         
-        # Replace variables with their max length
-        def replace_with_max_length(match):
-            expr = match.group(1).strip()
-            # Remove filters for lookup
-            var_part = expr.split('|')[0].strip().lower()
+        Args:
+            template_lines: List of up to 6 template lines
+            cache_key: Optional cache key, e.g. the page ID
+            version: Version of the template, e.g. the page's updated_at
             
-            # Check for color rules (adds 2 chars: color tile + space)
-            color_prefix_len = 0
-            parts = var_part.split('.')
-            if len(parts) >= 2:
-                plugin_id = parts[0]
-                field = parts[1]
-                # Check if plugin has color rules for this field
-                try:
-                    # Try to get color rules from config manager first (for legacy features)
-                    rules = self.config_manager.get_color_rules(plugin_id, field)
-                    
-                    # If not found, try to get from plugin manifest
-                    if not rules and self._plugin_registry:
-                        manifest = self._plugin_registry.get_manifest(plugin_id)
-                        if manifest and manifest.color_rules_schema:
-                            field_schema = manifest.color_rules_schema.get(field)
-                            if field_schema and isinstance(field_schema, dict):
-                                rules = field_schema.get("default_rules", [])
-                    if rules:
-                        color_prefix_len = 2  # Color tile + space
-                except Exception:
-                    pass
+        Returns:
+            PageLayout with per-line widths, wrap and overflow flags
+        """
+        index = self._get_width_index()
+        compiled = self.compile_template(template_lines, cache_key=cache_key, version=version)
+        
+        if cache_key is not None:
+            cached = self._layout_cache.get(cache_key)
+            if cached is not None and cached[0] is compiled and cached[1].width_key == index.key:
+                return cached[1]
+        
+        line_layouts = []
+        for line, source in zip(compiled.lines, list(compiled.source) + [""] * 6):
+            _, _, content = self._extract_alignment(source)
+            if line.wrap and line.wrap_slot is not None:
+                # Variable-level wrap: the rest of the line stays fixed around the variable
+                fixed = self._estimate_width(WRAP_VAR_PATTERN.sub('', content, count=1))
+                width = fixed + index.width(line.wrap_slot.var_part.lower())
+            else:
+                width = self._estimate_width(content)
             
-            # Get max length for this variable
-            max_len = max_lengths.get(var_part, 10)  # Default 10 if unknown
-            return 'X' * (max_len + color_prefix_len)
-        
-        result = VAR_PATTERN.sub(replace_with_max_length, result)
+            if line.wrap:
+                wrap_lines = max(1, -(-width // BOARD_WIDTH))
+                line_layouts.append(LineLayout(
+                    max_width=width,
+                    wrap=True,
+                    wrap_lines=wrap_lines,
+                    overflow=wrap_lines > line.wrap_capacity,
+                ))
+            else:
+                line_layouts.append(LineLayout(max_width=width, overflow=width > BOARD_WIDTH))
         
-        return len(result)
+        layout = PageLayout(lines=tuple(line_layouts), width_key=index.key)
+        if cache_key is not None:
+            self._layout_cache[cache_key] = (compiled, layout)
+        return layout
     
     def _get_max_lengths_for_validation(self) -> Dict[str, int]:
         """Get max lengths for template validation.
@@ -1411,13 +1527,7 @@ class TemplateEngine:
         """
         if not self._plugin_registry:
             return {}
-        
-        max_lengths: Dict[str, int] = {}
-        for plugin_id, manifest in self._plugin_registry._manifests.items():
-            for var_name, max_len in manifest.max_lengths.items():
-                full_name = f"{plugin_id}.{var_name}"
-                max_lengths[full_name] = max_len
-        return max_lengths
+        return self._plugin_registry.get_all_max_lengths(include_disabled=True)
     
     def get_variable_max_lengths(self) -> Dict[str, int]:
         """Get the max character lengths for all variables from enabled plugins.
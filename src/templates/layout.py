@@ -0,0 +1,124 @@
+"""Static layout analysis for templates.
+
+Validation needs the worst-case rendered width of every template line,
+which depends on each variable's max length (from plugin manifests) and on
+whether it gets a color tile prefix (from color rules). VariableWidthIndex
+collects both once per plugin/config version instead of rebuilding them for
+every line; PageLayout records the per-line result for a whole page.
+
+See TemplateEngine.analyze_layout() and TemplateEngine.validate_template().
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Tuple
+
+BOARD_WIDTH = 22
+
+# Assumed max length of variables without a declared one
+DEFAULT_MAX_LENGTH = 10
+
+# Width of the color tile + space added in front of variables with color rules
+COLOR_PREFIX_WIDTH = 2
+
+
+class VariableWidthIndex:
+    """Worst-case width of each variable, for one plugin/config version.
+    
+    Attributes:
+        key: Version the index was built for (manifest and config versions)
+        max_lengths: "plugin_id.variable" -> declared max length
+    """
+    
+    def __init__(
+        self,
+        key: Hashable,
+        max_lengths: Dict[str, int],
+        has_color_rules: Callable[[str, str], bool],
+    ):
+        """Initialize the index.
+        
+        Args:
+            key: Version the index is built for
+            max_lengths: "plugin_id.variable" -> declared max length
+            has_color_rules: Returns whether (plugin_id, field) has color rules;
+                             called at most once per variable
+        """
+        self.key = key
+        self.max_lengths = max_lengths
+        self._has_color_rules = has_color_rules
+        self._widths: Dict[str, int] = {}
+    
+    def width(self, var_part: str) -> int:
+        """Get the worst-case rendered width of a variable.
+        
+        Args:
+            var_part: Lowercased variable without filters, e.g. 'weather.temp'
+        """
+        width = self._widths.get(var_part)
+        if width is None:
+            width = self.max_lengths.get(var_part, DEFAULT_MAX_LENGTH)
+            parts = var_part.split('.')
+            if len(parts) >= 2 and self._has_color_rules(parts[0], parts[1]):
+                width += COLOR_PREFIX_WIDTH
+            self._widths[var_part] = width
+        return width
+
+
+@dataclass(frozen=True)
+class LineLayout:
+    """Static layout of one template line.
+    
+    Attributes:
+        max_width: Worst-case rendered width in tiles (before wrapping)
+        wrap: Whether the line wraps onto following empty lines
+        wrap_lines: Lines the content may need when wrapped (1 if not wrapped)
+        overflow: Whether the content may not fit (truncated or wrap too short)
+    """
+    max_width: int
+    wrap: bool = False
+    wrap_lines: int = 1
+    overflow: bool = False
+
+
+@dataclass(frozen=True)
+class PageLayout:
+    """Static layout of a whole template page.
+    
+    Attributes:
+        lines: Exactly 6 LineLayouts
+        width_key: VariableWidthIndex version the analysis used
+    """
+    lines: Tuple[LineLayout, ...]
+    width_key: Hashable = None
+    
+    @property
+    def max_width(self) -> int:
+        """Widest worst-case line width."""
+        return max((line.max_width for line in self.lines), default=0)
+    
+    @property
+    def overflow_lines(self) -> Tuple[int, ...]:
+        """1-based numbers of the lines that may overflow."""
+        return tuple(i for i, line in enumerate(self.lines, 1) if line.overflow)
+    
+    @property
+    def wrapped_lines(self) -> Tuple[int, ...]:
+        """1-based numbers of the lines that may wrap onto more than one line."""
+        return tuple(i for i, line in enumerate(self.lines, 1) if line.wrap_lines > 1)
+    
+    def to_dict(self) -> Dict:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "max_width": self.max_width,
+            "overflow_lines": list(self.overflow_lines),
+            "wrapped_lines": list(self.wrapped_lines),
+            "lines": [
+                {
+                    "max_width": line.max_width,
+                    "wrap": line.wrap,
+                    "wrap_lines": line.wrap_lines,
+                    "overflow": line.overflow,
+                }
+                for line in self.lines
+            ],
+        }
@@ -4,38 +4,13 @@ This module handles conversion of text (with color markers) into the 6x22
 character code arrays that the board requires.
 """
 
-import re
 import logging
 from typing import List, Optional
 
-from .board_chars import BoardChars
+from .tiles import TileGrid
 
 logger = logging.getLogger(__name__)
 
-# Color name to code mapping
-COLOR_CODES = {
-    "red": 63,
-    "orange": 64,
-    "yellow": 65,
-    "green": 66,
-    "blue": 67,
-    "violet": 68,
-    "purple": 68,
-    "white": 69,
-    "black": 70,
-}
-
-# Parse color markers: {63}, {red}, {/red}, {/} - each produces a single colored tile
-# Note: Single brackets are used after template normalization to avoid conflicting with {{variable}} syntax
-COLOR_MARKER_PATTERN = re.compile(
-    r'\{(?:'
-    r'(6[3-9]|70)|'  # Numeric codes 63-70
-    r'(red|orange|yellow|green|blue|violet|purple|white|black)|'  # Named colors
-    r'(/(?:red|orange|yellow|green|blue|violet|purple|white|black)?)'  # End tags {/} or {/red}
-    r')\}',
-    re.IGNORECASE
-)
-
 
 def text_to_board_array(text: str, use_color_tiles: bool = True) -> List[List[int]]:
     """
@@ -58,61 +33,7 @@ def text_to_board_array(text: str, use_color_tiles: bool = True) -> List[List[in
     Returns:
         6x22 array of character codes (0-71)
     """
-    # Initialize empty board (all spaces)
-    board = [[BoardChars.SPACE] * 22 for _ in range(6)]
-    
-    # Split into lines (max 6)
-    lines = text.split('\n')[:6]
-    
-    # Process each line
-    for row_idx, line in enumerate(lines):
-        col_idx = 0
-        pos = 0
-        
-        while pos < len(line) and col_idx < 22:
-            # Check for color marker at current position
-            match = COLOR_MARKER_PATTERN.match(line, pos)
-            
-            if match:
-                # Color marker found
-                numeric_code = match.group(1)
-                named_color = match.group(2)
-                end_tag = match.group(3)
-                
-                if end_tag:
-                    # End tags are ignored (just skip them)
-                    pass
-                elif use_color_tiles:
-                    # Color marker produces ONE colored tile
-                    if numeric_code:
-                        board[row_idx][col_idx] = int(numeric_code)
-                        col_idx += 1
-                    elif named_color:
-                        color_code = COLOR_CODES.get(named_color.lower())
-                        if color_code:
-                            board[row_idx][col_idx] = color_code
-                            col_idx += 1
-                # If not use_color_tiles, we just skip the marker entirely
-                
-                # Move past the marker
-                pos = match.end()
-                continue
-            
-            # Regular character
-            char = line[pos].upper()
-            
-            # Convert character to code
-            char_code = BoardChars.get_char_code(char)
-            if char_code is not None:
-                board[row_idx][col_idx] = char_code
-            else:
-                # Unknown character - use space
-                board[row_idx][col_idx] = BoardChars.SPACE
-            
-            col_idx += 1
-            pos += 1
-    
-    return board
+    return TileGrid.from_text(text).to_board_array(use_color_tiles=use_color_tiles)
 
 
 def format_board_array_preview(board: List[List[int]]) -> str:
@@ -0,0 +1,236 @@
+"""Tile tokenizer shared by the template engine and board conversion.
+
+Rendered text maps onto board tiles one token at a time:
+- A single character is one tile
+- A color marker like {63} or {red} is one solid color tile
+- An end tag like {/} or {/red} is zero tiles (kept in text, never displayed)
+
+Counting, truncation, alignment, fill_space, wrapping and conversion to
+character codes all work on the token list from tokenize(), so a line is
+scanned once per stage and every stage agrees on what a tile is.
+"""
+
+import re
+from functools import cached_property
+from typing import Dict, List, Optional, Sequence
+
+from .board_chars import BoardChars
+
+# Color name/code to tile code
+COLOR_CODES = {
+    "red": 63,
+    "orange": 64,
+    "yellow": 65,
+    "green": 66,
+    "blue": 67,
+    "violet": 68,
+    "purple": 68,
+    "white": 69,
+    "black": 70,
+}
+
+# Color markers: {63}..{70}, {red}, ... and end tags {/}, {/red}, ...
+TILE_MARKER_PATTERN = re.compile(
+    r'\{(?:6[3-9]|70|'
+    r'red|orange|yellow|green|blue|violet|purple|white|black|'
+    r'/(?:red|orange|yellow|green|blue|violet|purple|white|black)?'
+    r')\}',
+    re.IGNORECASE
+)
+
+BOARD_WIDTH = 22
+BOARD_HEIGHT = 6
+
+# Character -> tile code (None for characters the board can't show)
+_char_codes: Dict[str, Optional[int]] = {}
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into tile tokens.
+    
+    Args:
+        text: Rendered text (may contain color markers and end tags)
+    
+    Returns:
+        Tokens in order: single characters, color markers and end tags
+    """
+    if "{" not in text:
+        return list(text)
+    
+    tokens: List[str] = []
+    pos = 0
+    for match in TILE_MARKER_PATTERN.finditer(text):
+        tokens.extend(text[pos:match.start()])
+        tokens.append(match.group(0))
+        pos = match.end()
+    tokens.extend(text[pos:])
+    return tokens
+
+
+def is_end_tag(token: str) -> bool:
+    """Check if a token is a zero-width end tag like {/} or {/red}."""
+    return token[:2] == "{/"
+
+
+def count_tiles(tokens: Sequence[str]) -> int:
+    """Count the tiles a token list occupies (end tags take none)."""
+    return len(tokens) - sum(1 for token in tokens if token[:2] == "{/")
+
+
+def truncate_tiles(tokens: Sequence[str], max_tiles: int = BOARD_WIDTH) -> List[str]:
+    """Keep the first max_tiles tiles, dropping end tags.
+    
+    Args:
+        tokens: Tokens from tokenize()
+        max_tiles: Maximum number of tiles to keep
+    
+    Returns:
+        Truncated token list
+    """
+    result = []
+    for token in tokens:
+        if len(result) >= max_tiles:
+            break
+        if token[:2] != "{/":
+            result.append(token)
+    return result
+
+
+def pad_tiles(tokens: Sequence[str], alignment: str = "left", width: int = BOARD_WIDTH) -> List[str]:
+    """Pad or truncate tokens to exactly `width` tiles.
+    
+    Args:
+        tokens: Tokens from tokenize()
+        alignment: 'left', 'center', or 'right'
+        width: Target width in tiles
+        
+    Returns:
+        Aligned token list
+    """
+    tile_count = count_tiles(tokens)
+    if tile_count >= width:
+        return truncate_tiles(tokens, width)
+    
+    padding_needed = width - tile_count
+    if alignment == 'center':
+        left_pad = padding_needed // 2
+        return [' '] * left_pad + list(tokens) + [' '] * (padding_needed - left_pad)
+    elif alignment == 'right':
+        return [' '] * padding_needed + list(tokens)
+    return list(tokens) + [' '] * padding_needed
+
+
+def align_tiles(tokens: Sequence[str], alignment: str = "left", width: int = BOARD_WIDTH) -> str:
+    """Pad or truncate tokens to exactly `width` tiles, as text.
+    
+    Args:
+        tokens: Tokens from tokenize()
+        alignment: 'left', 'center', or 'right'
+        width: Target width in tiles
+        
+    Returns:
+        Aligned text
+    """
+    return "".join(pad_tiles(tokens, alignment, width))
+
+
+def token_code(token: str, use_color_tiles: bool = True) -> Optional[int]:
+    """Get the board character code for a token.
+    
+    Args:
+        token: Token from tokenize()
+        use_color_tiles: If False, color markers produce no tile
+    
+    Returns:
+        Character code (unknown characters become a space), or None if the
+        token doesn't occupy a tile
+    """
+    if len(token) > 1:
+        if token[:2] == "{/" or not use_color_tiles:
+            return None
+        content = token[1:-1]
+        return int(content) if content.isdigit() else COLOR_CODES[content.lower()]
+    
+    code = _char_codes.get(token, -1)
+    if code == -1:
+        upper = token.upper()  # May be longer, e.g. "ß" -> "SS"
+        code = BoardChars.get_char_code(upper) if len(upper) == 1 else None
+        _char_codes[token] = code
+    return BoardChars.SPACE if code is None else code
+
+
+def tokens_to_codes(
+    tokens: Sequence[str],
+    width: int = BOARD_WIDTH,
+    use_color_tiles: bool = True
+) -> List[int]:
+    """Convert tokens to one board row of character codes.
+    
+    Args:
+        tokens: Tokens from tokenize()
+        width: Row width; extra tiles are dropped, missing ones are spaces
+        use_color_tiles: If False, color markers are skipped entirely
+    
+    Returns:
+        List of exactly `width` character codes
+    """
+    row = []
+    for token in tokens:
+        if len(row) >= width:
+            break
+        code = token_code(token, use_color_tiles)
+        if code is not None:
+            row.append(code)
+    row.extend([BoardChars.SPACE] * (width - len(row)))
+    return row
+
+
+class TileGrid:
+    """Rendered board content as tile tokens, one list per line.
+    
+    Renderers build this directly, so the board array comes straight from
+    the tokens instead of re-parsing the formatted text. Both the text and
+    the board array are only built when first requested.
+    """
+    
+    def __init__(self, lines: Sequence[Sequence[str]]):
+        """Initialize the grid.
+        
+        Args:
+            lines: Tokens for each line (at most BOARD_HEIGHT lines)
+        """
+        self.lines = [list(line) for line in lines[:BOARD_HEIGHT]]
+    
+    @classmethod
+    def from_text(cls, text: str) -> "TileGrid":
+        """Build a grid by tokenizing newline-separated text."""
+        return cls([tokenize(line) for line in text.split('\n')])
+    
+    @cached_property
+    def text(self) -> str:
+        """Formatted text with color markers (newline-separated)."""
+        return '\n'.join("".join(line) for line in self.lines)
+    
+    @cached_property
+    def _board_array(self) -> List[List[int]]:
+        """Board array with color tiles, built once."""
+        return self._build_board_array(use_color_tiles=True)
+    
+    def _build_board_array(self, use_color_tiles: bool) -> List[List[int]]:
+        """Convert each line's tokens to codes, padding missing lines with spaces."""
+        board = [tokens_to_codes(line, BOARD_WIDTH, use_color_tiles) for line in self.lines]
+        board.extend([BoardChars.SPACE] * BOARD_WIDTH for _ in range(BOARD_HEIGHT - len(board)))
+        return board
+    
+    def to_board_array(self, use_color_tiles: bool = True) -> List[List[int]]:
+        """Get the 6x22 array of character codes.
+        
+        Args:
+            use_color_tiles: If False, color markers are skipped entirely
+            
+        Returns:
+            A new 6x22 array (safe for the caller to modify)
+        """
+        if not use_color_tiles:
+            return self._build_board_array(use_color_tiles=False)
+        return [row[:] for row in self._board_array]
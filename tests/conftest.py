@@ -19,6 +19,7 @@ def reset_singletons():
     from src.settings import service as settings_service
     from src.pages import service as pages_service
     from src.templates import engine as template_engine
+    from src import persistence
     
     # Reset all singletons before the test
     displays_service._display_service = None
@@ -28,7 +29,9 @@ def reset_singletons():
     
     yield
     
-    # Reset again after the test (cleanup)
+    # Reset again after the test (cleanup). Pending debounced writes are
+    # dropped so they can't recreate temp files the test already removed.
+    persistence.reset_writers()
     displays_service._display_service = None
     settings_service._settings_service = None
     pages_service._page_service = None
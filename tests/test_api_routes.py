@@ -0,0 +1,75 @@
+"""Tests for API route scheduling (event loop vs threadpool)."""
+
+import inspect
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+
+from src import api_server
+from src.api_server import app
+
+
+# Routes that make outbound HTTP calls, talk to the board, render pages or
+# read files. They must be plain functions so FastAPI runs them in its
+# threadpool instead of blocking the event loop.
+BLOCKING_ROUTES = [
+    "get_logs",
+    "start_service",
+    "send_message",
+    "update_board_config",
+    "test_board_connection",
+    "enable_local_api",
+    "get_displays_raw_batch",
+    "list_all_baywheels_stations",
+    "search_baywheels_stations_by_address",
+    "list_all_muni_stops",
+    "find_nearby_muni_stops",
+    "search_muni_stops_by_address",
+    "search_stock_symbols",
+    "geocode_address",
+    "debug_blank_board",
+    "debug_fill_board",
+    "debug_show_info",
+    "debug_test_connection",
+    "preview_page",
+    "preview_pages_batch",
+    "send_page",
+    "render_template",
+    "get_home_assistant_entities",
+    "get_plugin_data",
+]
+
+
+@pytest.mark.parametrize("name", BLOCKING_ROUTES)
+def test_blocking_routes_run_in_threadpool(name):
+    """Test blocking routes aren't coroutines."""
+    assert not inspect.iscoroutinefunction(getattr(api_server, name))
+
+
+def test_slow_route_does_not_block_health():
+    """Test a slow upstream call doesn't stall other requests."""
+    started = threading.Event()
+    
+    def slow_connection_test():
+        started.set()
+        time.sleep(1.0)
+        return True
+    
+    # Entering the client shares one event loop between requests
+    with patch("src.api_server._get_board_client") as mock_get_client, \
+            patch("src.api_server.get_service", return_value=None), \
+            patch.object(api_server, "_dev_mode", False), \
+            TestClient(app) as client:
+        mock_get_client.return_value.test_connection.side_effect = slow_connection_test
+        slow = threading.Thread(target=client.post, args=("/debug/test-connection",))
+        slow.start()
+        try:
+            assert started.wait(2)
+            start = time.monotonic()
+            assert client.get("/health").status_code == 200
+            assert time.monotonic() - start < 0.5
+        finally:
+            slow.join()
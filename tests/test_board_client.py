@@ -5,6 +5,7 @@ from unittest.mock import Mock, patch, MagicMock
 import requests
 
 from src.board_client import BoardClient, VALID_STRATEGIES, strip_color_markers
+from src.board_frame import Frame
 
 
 class TestStripColorMarkers:
@@ -256,6 +257,79 @@ class TestSendCharacters:
         assert mock_post.call_count == 1
 
 
+    @patch('src.board_client.requests.post')
+    def test_send_characters_below_threshold_skips(self, mock_post, valid_grid):
+        """Test that sends changing fewer tiles than the threshold are skipped."""
+        mock_post.return_value.raise_for_status = Mock()
+        client = BoardClient(api_key="test_key", host="192.168.0.11", min_changed_tiles=3)
+        client.send_characters(valid_grid)
+        
+        # Two changed tiles - below threshold
+        grid = [row[:] for row in valid_grid]
+        grid[0][20] = 1
+        grid[0][21] = 2
+        success, was_sent = client.send_characters(grid)
+        assert success is True
+        assert was_sent is False
+        
+        # Changes accumulate against the last frame actually sent
+        grid[1][0] = 3
+        success, was_sent = client.send_characters(grid)
+        assert was_sent is True
+        assert mock_post.call_count == 2
+        
+        stats = client.get_diff_stats()
+        assert stats["skipped_below_threshold"] == 1
+        assert stats["last_diff"]["change_count"] == 3
+    
+    @patch('src.board_client.requests.post')
+    def test_send_characters_per_call_threshold(self, mock_post, client, valid_grid):
+        """Test min_changes overrides the client threshold and force bypasses it."""
+        mock_post.return_value.raise_for_status = Mock()
+        client.send_characters(valid_grid)
+        grid = [row[:] for row in valid_grid]
+        grid[2][2] = 5
+        
+        assert client.send_characters(grid, min_changes=2) == (True, False)
+        assert client.send_characters(grid, min_changes=2, force=True) == (True, True)
+    
+    @patch('src.board_client.requests.post')
+    def test_send_characters_auto_strategy(self, mock_post, client, valid_grid):
+        """Test auto picks the strategy that settles the changes fastest."""
+        mock_post.return_value.raise_for_status = Mock()
+        client.send_characters(valid_grid)
+        grid = [row[:] for row in valid_grid]
+        grid[3][21] = 1
+        
+        client.send_characters(grid, strategy="auto")
+        
+        assert mock_post.call_args.kwargs["json"]["strategy"] == "reverse-column"
+    
+    @patch('src.board_client.requests.post')
+    def test_churn_stats_by_label(self, mock_post, client, valid_grid):
+        """Test sends and skips are counted per label."""
+        mock_post.return_value.raise_for_status = Mock()
+        client.send_characters(valid_grid, label="page-1")
+        client.send_characters(valid_grid, label="page-1")
+        
+        stats = client.get_diff_stats()["by_label"]["page-1"]
+        assert stats["sends"] == 1
+        assert stats["skipped_unchanged"] == 1
+        assert stats["tiles_changed"] == 132
+    
+    @patch('src.board_client.requests.post')
+    def test_send_frame_keeps_last_frame(self, mock_post, client, valid_grid):
+        """Test a Frame is sent in list format and kept as the last frame."""
+        mock_post.return_value.raise_for_status = Mock()
+        frame = Frame.from_rows(valid_grid)
+        
+        assert client.send_characters(frame) == (True, True)
+        
+        assert mock_post.call_args.kwargs["json"]["characters"] == valid_grid
+        assert client.get_last_frame() is frame
+        assert client.send_characters(valid_grid) == (True, False)
+
+
 class TestReadCurrentMessage:
     """Tests for read_current_message method."""
     
@@ -0,0 +1,78 @@
+"""Tests for tile-level board diffs."""
+
+import pytest
+
+from src.board_diff import BoardDiff, TileRun, diff_boards, fastest_strategy
+
+
+def blank():
+    """Create a blank 6x22 grid."""
+    return [[0] * 22 for _ in range(6)]
+
+
+class TestDiffBoards:
+    """Tests for diff_boards."""
+    
+    def test_identical_frames(self):
+        """Test identical frames produce an empty diff."""
+        diff = diff_boards(blank(), blank())
+        assert diff.is_empty
+        assert diff.change_count == 0
+        assert diff.bounding_box() is None
+    
+    def test_no_previous_frame_is_full(self):
+        """Test every tile counts as changed without a previous frame."""
+        diff = diff_boards(None, blank())
+        assert diff.full
+        assert diff.change_count == 132
+    
+    def test_changed_tiles_and_regions(self):
+        """Test changed tiles are grouped into rows, runs and a bounding box."""
+        new = blank()
+        new[1][3] = 1
+        new[1][4] = 2
+        new[1][6] = 3
+        new[4][21] = 4
+        diff = diff_boards(blank(), new)
+        
+        assert diff.change_count == 4
+        assert diff.changed_rows == [1, 4]
+        assert diff.regions() == [TileRun(1, 3, 4), TileRun(1, 6, 6), TileRun(4, 21, 21)]
+        assert diff.bounding_box() == (1, 3, 4, 21)
+        assert diff.to_dict()["regions"][0] == {"row": 1, "start_col": 3, "end_col": 4}
+
+
+class TestFastestStrategy:
+    """Tests for settle-time based strategy selection."""
+    
+    def _diff_at(self, *tiles):
+        """Create a diff with the given changed tiles."""
+        return BoardDiff(changed_tiles=list(tiles))
+    
+    def test_left_edge_prefers_column(self):
+        """Test changes on the left settle fastest left-to-right."""
+        assert fastest_strategy(self._diff_at((0, 0), (5, 1))) in ("column", "edges-to-center")
+        assert self._diff_at((5, 1)).settle_steps("column") == 2
+    
+    def test_right_edge_prefers_reverse_column(self):
+        """Test changes on the right settle fastest right-to-left."""
+        assert fastest_strategy(self._diff_at((2, 20), (3, 21))) == "reverse-column"
+    
+    def test_top_row_prefers_row(self):
+        """Test changes in the top row settle fastest top-to-bottom."""
+        assert fastest_strategy(self._diff_at((0, 5), (0, 15))) == "row"
+    
+    def test_step_size_shortens_settle(self):
+        """Test larger step sizes settle in fewer steps."""
+        diff = self._diff_at((0, 10))
+        assert diff.settle_steps("column") == 11
+        assert diff.settle_steps("column", step_size=4) == 3
+    
+    def test_empty_diff(self):
+        """Test no strategy is picked when nothing changes."""
+        assert fastest_strategy(BoardDiff()) is None
+    
+    def test_random_is_not_predictable(self):
+        """Test the random strategy has no settle time."""
+        with pytest.raises(ValueError):
+            self._diff_at((0, 0)).settle_steps("random")
@@ -0,0 +1,68 @@
+"""Tests for the compact board frame."""
+
+import pytest
+
+from src.board_frame import COLS, ROWS, SIZE, Frame
+
+
+def grid(code=0):
+    """Create a 6x22 grid filled with one code."""
+    return [[code] * COLS for _ in range(ROWS)]
+
+
+class TestFrame:
+    """Tests for Frame."""
+    
+    def test_round_trip(self):
+        """Test rows survive conversion to a frame and back."""
+        rows = grid()
+        rows[2][5] = 63
+        frame = Frame.from_rows(rows)
+        
+        assert len(bytes(frame)) == SIZE
+        assert frame.to_rows() == rows
+        assert frame.tile(2, 5) == 63
+        assert frame.row(2)[5] == 63
+    
+    def test_from_rows_rejects_bad_shape(self):
+        """Test grids of the wrong shape or with bad codes are rejected."""
+        with pytest.raises(ValueError, match="rows"):
+            Frame.from_rows(grid()[:5])
+        with pytest.raises(ValueError, match="columns"):
+            Frame.from_rows([[0] * 20 for _ in range(ROWS)])
+        bad = grid()
+        bad[0][0] = 300
+        with pytest.raises(ValueError):
+            Frame.from_rows(bad)
+    
+    def test_equality_and_hash(self):
+        """Test frames compare by content, including against nested lists."""
+        a = Frame.filled(1)
+        b = Frame.from_rows(grid(1))
+        
+        assert a == b
+        assert hash(a) == hash(b)
+        assert len({a, b}) == 1
+        assert a == grid(1)
+        assert a != grid(2)
+        assert a != grid(1)[:3]
+    
+    def test_with_tiles_returns_copy(self):
+        """Test writing tiles leaves the original frame untouched."""
+        blank = Frame.filled(0)
+        updated = blank.with_tiles(5, 20, [1, 2, 3])
+        
+        assert blank == grid()
+        assert updated.tile(5, 20) == 1
+        assert updated.tile(5, 21) == 2  # Third code clipped at the row end
+        assert updated.changed_tiles(blank) == [(5, 20), (5, 21)]
+    
+    def test_changed_indices(self):
+        """Test XOR diffing finds every changed tile in order."""
+        rows = grid()
+        rows[0][0] = 1
+        rows[3][7] = 2
+        rows[5][21] = 3
+        
+        assert Frame.from_rows(rows).changed_indices(Frame.filled(0)) == [0, 3 * COLS + 7, SIZE - 1]
+        assert Frame.filled(0).changed_indices(Frame.filled(0)) == []
@@ -0,0 +1,134 @@
+"""Tests for the sent-frame history."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.board_client import BoardClient
+from src.board_frame import Frame
+from src.board_history import EVENT_SENT, EVENT_SKIPPED_UNCHANGED, FrameHistory
+
+
+class TestFrameHistory:
+    """Tests for FrameHistory."""
+    
+    def test_ring_buffer_drops_oldest(self):
+        """Test the history keeps only the newest records."""
+        history = FrameHistory(max_entries=3)
+        for code in range(5):
+            history.record(Frame.filled(code), label="page")
+        
+        assert [entry.seq for entry in history.query()] == [5, 4, 3]
+        assert history.get(1) is None
+        assert history.get(4).frame == Frame.filled(3)
+        assert history.stats()["unique_frames"] == 3
+    
+    def test_identical_frames_are_shared(self):
+        """Test repeated frames are stored once."""
+        history = FrameHistory()
+        first = history.record(Frame.filled(1))
+        second = history.record(Frame.from_rows([[1] * 22 for _ in range(6)]))
+        
+        assert first.frame is second.frame
+        assert history.stats()["unique_frames"] == 1
+    
+    def test_query_filters(self):
+        """Test records can be filtered by label and event."""
+        history = FrameHistory()
+        history.record(Frame.filled(0), label="a")
+        history.record(Frame.filled(0), event=EVENT_SKIPPED_UNCHANGED, label="a")
+        history.record(Frame.filled(1), label="b")
+        
+        assert [entry.seq for entry in history.query(label="a")] == [2, 1]
+        assert [entry.seq for entry in history.query(event=EVENT_SENT)] == [3, 1]
+        assert len(history.query(limit=1)) == 1
+    
+    def test_stats_by_label(self):
+        """Test skip rate, churn and latency are summarized per label."""
+        history = FrameHistory()
+        history.record(Frame.filled(0), label="a", tiles_changed=10, latency_ms=20)
+        history.record(Frame.filled(1), label="a", tiles_changed=4, latency_ms=40)
+        history.record(Frame.filled(1), event=EVENT_SKIPPED_UNCHANGED, label="a")
+        
+        stats = history.stats()["by_label"]["a"]
+        assert stats["sends"] == 2
+        assert stats["skips"] == 1
+        assert stats["skip_rate"] == pytest.approx(0.333)
+        assert stats["avg_tiles_changed"] == 7
+        assert stats["avg_latency_ms"] == 30
+        assert stats["max_latency_ms"] == 40
+    
+    def test_consecutive_skips_are_merged(self):
+        """Test repeated skips share one counted record and don't evict sends."""
+        history = FrameHistory(max_entries=2)
+        history.record(Frame.filled(0), label="a")
+        for _ in range(5):
+            history.record(Frame.filled(0), event=EVENT_SKIPPED_UNCHANGED, label="a")
+        
+        skipped, sent = history.query()
+        assert sent.event == EVENT_SENT
+        assert skipped.seq == 2
+        assert skipped.count == 5
+        assert skipped.last_timestamp >= skipped.timestamp
+        assert history.get(2) is skipped
+        assert history.stats()["by_label"]["a"]["skips"] == 5
+        assert history.stats()["unique_frames"] == 1
+        
+        # A different label or a send starts a new record
+        history.record(Frame.filled(0), event=EVENT_SKIPPED_UNCHANGED, label="b")
+        assert [entry.count for entry in history.query()] == [1, 5]
+    
+    def test_append_log(self, tmp_path):
+        """Test sends (not skips) are appended to the on-disk log with the frame as hex."""
+        log_path = tmp_path / "history" / "frames.jsonl"
+        history = FrameHistory(log_path=log_path)
+        history.record(Frame.filled(2), label="page")
+        history.record(Frame.filled(2), event=EVENT_SKIPPED_UNCHANGED, label="page")
+        history.record(Frame.filled(3), label="page")
+        
+        lines = [json.loads(line) for line in log_path.read_text().splitlines()]
+        assert [line["seq"] for line in lines] == [1, 3]
+        assert Frame(bytes.fromhex(lines[1]["frame"])) == Frame.filled(3)
+
+
+class TestBoardClientHistory:
+    """Tests for BoardClient's use of the history."""
+    
+    @pytest.fixture
+    def client(self):
+        """Create a client that records into a history."""
+        return BoardClient(api_key="test_key", host="192.168.0.11", history=FrameHistory())
+    
+    @patch('src.board_client.requests.post')
+    def test_sends_and_skips_are_recorded(self, mock_post, client):
+        """Test sends record strategy, churn and latency; skips are recorded too."""
+        mock_post.return_value.raise_for_status = Mock()
+        client.send_characters(Frame.filled(1), strategy="row", label="page")
+        client.send_characters(Frame.filled(1), label="page")
+        
+        skipped, sent = client.history.query()
+        assert sent.event == EVENT_SENT
+        assert sent.strategy == "row"
+        assert sent.tiles_changed == 132
+        assert sent.latency_ms is not None
+        assert skipped.event == EVENT_SKIPPED_UNCHANGED
+    
+    @patch('src.board_client.requests.post')
+    def test_replay(self, mock_post, client):
+        """Test replaying re-sends the recorded frame with its transition."""
+        mock_post.return_value.raise_for_status = Mock()
+        client.send_characters(Frame.filled(1), strategy="row", label="page")
+        client.send_characters(Frame.filled(2), label="page")
+        
+        assert client.replay(1) == (True, True)
+        
+        payload = mock_post.call_args.kwargs["json"]
+        assert payload["characters"] == Frame.filled(1).to_rows()
+        assert payload["strategy"] == "row"
+        assert client.history.query(limit=1)[0].label == "replay"
+    
+    def test_replay_unknown_record(self, client):
+        """Test replaying a missing record raises KeyError."""
+        with pytest.raises(KeyError):
+            client.replay(1)
@@ -0,0 +1,114 @@
+"""Tests for the persistent remote catalog cache."""
+
+import json
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from src.data_sources.catalog_store import CatalogStore
+
+
+def _response(status_code=200, body=None, headers=None):
+    """Fake HTTP response."""
+    response = Mock()
+    response.status_code = status_code
+    response.text = json.dumps(body) if body is not None else ""
+    response.headers = headers or {}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(str(status_code))
+    return response
+
+
+@pytest.fixture
+def session():
+    """Patched shared HTTP session."""
+    with patch("src.data_sources.catalog_store.get_http_session") as get_session:
+        yield get_session.return_value
+
+
+def _store(tmp_path, **kwargs):
+    """Catalog store that keeps the item list of the response."""
+    return CatalogStore(
+        name="test",
+        url="https://example.com/catalog.json",
+        parse=lambda content: json.loads(content)["items"],
+        ttl_seconds=kwargs.pop("ttl_seconds", 3600),
+        path=tmp_path / "test.json",
+        **kwargs,
+    )
+
+
+class TestCatalogStore:
+    """Tests for CatalogStore."""
+    
+    def test_download_is_stored_and_reused_after_restart(self, tmp_path, session):
+        """Test a downloaded catalog is served from disk by a new store."""
+        session.get.return_value = _response(body={"items": [1, 2]}, headers={"ETag": '"v1"'})
+        assert _store(tmp_path).get() == [1, 2]
+        
+        session.get.reset_mock()
+        restarted = _store(tmp_path)
+        
+        assert restarted.get() == [1, 2]
+        session.get.assert_not_called()
+    
+    def test_expired_catalog_refreshed_conditionally(self, tmp_path, session):
+        """Test an expired catalog is revalidated with its ETag and kept on 304."""
+        session.get.return_value = _response(body={"items": [1]}, headers={"ETag": '"v1"'})
+        store = _store(tmp_path, ttl_seconds=0)
+        first = store.get()
+        
+        session.get.return_value = _response(status_code=304)
+        assert store.get() is first
+        assert session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    
+    def test_unchanged_catalog_not_rewritten(self, tmp_path, session):
+        """Test a 304 only stores the new fetch time, which survives a restart."""
+        session.get.return_value = _response(body={"items": [1]}, headers={"ETag": '"v1"'})
+        store = _store(tmp_path, ttl_seconds=0)
+        store.get()
+        catalog_mtime = store.path.stat().st_mtime_ns
+        
+        session.get.return_value = _response(status_code=304)
+        with patch("src.data_sources.catalog_store.time.time", return_value=time.time() + 1000):
+            store.get()
+            restarted = _store(tmp_path, ttl_seconds=0)
+            restarted.peek()
+            
+            assert store.path.stat().st_mtime_ns == catalog_mtime
+            assert restarted.age == 0
+    
+    def test_failed_refresh_serves_cached_catalog(self, tmp_path, session):
+        """Test a failing refresh falls back to the cached catalog."""
+        session.get.return_value = _response(body={"items": [1]})
+        store = _store(tmp_path, ttl_seconds=0)
+        store.get()
+        
+        session.get.return_value = _response(status_code=500)
+        assert store.get() == [1]
+    
+    def test_failure_without_catalog_raises(self, tmp_path, session):
+        """Test there's nothing to fall back to before the first download."""
+        session.get.return_value = _response(status_code=500)
+        
+        with pytest.raises(requests.exceptions.HTTPError):
+            _store(tmp_path).get()
+    
+    def test_refreshes_in_background_before_expiry(self, tmp_path, session):
+        """Test reads near the end of the TTL serve the cached copy and refresh behind it."""
+        session.get.return_value = _response(body={"items": [1]})
+        store = _store(tmp_path, ttl_seconds=100, refresh_ahead=0.5)
+        store.get()
+        store._fetched_at = time.time() - 60
+        
+        session.get.return_value = _response(body={"items": [2]})
+        assert store.get() == [1]
+        store._background.join(timeout=5)
+        assert store.peek() == [2]
+    
+    def test_peek_does_not_download(self, tmp_path, session):
+        """Test peek() only reads memory and disk."""
+        assert _store(tmp_path).peek() is None
+        session.get.assert_not_called()
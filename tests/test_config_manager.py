@@ -0,0 +1,108 @@
+"""Tests for ConfigManager's read-only configuration snapshots."""
+
+import copy
+import json
+
+import pytest
+
+from src.config_manager import ConfigManager, FrozenDict, FrozenList, freeze
+
+
+@pytest.fixture
+def config_manager(tmp_path):
+    """Fresh ConfigManager backed by a temporary config file."""
+    previous = ConfigManager._instance
+    ConfigManager._instance = None
+    manager = ConfigManager(str(tmp_path / "config.json"))
+    yield manager
+    ConfigManager._instance = previous
+
+
+class TestFreeze:
+    """Tests for FrozenDict/FrozenList."""
+    
+    def test_mutation_raises(self):
+        """Test frozen containers reject every kind of mutation."""
+        frozen = freeze({"a": [1, {"b": 2}]})
+        
+        with pytest.raises(TypeError):
+            frozen["c"] = 3
+        with pytest.raises(TypeError):
+            frozen.update(c=3)
+        with pytest.raises(TypeError):
+            frozen["a"].append(4)
+        with pytest.raises(TypeError):
+            frozen["a"][1]["b"] = 5
+        assert frozen == {"a": [1, {"b": 2}]}
+    
+    def test_behaves_like_plain_containers(self):
+        """Test frozen containers still pass isinstance checks and serialize."""
+        frozen = freeze({"a": [1, 2]})
+        
+        assert isinstance(frozen, dict) and isinstance(frozen, FrozenDict)
+        assert isinstance(frozen["a"], list) and isinstance(frozen["a"], FrozenList)
+        assert json.loads(json.dumps(frozen)) == {"a": [1, 2]}
+    
+    def test_deepcopy_is_mutable(self):
+        """Test copies of frozen containers are plain dicts/lists."""
+        copied = copy.deepcopy(freeze({"a": [1]}))
+        
+        copied["a"].append(2)
+        assert type(copied) is dict
+        assert copied == {"a": [1, 2]}
+
+
+class TestConfigSnapshots:
+    """Tests for snapshot publishing in ConfigManager."""
+    
+    def test_views_are_read_only(self, config_manager):
+        """Test view getters return the frozen snapshot without copying."""
+        general = config_manager.get_general_view()
+        
+        assert isinstance(general, FrozenDict)
+        assert config_manager.get_general_view() is general
+        with pytest.raises(TypeError):
+            general["timezone"] = "UTC"
+    
+    def test_getters_return_mutable_copies(self, config_manager):
+        """Test the copying getters can be mutated without affecting the config."""
+        general = config_manager.get_general()
+        general["timezone"] = "Changed/Zone"
+        
+        assert type(general) is dict
+        assert config_manager.get_general_view()["timezone"] != "Changed/Zone"
+    
+    def test_write_publishes_new_snapshot(self, config_manager):
+        """Test writes swap in a new snapshot and leave old ones unchanged."""
+        before = config_manager.snapshot()
+        old_timezone = before["general"]["timezone"]
+        
+        config_manager.set_general({"timezone": "Europe/Paris"})
+        
+        assert config_manager.snapshot() is not before
+        assert config_manager.get_general_view()["timezone"] == "Europe/Paris"
+        assert before["general"]["timezone"] == old_timezone
+    
+    def test_every_published_snapshot_bumps_version(self, config_manager, monkeypatch):
+        """Test reloads and failed saves still change the version with the snapshot."""
+        version = config_manager.version
+        config_manager.reload()
+        assert config_manager.version > version
+        
+        def fail(*args, **kwargs):
+            raise IOError("disk full")
+        
+        version = config_manager.version
+        monkeypatch.setattr("src.config_manager.get_writer", fail)
+        assert config_manager.set_general({"timezone": "Asia/Tokyo"}) is False
+        assert config_manager.get_general_view()["timezone"] == "Asia/Tokyo"
+        assert config_manager.version > version
+    
+    def test_feature_view_falls_back_to_defaults(self, config_manager):
+        """Test features missing from the file come from the defaults."""
+        view = config_manager.get_feature_view("weather")
+        
+        assert view is not None
+        assert "enabled" in view
+        assert config_manager.get_feature_view("no_such_feature") is None
+        assert config_manager.get_feature("no_such_feature") is None
@@ -4,6 +4,8 @@ import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import Mock, patch
 from src.api_server import app
+from src.board_frame import Frame
+from src.board_history import FrameHistory
 
 
 @pytest.fixture
@@ -199,6 +201,46 @@ class TestDebugCacheStatus:
             assert response.status_code == 400
 
 
+class TestDebugFrameHistory:
+    """Tests for /debug/frame-history endpoints."""
+    
+    @pytest.fixture
+    def history(self):
+        """Patch the service with a frame history holding one send."""
+        history = FrameHistory()
+        history.record(Frame.filled(63), label="page-1", strategy="column", tiles_changed=132, latency_ms=12.0)
+        with patch('src.api_server.get_service', return_value=Mock(frame_history=history)):
+            yield history
+    
+    def test_get_frame_history(self, client, history):
+        """Test records are listed with per-label stats."""
+        response = client.get("/debug/frame-history", params={"include_frames": True})
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert data["records"][0]["label"] == "page-1"
+        assert data["records"][0]["characters"] == [[63] * 22 for _ in range(6)]
+        assert data["stats"]["by_label"]["page-1"]["sends"] == 1
+    
+    def test_replay_frame(self, client, mock_board_client, history):
+        """Test replaying a frame re-sends it through the client."""
+        mock_board_client.history = history
+        mock_board_client.replay.return_value = (True, True)
+        
+        with patch('src.api_server.get_settings_service') as mock_settings:
+            mock_settings.return_value.should_send_to_board.return_value = True
+            response = client.post("/debug/frame-history/1/replay")
+        
+        assert response.status_code == 200
+        mock_board_client.replay.assert_called_once_with(1, strategy=None)
+    
+    def test_replay_unknown_frame(self, client, mock_board_client, history):
+        """Test replaying a record that doesn't exist returns 404."""
+        mock_board_client.history = history
+        response = client.post("/debug/frame-history/99/replay")
+        assert response.status_code == 404
+
+
 class TestDebugSystemInfo:
     """Tests for /debug/system-info endpoint."""
     
@@ -0,0 +1,111 @@
+"""Tests for the spatial index used by nearby stop/station searches."""
+
+import random
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from src import api_server
+from src.data_sources.geo_index import GeoGridIndex, haversine_km
+
+
+def _random_points(count, seed=1):
+    """Random points spread over San Francisco."""
+    rng = random.Random(seed)
+    return [
+        (37.70 + rng.random() * 0.12, -122.51 + rng.random() * 0.15, i)
+        for i in range(count)
+    ]
+
+
+class TestGeoGridIndex:
+    """Tests for GeoGridIndex."""
+    
+    def test_within_matches_full_scan(self):
+        """Test radius queries find exactly what measuring every point finds."""
+        points = _random_points(2000)
+        index = GeoGridIndex(points)
+        rng = random.Random(2)
+        
+        for _ in range(50):
+            lat = 37.68 + rng.random() * 0.16
+            lon = -122.53 + rng.random() * 0.19
+            radius = rng.random() * 2
+            expected = [i for p_lat, p_lon, i in points if haversine_km(lat, lon, p_lat, p_lon) <= radius]
+            
+            assert [i for _, i in index.within(lat, lon, radius)] == expected
+    
+    def test_nearest_matches_full_scan(self):
+        """Test k-nearest queries return the same points as sorting all of them."""
+        points = _random_points(2000)
+        index = GeoGridIndex(points)
+        rng = random.Random(3)
+        
+        for _ in range(50):
+            lat = 37.68 + rng.random() * 0.16
+            lon = -122.53 + rng.random() * 0.19
+            k = rng.randint(1, 15)
+            expected = sorted((haversine_km(lat, lon, p_lat, p_lon), i) for p_lat, p_lon, i in points)[:k]
+            
+            assert [i for _, i in index.nearest(lat, lon, k)] == [i for _, i in expected]
+    
+    def test_nearest_far_outside_data_area(self):
+        """Test a query far from every point is fast and still exact."""
+        points = _random_points(4000)
+        index = GeoGridIndex(points)
+        lat, lon = 40.7, -74.0  # New York
+        expected = sorted(points, key=lambda p: haversine_km(lat, lon, p[0], p[1]))[:5]
+        
+        with patch("src.data_sources.geo_index.haversine_km", wraps=haversine_km) as measure:
+            result = index.nearest(lat, lon, k=5)
+        
+        assert [i for _, i in result] == [i for _, _, i in expected]
+        assert measure.call_count < 1000
+        assert index.nearest(lat, lon, k=5, max_radius_km=100) == []
+    
+    def test_nearest_respects_max_radius(self):
+        """Test k-nearest queries stop at the optional radius."""
+        index = GeoGridIndex([(37.7749, -122.4194, "near"), (37.8049, -122.4194, "far")])
+        
+        assert [item for _, item in index.nearest(37.7749, -122.4194, 5, max_radius_km=1.0)] == ["near"]
+        assert [item for _, item in index.nearest(37.7749, -122.4194, 5)] == ["near", "far"]
+    
+    def test_skips_points_without_coordinates(self):
+        """Test entries missing a latitude or longitude aren't indexed."""
+        index = GeoGridIndex([(None, -122.4, "a"), (37.7, None, "b"), (37.7, -122.4, "c")])
+        
+        assert len(index) == 1
+        assert index.within(37.7, -122.4, 1.0) == [(0.0, "c")]
+    
+    def test_empty_index(self):
+        """Test queries on an empty index return nothing."""
+        index = GeoGridIndex([])
+        
+        assert index.within(37.7, -122.4, 10) == []
+        assert index.nearest(37.7, -122.4, 3) == []
+
+
+class TestNearbyMuniStops:
+    """Tests for /muni/stops/nearby."""
+    
+    def test_nearby_stops_sorted_and_limited(self):
+        """Test nearby stops come back nearest first, within radius and limit."""
+        catalog = {
+            "stops": [
+                {"stop_code": "1", "stop_id": "SF_1", "name": "A", "lat": 37.7760, "lon": -122.4194},
+                {"stop_code": "2", "stop_id": "SF_2", "name": "B", "lat": 37.7750, "lon": -122.4194},
+                {"stop_code": "3", "stop_id": "SF_3", "name": "C", "lat": None, "lon": None},
+                {"stop_code": "4", "stop_id": "SF_4", "name": "D", "lat": 37.8500, "lon": -122.4194},
+            ],
+            "total": 4,
+        }
+        
+        with patch.object(api_server, "list_all_muni_stops", return_value=catalog):
+            response = TestClient(api_server.app).get(
+                "/muni/stops/nearby", params={"lat": 37.7749, "lng": -122.4194, "radius": 1.0, "limit": 5}
+            )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert [stop["stop_code"] for stop in data["stops"]] == ["2", "1"]
+        assert data["stops"][0]["distance_km"] == 0.01
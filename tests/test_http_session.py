@@ -0,0 +1,83 @@
+"""Tests for the shared plugin HTTP session."""
+
+import threading
+import time
+
+import requests
+from unittest.mock import patch
+
+from src.plugins.base import PluginBase, PluginResult
+from src.plugins.http import HttpSession, get_http_session, reset_http_session
+
+
+class TestHttpSession:
+    """Tests for HttpSession."""
+    
+    def test_default_timeout_applied(self):
+        """Test requests without a timeout get the session default."""
+        session = HttpSession(timeout=7)
+        with patch.object(requests.Session, "request") as mock_request:
+            session.get("https://example.com")
+            session.get("https://example.com", timeout=3)
+        
+        assert mock_request.call_args_list[0].kwargs["timeout"] == 7
+        assert mock_request.call_args_list[1].kwargs["timeout"] == 3
+    
+    def test_adapters_pool_and_retry(self):
+        """Test http and https share a pooled adapter with retries."""
+        session = HttpSession(retries=3, pool_maxsize=5)
+        adapter = session.get_adapter("https://api.example.com")
+        
+        assert adapter is session.get_adapter("http://api.example.com")
+        assert adapter._pool_maxsize == 5
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+    
+    def test_concurrency_cap(self):
+        """Test no more than max_concurrent requests run at once."""
+        session = HttpSession(max_concurrent=2)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+        
+        def fake_request(*args, **kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+        
+        with patch.object(requests.Session, "request", side_effect=fake_request):
+            threads = [
+                threading.Thread(target=session.get, args=("https://example.com",))
+                for _ in range(6)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        assert peak == 2
+    
+    def test_singleton_shared_with_plugins(self):
+        """Test plugins receive the shared session via PluginBase.http."""
+        
+        class HttpPlugin(PluginBase):
+            @property
+            def plugin_id(self) -> str:
+                return "http_plugin"
+            
+            def fetch_data(self) -> PluginResult:
+                return PluginResult(available=True, data={})
+        
+        reset_http_session()
+        try:
+            session = get_http_session()
+            assert HttpPlugin({"id": "http_plugin"}).http is session
+            
+            reset_http_session()
+            assert get_http_session() is not session
+        finally:
+            reset_http_session()
@@ -304,3 +304,143 @@ class TestLogFilePersistence:
 
 
 
+
+
+class TestLogStore:
+    """Tests for the indexed log store behind /logs."""
+    
+    def _write(self, path, entries, mode='a'):
+        with open(path, mode) as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + '\n')
+    
+    def _entry(self, i, level="INFO", message=None):
+        return {
+            "timestamp": f"2025-12-25T10:00:{i:02d}",
+            "level": level,
+            "logger": "src.test",
+            "message": message or f"message {i}",
+        }
+    
+    def test_newest_first_pagination(self, test_log_dir):
+        """Test entries are returned newest first across pages."""
+        from src.log_store import LogStore
+        log_file = test_log_dir / "app.log"
+        self._write(log_file, [self._entry(i) for i in range(10)])
+        store = LogStore(log_file, 5)
+        
+        logs, total, has_more = store.query(limit=4, offset=0)
+        assert total == 10
+        assert has_more
+        assert [log["message"] for log in logs] == ["message 9", "message 8", "message 7", "message 6"]
+        
+        logs, _, has_more = store.query(limit=4, offset=8)
+        assert [log["message"] for log in logs] == ["message 1", "message 0"]
+        assert not has_more
+    
+    def test_incremental_append(self, test_log_dir):
+        """Test lines appended after the first query are picked up."""
+        from src.log_store import LogStore
+        log_file = test_log_dir / "app.log"
+        self._write(log_file, [self._entry(i) for i in range(3)])
+        store = LogStore(log_file, 5)
+        assert store.query()[1] == 3
+        
+        # A partial line is only indexed once it's complete
+        with open(log_file, 'a') as f:
+            f.write(json.dumps(self._entry(3))[:10])
+        assert store.query()[1] == 3
+        with open(log_file, 'a') as f:
+            f.write(json.dumps(self._entry(3))[10:] + '\n')
+        
+        logs, total, _ = store.query()
+        assert total == 4
+        assert logs[0]["message"] == "message 3"
+    
+    def test_rotation_keeps_order(self, test_log_dir):
+        """Test rotated backups are read after the current file."""
+        from src.log_store import LogStore
+        log_file = test_log_dir / "app.log"
+        self._write(log_file, [self._entry(i) for i in range(3)])
+        store = LogStore(log_file, 5)
+        store.query()
+        
+        os.rename(log_file, f"{log_file}.1")
+        self._write(log_file, [self._entry(i) for i in range(3, 5)], mode='w')
+        
+        logs, total, _ = store.query()
+        assert total == 5
+        assert [log["message"] for log in logs] == [f"message {i}" for i in range(4, -1, -1)]
+    
+    def test_truncated_file_is_reindexed(self, test_log_dir):
+        """Test a file that shrank is indexed from scratch."""
+        from src.log_store import LogStore
+        log_file = test_log_dir / "app.log"
+        self._write(log_file, [self._entry(i) for i in range(5)])
+        store = LogStore(log_file, 5)
+        store.query()
+        
+        self._write(log_file, [self._entry(7)], mode='w')
+        logs, total, _ = store.query()
+        assert total == 1
+        assert logs[0]["message"] == "message 7"
+    
+    def test_level_and_search_filters(self, test_log_dir):
+        """Test level and search filters with counts."""
+        from src.log_store import LogStore
+        log_file = test_log_dir / "app.log"
+        self._write(log_file, [
+            self._entry(0, "INFO", "Weather updated"),
+            self._entry(1, "ERROR", "Weather API failed"),
+            self._entry(2, "ERROR", "Board unreachable"),
+            self._entry(3, "INFO", 'Quoted "weather" value'),
+            self._entry(4, "INFO", "Temp 20°C"),
+        ])
+        store = LogStore(log_file, 5)
+        
+        assert store.query(level="error")[1] == 2
+        logs, total, _ = store.query(search="WEATHER")
+        assert total == 3
+        logs, total, _ = store.query(level="ERROR", search="weather")
+        assert total == 1
+        assert logs[0]["message"] == "Weather API failed"
+        # Needles that JSON escapes fall back to parsing each entry
+        assert store.query(search='"weather"')[1] == 1
+        assert store.query(search="20°c")[1] == 1
+        # Logger names are searched too
+        assert store.query(search="src.test")[1] == 5
+    
+    def test_search_scans_in_chunks(self, test_log_dir, monkeypatch):
+        """Test searches give the same results when the file is read in small chunks."""
+        from src import log_store
+        monkeypatch.setattr(log_store, "SEARCH_CHUNK_BYTES", 150)
+        log_file = test_log_dir / "app.log"
+        self._write(log_file, [
+            self._entry(i, "ERROR" if i % 3 == 0 else "INFO", f"weather {i}" if i % 2 else f"board {i}")
+            for i in range(30)
+        ])
+        store = log_store.LogStore(log_file, 5)
+        
+        logs, total, _ = store.query(limit=30, search="weather")
+        assert total == 15
+        assert [log["message"] for log in logs] == [f"weather {i}" for i in range(29, 0, -2)]
+        logs, total, _ = store.query(limit=30, level="ERROR", search="weather")
+        assert [log["message"] for log in logs] == ["weather 27", "weather 21", "weather 15", "weather 9", "weather 3"]
+        assert store.query(level="ERROR", search="20°c")[1] == 0
+        assert store.query(search="src.test")[1] == 30
+    
+    def test_recent_entries_are_deduplicated(self, test_log_dir):
+        """Test in-memory entries come first and aren't repeated from the files."""
+        from src.log_store import LogStore
+        log_file = test_log_dir / "app.log"
+        entries = [self._entry(i) for i in range(5)]
+        self._write(log_file, entries)
+        store = LogStore(log_file, 5)
+        
+        recent = entries[3:] + [self._entry(5)]
+        logs, total, _ = store.query(limit=10, recent=recent)
+        assert total == 6
+        assert [log["message"] for log in logs] == [f"message {i}" for i in range(5, -1, -1)]
+        
+        logs, total, _ = store.query(limit=2, offset=3, recent=recent)
+        assert [log["message"] for log in logs] == ["message 2", "message 1"]
@@ -183,6 +183,51 @@ class TestSettingsService:
         assert transition.strategy == "diagonal"
         assert transition.step_interval_ms == 1000
         assert output.target == "both"
+    
+    def test_init_reads_file_once(self, temp_settings_file):
+        """Test startup parses the settings file a single time."""
+        with patch("src.settings.service.read_json", return_value={"polling": {"interval_seconds": 30}}) as read:
+            service = SettingsService(settings_file=temp_settings_file)
+        
+        assert read.call_count == 1
+        assert service.get_polling_interval() == 30
+    
+    def test_snapshot_versioned_and_unchanged_by_updates(self, service):
+        """Test each change publishes a new snapshot and old ones stay as they were."""
+        before = service.get_snapshot()
+        
+        service.set_polling_interval(120)
+        after = service.get_snapshot()
+        
+        assert after.version == before.version + 1 == service.version
+        assert after.polling.interval_seconds == 120
+        assert before.polling.interval_seconds != 120
+        assert after.to_dict()["polling"] == {"interval_seconds": 120}
+    
+    def test_subscribers_notified(self, service):
+        """Test listeners get the previous and new snapshot until unsubscribed."""
+        changes = []
+        unsubscribe = service.subscribe(lambda previous, new: changes.append((previous, new)))
+        
+        service.set_schedule_enabled(True)
+        unsubscribe()
+        service.set_schedule_enabled(False)
+        
+        assert len(changes) == 1
+        previous, new = changes[0]
+        assert previous.schedule.enabled is False
+        assert new.schedule.enabled is True
+    
+    def test_failing_subscriber_does_not_block_update(self, service):
+        """Test a listener that raises doesn't break the change or other listeners."""
+        seen = []
+        service.subscribe(Mock(side_effect=RuntimeError("boom")))
+        service.subscribe(lambda previous, new: seen.append(new.output.target))
+        
+        service.set_output_target("ui")
+        
+        assert service.get_output_settings().target == "ui"
+        assert seen == ["ui"]
 
 
 class TestOutputAPIEndpoints:
@@ -1,5 +1,6 @@
 """Tests for pages module (models, storage, service, API)."""
 
+import json
 import pytest
 import tempfile
 import os
@@ -195,7 +196,34 @@ class TestPageStorage:
         
         assert retrieved is not None
         assert retrieved.name == "Persistent"
+    
+    def test_bulk_changes_write_file_once(self, temp_storage_file):
+        """Test a burst of changes is coalesced into a single file write."""
+        storage = PageStorage(storage_file=temp_storage_file)
+        storage._writer.debounce_seconds = 60
+        for i in range(5):
+            storage.create(Page(name=f"Page {i}", type="single", display_type="weather"))
+        
+        assert storage._writer.pending
+        assert storage._writer.flush() is True
+        assert storage._writer.writes == 1
+        
+        with open(temp_storage_file) as f:
+            assert len(json.load(f)["pages"]) == 5
 
+    
+    def test_debounced_write_saves_pages_as_of_save(self, temp_storage_file):
+        """Test a background write serializes the pages captured when _save() ran."""
+        storage = PageStorage(storage_file=temp_storage_file)
+        storage._writer.debounce_seconds = 60
+        page = storage.create(Page(name="Saved", type="single", display_type="weather"))
+        
+        # A change still in progress (not yet saved) isn't written
+        storage._pages["unsaved"] = page.model_copy(update={"id": "unsaved"})
+        storage._writer.flush()
+        
+        with open(temp_storage_file) as f:
+            assert [p["name"] for p in json.load(f)["pages"]] == ["Saved"]
 
 class TestPageService:
     """Tests for PageService."""
@@ -353,6 +381,22 @@ class TestPageService:
         assert result.available is True
         assert "Hello World" in result.formatted
     
+    def test_get_page_layout(self, service):
+        """Test layout analysis is cached for template pages only."""
+        page = service.create_page(PageCreate(
+            name="Template",
+            type="template",
+            template=["Hello World", "This line is way too long for board", "", "", "", ""]
+        ))
+        single = service.create_page(PageCreate(name="Weather", type="single", display_type="weather"))
+        
+        layout = service.get_page_layout(page.id)
+        assert layout.lines[0].max_width == 11
+        assert layout.overflow_lines == (2,)
+        assert service.get_page_layout(page.id) is layout
+        assert service.get_page_layout(single.id) is None
+        assert service.get_page_layout("missing") is None
+    
     @patch('src.pages.service.get_display_service')
     def test_preview_page_uses_cache(self, mock_get_display, service):
         """Test that preview_page uses cache on subsequent calls."""
@@ -437,10 +481,83 @@ class TestPageService:
         
         assert "cache_size" in stats
         assert "cached_pages" in stats
-        assert "ttl_seconds" in stats
+        assert "dependencies" in stats
         assert stats["cache_size"] == 0
         assert stats["cached_pages"] == []
     
+    @patch('src.pages.service.get_plugin_registry')
+    @patch('src.pages.service.get_display_service')
+    def test_plugin_data_update_invalidates_cache(self, mock_get_display, mock_get_registry, service):
+        """Test that a new plugin data version invalidates the cache, and nothing else does."""
+        mock_display_service = Mock()
+        mock_display_service.get_display.return_value = DisplayResult(
+            display_type="weather",
+            formatted="Sunny, 72F",
+            raw={"temp": 72},
+            available=True
+        )
+        mock_get_display.return_value = mock_display_service
+        registry = mock_get_registry.return_value
+        registry.get_data_versions.return_value = {"weather": 1}
+        
+        page = service.create_page(PageCreate(name="Weather", type="single", display_type="weather"))
+        
+        service.preview_page(page.id)
+        service.preview_page(page.id)
+        assert mock_display_service.get_display.call_count == 1
+        registry.get_data_versions.assert_called_with({"weather"}, fetch=False)
+        
+        # Plugin fetched new data
+        registry.get_data_versions.return_value = {"weather": 2}
+        service.preview_page(page.id)
+        service.preview_page(page.id)
+        assert mock_display_service.get_display.call_count == 2
+        assert service.get_cache_stats()["dependencies"][page.id] == {"weather": 2}
+    
+    @patch('src.pages.service.get_plugin_registry')
+    @patch('src.pages.service.get_display_service')
+    def test_uncached_plugin_always_renders(self, mock_get_display, mock_get_registry, service):
+        """Test that pages using plugins without a data cache are never served stale."""
+        mock_display_service = Mock()
+        mock_display_service.get_display.return_value = DisplayResult(
+            display_type="date_time",
+            formatted="12:00",
+            raw={},
+            available=True
+        )
+        mock_get_display.return_value = mock_display_service
+        mock_get_registry.return_value.get_data_versions.return_value = {"date_time": None}
+        
+        page = service.create_page(PageCreate(name="Clock", type="single", display_type="date_time"))
+        
+        service.preview_page(page.id)
+        service.preview_page(page.id)
+        assert mock_display_service.get_display.call_count == 2
+    
+    @patch('src.pages.service.get_config_manager')
+    @patch('src.pages.service.get_display_service')
+    def test_config_change_invalidates_cache(self, mock_get_display, mock_get_config, service):
+        """Test that a configuration change (e.g. color rules) invalidates the cache."""
+        mock_display_service = Mock()
+        mock_display_service.get_display.return_value = DisplayResult(
+            display_type="weather",
+            formatted="Sunny, 72F",
+            raw={"temp": 72},
+            available=True
+        )
+        mock_get_display.return_value = mock_display_service
+        mock_get_config.return_value.version = 1
+        
+        page = service.create_page(PageCreate(name="Weather", type="single", display_type="weather"))
+        
+        service.preview_page(page.id)
+        service.preview_page(page.id)
+        assert mock_display_service.get_display.call_count == 1
+        
+        mock_get_config.return_value.version = 2
+        service.preview_page(page.id)
+        assert mock_display_service.get_display.call_count == 2
+    
     @patch('src.pages.service.get_display_service')
     def test_cache_stats_after_preview(self, mock_get_display, service):
         """Test cache statistics after previewing pages."""
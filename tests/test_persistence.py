@@ -0,0 +1,92 @@
+"""Tests for atomic, debounced JSON persistence."""
+
+import json
+import stat
+
+import pytest
+
+from src import persistence
+from src.persistence import JsonFileWriter, get_writer, read_json, write_json_atomic
+
+
+class TestWriteJsonAtomic:
+    """Tests for write_json_atomic()."""
+    
+    def test_writes_and_leaves_no_temp_files(self, tmp_path):
+        """Test the target is written and the temporary file is renamed away."""
+        path = tmp_path / "data.json"
+        write_json_atomic(path, {"a": 1})
+        
+        assert json.loads(path.read_text()) == {"a": 1}
+        assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+    
+    def test_failed_write_keeps_old_file(self, tmp_path):
+        """Test a write that fails midway leaves the previous contents."""
+        path = tmp_path / "data.json"
+        write_json_atomic(path, {"a": 1})
+        
+        with pytest.raises(TypeError):
+            write_json_atomic(path, {"a": object()})
+        
+        assert json.loads(path.read_text()) == {"a": 1}
+        assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+    
+    def test_keeps_file_mode(self, tmp_path):
+        """Test rewrites keep the target's mode and new files get the umask default."""
+        path = tmp_path / "data.json"
+        write_json_atomic(path, {"a": 1})
+        assert stat.S_IMODE(path.stat().st_mode) == 0o666 & ~persistence._UMASK
+        
+        path.chmod(0o644)
+        write_json_atomic(path, {"a": 2})
+        assert stat.S_IMODE(path.stat().st_mode) == 0o644
+    
+    def test_compact_encoding(self, tmp_path):
+        """Test compact mode writes without whitespace."""
+        path = tmp_path / "data.json"
+        write_json_atomic(path, {"a": [1, 2]}, fsync=False, compact=True)
+        
+        assert path.read_text() == '{"a":[1,2]}'
+
+
+class TestJsonFileWriter:
+    """Tests for JsonFileWriter."""
+    
+    def test_synchronous_without_debounce(self, tmp_path):
+        """Test writes happen immediately when debouncing is off."""
+        writer = JsonFileWriter(tmp_path / "data.json")
+        writer.write({"a": 1})
+        
+        assert not writer.pending
+        assert writer.writes == 1
+        assert json.loads((tmp_path / "data.json").read_text()) == {"a": 1}
+    
+    def test_burst_is_coalesced(self, tmp_path):
+        """Test a burst of writes is serialized and written once."""
+        writer = JsonFileWriter(tmp_path / "data.json", debounce_seconds=60)
+        calls = []
+        
+        def build(value):
+            def serialize():
+                calls.append(value)
+                return {"value": value}
+            return serialize
+        
+        for value in range(10):
+            writer.write(build(value))
+        
+        assert writer.pending
+        assert not (tmp_path / "data.json").exists()
+        assert writer.flush() is True
+        assert calls == [9]
+        assert writer.writes == 1
+        assert writer.coalesced == 9
+        assert json.loads((tmp_path / "data.json").read_text()) == {"value": 9}
+        assert writer.flush() is False
+    
+    def test_read_json_flushes_pending_write(self, tmp_path):
+        """Test reading a file through read_json() sees a pending write."""
+        path = tmp_path / "data.json"
+        get_writer(path, debounce_seconds=60).write({"a": 2})
+        
+        assert read_json(path) == {"a": 2}
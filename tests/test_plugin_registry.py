@@ -0,0 +1,517 @@
+"""Tests for PluginRegistry data fetching."""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import patch
+
+from src.plugins.base import PluginBase, PluginResult
+from src.plugins.registry import PluginRegistry
+
+
+class FakePlugin(PluginBase):
+    """Plugin that returns canned data after an optional delay."""
+    
+    def __init__(self, plugin_id: str, delay: float = 0.0, data=None):
+        self._id = plugin_id
+        self.delay = delay
+        self.data = data if data is not None else {"value": plugin_id}
+        self.calls = 0
+        super().__init__({"id": plugin_id})
+    
+    @property
+    def plugin_id(self) -> str:
+        return self._id
+    
+    def fetch_data(self) -> PluginResult:
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        return PluginResult(available=True, data=dict(self.data))
+
+
+def make_registry(*plugins, workers=4, timeout=10.0, deadline=15.0):
+    """Create a registry with the given plugins enabled."""
+    registry = PluginRegistry()
+    for plugin in plugins:
+        registry._plugins[plugin.plugin_id] = plugin
+        registry._enabled[plugin.plugin_id] = True
+    registry._get_fetch_settings = lambda: (workers, timeout, deadline)
+    return registry
+
+
+class TestConcurrentFetch:
+    """Tests for concurrent plugin fetching."""
+    
+    def test_plugins_fetched_in_parallel(self):
+        """Test total latency is bounded by the slowest plugin, not the sum."""
+        plugins = [FakePlugin(f"p{i}", delay=0.2) for i in range(4)]
+        registry = make_registry(*plugins)
+        
+        start = time.monotonic()
+        context = registry.build_template_context()
+        elapsed = time.monotonic() - start
+        
+        assert set(context) == {"p0", "p1", "p2", "p3"}
+        assert elapsed < 0.6
+    
+    def test_slow_plugin_omitted_after_timeout(self):
+        """Test a plugin missing its deadline doesn't stall the others."""
+        fast = FakePlugin("fast")
+        slow = FakePlugin("slow", delay=1.0)
+        registry = make_registry(fast, slow, timeout=0.1)
+        
+        start = time.monotonic()
+        context = registry.build_template_context()
+        
+        assert time.monotonic() - start < 0.5
+        assert context == {"fast": {"value": "fast"}}
+    
+    def test_slow_plugin_uses_last_good_data(self):
+        """Test a timed-out plugin falls back to its last good result."""
+        plugin = FakePlugin("slow")
+        registry = make_registry(plugin, timeout=0.1)
+        assert registry.build_template_context() == {"slow": {"value": "slow"}}
+        
+        plugin.delay = 1.0
+        plugin.data = {"value": "new"}
+        results = registry.fetch_plugins_concurrently(["slow"])
+        
+        assert results["slow"].data == {"value": "slow"}
+    
+    def test_last_good_data_dropped_after_config_change(self):
+        """Test the fallback isn't served once the plugin's cache was cleared."""
+        plugin = FakePlugin("slow")
+        registry = make_registry(plugin, timeout=0.1)
+        registry.build_template_context()
+        
+        plugin.delay = 1.0
+        plugin.config = {"units": "metric"}  # Clears the plugin's cache
+        results = registry.fetch_plugins_concurrently(["slow"])
+        
+        assert not results["slow"].available
+        assert "slow" not in registry._last_good
+    
+    def test_last_good_data_is_prepared_on_fallback(self):
+        """Test the fallback is the raw result passed through prepare_result()."""
+        plugin = FakePlugin("slow")
+        plugin.prepare_result = lambda result: PluginResult(
+            available=True, data={**result.data, "prepared": True}
+        )
+        registry = make_registry(plugin, timeout=0.1)
+        registry.fetch_plugins_concurrently(["slow"])
+        
+        plugin.delay = 1.0
+        results = registry.fetch_plugins_concurrently(["slow"])
+        
+        assert results["slow"].data == {"value": "slow", "prepared": True}
+        assert registry._last_good["slow"][1].data == {"value": "slow"}
+    
+    def test_clear_cache_and_disable_drop_last_good_data(self):
+        """Test registry cache clears and disabling forget the fallback."""
+        plugin = FakePlugin("p")
+        registry = make_registry(plugin)
+        registry.fetch_plugins_concurrently(["p"])
+        assert "p" in registry._last_good
+        
+        registry.clear_cache("p")
+        assert "p" not in registry._last_good
+        
+        registry.fetch_plugins_concurrently(["p"])
+        registry.disable_plugin("p")
+        assert "p" not in registry._last_good
+    
+    def test_render_deadline_bounds_total_wait(self):
+        """Test the overall deadline caps waiting even for queued plugins."""
+        plugins = [FakePlugin(f"p{i}", delay=0.5) for i in range(3)]
+        registry = make_registry(*plugins, workers=2, deadline=0.2)
+        
+        start = time.monotonic()
+        results = registry.fetch_plugins_concurrently(["p0", "p1", "p2"])
+        
+        assert time.monotonic() - start < 0.45
+        assert all(not result.available for result in results.values())
+    
+    def test_inflight_fetch_is_reused(self):
+        """Test a still-running fetch is joined instead of started again."""
+        plugin = FakePlugin("slow", delay=0.3)
+        registry = make_registry(plugin, timeout=0.05)
+        
+        registry.fetch_plugins_concurrently(["slow"])
+        registry.fetch_plugins_concurrently(["slow"])
+        time.sleep(0.4)
+        
+        assert plugin.calls == 1
+    
+    def test_sequential_mode(self):
+        """Test workers <= 1 fetches plugins in the calling thread."""
+        seen_threads = []
+        plugin = FakePlugin("p")
+        original = plugin.fetch_data
+        
+        def fetch():
+            seen_threads.append(threading.current_thread())
+            return original()
+        
+        plugin.fetch_data = fetch
+        registry = make_registry(plugin, workers=1)
+        
+        assert registry.build_template_context() == {"p": {"value": "p"}}
+        assert seen_threads == [threading.current_thread()]
+    
+    def test_disabled_plugins_are_not_fetched(self):
+        """Test only enabled plugins contribute to the context."""
+        enabled = FakePlugin("on")
+        disabled = FakePlugin("off")
+        registry = make_registry(enabled, disabled)
+        registry._enabled["off"] = False
+        
+        assert registry.build_template_context() == {"on": {"value": "on"}}
+        assert disabled.calls == 0
+
+
+class FlakyPlugin(FakePlugin):
+    """Plugin whose fetch can be switched to fail."""
+    
+    def __init__(self, plugin_id: str, **kwargs):
+        super().__init__(plugin_id, **kwargs)
+        self.fail = False
+    
+    def fetch_data(self) -> PluginResult:
+        if self.fail:
+            self.calls += 1
+            return PluginResult(available=False, error="upstream down")
+        return super().fetch_data()
+
+
+class TestResultCache:
+    """Tests for the PluginBase TTL result cache."""
+    
+    def make_plugin(self, refresh_seconds=None, manifest_default=None):
+        plugin = FlakyPlugin("cached")
+        if manifest_default is not None:
+            plugin._manifest["settings_schema"] = {
+                "properties": {"refresh_seconds": {"default": manifest_default}}
+            }
+        if refresh_seconds is not None:
+            plugin._config = {"refresh_seconds": refresh_seconds}
+        return plugin
+    
+    def expire(self, plugin, seconds):
+        """Age the cached entry by the given number of seconds."""
+        plugin.cached_result.fetched_at -= seconds
+    
+    def test_ttl_from_config_then_manifest(self):
+        """Test refresh_seconds comes from config, falling back to the manifest."""
+        assert self.make_plugin().get_refresh_seconds() is None
+        assert self.make_plugin(manifest_default=300).get_refresh_seconds() == 300
+        assert self.make_plugin(refresh_seconds=60, manifest_default=300).get_refresh_seconds() == 60
+    
+    def test_uncached_without_refresh_seconds(self):
+        """Test plugins without a TTL fetch every time."""
+        plugin = self.make_plugin()
+        plugin.fetch_data_cached()
+        plugin.fetch_data_cached()
+        assert plugin.calls == 2
+    
+    def test_fresh_hit(self):
+        """Test results are reused within the TTL."""
+        plugin = self.make_plugin(refresh_seconds=60)
+        first = plugin.fetch_data_cached()
+        second = plugin.fetch_data_cached()
+        
+        assert first is second
+        assert plugin.calls == 1
+        stats = plugin.get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+    
+    def test_stale_while_revalidate(self):
+        """Test expired results are served while refreshing in the background."""
+        plugin = self.make_plugin(refresh_seconds=60)
+        plugin.fetch_data_cached()
+        plugin.data = {"value": "new"}
+        self.expire(plugin, 61)
+        
+        stale = plugin.fetch_data_cached()
+        assert stale.data == {"value": "cached"}
+        
+        deadline = time.monotonic() + 2
+        while plugin.cached_result.result.data != {"value": "new"}:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert plugin.get_cache_stats()["stale_hits"] == 1
+    
+    def test_failed_revalidation_keeps_stale_result(self):
+        """Test a failed background refresh doesn't replace a servable result."""
+        plugin = self.make_plugin(refresh_seconds=60)
+        good = plugin.fetch_data_cached()
+        plugin.fail = True
+        self.expire(plugin, 61)
+        
+        assert plugin.refresh_cache().available is False
+        assert plugin.cached_result.result is good
+        assert plugin.fetch_data_cached() is good
+        assert plugin.get_cache_stats()["errors"] == 1
+        # The failed refresh isn't retried on every read
+        time.sleep(0.05)
+        assert plugin.calls == 2
+        
+        # Past the stale window the failure is cached as usual
+        self.expire(plugin, 60)
+        assert plugin.fetch_data_cached().error == "upstream down"
+    
+    def test_too_stale_fetches_synchronously(self):
+        """Test results past the stale window block on a fresh fetch."""
+        plugin = self.make_plugin(refresh_seconds=60)
+        plugin.fetch_data_cached()
+        plugin.data = {"value": "new"}
+        self.expire(plugin, 500)
+        
+        assert plugin.fetch_data_cached().data == {"value": "new"}
+    
+    def test_stale_serving_opt_out(self):
+        """Test plugins with SERVE_STALE = False fetch as soon as the TTL expires."""
+        plugin = self.make_plugin(refresh_seconds=60)
+        plugin.SERVE_STALE = False
+        plugin.fetch_data_cached()
+        plugin.data = {"value": "new"}
+        self.expire(plugin, 61)
+        
+        assert plugin.fetch_data_cached().data == {"value": "new"}
+        assert plugin.get_cache_stats()["stale_hits"] == 0
+    
+    def test_prepare_result_runs_on_every_read(self):
+        """Test time-relative fields are derived on cache hits too."""
+        plugin = self.make_plugin(refresh_seconds=60)
+        reads = []
+        
+        def prepare(result):
+            reads.append(result)
+            return PluginResult(available=True, data={**result.data, "read": len(reads)})
+        
+        plugin.prepare_result = prepare
+        assert plugin.fetch_data_cached().data["read"] == 1
+        assert plugin.fetch_data_cached().data["read"] == 2
+        assert plugin.calls == 1
+        assert plugin.cached_result.result.data == {"value": "cached"}
+    
+    def test_time_relative_plugins_have_no_data_version(self):
+        """Test previews of time-relative plugins are never reused."""
+        plugin = self.make_plugin(refresh_seconds=60)
+        plugin.TIME_RELATIVE = True
+        registry = make_registry(plugin)
+        
+        assert registry.get_data_versions(["cached"]) == {"cached": None}
+    
+    def test_negative_caching(self):
+        """Test failed fetches are cached briefly."""
+        plugin = self.make_plugin(refresh_seconds=300)
+        plugin.fail = True
+        plugin.fetch_data_cached()
+        result = plugin.fetch_data_cached()
+        
+        assert not result.available
+        assert plugin.calls == 1
+        assert plugin.get_cache_stats()["negative_hits"] == 1
+        
+        self.expire(plugin, 31)
+        plugin.fetch_data_cached()
+        assert plugin.calls == 2
+    
+    def test_config_change_clears_cache(self):
+        """Test updating the config forces a fresh fetch."""
+        plugin = self.make_plugin(refresh_seconds=60)
+        plugin.fetch_data_cached()
+        plugin.config = {"refresh_seconds": 60, "location": "elsewhere"}
+        plugin.fetch_data_cached()
+        
+        assert plugin.calls == 2
+    
+    def test_concurrent_misses_share_one_fetch(self):
+        """Test simultaneous cache misses wait for a single fetch_data() call."""
+        plugin = self.make_plugin(refresh_seconds=60)
+        plugin.delay = 0.2
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(plugin.fetch_data_cached()))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert plugin.calls == 1
+        assert len(results) == 5
+        assert all(result.data == {"value": "cached"} for result in results)
+    
+    def test_clear_during_fetch_discards_result(self):
+        """Test a fetch started before a config change doesn't fill the cache."""
+        plugin = self.make_plugin(refresh_seconds=60)
+        plugin.delay = 0.2
+        thread = threading.Thread(target=plugin.fetch_data_cached)
+        thread.start()
+        time.sleep(0.05)
+        
+        plugin.config = {"refresh_seconds": 60, "location": "elsewhere"}
+        thread.join()
+        assert plugin.cached_result is None
+        
+        # A fetch after the change starts afresh rather than joining the old one
+        plugin.delay = 0
+        plugin.data = {"value": "new"}
+        assert plugin.fetch_data_cached().data == {"value": "new"}
+        assert plugin.calls == 2
+    
+    def test_registry_uses_cache(self):
+        """Test registry fetches share one upstream call per TTL window."""
+        plugin = self.make_plugin(refresh_seconds=60)
+        registry = make_registry(plugin)
+        
+        registry.build_template_context()
+        registry.build_template_context()
+        
+        assert plugin.calls == 1
+        assert registry.get_cache_stats()["cached"]["hits"] == 1
+
+
+class TestPrefetcher:
+    """Tests for background plugin prefetching."""
+    
+    def make_prefetcher(self, *plugins):
+        from src.plugins.prefetch import PluginPrefetcher
+        return PluginPrefetcher(make_registry(*plugins))
+    
+    def make_plugin(self, plugin_id="p", refresh_seconds=60):
+        plugin = FlakyPlugin(plugin_id)
+        if refresh_seconds is not None:
+            plugin._config = {"refresh_seconds": refresh_seconds}
+        return plugin
+    
+    def test_cold_plugins_fetched_then_scheduled(self):
+        """Test due plugins are refreshed and rescheduled before their TTL expires."""
+        plugin = self.make_plugin(refresh_seconds=100)
+        prefetcher = self.make_prefetcher(plugin)
+        
+        prefetcher.run_pending()
+        
+        assert plugin.calls == 1
+        assert plugin.cached_result.result.available
+        next_in = prefetcher.get_status()["plugins"]["p"]["next_refresh_in_seconds"]
+        assert 65 <= next_in <= 95
+        
+        prefetcher.run_pending()
+        assert plugin.calls == 1
+    
+    def test_render_reads_warm_cache(self):
+        """Test renders after a prefetch don't call the data source."""
+        plugin = self.make_plugin()
+        registry = make_registry(plugin)
+        from src.plugins.prefetch import PluginPrefetcher
+        PluginPrefetcher(registry).run_pending()
+        
+        assert registry.build_template_context() == {"p": {"value": "p"}}
+        assert plugin.calls == 1
+    
+    def test_uncached_plugins_skipped(self):
+        """Test plugins without a TTL are left to render time."""
+        plugin = self.make_plugin(refresh_seconds=None)
+        prefetcher = self.make_prefetcher(plugin)
+        
+        prefetcher.run_pending()
+        
+        assert plugin.calls == 0
+    
+    def test_failures_back_off(self):
+        """Test consecutive failures increase the retry delay."""
+        plugin = self.make_plugin()
+        plugin.fail = True
+        prefetcher = self.make_prefetcher(plugin)
+        
+        delays = []
+        for _ in range(3):
+            prefetcher._next_due["p"] = 0
+            prefetcher.run_pending()
+            delays.append(prefetcher.get_status()["plugins"]["p"]["next_refresh_in_seconds"])
+        
+        assert delays[0] < delays[1] < delays[2]
+        assert prefetcher.get_status()["plugins"]["p"]["consecutive_failures"] == 3
+        
+        plugin.fail = False
+        prefetcher._next_due["p"] = 0
+        prefetcher.run_pending()
+        assert prefetcher.get_status()["plugins"]["p"]["consecutive_failures"] == 0
+    
+    def test_cleared_cache_refetched_immediately(self):
+        """Test a config change (which clears the cache) triggers a refresh."""
+        plugin = self.make_plugin()
+        prefetcher = self.make_prefetcher(plugin)
+        prefetcher.run_pending()
+        
+        plugin.config = {"refresh_seconds": 60, "location": "elsewhere"}
+        prefetcher.run_pending()
+        
+        assert plugin.calls == 2
+    
+    def test_background_thread(self):
+        """Test the started prefetcher warms caches on its own."""
+        plugin = self.make_plugin()
+        prefetcher = self.make_prefetcher(plugin)
+        prefetcher.start()
+        try:
+            deadline = time.monotonic() + 2
+            while plugin.cached_result is None:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+            assert prefetcher.get_status()["running"]
+        finally:
+            prefetcher.stop()
+        assert not prefetcher.running
+
+
+class TestDataVersions:
+    """Tests for PluginRegistry.get_data_versions."""
+    
+    def test_versions_track_fetches(self):
+        """Test versions only change when the plugin fetches new data."""
+        plugin = FlakyPlugin("cached")
+        plugin._config = {"refresh_seconds": 60}
+        registry = make_registry(plugin)
+        
+        first = registry.get_data_versions(["cached"])
+        assert first == registry.get_data_versions(["cached"])
+        assert plugin.calls == 1
+        
+        plugin.cached_result.fetched_at -= 500  # Past the stale window
+        assert registry.get_data_versions(["cached"])["cached"] > first["cached"]
+    
+    def test_cached_versions_never_fetch(self):
+        """Test fetch=False reads the cache only and reports expired data as None."""
+        plugin = FlakyPlugin("cached")
+        plugin._config = {"refresh_seconds": 60}
+        registry = make_registry(plugin)
+        
+        assert registry.get_data_versions(["cached"], fetch=False) == {"cached": None}
+        assert plugin.calls == 0
+        
+        fetched = registry.get_data_versions(["cached"])
+        assert registry.get_data_versions(["cached"], fetch=False) == fetched
+        
+        plugin.cached_result.fetched_at -= 500
+        assert registry.get_data_versions(["cached"], fetch=False) == {"cached": None}
+        assert plugin.calls == 1
+    
+    def test_disabled_and_uncached_plugins(self):
+        """Test disabled plugins are stable and uncached plugins always change."""
+        cached = FlakyPlugin("off")
+        uncached = FlakyPlugin("clock")
+        registry = make_registry(cached, uncached)
+        registry._enabled["off"] = False
+        
+        versions = registry.get_data_versions(["off", "clock", "missing"])
+        
+        assert versions == {"off": 0, "clock": None, "missing": 0}
+        assert cached.calls == 0
+        assert uncached.calls == 0
@@ -9,6 +9,7 @@ from src.templates.engine import (
     SYMBOL_CHARS,
     TemplateError,
 )
+from src.templates.color_rules import ColorRuleEvaluator
 from src.displays.service import DisplayResult
 
 
@@ -81,6 +82,39 @@ class TestVariableSubstitution:
         context = {"weather": {"temperature": 72.0}}
         result = engine.render("{{weather.temperature}}", context)
         assert result == "72"  # No decimal for whole numbers
+    
+    def test_list_access(self, engine):
+        """Test index and bracket access into lists."""
+        context = {"baywheels": {"stations": [{"name": "A"}, {"name": "B"}]}}
+        assert engine.render("{{baywheels.stations.1.name}}", context) == "B"
+        assert engine.render("{{baywheels.stations[0].name}}", context) == "???"  # Dict key, not a list index
+        assert engine.render("{{baywheels.stations.5.name}}", context) == "???"
+        assert engine.render("{{baywheels.stations.x.name}}", context) == "???"
+    
+    def test_home_assistant_entity_lookup(self, engine):
+        """Test HA entity IDs are matched across domains with underscores."""
+        context = {"home_assistant": {
+            "media_player.living_room": {"state": "playing", "attributes": {"volume": 0.5}},
+            "sensor.temp": {"state": "21", "unit": "C"},
+        }}
+        assert engine.render("{{home_assistant.media_player_living_room.state}}", context) == "playing"
+        assert engine.render("{{home_assistant.media_player_living_room.volume}}", context) == "0.5"
+        assert engine.render("{{home_assistant.sensor_temp.unit}}", context) == "C"
+        assert engine.render("{{home_assistant.sensor_humidity.state}}", context) == "???"
+    
+    def test_accessors_compiled_once(self, engine):
+        """Test compiled slots carry a pre-resolved accessor."""
+        compiled = engine.compile_template(["{{home_assistant.binary_sensor_door_open.state}}"])
+        slot = compiled.lines[0].body.segments[0]
+        
+        assert slot.accessor.kind == "ha"
+        assert slot.accessor.entity_ids == (
+            "binary.sensor_door_open", "binary_sensor.door_open", "binary_sensor_door.open",
+        )
+        with patch.object(engine, "_compile_accessor") as mock_compile:
+            context = {"home_assistant": {"binary_sensor.door_open": {"state": "off"}}}
+            assert engine.render_compiled(compiled, context).split("\n")[0].strip() == "off"
+            mock_compile.assert_not_called()
 
 
 class TestFilters:
@@ -133,6 +167,53 @@ class TestColors:
         assert "Text" in result
 
 
+class TestColorRules:
+    """Tests for compiled color rule evaluation."""
+    
+    RULES = [
+        {"condition": ">=", "value": 90, "color": "red"},
+        {"condition": "<", "value": "50", "color": "blue"},
+        {"condition": "==", "value": "Offline", "color": "violet"},
+        {"condition": ">", "value": "n/a", "color": "green"},
+    ]
+    
+    @pytest.fixture
+    def engine(self):
+        engine = TemplateEngine()
+        engine._config_manager = Mock(version=1)
+        engine._config_manager.get_color_rules.side_effect = (
+            lambda plugin_id, field: self.RULES if (plugin_id, field) == ("sensor", "reading") else []
+        )
+        return engine
+    
+    def test_evaluator(self):
+        """Test rules match in order, numerically or as case-insensitive strings."""
+        rules = ColorRuleEvaluator(self.RULES, COLOR_CODES)
+        assert rules.color_code(95) == COLOR_CODES["red"]
+        assert rules.color_code("12.5") == COLOR_CODES["blue"]
+        assert rules.color_code("offline") == COLOR_CODES["violet"]
+        assert rules.color_code(70) is None
+        assert ColorRuleEvaluator([{"condition": "==", "value": 1, "color": "nope"}], COLOR_CODES).color_code(1) is None
+    
+    def test_rules_compiled_once(self, engine):
+        """Test rendering doesn't re-read color rules from the config."""
+        for reading in (95, 40, 95):
+            result = engine.render("{{sensor.reading}} {{sensor.reading_color}}", {"sensor": {"reading": reading}})
+        
+        assert result == "{63} 95 {63}"
+        assert engine._config_manager.get_color_rules.call_count == 1
+    
+    def test_rules_recompiled_on_config_change(self, engine):
+        """Test a config change invalidates compiled rules."""
+        context = {"sensor": {"reading": 95}}
+        assert engine.render("{{sensor.reading}}", context) == "{63} 95"
+        
+        engine._config_manager.get_color_rules.side_effect = lambda plugin_id, field: []
+        assert engine.render("{{sensor.reading}}", context) == "{63} 95"
+        engine._config_manager.version = 2
+        assert engine.render("{{sensor.reading}}", context) == "95"
+
+
 class TestSymbols:
     """Tests for symbol shortcuts."""
     
@@ -191,6 +272,64 @@ class TestValidation:
         assert any("too long" in e.message.lower() for e in errors)
 
 
+class TestLayoutAnalysis:
+    """Tests for cached variable widths and page layout analysis."""
+    
+    @pytest.fixture
+    def engine(self):
+        engine = TemplateEngine()
+        engine._plugin_registry = Mock(manifest_version=1, plugins={"weather": Mock()})
+        engine._plugin_registry.get_all_max_lengths.return_value = {"weather.temperature": 4, "weather.condition": 30}
+        engine._plugin_registry.get_manifest.return_value = None
+        engine._config_manager = Mock(version=1)
+        engine._config_manager.get_color_rules.side_effect = (
+            lambda plugin_id, field: [{"color": "red"}] if field == "temperature" else []
+        )
+        return engine
+    
+    def test_max_lengths_built_once(self, engine):
+        """Test validating repeatedly doesn't rebuild the max length map."""
+        for _ in range(3):
+            assert engine.validate_template("{{weather.temperature}}\n{{weather.temperature}} F") == []
+        
+        assert engine._plugin_registry.get_all_max_lengths.call_count == 1
+        assert engine._config_manager.get_color_rules.call_count == 1
+        assert engine._calculate_max_line_length("{{weather.temperature}} F") == 8  # 2 (color) + 4 + 2
+    
+    def test_index_rebuilt_on_plugin_or_config_change(self, engine):
+        """Test a manifest or config change invalidates cached widths."""
+        engine._calculate_max_line_length("{{weather.temperature}}")
+        engine._plugin_registry.get_all_max_lengths.return_value = {"weather.temperature": 20}
+        engine._plugin_registry.manifest_version = 2
+        assert engine._calculate_max_line_length("{{weather.temperature}}") == 22
+        
+        engine._config_manager.get_color_rules.side_effect = lambda plugin_id, field: []
+        engine._config_manager.version = 2
+        assert engine._calculate_max_line_length("{{weather.temperature}}") == 20
+    
+    def test_analyze_layout(self, engine):
+        """Test per-line widths, wrapping and overflow are reported."""
+        layout = engine.analyze_layout([
+            "{center}{{weather.temperature}}",
+            "Now: {{weather.condition}}",
+            "{{weather.condition|wrap}}",
+        ])
+        
+        assert layout.lines[0].max_width == 6
+        assert not layout.lines[0].overflow
+        assert layout.lines[1].overflow
+        assert layout.lines[2].wrap
+        assert layout.lines[2].wrap_lines == 2
+        assert layout.overflow_lines == (2,)
+        assert layout.wrapped_lines == (3,)
+    
+    def test_analyze_layout_cached_per_page(self, engine):
+        """Test the layout is reused until the page version changes."""
+        first = engine.analyze_layout(["{{weather.temperature}}"], cache_key="page-1", version=1)
+        assert engine.analyze_layout(["{{weather.temperature}}"], cache_key="page-1", version=1) is first
+        assert engine.analyze_layout(["{{weather.condition}}"], cache_key="page-1", version=2) is not first
+
+
 class TestRenderLines:
     """Tests for render_lines method (template pages)."""
     
@@ -256,6 +395,21 @@ class TestRenderLines:
         assert "Line 6" in output_lines[5]  # Last line should be Line 6, not Line 9
 
 
+    def test_render_compiled_tiles_matches_text(self, engine):
+        """Test the tile render gives the same text and board array as the string path."""
+        from src.text_to_board import text_to_board_array
+        
+        lines = ["{center}{{red}} HI {{green}}", "{right}{{test.value}}", "", "{{fill_space_repeat:-}}"]
+        context = {"test": {"value": "42"}}
+        compiled = engine.compile_template(lines)
+        
+        tiles = engine.render_compiled_tiles(compiled, context)
+        text = engine.render_compiled(compiled, context)
+        
+        assert tiles.text == text
+        assert tiles.to_board_array() == text_to_board_array(text)
+
+
 class TestAvailableVariables:
     """Tests for available variables listing via plugin system."""
     
@@ -630,3 +784,135 @@ class TestColorWrapping:
             close_count = line.count("}")
             assert open_count == close_count, f"Line has mismatched braces: {line}"
 
+
+
+class TestReferencedPlugins:
+    """Tests for dependency-aware context building."""
+    
+    @pytest.fixture
+    def engine(self):
+        return TemplateEngine()
+    
+    def test_extracts_plugin_ids(self, engine):
+        """Test plugin namespaces are extracted from variables."""
+        lines = [
+            "{center}{{date_time.time}}",
+            "{{weather.temperature|pad:3}} {{weather.temperature_color}}",
+            "{{home_assistant.sensor_temp.state}}",
+        ]
+        assert engine.get_referenced_plugins(lines) == {"date_time", "weather", "home_assistant"}
+    
+    def test_ignores_colors_and_fill_space(self, engine):
+        """Test color tiles and fill_space markers are not plugin references."""
+        lines = ["{{red}}{{63}} A{{fill_space}}B{{fill_space_repeat:-}}", "{sun} plain"]
+        assert engine.get_referenced_plugins(lines) == set()
+    
+    def test_render_lines_only_fetches_referenced_plugins(self, engine):
+        """Test render_lines builds a context with only the referenced plugins."""
+        registry = Mock()
+        registry.build_template_context.return_value = {"date_time": {"time": "10:30"}}
+        engine._plugin_registry = registry
+        
+        result = engine.render_lines(["{{date_time.time}}"])
+        
+        registry.build_template_context.assert_called_once_with({"date_time"})
+        assert result.split('\n')[0].startswith("10:30")
+    
+    def test_static_template_skips_fetching(self, engine):
+        """Test a template with no variables doesn't fetch any plugin data."""
+        registry = Mock()
+        engine._plugin_registry = registry
+        
+        engine.render_lines(["Hello", "{{red}} World"])
+        
+        registry.build_template_context.assert_not_called()
+    
+    def test_registry_filters_plugin_ids(self):
+        """Test build_template_context only fetches the requested plugins."""
+        from src.plugins.base import PluginResult
+        from src.plugins.registry import PluginRegistry
+        
+        registry = PluginRegistry()
+        for plugin_id in ("weather", "date_time", "stocks"):
+            registry._plugins[plugin_id] = Mock()
+            registry._enabled[plugin_id] = True
+        registry._enabled["stocks"] = False
+        
+        with patch.object(
+            registry, "fetch_plugin_data", return_value=PluginResult(available=True, data={"x": 1})
+        ) as mock_fetch:
+            context = registry.build_template_context({"date_time", "stocks", "unknown"})
+        
+        mock_fetch.assert_called_once_with("date_time")
+        assert context == {"date_time": {"x": 1}}
+
+
+class TestCompiledTemplates:
+    """Tests for compiled template caching."""
+    
+    @pytest.fixture
+    def engine(self):
+        return TemplateEngine()
+    
+    def test_compile_structure(self, engine):
+        """Test compiled lines capture alignment, wrap, slots and fill_space."""
+        compiled = engine.compile_template([
+            "{center}Hi {{weather.temperature|pad:3}}{sun}",
+            "{wrap}{{weather.description}}",
+            "",
+            "A{{fill_space}}B",
+        ])
+        
+        assert len(compiled.lines) == 6
+        first = compiled.lines[0]
+        assert first.alignment == "center"
+        assert not first.wrap
+        slot = first.body.segments[1]
+        assert slot.var_part == "weather.temperature"
+        assert slot.filter_op == ("pad", 3)
+        assert first.body.segments[2] == SYMBOL_CHARS["sun"]
+        
+        second = compiled.lines[1]
+        assert second.wrap
+        assert second.wrap_capacity == 2  # Itself plus one empty line below
+        
+        assert compiled.lines[3].has_fill_space
+        assert compiled.plugin_ids == frozenset({"weather"})
+    
+    def test_render_compiled_matches_render_lines(self, engine):
+        """Test compiled rendering produces the same output as render_lines."""
+        lines = [
+            "{center}{{red}} {{test.name}} {{red}}",
+            "{{test.desc|wrap}}",
+            "",
+            "{right}{{test.count|pad:4}}",
+            "L{{fill_space_repeat:-}}R",
+        ]
+        context = {"test": {"name": "Board", "desc": "a long description that wraps around", "count": 5}}
+        
+        compiled = engine.compile_template(lines)
+        assert engine.render_compiled(compiled, context) == engine.render_lines(lines, context)
+    
+    def test_cache_reused_until_version_changes(self, engine):
+        """Test compiled templates are cached by key and version."""
+        from datetime import datetime
+        
+        v1 = datetime(2024, 1, 1)
+        first = engine.compile_template(["{{test.a}}"], cache_key="page-1", version=v1)
+        assert engine.compile_template(["{{test.a}}"], cache_key="page-1", version=v1) is first
+        
+        v2 = datetime(2024, 1, 2)
+        second = engine.compile_template(["{{test.b}}"], cache_key="page-1", version=v2)
+        assert second is not first
+        assert engine.render_compiled(second, {"test": {"b": "B"}}).startswith("B")
+    
+    def test_invalidate_compiled(self, engine):
+        """Test invalidating a cached compiled template."""
+        first = engine.compile_template(["X"], cache_key="page-1")
+        engine.invalidate_compiled("page-1")
+        assert engine.compile_template(["X"], cache_key="page-1") is not first
+    
+    def test_symbol_completed_by_value(self, engine):
+        """Test symbols split across a literal and a value are still substituted."""
+        result = engine.render_lines(["{su{{test.s}}"], {"test": {"s": "n}"}})
+        assert result.split('\n')[0].startswith(SYMBOL_CHARS["sun"])
@@ -0,0 +1,89 @@
+"""Tests for the shared tile tokenizer."""
+
+import pytest
+
+from src.board_chars import BoardChars
+from src.templates.engine import TemplateEngine
+from src.text_to_board import text_to_board_array
+from src.tiles import TileGrid, align_tiles, count_tiles, tokenize, tokens_to_codes, truncate_tiles
+
+
+class TestTokenize:
+    """Tests for tokenize and tile counting."""
+    
+    def test_plain_text(self):
+        """Test plain text is one token per character."""
+        assert tokenize("AB C") == ["A", "B", " ", "C"]
+    
+    def test_color_markers_and_end_tags(self):
+        """Test markers are single tokens and end tags take no tiles."""
+        tokens = tokenize("{red}HI{/red}{66}{/}")
+        assert tokens == ["{red}", "H", "I", "{/red}", "{66}", "{/}"]
+        assert count_tiles(tokens) == 4
+    
+    @pytest.mark.parametrize("text,expected", [
+        ("{71}", list("{71}")),
+        ("{sun}", list("{sun}")),
+        ("{/x}", list("{/x}")),
+        ("{{66}", ["{", "{66}"]),
+    ])
+    def test_non_markers_are_characters(self, text, expected):
+        """Test brace text that isn't a marker is treated as characters."""
+        assert tokenize(text) == expected
+    
+    def test_truncate_drops_end_tags(self):
+        """Test truncation counts tiles and drops end tags."""
+        assert truncate_tiles(tokenize("{63}A{/}BCD"), 3) == ["{63}", "A", "B"]
+    
+    def test_align_counts_markers_as_one_tile(self):
+        """Test alignment pads by tile count, not character count."""
+        assert align_tiles(tokenize("{63}AB"), "right", width=5) == "  {63}AB"
+        assert align_tiles(tokenize("{63}AB"), "center", width=6) == " {63}AB  "
+
+
+class TestBoardConversion:
+    """Tests for converting tiles to board codes."""
+    
+    def test_tokens_to_codes(self):
+        """Test characters, colors and unknown characters map to codes."""
+        row = tokens_to_codes(tokenize("a{red}~{/}1"), width=6)
+        assert row == [1, 63, BoardChars.SPACE, 27, BoardChars.SPACE, BoardChars.SPACE]
+    
+    def test_strip_color_tiles(self):
+        """Test color markers are skipped when color tiles are disabled."""
+        assert tokens_to_codes(tokenize("{red}A"), width=2, use_color_tiles=False) == [1, BoardChars.SPACE]
+    
+    def test_character_that_uppercases_to_two(self):
+        """Test characters whose uppercase form is longer become spaces."""
+        assert tokens_to_codes(["ß"], width=1) == [BoardChars.SPACE]
+    
+    def test_engine_output_fills_board_row(self):
+        """Test the engine and board conversion agree on tile widths."""
+        engine = TemplateEngine()
+        line = engine._apply_alignment("{red}{/red}{66}HI", "right", width=22)
+        board = text_to_board_array(line)
+        assert board[0][-4:] == [63, 66, 8, 9]
+        assert board[0][:18] == [BoardChars.SPACE] * 18
+
+
+class TestTileGrid:
+    """Tests for TileGrid."""
+    
+    def test_board_array_from_tokens(self):
+        """Test a grid converts to the same array as its text."""
+        grid = TileGrid([tokenize("{red}A"), [], tokenize("B{/}C")])
+        assert grid.text == "{red}A\n\nB{/}C"
+        assert grid.to_board_array() == text_to_board_array(grid.text)
+        assert len(grid.to_board_array()) == 6
+    
+    def test_board_array_is_a_copy(self):
+        """Test callers can modify the returned array without affecting the grid."""
+        grid = TileGrid.from_text("A")
+        board = grid.to_board_array()
+        board[0][0] = 63
+        assert grid.to_board_array()[0][0] == 1
+    
+    def test_without_color_tiles(self):
+        """Test color markers can be stripped when converting."""
+        grid = TileGrid.from_text("{red}A")
+        assert grid.to_board_array(use_color_tiles=False)[0][:2] == [1, BoardChars.SPACE]
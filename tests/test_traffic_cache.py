@@ -0,0 +1,138 @@
+"""Tests for traffic data cache service."""
+
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src import persistence
+from src.data_sources.traffic_cache import TrafficCache
+
+
+@pytest.fixture(autouse=True)
+def reset_traffic_cache(tmp_path, monkeypatch):
+    """Reset TrafficCache singleton and keep snapshots in a temp directory."""
+    import src.data_sources.traffic_cache as traffic_cache_module
+    
+    monkeypatch.setattr(traffic_cache_module, "DEFAULT_SNAPSHOT_DIR", tmp_path)
+    TrafficCache._instance = None
+    traffic_cache_module._cache_instance = None
+    
+    yield
+    
+    TrafficCache._instance = None
+    traffic_cache_module._cache_instance = None
+
+
+def _restart():
+    """Simulate a process restart: save pending snapshots and drop the singleton."""
+    import src.data_sources.traffic_cache as traffic_cache_module
+    persistence.flush_all()
+    TrafficCache._instance = None
+    traffic_cache_module._cache_instance = None
+    return TrafficCache()
+
+
+ROUTE = ("Home", "Work", "DRIVE", "google")
+
+
+class TestTrafficCache:
+    """Test cases for TrafficCache."""
+    
+    def test_get_and_set(self):
+        """Test caching route data within the TTL."""
+        cache = TrafficCache()
+        assert cache.get(*ROUTE) is None
+        
+        cache.set(*ROUTE, {"duration_minutes": 25})
+        assert cache.get(*ROUTE) == {"duration_minutes": 25}
+    
+    def test_snapshot_restored_after_restart(self):
+        """Test that entries survive a restart with their original age."""
+        cache = TrafficCache()
+        cache.set(*ROUTE, {"duration_minutes": 25})
+        cached_at = next(iter(cache._cache.values())).cached_at
+        
+        cache = _restart()
+        assert cache.get(*ROUTE) == {"duration_minutes": 25}
+        assert next(iter(cache._cache.values())).cached_at == cached_at
+        assert cache.get_status()["restored_entries"] == 1
+    
+    def test_snapshot_writes_are_debounced(self):
+        """Test that a burst of changes is saved once."""
+        cache = TrafficCache()
+        for minutes in range(5):
+            cache.set("Home", f"Stop {minutes}", "DRIVE", "google", {"duration_minutes": minutes})
+        
+        writer = persistence.get_writer(cache.snapshot_path)
+        assert writer.pending
+        writer.flush()
+        assert writer.writes == 1
+        assert len(json.loads(cache.snapshot_path.read_text())["routes"]) == 5
+    
+    def test_entries_too_old_not_restored(self):
+        """Test that entries past STALE_MAX_AGE are dropped on restore."""
+        cache = TrafficCache()
+        cache.set(*ROUTE, {"duration_minutes": 25})
+        persistence.flush_all()
+        
+        stored = json.loads(cache.snapshot_path.read_text())
+        stored["routes"][0]["cached_at"] -= TrafficCache.STALE_MAX_AGE + 1
+        cache.snapshot_path.write_text(json.dumps(stored))
+        
+        cache = _restart()
+        assert cache.get(*ROUTE) is None
+        assert cache.get_status()["restored_entries"] == 0
+
+
+class TestGetOrFetch:
+    """Test cases for stale-while-revalidate lookups."""
+    
+    def test_miss_fetches_synchronously(self):
+        """Test that a missing entry is fetched and cached."""
+        cache = TrafficCache()
+        fetch = Mock(return_value={"duration_minutes": 25})
+        
+        assert cache.get_or_fetch(*ROUTE, fetch) == {"duration_minutes": 25}
+        assert cache.get_or_fetch(*ROUTE, fetch) == {"duration_minutes": 25}
+        assert fetch.call_count == 1
+    
+    def test_stale_entry_served_while_refreshing(self):
+        """Test that an expired entry is returned at once and refreshed in the background."""
+        cache = TrafficCache()
+        cache.set(*ROUTE, {"duration_minutes": 25})
+        for cached_route in cache._cache.values():
+            cached_route.cached_at -= cache._ttl + 1
+        
+        released = threading.Event()
+        
+        def fetch():
+            released.wait(2)
+            return {"duration_minutes": 30}
+        
+        assert cache.get_or_fetch(*ROUTE, fetch) == {"duration_minutes": 25}
+        assert cache.get_status()["stale_hits"] == 1
+        
+        released.set()
+        deadline = time.time() + 2
+        while cache.get(*ROUTE) is None and time.time() < deadline:
+            time.sleep(0.01)
+        assert cache.get(*ROUTE) == {"duration_minutes": 30}
+    
+    def test_failed_refresh_keeps_stale_entry(self):
+        """Test that a failing background refresh leaves the stale entry in place."""
+        cache = TrafficCache()
+        cache.set(*ROUTE, {"duration_minutes": 25})
+        for cached_route in cache._cache.values():
+            cached_route.cached_at -= cache._ttl + 1
+        
+        fetch = Mock(side_effect=Exception("API down"))
+        assert cache.get_or_fetch(*ROUTE, fetch) == {"duration_minutes": 25}
+        
+        deadline = time.time() + 2
+        while cache.get_status()["error_count"] == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        assert cache.get_status()["error_count"] == 1
+        assert cache.get_or_fetch(*ROUTE, Mock(return_value=None)) == {"duration_minutes": 25}
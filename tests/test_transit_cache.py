@@ -5,15 +5,40 @@ import time
 import json
 import threading
 from unittest.mock import Mock, patch, MagicMock
-from src.data_sources.transit_cache import TransitCache, get_transit_cache
+from src.data_sources.transit_cache import (
+    TransitCache,
+    get_transit_cache,
+    iter_stop_visits,
+    line_matches,
+)
+
+
+def _chunks(data, size=64, bom=False):
+    """Encode a response body into streamed chunks."""
+    body = json.dumps(data).encode("utf-8")
+    if bom:
+        body = b"\xef\xbb\xbf" + body
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+def _streaming_response(data, **kwargs):
+    """Mock a streamed HTTP 200 response."""
+    response = Mock()
+    response.status_code = 200
+    response.raise_for_status = Mock()
+    response.iter_content = Mock(return_value=_chunks(data, **kwargs))
+    return response
 
 
 @pytest.fixture(autouse=True)
-def reset_transit_cache():
+def reset_transit_cache(tmp_path, monkeypatch):
     """Reset TransitCache singleton before each test to ensure test isolation."""
     # Import the module-level variable
     import src.data_sources.transit_cache as transit_cache_module
     
+    # Keep snapshots out of the real data directory
+    monkeypatch.setattr(transit_cache_module, "DEFAULT_SNAPSHOT_DIR", tmp_path)
+    
     # Stop any running threads
     if TransitCache._instance is not None:
         cache = TransitCache._instance
@@ -140,15 +165,11 @@ class TestTransitCache:
         assert "99999" in result
         assert len(result["99999"]) == 0  # No data for non-existent stop
     
-    @patch('src.data_sources.transit_cache.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_refresh_data_success(self, mock_get, mock_regional_response):
         """Test successful data refresh."""
         # Mock HTTP response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = json.dumps(mock_regional_response)
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _streaming_response(mock_regional_response)
         
         cache = TransitCache()
         cache.configure(api_key="test-key", enabled=True)
@@ -164,7 +185,7 @@ class TestTransitCache:
         sf_stops = cache.get_all_stops_for_agency("SF")
         assert "15210" in sf_stops
     
-    @patch('src.data_sources.transit_cache.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_refresh_data_rate_limit(self, mock_get):
         """Test handling of rate limit errors."""
         # Mock HTTP 429 response
@@ -246,12 +267,317 @@ class TestTransitCache:
         
         final_hits = cache.get_status()["cache_hits"]
         assert final_hits == initial_hits + 3
+    
+    def test_subscriptions_filter_visits(self, mock_regional_response):
+        """Test that only subscribed stops keep their visits."""
+        cache = TransitCache()
+        cache.subscribe("plugin:muni", "SF", ["15210"])
+        cache._parse_and_index(mock_regional_response)
+        
+        assert "15210" in cache.get_all_stops_for_agency("SF")
+        assert cache.get_all_stops_for_agency("BA") == {}
+        
+        status = cache.get_status()
+        assert status["subscribed_stops"] == 1
+        assert status["visits_in_feed"] == 3
+        
+        # Unsubscribing everything keeps every stop again
+        cache.unsubscribe("plugin:muni")
+        cache._parse_and_index(mock_regional_response)
+        assert "12TH" in cache.get_all_stops_for_agency("BA")
+    
+    def test_routes_indexed_for_unsubscribed_stops(self, mock_regional_response):
+        """Test that route names are kept for every stop."""
+        cache = TransitCache()
+        cache.subscribe("plugin:muni", "SF", ["99999"])
+        cache._parse_and_index(mock_regional_response)
+        
+        routes = cache.get_routes_for_stops("SF", ["15210", "99999"])
+        assert routes == {"15210": ["N-JUDAH"], "99999": []}
+        assert cache.get_routes_for_stops("BA", ["12TH"]) == {"12TH": ["RED"]}
+    
+    def test_requested_stops_kept_on_next_refresh(self, mock_regional_response):
+        """Test that stops read without a subscription are kept from the next refresh."""
+        cache = TransitCache()
+        cache.subscribe("plugin:muni", "SF", ["15210"])
+        cache._parse_and_index(mock_regional_response)
+        assert cache.get_stops_data("BA", ["12TH"])["12TH"] == []
+        
+        cache._parse_and_index(mock_regional_response)
+        assert len(cache.get_stops_data("BA", ["12TH"])["12TH"]) == 1
+    
+    def test_requested_stops_expire(self, mock_regional_response):
+        """Test that stops read without a subscription are dropped once no longer read."""
+        from src.data_sources import transit_cache
+        cache = TransitCache()
+        cache.subscribe("plugin:muni", "SF", ["15210"])
+        cache.get_stops_data("BA", ["12TH"])
+        cache.get_arrivals("SF", ["99999"])
+        assert cache.get_status()["subscribed_stops"] == 3
+        
+        # Subscribing to a requested stop takes it over
+        cache.subscribe("plugin:muni", "SF", ["15210", "99999"])
+        assert ("SF", "99999") not in cache._requested
+        
+        cache._requested[("BA", "12TH")] -= transit_cache.REQUESTED_STOP_TTL + 1
+        cache._parse_and_index(mock_regional_response)
+        assert cache.get_all_stops_for_agency("BA") == {}
+        assert cache._requested == {}
+    
+    @patch('src.plugins.http.HttpSession.get')
+    def test_truncated_stream_keeps_previous_data(self, mock_get, mock_regional_response):
+        """Test that a refresh cut off mid-stream leaves the cache unchanged."""
+        cache = TransitCache()
+        cache.configure(api_key="test-key", enabled=True)
+        mock_get.return_value = _streaming_response(mock_regional_response)
+        cache._refresh_data()
+        
+        truncated = _streaming_response({"ServiceDelivery": {}})
+        truncated.iter_content.return_value = _chunks(mock_regional_response)[:3]
+        mock_get.return_value = truncated
+        cache._refresh_data()
+        
+        status = cache.get_status()
+        assert status["refresh_count"] == 1
+        assert status["error_count"] == 1
+        assert len(cache.get_stops_data("SF", ["15210"])["15210"]) == 2
+        truncated.close.assert_called_once()
+
+
+class TestArrivals:
+    """Test cases for pre-parsed arrival records."""
+    
+    @pytest.fixture
+    def response(self):
+        """Feed with two lines at one stop, out of time order."""
+        def visit(line, arrival, **journey):
+            return {
+                "MonitoredVehicleJourney": {
+                    "OperatorRef": "SF",
+                    "PublishedLineName": line,
+                    "MonitoredCall": {
+                        "StopPointRef": "SF_15210",
+                        "StopPointName": "Judah St & 34th Ave",
+                        "ExpectedArrivalTime": arrival,
+                    },
+                    **journey,
+                }
+            }
+        
+        return {
+            "ServiceDelivery": {
+                "StopMonitoringDelivery": {
+                    "MonitoredStopVisit": [
+                        visit("N-JUDAH", "2024-12-26T10:12:00-08:00"),
+                        visit("N-JUDAH", "2024-12-26T10:05:00-08:00", Delay="PT2M30S", Occupancy="FULL"),
+                        visit("28", "2024-12-26T18:08:00Z", Occupancy=["MANY_SEATS"]),
+                        visit("28", "not a time"),
+                    ]
+                }
+            }
+        }
+    
+    def test_arrivals_parsed_and_sorted(self, response):
+        """Test that subscribed stops are parsed into sorted records."""
+        cache = TransitCache()
+        cache.subscribe("plugin:muni", "SF", ["15210"])
+        cache._parse_and_index(response)
+        
+        stop = cache.get_arrivals("SF", ["15210"])["15210"]
+        assert stop.stop_name == "Judah St & 34th Ave"
+        assert [a.line for a in stop.arrivals] == ["N-JUDAH", "28", "N-JUDAH"]
+        
+        first = stop.arrivals[0]
+        assert first.arrival == 1735236300  # 2024-12-26T18:05:00Z
+        assert first.delay == 150
+        assert first.delayed is True
+        assert first.occupancy == "FULL"
+        assert stop.arrivals[1].occupancy == "MANY_SEATS"
+        assert stop.arrivals[2].delay is None
+        assert stop.arrivals[2].occupancy == "UNKNOWN"
+        
+        assert first.minutes_until(first.arrival - 185) == 3
+        assert first.minutes_until(first.arrival + 60) == 0
+    
+    def test_records_reused_until_next_refresh(self, response):
+        """Test that reads share the records built by the refresh."""
+        cache = TransitCache()
+        cache.subscribe("plugin:muni", "SF", ["15210"])
+        cache._parse_and_index(response)
+        
+        first = cache.get_arrivals("SF", ["15210"])["15210"]
+        assert cache.get_arrivals("SF", ["15210"])["15210"] is first
+        
+        cache._parse_and_index(response)
+        assert cache.get_arrivals("SF", ["15210"])["15210"] is not first
+    
+    def test_line_filter(self, response):
+        """Test subscribed and ad hoc line filters."""
+        cache = TransitCache()
+        cache.subscribe("source:muni", "SF", ["15210"], lines=["n"])
+        cache._parse_and_index(response)
+        
+        judah = cache.get_arrivals("SF", ["15210"], lines=["N"])["15210"]
+        assert [a.line for a in judah.arrivals] == ["N-JUDAH", "N-JUDAH"]
+        
+        route_28 = cache.get_arrivals("SF", ["15210"], lines=["28"])["15210"]
+        assert [a.line for a in route_28.arrivals] == ["28"]
+    
+    def test_missing_stops_left_out(self, response):
+        """Test that stops without arrivals aren't returned."""
+        cache = TransitCache()
+        cache._parse_and_index(response)
+        assert cache.get_arrivals("SF", ["99999"]) == {}
+    
+    def test_line_matches(self):
+        """Test matching published line names against filters."""
+        assert line_matches("N-JUDAH", frozenset({"N"}))
+        assert line_matches("N-JUDAH", frozenset({"JUDAH"}))
+        assert line_matches("28", frozenset({"28"}))
+        assert not line_matches("28R", frozenset({"28"}))
+        assert not line_matches("J-CHURCH", frozenset({"N"}))
+
+
+class TestWarmStart:
+    """Test cases for snapshot persistence across restarts."""
+    
+    def _restart(self):
+        """Simulate a process restart by dropping the singleton."""
+        import src.data_sources.transit_cache as transit_cache_module
+        TransitCache._instance = None
+        transit_cache_module._cache_instance = None
+        cache = TransitCache()
+        cache.configure(api_key="test-key", refresh_interval=90, enabled=True)
+        cache.subscribe("plugin:muni", "SF", ["15210"])
+        return cache
+    
+    @pytest.fixture
+    def future_response(self, mock_regional_response):
+        """Regional response with arrivals a few minutes from now."""
+        visits = mock_regional_response["ServiceDelivery"]["StopMonitoringDelivery"]["MonitoredStopVisit"]
+        for minutes, visit in zip((5, 12, 3), visits):
+            arrival = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() + minutes * 60))
+            visit["MonitoredVehicleJourney"]["MonitoredCall"]["ExpectedArrivalTime"] = arrival
+        return mock_regional_response
+    
+    @patch('src.plugins.http.HttpSession.get')
+    def test_start_serves_snapshot_without_fetching(self, mock_get, future_response):
+        """Test that a recent snapshot is served at startup with no API call."""
+        mock_get.return_value = _streaming_response(future_response)
+        cache = self._restart()
+        cache._refresh_data()
+        assert cache.snapshot_path.exists()
+        
+        mock_get.reset_mock()
+        cache = self._restart()
+        cache.start()
+        
+        assert cache.is_ready()
+        assert mock_get.call_count == 0
+        status = cache.get_status()
+        assert status["restored_from_snapshot"] is True
+        assert status["refresh_count"] == 0
+        assert status["cache_age_seconds"] < 5
+        
+        stop = cache.get_arrivals("SF", ["15210"])["15210"]
+        assert [a.line for a in stop.arrivals] == ["N-JUDAH", "N-JUDAH"]
+        assert cache.get_routes_for_stops("BA", ["12TH"]) == {"12TH": ["RED"]}
+    
+    @patch('src.plugins.http.HttpSession.get')
+    def test_stale_snapshot_refreshed_in_background(self, mock_get, future_response):
+        """Test that a snapshot past the refresh interval is refreshed by the thread."""
+        mock_get.return_value = _streaming_response(future_response)
+        cache = self._restart()
+        cache._refresh_data()
+        
+        # Age the snapshot past the refresh interval
+        stored = json.loads(cache.snapshot_path.read_text())
+        stored["fetched_at"] -= 120
+        cache.snapshot_path.write_text(json.dumps(stored))
+        
+        mock_get.reset_mock()
+        mock_get.return_value = _streaming_response(future_response)
+        cache = self._restart()
+        cache.start()
+        
+        # Served right away, refreshed without blocking start()
+        assert cache.is_ready()
+        deadline = time.time() + 2
+        while cache.get_status()["refresh_count"] == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        assert cache.get_status()["refresh_count"] == 1
+        assert cache.get_status()["restored_from_snapshot"] is False
+    
+    @patch('src.plugins.http.HttpSession.get')
+    def test_outdated_snapshot_ignored(self, mock_get, future_response):
+        """Test that a snapshot older than SNAPSHOT_MAX_AGE isn't served."""
+        import src.data_sources.transit_cache as transit_cache_module
+        mock_get.return_value = _streaming_response(future_response)
+        cache = self._restart()
+        cache._refresh_data()
+        
+        stored = json.loads(cache.snapshot_path.read_text())
+        stored["fetched_at"] -= transit_cache_module.SNAPSHOT_MAX_AGE + 1
+        cache.snapshot_path.write_text(json.dumps(stored))
+        
+        mock_get.reset_mock()
+        mock_get.return_value = Mock(status_code=500, raise_for_status=Mock(side_effect=Exception("down")))
+        cache = self._restart()
+        cache.start()
+        
+        assert not cache.is_ready()
+        assert mock_get.call_count == 1
+    
+    def test_departed_arrivals_dropped_on_restore(self, future_response):
+        """Test that restored arrivals already gone are left out."""
+        visits = future_response["ServiceDelivery"]["StopMonitoringDelivery"]["MonitoredStopVisit"]
+        gone = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() - 600))
+        visits[0]["MonitoredVehicleJourney"]["MonitoredCall"]["ExpectedArrivalTime"] = gone
+        
+        cache = self._restart()
+        cache._parse_and_index(future_response)
+        cache._last_success = time.time()
+        cache._save_snapshot()
+        
+        cache = self._restart()
+        assert cache._restore_snapshot()
+        stop = cache.get_arrivals("SF", ["15210"])["15210"]
+        assert len(stop.arrivals) == 1
+
+
+class TestIterStopVisits:
+    """Test cases for the streaming StopMonitoring parser."""
+    
+    @pytest.mark.parametrize("size", [1, 7, 4096])
+    def test_yields_visits_for_any_chunking(self, mock_regional_response, size):
+        """Test that chunk boundaries don't affect parsing."""
+        expected = mock_regional_response["ServiceDelivery"]["StopMonitoringDelivery"]["MonitoredStopVisit"]
+        visits = list(iter_stop_visits(_chunks(mock_regional_response, size=size, bom=True)))
+        assert visits == expected
+    
+    def test_single_visit_object(self, mock_regional_response):
+        """Test a MonitoredStopVisit holding one object instead of a list."""
+        visit = mock_regional_response["ServiceDelivery"]["StopMonitoringDelivery"]["MonitoredStopVisit"][0]
+        data = {"ServiceDelivery": {"StopMonitoringDelivery": {"MonitoredStopVisit": visit}}}
+        assert list(iter_stop_visits(_chunks(data, size=5))) == [visit]
+    
+    def test_no_visits(self):
+        """Test responses without visits."""
+        assert list(iter_stop_visits(_chunks({"ServiceDelivery": {}}))) == []
+        empty = {"ServiceDelivery": {"StopMonitoringDelivery": {"MonitoredStopVisit": []}}}
+        assert list(iter_stop_visits(_chunks(empty, size=3))) == []
+    
+    def test_truncated_response(self, mock_regional_response):
+        """Test that a response ending mid-visit raises."""
+        body = b"".join(_chunks(mock_regional_response))
+        with pytest.raises(ValueError):
+            list(iter_stop_visits([body[:len(body) // 2]]))
 
 
 class TestTransitCacheIntegration:
     """Integration tests for transit cache with real-ish scenarios."""
     
-    @patch('src.data_sources.transit_cache.requests.get')
+    @patch('src.plugins.http.HttpSession.get')
     def test_multiple_agencies(self, mock_get):
         """Test caching data from multiple transit agencies."""
         response_data = {
@@ -299,11 +625,7 @@ class TestTransitCacheIntegration:
             }
         }
         
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = json.dumps(response_data)
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _streaming_response(response_data)
         
         cache = TransitCache()
         cache.configure(api_key="test-key", enabled=True)